@@ -1,27 +1,47 @@
 
 
+import asyncio
+import functools
+import io
 import json
 import logging
 import re
-from typing import Optional
+import time
+from typing import List, Optional
 
 import discord
 from discord import ui
 from discord.ext import commands
 
 # 로컬 모듈 임포트
+from command_scheduler import CommandScheduler, CommandTicket, SchedulerRejectedError
+from compute_dispatch import ComputeDispatcher, ComputeExpiredError, ComputeQueueFullError
 from config import Config
-from coupon_integrated import (create_coupon_simple,
-                               format_coupon_create_result,
-                               format_coupon_result, process_coupon_simple)
+from coupon_async import AsyncCouponProcessor
+from coupon_bulk import format_bulk_progress, issue_coupons
+from coupon_cache import CouponCheckCache
+from coupon_integrated import format_coupon_create_result, format_coupon_result
+from coupon_outbox import CouponOutbox
+from coupon_resilience import CouponResilience
 from decoder import SaveCodeDecoder
+from dm_dispatcher import DMDispatcher
+from embed_pager import EmbedPager
 from encoder import SaveCodeEncoder, create_custom_savecode
 from graduation_checker import GraduationChecker
 from item_searcher import ItemSearcher
 from items import ItemDatabase
-from raid_system import RaidWaitingSystem
-from savecode_decoder import decode_savecode2, extract_save_data
+from lumber_modifier import LumberModifier
+from metrics import LoopLagMonitor, MetricsServer, bot_metrics
+from raid_matchmaker import RaidMatchmaker
+from raid_registry import GuildRaidRegistry
+from raid_schedule import format_scheduled_time, parse_scheduled_time
+from raid_status import RaidStatusMessage
+from raid_system import PartyExpiryEvent, RaidWaitingSystem
+from result_cache import CachedResult, ResultCache
+from save_analysis import (GRADUATION_STATUSES, LoadSummary, SaveAnalysis, SaveAnalyzer, format_analyses_csv,
+                           summarize_analyses)
 from savecode_manager import SaveCodeManager
+from scheduler import TaskScheduler
 
 # 로깅 설정
 logging.basicConfig(
@@ -30,21 +50,123 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 만료/알림 힙에 더 이른 작업을 추가할 수 있는 변경 (만료 루프를 깨움)
+PARTY_SCHEDULE_OPS = {'party_create', 'party_close'}
 
+# 파티 찾기 화면에 불러올 최대 파티 수 (참가 버튼 수 제한)
+PARTY_LIST_LIMIT = 20
 
+# CPU 작업 실행기가 요청을 받지 못했을 때 안내 문구
+COMPUTE_BUSY_MESSAGE = "⏳ 처리 중인 요청이 많습니다. 잠시 후 다시 시도해주세요."
+COMPUTE_EXPIRED_MESSAGE = "⌛ 처리 시간이 초과되어 요청을 취소했습니다."
 
+# 명령어 대기열(CommandScheduler)을 거쳐 실행하는 무거운 명령어
+SCHEDULED_COMMANDS = ('로드', '값', '세이브생성')
 
+# 버튼/슬래시 명령어 상호작용 토큰 유효 시간 (초, 지나면 후속 응답을 보낼 수 없음)
+INTERACTION_TOKEN_TTL = 15 * 60
+
+# /로드에 붙이면 전체 결과를 CSV 파일로 첨부하는 옵션
+LOAD_FILE_FLAGS = {'--파일', '--csv'}
+
+# /로드 통계의 졸업 상태별 (이모지, 이름, 해당 캐릭터가 없을 때 문구)
+LOAD_GRADUATION_LABELS = {
+    'mikael': ('🌟', '미카엘 졸업', "미카엘 졸업 조건(통치자 성흔+집행하는 자 영혼)을 충족한 캐릭터가 없습니다"),
+    'terminator': ('💀', '종결자 졸업', "종결자 졸업 조건(3가지 특수 아이템)을 충족한 캐릭터가 없습니다"),
+    'apocalypse': ('😈', '묵시록 레이드 졸업', "묵시록 레이드 아이템(죄:)을 보유한 캐릭터가 없습니다"),
+    'uriel': ('👼', '우리엘 졸업', "우리엘 졸업 아이템 쌍을 보유한 캐릭터가 없습니다"),
+    'raphael': ('🕊️', '라파엘 졸업', "라파엘 졸업 아이템 쌍을 보유한 캐릭터가 없습니다"),
+    'gabriel': ('⚔️', '가브리엘 졸업', "가브리엘 졸업 아이템 쌍을 보유한 캐릭터가 없습니다"),
+}
+
+
+
+
+
+
+
+class CommandQueueRejected(commands.CommandError):
+    """명령어 대기열/요청 속도 제한으로 명령어를 실행하지 않음"""
+
+
+def is_admin(user) -> bool:
+    """서버 관리자 여부 (DM에서는 False)"""
+    permissions = getattr(user, 'guild_permissions', None)
+    return bool(permissions and permissions.administrator)
+
+
+async def acquire_interaction_slot(scheduler: CommandScheduler, interaction: discord.Interaction,
+                                   label: str) -> Optional[CommandTicket]:
+    """
+    모달 제출 등 상호작용을 명령어 대기열에 등록하고 차례가 될 때까지 대기
+
+    응답 제한 시간(3초) 안에 먼저 defer하고, 기다려야 하면 대기 순번을 바로 안내함
+
+    Returns:
+        CommandTicket: 처리가 끝나면 scheduler.release()로 반환 (거절되면 안내 후 None)
+    """
+    await interaction.response.defer(ephemeral=True)
+    try:
+        ticket = scheduler.submit(interaction.user.id, interaction.guild_id, admin=is_admin(interaction.user),
+                                  label=label)
+    except SchedulerRejectedError as e:
+        await interaction.followup.send(e.user_message, ephemeral=True)
+        return None
+    try:
+        if not ticket.started:
+            await interaction.followup.send(
+                f"⏳ 대기열 {scheduler.position(ticket)}번째입니다. 차례가 되면 바로 처리합니다.",
+                ephemeral=True
+            )
+        await scheduler.wait(ticket)
+    except BaseException:
+        scheduler.release(ticket)
+        raise
+    return ticket
+
+
+class TimedView(ui.View):
+    """버튼/선택 메뉴 처리 시간을 지표로 기록하는 View (나중에 add_item으로 추가한 항목 포함)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for item in self.children:
+            self._time_item(item)
+
+    def _time_item(self, item: ui.Item):
+        callback = item.callback
+        if getattr(callback, 'metrics_component', None) is not None:
+            return
+        # 데코레이터로 만든 버튼은 원래 함수 이름, 직접 지정한 콜백은 함수 이름으로 구분
+        name = getattr(getattr(callback, 'callback', callback), '__name__', 'callback')
+        if name == 'callback':
+            name = type(item).__name__
+        item.callback = bot_metrics.wrap_interaction(f"{type(self).__name__}.{name}", callback)
+
+    def add_item(self, item: ui.Item):
+        self._time_item(item)
+        return super().add_item(item)
+
+
+class TimedModal(ui.Modal):
+    """제출 처리 시간을 지표로 기록하는 Modal"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_submit = bot_metrics.wrap_interaction(type(self).__name__, self.on_submit)
 
 
 # 레이드 시스템 UI 클래스들
 
-class RaidSelectView(ui.View):
+class RaidSelectView(TimedView):
     """레이드 선택 셀렉트 박스 뷰"""
     
-    def __init__(self, raid_system, user_id):
+    def __init__(self, raid_system, user_id, dm_dispatcher, scheduler):
         super().__init__(timeout=300)
         self.raid_system = raid_system
         self.user_id = user_id
+        self.dm_dispatcher = dm_dispatcher
+        self.scheduler = scheduler
         
         # 레이드 목록을 셀렉트 옵션으로 변환
         options = []
@@ -71,35 +193,27 @@ class RaidSelectView(ui.View):
         selected_raid = self.raid_select.values[0]
         
         # 먼저 모달 열기
-        modal = PartyRecruitmentModal(self.raid_system, self.user_id, selected_raid)
+        modal = PartyRecruitmentModal(self.raid_system, self.user_id, selected_raid, self.dm_dispatcher, self.scheduler)
         await interaction.response.send_modal(modal)
         
-        # 백그라운드에서 원본 메시지 업데이트
-        async def update_original_message():
-            import asyncio
-            await asyncio.sleep(1)  # 모달이 열린 후 잠깐 대기
-            try:
-                updated_embed = discord.Embed(
-                    title="✅ 레이드 선택 완료",
-                    description=f"**{selected_raid}** 레이드를 선택했습니다.",
-                    color=0x00ff00
-                )
-                await interaction.edit_original_response(embed=updated_embed, view=None)
-            except:
-                pass  # 오류 무시
-        
-        # 백그라운드 태스크로 실행
-        import asyncio
-        asyncio.create_task(update_original_message())
+        # 모달이 열린 후 원본 메시지 업데이트 예약
+        updated_embed = discord.Embed(
+            title="✅ 레이드 선택 완료",
+            description=f"**{selected_raid}** 레이드를 선택했습니다.",
+            color=0x00ff00
+        )
+        self.scheduler.edit_response_later(interaction, 1, embed=updated_embed, view=None)
 
-class PartyRecruitmentModal(ui.Modal, title='📢 파티 모집하기'):
+class PartyRecruitmentModal(TimedModal, title='📢 파티 모집하기'):
     """파티 모집 생성 모달 (레이드는 이미 선택됨)"""
     
-    def __init__(self, raid_system, user_id, selected_raid):
+    def __init__(self, raid_system, user_id, selected_raid, dm_dispatcher, scheduler):
         super().__init__()
         self.raid_system = raid_system
         self.user_id = user_id
         self.selected_raid = selected_raid
+        self.dm_dispatcher = dm_dispatcher
+        self.scheduler = scheduler
     
     room_title = ui.TextInput(
         label='방제',
@@ -120,7 +234,7 @@ class PartyRecruitmentModal(ui.Modal, title='📢 파티 모집하기'):
     
     scheduled_time = ui.TextInput(
         label='예정 시간 (선택사항)',
-        placeholder='예: 오늘 저녁 8시, 30분 후 등',
+        placeholder='예: 21:30, 오늘 저녁 8시, 30분 후 (한국 시간)',
         style=discord.TextStyle.short,
         max_length=50,
         required=False
@@ -157,6 +271,16 @@ class PartyRecruitmentModal(ui.Modal, title='📢 파티 모집하기'):
                 )
                 return
             
+            # 예정 시간 해석 (해석할 수 없는 자유 입력은 표시만 하고 알림/자동 종료 대상에서 제외)
+            scheduled_time = self.scheduled_time.value.strip()
+            scheduled_at = parse_scheduled_time(scheduled_time)
+            if scheduled_at is not None and scheduled_at <= time.time():
+                await interaction.response.send_message(
+                    "❌ 예정 시간이 이미 지났습니다. 지금 이후의 시간을 입력해주세요.",
+                    ephemeral=True
+                )
+                return
+            
             # 기존 파티 확인 (한 명당 하나의 파티만 리더 가능)
             existing_parties = self.raid_system.get_user_led_parties(self.user_id)
             if existing_parties:
@@ -172,15 +296,13 @@ class PartyRecruitmentModal(ui.Modal, title='📢 파티 모집하기'):
                 raid_name=raid_name,
                 max_members=max_members_count,
                 description=self.description.value.strip(),
-                scheduled_time=self.scheduled_time.value.strip(),
-                room_title=self.room_title.value.strip()
+                scheduled_time=scheduled_time,
+                room_title=self.room_title.value.strip(),
+                scheduled_at=scheduled_at
             )
             
             party = self.raid_system.get_party_recruitment(party_id)
             
-            # 해당 레이드 대기자들에게 알림 DM 발송
-            await self.send_party_notification(interaction, party, raid_name)
-            
             embed = discord.Embed(
                 title="✅ 파티 모집이 생성되었습니다!",
                 description=f"파티 ID: `{party_id}`",
@@ -195,24 +317,17 @@ class PartyRecruitmentModal(ui.Modal, title='📢 파티 모집하기'):
             
             embed.add_field(
                 name="💡 안내",
-                value="• 다른 사용자들이 '파티 찾기'에서 참가할 수 있습니다\n• 해당 레이드 대기자들에게 알림을 발송했습니다",
+                value="• 다른 사용자들이 '파티 찾기'에서 참가할 수 있습니다\n• 해당 레이드 대기자들에게 알림을 발송하고 있습니다",
                 inline=False
             )
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
-            # 백그라운드에서 15초 후 메시지 자동 삭제
-            async def delete_after_delay():
-                import asyncio
-                await asyncio.sleep(15)
-                try:
-                    await interaction.delete_original_response()
-                except:
-                    pass  # 이미 삭제된 경우 무시
+            # 해당 레이드 대기자들에게 알림 DM 발송 (응답 후 백그라운드에서 진행)
+            await self.send_party_notification(interaction, party, raid_name)
             
-            # 백그라운드 태스크로 실행
-            import asyncio
-            asyncio.create_task(delete_after_delay())
+            # 15초 후 메시지 자동 삭제
+            self.scheduler.delete_response_later(interaction, 15)
             
         except ValueError:
             await interaction.response.send_message("❌ 모집 인원은 숫자로 입력해주세요.", ephemeral=True)
@@ -221,81 +336,71 @@ class PartyRecruitmentModal(ui.Modal, title='📢 파티 모집하기'):
             await interaction.response.send_message(f"❌ 파티 모집 생성 중 오류 발생: {e}", ephemeral=True)
     
     async def send_party_notification(self, interaction, party, raid_name):
-        """해당 레이드 대기자들에게 파티 모집 알림 DM 발송"""
+        """해당 레이드 대기자들에게 파티 모집 알림 DM 발송 (백그라운드, 결과는 리더에게 후속 메시지로 전달)"""
         try:
-            # 해당 레이드 대기자 목록 가져오기
-            waiting_users = self.raid_system.get_raid_participants(raid_name)
-            
-            # 파티 리더는 제외
-            waiting_users = [user_id for user_id in waiting_users if user_id != self.user_id]
+            # 해당 레이드 대기자 목록 가져오기 (파티 리더는 제외)
+            waiting_users = [user_id for user_id in self.raid_system.get_waiting_queue(raid_name) if user_id != self.user_id]
             
             if not waiting_users:
                 return  # 대기자가 없으면 알림 안 보냄
             
-            sent_count = 0
-            failed_count = 0
+            # 알림 DM 생성 (모든 대기자에게 같은 임베드 재사용)
+            leader = interaction.guild.get_member(party.leader_id)
+            notification_embed = discord.Embed(
+                title="🔔 파티 모집 알림",
+                description=f"대기 중이신 **{raid_name}** 레이드의 파티 모집이 등록되었습니다!",
+                color=0x3498db
+            )
             
-            for user_id in waiting_users:
-                try:
-                    user = interaction.guild.get_member(user_id)
-                    if user:
-                        # 알림 DM 생성
-                        notification_embed = discord.Embed(
-                            title="🔔 파티 모집 알림",
-                            description=f"대기 중이신 **{raid_name}** 레이드의 파티 모집이 등록되었습니다!",
-                            color=0x3498db
-                        )
-                        
-                        notification_embed.add_field(
-                            name="📋 모집 정보",
-                            value=f"**레이드**: {raid_name}\n**리더**: {interaction.guild.get_member(party.leader_id).display_name if interaction.guild.get_member(party.leader_id) else 'Unknown'}\n**모집 인원**: {party.max_members}명\n**현재 인원**: {len(party.current_members)}명",
-                            inline=False
-                        )
-                        
-                        if party.description:
-                            notification_embed.add_field(
-                                name="📝 모집 설명",
-                                value=party.description,
-                                inline=False
-                            )
-                        
-                        if party.scheduled_time:
-                            notification_embed.add_field(
-                                name="⏰ 예정 시간",
-                                value=party.scheduled_time,
-                                inline=False
-                            )
-                        
-                        notification_embed.add_field(
-                            name="💡 참가 방법",
-                            value="서버의 **👥 파티 찾기** 버튼을 클릭하여 참가할 수 있습니다!",
-                            inline=False
-                        )
-                        
-                        notification_embed.set_footer(text=f"서버: {interaction.guild.name}")
-                        
-                        await user.send(embed=notification_embed)
-                        sent_count += 1
-                        
-                except discord.Forbidden:
-                    # DM을 받을 수 없는 사용자
-                    failed_count += 1
-                except Exception as e:
-                    logger.error(f"파티 모집 알림 DM 발송 중 오류 (user_id: {user_id}): {e}")
-                    failed_count += 1
+            notification_embed.add_field(
+                name="📋 모집 정보",
+                value=f"**레이드**: {raid_name}\n**리더**: {leader.display_name if leader else 'Unknown'}\n**모집 인원**: {party.max_members}명\n**현재 인원**: {len(party.current_members)}명",
+                inline=False
+            )
+            
+            if party.description:
+                notification_embed.add_field(
+                    name="📝 모집 설명",
+                    value=party.description,
+                    inline=False
+                )
+            
+            if party.scheduled_time:
+                notification_embed.add_field(
+                    name="⏰ 예정 시간",
+                    value=format_scheduled_time(party.scheduled_at) if party.scheduled_at is not None else party.scheduled_time,
+                    inline=False
+                )
+            
+            notification_embed.add_field(
+                name="💡 참가 방법",
+                value="서버의 **👥 파티 찾기** 버튼을 클릭하여 참가할 수 있습니다!",
+                inline=False
+            )
+            
+            notification_embed.set_footer(text=f"서버: {interaction.guild.name}")
+            
+            async def report(result):
+                await interaction.followup.send(
+                    f"📨 파티 모집 알림 발송 완료 - 성공: {result.sent}명, 실패: {result.failed}명",
+                    ephemeral=True
+                )
             
-            logger.info(f"파티 모집 알림 발송 완료 - 성공: {sent_count}명, 실패: {failed_count}명")
+            self.dm_dispatcher.dispatch_background(
+                waiting_users, notification_embed, guild=interaction.guild, on_complete=report
+            )
             
         except Exception as e:
             logger.error(f"파티 모집 알림 발송 중 전체 오류: {e}")
 
 
-class CouponProcessModal(ui.Modal, title='🎫 쿠폰 사용하기'):
+class CouponProcessModal(TimedModal, title='🎫 쿠폰 사용하기'):
     """쿠폰 처리를 위한 모달"""
     
-    def __init__(self, bot_instance):
+    def __init__(self, coupon_processor: AsyncCouponProcessor, command_scheduler: CommandScheduler):
         super().__init__()
-        self.bot_instance = bot_instance
+        self.coupon_processor = coupon_processor
+        self.command_scheduler = command_scheduler
     
     coupon_code = ui.TextInput(
         label='쿠폰 코드',
@@ -322,11 +427,18 @@ class CouponProcessModal(ui.Modal, title='🎫 쿠폰 사용하기'):
     )
     
     async def on_submit(self, interaction: discord.Interaction):
-        """모달 제출 시 쿠폰 처리"""
+        """모달 제출 시 쿠폰 처리 (명령어 대기열을 거쳐 실행)"""
+        ticket = await acquire_interaction_slot(self.command_scheduler, interaction, 'coupon_use')
+        if ticket is None:
+            return
+        try:
+            await self._process_submit(interaction)
+        finally:
+            self.command_scheduler.release(ticket)
+    
+    async def _process_submit(self, interaction: discord.Interaction):
+        """쿠폰 처리"""
         try:
-            # 즉시 응답하여 타임아웃 방지
-            await interaction.response.defer(ephemeral=True)
-            
             # 입력값 검증
             coupon_code = self.coupon_code.value.strip()
             player_name = self.player_name.value.strip()
@@ -347,8 +459,8 @@ class CouponProcessModal(ui.Modal, title='🎫 쿠폰 사용하기'):
             )
             await interaction.followup.send(embed=processing_embed, ephemeral=True)
             
-            # 쿠폰 처리 실행
-            result = process_coupon_simple(coupon_code, savecode, player_name)
+            # 쿠폰 처리 실행 (API 응답을 기다리는 동안 다른 상호작용은 계속 처리됨)
+            result = await self.coupon_processor.process_coupon_with_savecode(coupon_code, savecode, player_name)
             
             # 결과 처리
             if result.success:
@@ -457,11 +569,13 @@ class CouponProcessModal(ui.Modal, title='🎫 쿠폰 사용하기'):
                 await interaction.followup.send(embed=error_embed, ephemeral=True)
 
 
-class CouponCreateModal(ui.Modal, title='🎫 쿠폰 생성하기'):
+class CouponCreateModal(TimedModal, title='🎫 쿠폰 생성하기'):
     """쿠폰 생성을 위한 모달"""
     
-    def __init__(self):
+    def __init__(self, coupon_processor: AsyncCouponProcessor, command_scheduler: CommandScheduler):
         super().__init__()
+        self.coupon_processor = coupon_processor
+        self.command_scheduler = command_scheduler
     
     lumber = ui.TextInput(
         label='나무 수량',
@@ -480,11 +594,18 @@ class CouponCreateModal(ui.Modal, title='🎫 쿠폰 생성하기'):
     )
     
     async def on_submit(self, interaction: discord.Interaction):
-        """모달 제출 시 쿠폰 생성"""
+        """모달 제출 시 쿠폰 생성 (명령어 대기열을 거쳐 실행)"""
+        ticket = await acquire_interaction_slot(self.command_scheduler, interaction, 'coupon_create')
+        if ticket is None:
+            return
+        try:
+            await self._process_submit(interaction)
+        finally:
+            self.command_scheduler.release(ticket)
+    
+    async def _process_submit(self, interaction: discord.Interaction):
+        """쿠폰 생성"""
         try:
-            # 즉시 응답하여 타임아웃 방지
-            await interaction.response.defer(ephemeral=True)
-            
             # 입력값 검증
             lumber_value = self.lumber.value.strip()
             gold_value = self.gold.value.strip()
@@ -529,7 +650,7 @@ class CouponCreateModal(ui.Modal, title='🎫 쿠폰 생성하기'):
             await interaction.followup.send(embed=processing_embed, ephemeral=True)
             
             # 쿠폰 생성 실행
-            success, response = create_coupon_simple(lumber_int, gold_int)
+            success, response = await self.coupon_processor.create_coupon(lumber_int, gold_int)
             
             # 결과 처리
             if success and response.is_success:
@@ -606,17 +727,18 @@ class CouponCreateModal(ui.Modal, title='🎫 쿠폰 생성하기'):
                 await interaction.followup.send(embed=error_embed, ephemeral=True)
 
 
-class PartyListView(ui.View):
+class PartyListView(TimedView):
     """파티 찾기 UI"""
     
-    def __init__(self, raid_system, current_parties, user_id):
+    def __init__(self, raid_system, current_parties, user_id, scheduler):
         super().__init__(timeout=300)
         self.raid_system = raid_system
         self.current_parties = current_parties
         self.user_id = user_id
+        self.scheduler = scheduler
         
         # 파티별 참가 버튼 생성 (최대 25개 버튼 제한)
-        for i, party in enumerate(current_parties[:20]):  # 최대 20개 파티만 표시
+        for i, party in enumerate(current_parties[:PARTY_LIST_LIMIT]):  # 최대 20개 파티만 표시
             button = ui.Button(
                 label=f"{party.raid_name} ({len(party.current_members)}/{party.max_members})",
                 style=discord.ButtonStyle.primary,
@@ -656,7 +778,7 @@ class PartyListView(ui.View):
                 success = self.raid_system.join_party(party_id, self.user_id)
                 if success:
                     # 파티 참가 성공 시 해당 레이드 대기 목록에서 제거
-                    was_waiting = self.user_id in self.raid_system.get_raid_participants(party.raid_name)
+                    was_waiting = self.raid_system.is_user_waiting(party.raid_name, self.user_id)
                     if was_waiting:
                         self.raid_system.toggle_raid_participation(party.raid_name, self.user_id)
                     
@@ -689,18 +811,8 @@ class PartyListView(ui.View):
                     
                     await interaction.response.send_message(embed=embed, ephemeral=True)
                     
-                    # 백그라운드에서 10초 후 메시지 자동 삭제
-                    async def delete_after_delay():
-                        import asyncio
-                        await asyncio.sleep(10)
-                        try:
-                            await interaction.delete_original_response()
-                        except:
-                            pass  # 이미 삭제된 경우 무시
-                    
-                    # 백그라운드 태스크로 실행
-                    import asyncio
-                    asyncio.create_task(delete_after_delay())
+                    # 10초 후 메시지 자동 삭제
+                    self.scheduler.delete_response_later(interaction, 10)
                 else:
                     await interaction.response.send_message("❌ 파티 참가에 실패했습니다.", ephemeral=True)
                 
@@ -714,7 +826,8 @@ class PartyListView(ui.View):
         """파티 목록 새로고침"""
         try:
             # 새로운 파티 목록 가져오기
-            new_parties = self.raid_system.get_active_parties()
+            new_parties = self.raid_system.get_active_parties(limit=PARTY_LIST_LIMIT)
+            total_parties = self.raid_system.count_active_parties()
             
             if not new_parties:
                 embed = discord.Embed(
@@ -737,7 +850,7 @@ class PartyListView(ui.View):
             # UI 갱신
             embed = discord.Embed(
                 title="👥 파티 찾기",
-                description=f"현재 {len(new_parties)}개의 파티가 모집 중입니다.",
+                description=f"현재 {total_parties}개의 파티가 모집 중입니다.",
                 color=0x3498db
             )
             
@@ -748,11 +861,11 @@ class PartyListView(ui.View):
                     inline=True
                 )
             
-            if len(new_parties) > 10:
-                embed.set_footer(text=f"+ {len(new_parties) - 10}개의 추가 파티가 있습니다.")
+            if total_parties > 10:
+                embed.set_footer(text=f"+ {total_parties - 10}개의 추가 파티가 있습니다.")
             
             # 새로운 뷰로 업데이트
-            new_view = PartyListView(self.raid_system, new_parties, self.user_id)
+            new_view = PartyListView(self.raid_system, new_parties, self.user_id, self.scheduler)
             await interaction.response.edit_message(embed=embed, view=new_view)
             
         except Exception as e:
@@ -760,13 +873,14 @@ class PartyListView(ui.View):
             await interaction.response.send_message(f"❌ 파티 목록 새로고침 중 오류 발생: {e}", ephemeral=True)
 
 
-class PartyManagementView(ui.View):
+class PartyManagementView(TimedView):
     """사용자의 파티 관리를 위한 뷰"""
     
-    def __init__(self, raid_system, user_id, led_parties, joined_parties):
+    def __init__(self, raid_system, user_id, led_parties, joined_parties, dm_dispatcher):
         super().__init__(timeout=300)
         self.raid_system = raid_system
         self.user_id = user_id
+        self.dm_dispatcher = dm_dispatcher
         self.led_parties = led_parties
         self.joined_parties = joined_parties
         
@@ -867,83 +981,71 @@ class PartyManagementView(ui.View):
                 # 파티 모집 종료 (레이드 시작)
                 success = self.raid_system.close_party_recruitment(party_id)
                 if success:
-                    # 리더에게 성공 메시지
+                    # 리더에게 성공 메시지 (DM 발송 결과는 발송이 끝난 뒤 후속 메시지로 전달)
                     leader_embed = discord.Embed(
                         title="✅ 레이드 시작 완료",
-                        description=f"**{party.raid_name}** 레이드가 시작되었습니다!\n모든 파티원에게 개인 메시지를 발송했습니다.",
+                        description=f"**{party.raid_name}** 레이드가 시작되었습니다!\n모든 파티원에게 개인 메시지를 발송하고 있습니다.",
                         color=0x00ff00
                     )
                     
-                    # 각 파티원에게 개인 DM 발송
-                    sent_count = 0
-                    failed_count = 0
+                    # 파티원 DM 생성 (모든 파티원에게 같은 임베드 재사용)
+                    leader = interaction.guild.get_member(party.leader_id)
+                    dm_embed = discord.Embed(
+                        title="🚀 레이드 시작 알림",
+                        description=f"참가하신 **{party.raid_name}** 레이드가 시작되었습니다!",
+                        color=0x00ff00
+                    )
                     
-                    for user_id in party.current_members:
-                        try:
-                            user = interaction.guild.get_member(user_id)
-                            if user:
-                                dm_embed = discord.Embed(
-                                    title="🚀 레이드 시작 알림",
-                                    description=f"참가하신 **{party.raid_name}** 레이드가 시작되었습니다!",
-                                    color=0x00ff00
-                                )
-                                
-                                dm_embed.add_field(
-                                    name="🎯 레이드 정보",
-                                    value=f"**레이드**: {party.raid_name}\n**방제**: {party.room_title}\n**파티원**: {len(party.current_members)}명\n**리더**: {interaction.guild.get_member(party.leader_id).display_name if interaction.guild.get_member(party.leader_id) else 'Unknown'}",
-                                    inline=False
-                                )
-                                
-                                # 파티원 목록 (DM용)
-                                member_names = []
-                                for member_id in party.current_members:
-                                    member = interaction.guild.get_member(member_id)
-                                    if member:
-                                        if member_id == party.leader_id:
-                                            member_names.append(f"👑 {member.display_name}")
-                                        else:
-                                            member_names.append(f"• {member.display_name}")
-                                
-                                dm_embed.add_field(
-                                    name="👥 파티원",
-                                    value="\n".join(member_names),
-                                    inline=False
-                                )
-                                
-                                dm_embed.add_field(
-                                    name="💡 안내",
-                                    value="레이드를 즐겨주세요! 파티원들과 함께 멋진 레이드를 완주하시길 바랍니다.",
-                                    inline=False
-                                )
-                                
-                                dm_embed.set_footer(text=f"서버: {interaction.guild.name}")
-                                
-                                await user.send(embed=dm_embed)
-                                sent_count += 1
+                    dm_embed.add_field(
+                        name="🎯 레이드 정보",
+                        value=f"**레이드**: {party.raid_name}\n**방제**: {party.room_title}\n**파티원**: {len(party.current_members)}명\n**리더**: {leader.display_name if leader else 'Unknown'}",
+                        inline=False
+                    )
+                    
+                    # 파티원 목록 (DM용)
+                    member_names = []
+                    for member_id in party.current_members:
+                        member = interaction.guild.get_member(member_id)
+                        if member:
+                            if member_id == party.leader_id:
+                                member_names.append(f"👑 {member.display_name}")
                             else:
-                                failed_count += 1
-                        except discord.Forbidden:
-                            # DM을 받을 수 없는 사용자
-                            failed_count += 1
-                        except Exception as e:
-                            logger.error(f"DM 발송 중 오류 (user_id: {user_id}): {e}")
-                            failed_count += 1
+                                member_names.append(f"• {member.display_name}")
                     
-                    # 발송 결과 추가
-                    leader_embed.add_field(
-                        name="📨 발송 결과",
-                        value=f"✅ 성공: {sent_count}명\n❌ 실패: {failed_count}명",
+                    dm_embed.add_field(
+                        name="👥 파티원",
+                        value="\n".join(member_names),
                         inline=False
                     )
                     
-                    if failed_count > 0:
-                        leader_embed.add_field(
-                            name="⚠️ 알림",
-                            value="일부 파티원에게 DM을 보낼 수 없었습니다. (DM 차단 또는 설정 문제)",
-                            inline=False
-                        )
+                    dm_embed.add_field(
+                        name="💡 안내",
+                        value="레이드를 즐겨주세요! 파티원들과 함께 멋진 레이드를 완주하시길 바랍니다.",
+                        inline=False
+                    )
+                    
+                    dm_embed.set_footer(text=f"서버: {interaction.guild.name}")
                     
                     await interaction.response.send_message(embed=leader_embed, ephemeral=True)
+                    
+                    async def report(result):
+                        result_embed = discord.Embed(
+                            title="📨 발송 결과",
+                            description=f"✅ 성공: {result.sent}명\n❌ 실패: {result.failed}명",
+                            color=0x00ff00 if result.failed == 0 else 0xf39c12
+                        )
+                        if result.failed > 0:
+                            result_embed.add_field(
+                                name="⚠️ 알림",
+                                value="일부 파티원에게 DM을 보낼 수 없었습니다. (DM 차단 또는 설정 문제)",
+                                inline=False
+                            )
+                        await interaction.followup.send(embed=result_embed, ephemeral=True)
+                    
+                    self.dm_dispatcher.dispatch_background(
+                        party.current_members, dm_embed, guild=interaction.guild,
+                        route='raid_start', on_complete=report
+                    )
                 else:
                     await interaction.response.send_message("❌ 레이드 시작에 실패했습니다.", ephemeral=True)
                 
@@ -1015,7 +1117,7 @@ class PartyManagementView(ui.View):
         return leave_callback
 
 
-class RejoinWaitingView(ui.View):
+class RejoinWaitingView(TimedView):
     """파티 탈퇴 후 레이드 대기 재등록 뷰"""
     
     def __init__(self, raid_system, user_id, raid_name):
@@ -1029,7 +1131,7 @@ class RejoinWaitingView(ui.View):
         """레이드 대기 재등록 버튼"""
         try:
             # 이미 대기 중인지 확인
-            if self.user_id in self.raid_system.get_raid_participants(self.raid_name):
+            if self.raid_system.is_user_waiting(self.raid_name, self.user_id):
                 await interaction.response.send_message("❌ 이미 해당 레이드 대기 목록에 등록되어 있습니다.", ephemeral=True)
                 return
             
@@ -1087,7 +1189,7 @@ class RejoinWaitingView(ui.View):
             pass
 
 
-class RaidSelectionView(ui.View):
+class RaidSelectionView(TimedView):
     """레이드 선택 토글 UI"""
     
     def __init__(self, raid_system: RaidWaitingSystem, user_id: int):
@@ -1097,9 +1199,7 @@ class RaidSelectionView(ui.View):
         self.selected_raids = set()  # 선택된 레이드들
         
         # 현재 사용자가 대기 중인 레이드들 확인
-        for raid_name in self.raid_system.get_all_raids():
-            if user_id in self.raid_system.get_raid_participants(raid_name):
-                self.selected_raids.add(raid_name)
+        self.selected_raids.update(self.raid_system.get_user_raids(user_id))
         
         # 레이드별 토글 버튼 생성
         raid_names = self.raid_system.get_all_raids()
@@ -1156,7 +1256,7 @@ class RaidSelectionView(ui.View):
     async def submit_selection(self, interaction: discord.Interaction):
         """선택 내용 제출"""
         # 기존 대기 목록에서 사용자 제거
-        for raid_name in self.raid_system.get_all_raids():
+        for raid_name in self.raid_system.get_user_raids(self.user_id):
             self.raid_system.remove_from_raid(raid_name, self.user_id)
         
         # 새로 선택된 레이드에 사용자 추가
@@ -1199,24 +1299,24 @@ class RaidSelectionView(ui.View):
         await interaction.response.edit_message(embed=embed, view=self)
 
 
-class RaidControlView(ui.View):
+class RaidControlView(TimedView):
     """레이드 제어 버튼을 제공하는 Persistent View"""
     
-    def __init__(self, raid_system: RaidWaitingSystem):
+    def __init__(self, raid_registry: GuildRaidRegistry, dm_dispatcher: DMDispatcher, scheduler: TaskScheduler):
         super().__init__(timeout=None)  # persistent view는 timeout 없음
-        self.raid_system = raid_system
+        self.raid_registry = raid_registry  # 모든 길드가 같은 View를 공유하므로 상호작용마다 길드 시스템 조회
+        self.dm_dispatcher = dm_dispatcher
+        self.scheduler = scheduler
     
     @ui.button(label="레이드 대기 등록", style=discord.ButtonStyle.primary, emoji="🎯", custom_id="raid_wait_button")
     async def raid_wait_button(self, interaction: discord.Interaction, button: ui.Button):
         """레이드 대기 등록 버튼"""
         try:
+            raid_system = self.raid_registry.get(interaction.guild_id)
             user_id = interaction.user.id
             
             # 현재 대기 중인 레이드 확인
-            current_raids = []
-            for raid_name in self.raid_system.get_all_raids():
-                if user_id in self.raid_system.get_raid_participants(raid_name):
-                    current_raids.append(raid_name)
+            current_raids = raid_system.get_user_raids(user_id)
             
             embed = discord.Embed(
                 title="🎯 레이드 대기 등록",
@@ -1232,7 +1332,7 @@ class RaidControlView(ui.View):
                     inline=False
                 )
             
-            view = RaidSelectionView(self.raid_system, user_id)
+            view = RaidSelectionView(raid_system, user_id)
             await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
             
         except Exception as e:
@@ -1243,10 +1343,11 @@ class RaidControlView(ui.View):
     async def helper_wait_button(self, interaction: discord.Interaction, button: ui.Button):
         """헬퍼 대기 등록 버튼"""
         try:
+            raid_system = self.raid_registry.get(interaction.guild_id)
             user_id = interaction.user.id
             
             # 헬퍼 대기 상태 토글
-            is_helper = self.raid_system.toggle_helper_participation(user_id)
+            is_helper = raid_system.toggle_helper_participation(user_id)
             
             if is_helper:
                 embed = discord.Embed(
@@ -1276,8 +1377,9 @@ class RaidControlView(ui.View):
     async def party_recruit_button(self, interaction: discord.Interaction, button: ui.Button):
         """파티 모집하기 버튼"""
         try:
+            raid_system = self.raid_registry.get(interaction.guild_id)
             # 레이드 선택 뷰 생성
-            raid_select_view = RaidSelectView(self.raid_system, interaction.user.id)
+            raid_select_view = RaidSelectView(raid_system, interaction.user.id, self.dm_dispatcher, self.scheduler)
             
             # 사용 가능한 레이드가 있는지 확인
             if not hasattr(raid_select_view, 'raid_select'):
@@ -1307,8 +1409,10 @@ class RaidControlView(ui.View):
     async def party_find_button(self, interaction: discord.Interaction, button: ui.Button):
         """파티 찾기 버튼"""
         try:
+            raid_system = self.raid_registry.get(interaction.guild_id)
             # 현재 모집 중인 파티 목록 가져오기
-            active_parties = self.raid_system.get_active_parties()
+            active_parties = raid_system.get_active_parties(limit=PARTY_LIST_LIMIT)
+            total_parties = raid_system.count_active_parties()
             
             if not active_parties:
                 embed = discord.Embed(
@@ -1327,22 +1431,22 @@ class RaidControlView(ui.View):
             # 파티 목록 표시
             embed = discord.Embed(
                 title="👥 파티 찾기",
-                description=f"현재 {len(active_parties)}개의 파티가 모집 중입니다.",
+                description=f"현재 {total_parties}개의 파티가 모집 중입니다.",
                 color=0x3498db
             )
             
             for i, party in enumerate(active_parties[:10]):  # 최대 10개 파티 정보 표시
                 embed.add_field(
                     name=f"🎯 {party.raid_name}",
-                    value=self.raid_system.format_party_info(party, interaction.guild),
+                    value=raid_system.format_party_info(party, interaction.guild),
                     inline=True
                 )
             
-            if len(active_parties) > 10:
-                embed.set_footer(text=f"+ {len(active_parties) - 10}개의 추가 파티가 있습니다.")
+            if total_parties > 10:
+                embed.set_footer(text=f"+ {total_parties - 10}개의 추가 파티가 있습니다.")
             
             # 파티 참가 UI 표시
-            view = PartyListView(self.raid_system, active_parties, interaction.user.id)
+            view = PartyListView(raid_system, active_parties, interaction.user.id, self.scheduler)
             await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
             
         except Exception as e:
@@ -1353,64 +1457,8 @@ class RaidControlView(ui.View):
     async def raid_room_button(self, interaction: discord.Interaction, button: ui.Button):
         """대기방 현황 버튼"""
         try:
-            embed = discord.Embed(
-                title="🏛️ 레이드 대기방 현황",
-                description="각 레이드별 대기자 목록입니다",
-                color=0x9b59b6
-            )
-            
-            # 각 레이드별 대기자 정보 추가
-            has_participants = False
-            for raid_name in self.raid_system.get_all_raids():
-                participants = self.raid_system.get_raid_participants(raid_name)
-                if participants:
-                    has_participants = True
-                    participant_mentions = []
-                    for user_id in participants:
-                        try:
-                            user = interaction.guild.get_member(user_id)
-                            if user:
-                                participant_mentions.append(user.display_name)
-                            else:
-                                participant_mentions.append(f"Unknown User ({user_id})")
-                        except:
-                            participant_mentions.append(f"Unknown User ({user_id})")
-                    
-                    embed.add_field(
-                        name=f"🎯 {raid_name}",
-                        value=f"**대기자 {len(participants)}명**\n" + "\n".join([f"• {name}" for name in participant_mentions[:5]]) + 
-                              (f"\n... 외 {len(participants)-5}명" if len(participants) > 5 else ""),
-                        inline=True
-                    )
-            
-            # 헬퍼 대기자 정보 추가
-            helpers = self.raid_system.get_helper_participants()
-            if helpers:
-                has_participants = True
-                helper_mentions = []
-                for user_id in helpers:
-                    try:
-                        user = interaction.guild.get_member(user_id)
-                        if user:
-                            helper_mentions.append(user.display_name)
-                        else:
-                            helper_mentions.append(f"Unknown User ({user_id})")
-                    except:
-                        helper_mentions.append(f"Unknown User ({user_id})")
-                
-                embed.add_field(
-                    name="🤝 헬퍼 대기",
-                    value=f"**헬퍼 {len(helpers)}명**\n" + "\n".join([f"• {name}" for name in helper_mentions[:5]]) + 
-                          (f"\n... 외 {len(helpers)-5}명" if len(helpers) > 5 else ""),
-                    inline=True
-                )
-            
-            if not has_participants:
-                embed.add_field(
-                    name="📭 현재 상황",
-                    value="아직 대기 중인 사용자가 없습니다.\n\n레이드 대기 등록을 해보세요!",
-                    inline=False
-                )
+            # 바뀐 레이드만 다시 그리는 현황판 캐시 사용
+            embed = self.raid_registry.get_board(interaction.guild_id).build_embed(interaction.guild)
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
@@ -1422,11 +1470,12 @@ class RaidControlView(ui.View):
     async def party_manage_button(self, interaction: discord.Interaction, button: ui.Button):
         """내 파티 관리 버튼"""
         try:
+            raid_system = self.raid_registry.get(interaction.guild_id)
             user_id = interaction.user.id
             
             # 사용자가 리더인 파티와 참가 중인 파티 확인
-            led_parties = self.raid_system.get_user_led_parties(user_id)
-            joined_parties = self.raid_system.get_user_joined_parties(user_id)
+            led_parties = raid_system.get_user_led_parties(user_id)
+            joined_parties = raid_system.get_user_joined_parties(user_id)
             
             if not led_parties and not joined_parties:
                 embed = discord.Embed(
@@ -1443,7 +1492,7 @@ class RaidControlView(ui.View):
                 return
             
             # 파티 관리 뷰 표시
-            view = PartyManagementView(self.raid_system, user_id, led_parties, joined_parties)
+            view = PartyManagementView(raid_system, user_id, led_parties, joined_parties, self.dm_dispatcher)
             
             embed = discord.Embed(
                 title="⚙️ 내 파티 관리",
@@ -1482,8 +1531,8 @@ class RaidControlView(ui.View):
             
             active_raids = 0
             
-            for raid_name in self.raid_system.get_all_raids():
-                waiting_users = self.raid_system.get_raid_participants(raid_name)
+            for raid_name in raid_system.get_all_raids():
+                waiting_users = raid_system.get_raid_participants(raid_name)
                 
                 if waiting_users:
                     active_raids += 1
@@ -1537,7 +1586,7 @@ class RaidControlView(ui.View):
                     )
             
             # 헬퍼 대기자 목록 추가
-            helper_participants = self.raid_system.get_helper_participants()
+            helper_participants = raid_system.get_helper_participants()
             if helper_participants:
                 helper_list = []
                 for user_id in helper_participants:
@@ -1896,7 +1945,7 @@ class SaveCodeBot:
             await interaction.response.send_message(f"❌ 처리 중 오류 발생: {e}", ephemeral=True)
 
 
-class CustomSaveCodeModal(ui.Modal, title='📊 커스텀 세이브코드 생성'):
+class CustomSaveCodeModal(TimedModal, title='📊 커스텀 세이브코드 생성'):
     """커스텀 세이브코드 생성 모달"""
     
     def __init__(self, encoder, player_name):
@@ -1999,6 +2048,115 @@ class CustomSaveCodeModal(ui.Modal, title='📊 커스텀 세이브코드 생성
 #         await interaction.response.send_modal(modal)
 
 
+class MetricsContext(commands.Context):
+    """명령어 메시지를 받은 시각과 첫 응답 시각을 기록하는 Context (응답 시간 지표용)"""
+    
+    received_at: float = 0.0
+    first_response_at: Optional[float] = None
+    
+    async def send(self, *args, **kwargs):
+        message = await super().send(*args, **kwargs)
+        if self.first_response_at is None:
+            self.first_response_at = time.perf_counter()
+        return message
+
+
+class ShutdownHookBot(commands.Bot):
+    """연결을 닫기 전에 등록된 정리 작업을 실행하는 Bot"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shutdown_hooks = []  # 종료 시 실행할 비동기 함수 목록
+    
+    async def get_context(self, origin, /, *, cls=MetricsContext):
+        ctx = await super().get_context(origin, cls=cls)
+        ctx.received_at = time.perf_counter()
+        return ctx
+    
+    async def close(self):
+        hooks, self.shutdown_hooks = self.shutdown_hooks, []
+        for hook in hooks:
+            try:
+                await hook()
+            except Exception as e:
+                logger.error(f"종료 작업 실행 중 오류: {e}")
+        await super().close()
+
+
+class LoadResultView(TimedView):
+    """/로드 결과 페이지 이동 뷰 (페이지는 분석 결과로 요청 시 생성, 만든 임베드는 캐시된 결과에 보관)"""
+
+    def __init__(self, bot_instance, user_id, result: CachedResult):
+        super().__init__(timeout=300)
+        self.bot = bot_instance
+        self.user_id = user_id
+        self.result = result
+        self.analyses = result.analyses
+        self.pager = EmbedPager(len(self.analyses), self._build_embed, result.header)
+        self.page_index = 0
+        self.message = None
+
+    def _build_embed(self, index: int) -> discord.Embed:
+        embed = self.result.rendered.get(index)
+        if embed is None:
+            embed = self.result.rendered[index] = self.bot._build_load_embed(self.analyses[index])
+        return embed
+
+    def update_buttons(self):
+        """현재 페이지에 맞춰 이전/다음 버튼 상태 갱신"""
+        self.prev_button.disabled = self.page_index == 0
+        self.next_button.disabled = not self.pager.has_next(self.page_index)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("❌ 명령어를 실행한 사용자만 페이지를 넘길 수 있습니다.", ephemeral=True)
+            return False
+        return True
+
+    async def _show_page(self, interaction: discord.Interaction, page_index: int):
+        self.page_index = page_index
+        embeds, _, _ = self.pager.page(page_index)
+        self.update_buttons()
+        await interaction.response.edit_message(embeds=embeds, view=self)
+
+    @ui.button(label="◀ 이전", style=discord.ButtonStyle.secondary)
+    async def prev_button(self, interaction: discord.Interaction, button: ui.Button):
+        """이전 페이지"""
+        await self._show_page(interaction, max(0, self.page_index - 1))
+
+    @ui.button(label="다음 ▶", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: ui.Button):
+        """다음 페이지"""
+        await self._show_page(interaction, self.page_index + 1)
+
+    @ui.button(label="📎 CSV 받기", style=discord.ButtonStyle.primary)
+    async def csv_button(self, interaction: discord.Interaction, button: ui.Button):
+        """전체 결과 CSV 파일 받기"""
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        try:
+            await self.bot._ensure_load_csv(
+                self.result, self.bot._compute_deadline(interaction.created_at, INTERACTION_TOKEN_TTL)
+            )
+        except ComputeQueueFullError:
+            await interaction.followup.send(COMPUTE_BUSY_MESSAGE, ephemeral=True)
+            return
+        except ComputeExpiredError:
+            return  # 상호작용이 만료되어 응답할 수 없음
+        await interaction.followup.send(
+            f"📎 세이브코드 {len(self.analyses)}개 분석 결과",
+            file=self.bot._build_load_csv_file(self.result.csv_text),
+            ephemeral=True
+        )
+
+    async def on_timeout(self):
+        # 시간이 지난 버튼은 눌러도 응답하지 않으므로 메시지에서 제거
+        if self.message is not None:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException:
+                pass
+
+
 class SaveCodeBot:
     """디스코드 세이브코드 봇 클래스"""
     
@@ -2010,11 +2168,48 @@ class SaveCodeBot:
         self.item_db = ItemDatabase()  # 아이템 데이터베이스 초기화
         self.graduation_checker = GraduationChecker()  # 졸업 조건 확인기 초기화
 
-        self.raid_system = RaidWaitingSystem()  # 레이드 대기 시스템 초기화
+        # 길드별 레이드 대기 시스템 (처음 사용하는 길드에서 생성, 저장된 길드는 미리 복원)
+        self.raid_matchmakers = {}  # {guild_id: RaidMatchmaker} (자동 매칭 사용 시)
+        self._party_expiry_wakeup = None  # 더 이른 만료/알림 작업이 생기면 만료 루프를 깨움 (루프 시작 시 생성)
+        self.raid_registry = GuildRaidRegistry(
+            state_dir=self.config.RAID_STATE_DIR,
+            fsync_interval=self.config.RAID_STATE_FSYNC_INTERVAL,
+            snapshot_every=self.config.RAID_STATE_SNAPSHOT_EVERY,
+            party_timeout_minutes=self.config.RAID_TIMEOUT_MINUTES,
+            purge_grace_minutes=self.config.RAID_PARTY_PURGE_MINUTES,
+            catalog_path=self.config.RAID_CATALOG_FILE,
+            reminder_minutes=self.config.RAID_REMINDER_MINUTES,
+            no_show_grace_minutes=self.config.RAID_NO_SHOW_MINUTES,
+            legacy_guild_id=self.config.RAID_STATE_LEGACY_GUILD_ID,
+            on_create=self._setup_guild_raid_system
+        )
+        self.raid_registry.load_saved()
+        self.raid_status = None
+        if self.config.RAID_STATUS_MESSAGE:
+            self.raid_status = RaidStatusMessage(
+                debounce_seconds=self.config.RAID_STATUS_DEBOUNCE,
+                min_edit_interval=self.config.RAID_STATUS_MIN_EDIT_INTERVAL
+            )
+        self._raid_state_task = None
+        self._party_expiry_task = None
+        self._coupon_outbox_task = None
         # summon_chunk_n None이면 자동 감지
         self.savecode_manager = SaveCodeManager(summon_chunk_n=getattr(self.config, "SUMMON_CHUNK_N", None))
+        # /로드, /검증, /아이템 공용 분석기 (코드당 파싱 1회)
+        self.save_analyzer = SaveAnalyzer(
+            item_db=self.item_db,
+            savecode_manager=self.savecode_manager,
+            graduation_checker=self.graduation_checker,
+            save_value_length=self.config.UDG_SAVE_VALUE_LENGTH,
+            summon_chunk_n=self.config.SUMMON_CHUNK_N
+        )
+        # 같은 이름/세이브코드 목록의 /로드, /검증 결과 재사용 (아이템/졸업 조건을 다시 로드하면 비워짐)
+        self.result_cache = ResultCache(
+            ttl=self.config.RESULT_CACHE_TTL,
+            max_entries=self.config.RESULT_CACHE_MAX_ENTRIES
+        )
+
 
-        
         # 봇 인텐트 설정
         intents = discord.Intents.default()
         intents.messages = True
@@ -2022,8 +2217,95 @@ class SaveCodeBot:
         intents.guilds = True  # 길드 정보 접근
         intents.members = True  # 멤버 정보 접근 (특권 인텐트)
         
-        # 봇 인스턴스 생성
-        self.bot = commands.Bot(command_prefix=self.config.COMMAND_PREFIX, intents=intents)
+        # 봇 인스턴스 생성 (지표를 켜면 상호작용 첫 응답 시각을 HTTP 요청 추적으로 기록)
+        self.bot = ShutdownHookBot(
+            command_prefix=self.config.COMMAND_PREFIX,
+            intents=intents,
+            http_trace=bot_metrics.trace_config() if self.config.METRICS_PORT else None
+        )
+        
+        # 파티 알림/레이드 시작 등 DM 일괄 발송기 (전체 봇 공용)
+        self.dm_dispatcher = DMDispatcher(
+            self.bot,
+            concurrency=self.config.DM_CONCURRENCY,
+            global_rate=self.config.DM_GLOBAL_RATE,
+            default_route_rate=(self.config.DM_ROUTE_RATE, self.config.DM_ROUTE_RATE)
+        )
+        self.bot.shutdown_hooks.append(self.dm_dispatcher.shutdown)
+        
+        # 임시 메시지 삭제/수정 등 지연 작업 스케줄러 (종료 시 남은 작업을 바로 실행해 정리)
+        self.scheduler = TaskScheduler(max_in_flight=self.config.SCHEDULER_MAX_IN_FLIGHT)
+        self.bot.shutdown_hooks.append(self.scheduler.shutdown)
+        
+        # 세이브코드 일괄 분석/아이템 검색 등 CPU 작업 실행기 (이벤트 루프가 멈추지 않도록)
+        self.compute = ComputeDispatcher(
+            executor=self.config.COMPUTE_EXECUTOR,
+            max_workers=self.config.COMPUTE_WORKERS,
+            max_queue=self.config.COMPUTE_MAX_QUEUE,
+            inline_max=self.config.COMPUTE_INLINE_MAX
+        )
+        self.bot.shutdown_hooks.append(functools.partial(self.compute.shutdown, wait=True))
+        
+        # 무거운 명령어/쿠폰 모달 공정 대기열 (사용자별 라운드 로빈, 관리자 우선)
+        self.command_scheduler = CommandScheduler(
+            max_concurrent=self.config.COMMAND_MAX_CONCURRENT,
+            user_concurrency=self.config.COMMAND_USER_CONCURRENCY,
+            guild_concurrency=self.config.COMMAND_GUILD_CONCURRENCY,
+            user_rate=self.config.COMMAND_USER_RATE / 60,
+            user_burst=self.config.COMMAND_USER_BURST,
+            guild_rate=self.config.COMMAND_GUILD_RATE / 60,
+            guild_burst=self.config.COMMAND_GUILD_BURST,
+            max_queue=self.config.COMMAND_MAX_QUEUE,
+            max_user_queue=self.config.COMMAND_MAX_USER_QUEUE
+        )
+        
+        # 쿠폰 API 클라이언트 (연결 풀을 유지하는 세션 하나를 봇 전체에서 공유,
+        # 세이브코드 수정에는 봇의 디코더/인코더를 그대로 사용)
+        self.coupon_check_cache = CouponCheckCache(
+            negative_ttl=self.config.COUPON_NEGATIVE_CACHE_TTL,
+            max_entries=self.config.COUPON_CACHE_MAX_ENTRIES
+        )
+        # 실패한 쿠폰 사용 처리는 SQLite 아웃박스에 남겨 재시도 (재시작해도 이어서 처리)
+        self.coupon_outbox = None
+        if self.config.COUPON_OUTBOX_PATH:
+            self.coupon_outbox = CouponOutbox(
+                self.config.COUPON_OUTBOX_PATH,
+                base_delay=self.config.COUPON_OUTBOX_BASE_DELAY,
+                max_delay=self.config.COUPON_OUTBOX_MAX_DELAY
+            )
+        # 쿠폰 서버 장애 시 바로 실패/재시도 제한/동시 요청 제한 (통계는 /쿠폰상태에서 확인)
+        self.coupon_resilience = CouponResilience(
+            failure_threshold=self.config.COUPON_BREAKER_THRESHOLD,
+            reset_timeout=self.config.COUPON_BREAKER_RESET,
+            max_retries=self.config.COUPON_MAX_RETRIES,
+            retry_base_delay=self.config.COUPON_RETRY_BASE_DELAY,
+            retry_budget_ratio=self.config.COUPON_RETRY_BUDGET_RATIO,
+            max_in_flight=self.config.COUPON_MAX_IN_FLIGHT
+        )
+        self.coupon_processor = AsyncCouponProcessor(
+            base_url=self.config.COUPON_API_URL,
+            timeout=self.config.COUPON_TIMEOUT,
+            connect_timeout=self.config.COUPON_CONNECT_TIMEOUT,
+            pool_size=self.config.COUPON_POOL_SIZE,
+            modifier=LumberModifier(self.decoder, self.encoder),
+            check_cache=self.coupon_check_cache,
+            outbox=self.coupon_outbox,
+            resilience=self.coupon_resilience,
+            max_redeeming_codes=self.config.COUPON_MAX_REDEEMING_CODES
+        )
+        self.bot.shutdown_hooks.append(self._stop_coupon_outbox)
+        self.bot.shutdown_hooks.append(self.coupon_processor.close)
+        
+        # Prometheus 지표 (포트를 지정한 경우에만 지표 서버와 이벤트 루프 지연 측정을 on_ready에서 시작,
+        # 쿠폰 API/대기열 통계는 수집 요청이 올 때만 읽음)
+        self.metrics_server = None
+        self.loop_lag_monitor = None
+        if self.config.METRICS_PORT:
+            self.metrics_server = MetricsServer(bot_metrics.registry, self.config.METRICS_HOST, self.config.METRICS_PORT)
+            self.loop_lag_monitor = LoopLagMonitor(bot_metrics, self.config.METRICS_LOOP_LAG_INTERVAL)
+            self.bot.shutdown_hooks.append(self.loop_lag_monitor.stop)
+            self.bot.shutdown_hooks.append(self.metrics_server.stop)
+        bot_metrics.registry.add_collector(self._collect_metrics)
         
         # Persistent View는 on_ready에서 생성
         self.raid_control_view = None
@@ -2031,6 +2313,59 @@ class SaveCodeBot:
         self._setup_events()
         self._setup_commands()
     
+    async def _stop_coupon_outbox(self):
+        """쿠폰 아웃박스 워커 중지 및 DB 닫기 (남은 호출은 다음 실행 때 재시도)"""
+        if self._coupon_outbox_task is not None:
+            self._coupon_outbox_task.cancel()
+            try:
+                await self._coupon_outbox_task
+            except asyncio.CancelledError:
+                pass
+            self._coupon_outbox_task = None
+        if self.coupon_outbox is not None:
+            self.coupon_outbox.close()
+    
+    def _observe_command(self, ctx: commands.Context, outcome: str):
+        """명령어 첫 응답/전체 처리 시간 기록"""
+        received_at = getattr(ctx, 'received_at', 0.0)
+        if received_at:
+            bot_metrics.observe_command(ctx.command.qualified_name, received_at,
+                                        getattr(ctx, 'first_response_at', None), outcome)
+    
+    def _collect_metrics(self):
+        """수집 요청 시 다른 모듈의 통계를 지표로 변환 (쿠폰 API, 레이드/명령어/CPU 작업 대기열, 결과 캐시)"""
+        coupon = self.coupon_resilience.get_stats()
+        yield ('savebot_coupon_api_requests_total', 'counter', '쿠폰 API 요청 수 (재시도 포함)',
+               [({'endpoint': label}, stats['requests']) for label, stats in coupon['endpoints'].items()])
+        yield ('savebot_coupon_api_errors_total', 'counter', '쿠폰 API 오류 수 (오류 종류별)',
+               [({'endpoint': label, 'kind': kind}, count)
+                for label, stats in coupon['endpoints'].items() for kind, count in stats['errors'].items()]
+               + [({'endpoint': 'all', 'kind': reason}, count) for reason, count in coupon['rejected'].items()])
+        yield ('savebot_coupon_circuit_open', 'gauge', '쿠폰 API 서킷 브레이커가 열려 있으면 1',
+               [({}, 0 if coupon['circuit_state'] == 'closed' else 1)])
+        
+        waiting = {}
+        helpers = 0
+        for _, raid_system in self.raid_registry.items():
+            for raid_name, user_ids in raid_system.waiting_lists.items():
+                waiting[raid_name] = waiting.get(raid_name, 0) + len(user_ids)
+            helpers += len(raid_system.helper_waiting_list)
+        yield ('savebot_raid_waiting', 'gauge', '레이드별 대기 인원 (전체 길드 합계)',
+               [({'raid': raid_name}, count) for raid_name, count in sorted(waiting.items())])
+        yield ('savebot_raid_helpers_waiting', 'gauge', '헬퍼 대기 인원 (전체 길드 합계)', [({}, helpers)])
+        
+        scheduler = self.command_scheduler.get_stats()
+        yield ('savebot_command_queue', 'gauge', '무거운 명령어 대기열 (실행 중/대기 중)',
+               [({'state': 'running'}, scheduler['running']), ({'state': 'queued'}, scheduler['queued'])])
+        yield ('savebot_command_rejected_total', 'counter', '명령어 대기열에서 거절한 요청 수',
+               [({'reason': reason}, count) for reason, count in scheduler['rejected'].items()])
+        yield ('savebot_compute_pending', 'gauge', 'CPU 작업 실행기에서 실행 중이거나 대기 중인 작업 수',
+               [({}, self.compute.get_stats()['pending'])])
+        
+        cache = self.result_cache.get_stats()
+        yield ('savebot_result_cache_lookups_total', 'counter', '/로드, /검증 결과 캐시 조회 수',
+               [({'result': 'hit'}, cache['hits']), ({'result': 'miss'}, cache['misses'])])
+    
     def _check_savecode_permission(self, ctx: commands.Context) -> bool:
         """세이브코드 생성 권한 검사"""
         # 관리자 전용 모드가 활성화된 경우
@@ -2070,9 +2405,188 @@ class SaveCodeBot:
             for allowed_role in self.config.SAVECODE_ALLOWED_ROLES:
                 if allowed_role in user_role_names:
                     return True
-        
+
         return False
-    
+
+    async def _acquire_command_slot(self, ctx: commands.Context):
+        """무거운 명령어 실행 전 대기열 등록 (기다려야 하면 대기 순번을 바로 안내)"""
+        try:
+            ticket = self.command_scheduler.submit(ctx.author.id, ctx.guild.id if ctx.guild else None,
+                                                   admin=is_admin(ctx.author), label=ctx.command.name)
+        except SchedulerRejectedError as e:
+            raise CommandQueueRejected(e.user_message)
+        
+        queue_message = None
+        try:
+            if not ticket.started:
+                queue_message = await ctx.send(
+                    f"⏳ 대기열 {self.command_scheduler.position(ticket)}번째입니다. 차례가 되면 바로 처리합니다."
+                )
+            await self.command_scheduler.wait(ticket)
+        except BaseException:
+            self.command_scheduler.release(ticket)
+            raise
+        ctx.command_ticket = ticket
+        if queue_message is not None:
+            try:
+                await queue_message.delete()
+            except discord.HTTPException:
+                pass
+
+    async def _release_command_slot(self, ctx: commands.Context):
+        """무거운 명령어 처리 종료 후 대기열 자리 반환"""
+        ticket = getattr(ctx, 'command_ticket', None)
+        if ticket is not None:
+            self.command_scheduler.release(ticket)
+
+    def _compute_deadline(self, created_at, token_ttl: Optional[float] = None) -> float:
+        """
+        CPU 작업 응답 기한 (loop.time() 기준)
+
+        명령어가 만들어진 시각부터 COMPUTE_TIMEOUT초, 상호작용이면 토큰 유효 시간(token_ttl) 중 이른 쪽
+        """
+        timeout = self.config.COMPUTE_TIMEOUT
+        if token_ttl is not None:
+            timeout = min(timeout, token_ttl)
+        age = (discord.utils.utcnow() - created_at).total_seconds()
+        return asyncio.get_running_loop().time() + timeout - age
+
+    def _build_load_embed(self, analysis: SaveAnalysis) -> discord.Embed:
+        """/로드 세이브코드 1개의 결과 임베드"""
+        if analysis.error:
+            error_embed = discord.Embed(
+                title="❌ 코드 처리 오류",
+                description=f"코드 '{analysis.code[:20]}...' 처리 중 오류가 발생했습니다.",
+                color=0xff0000
+            )
+            error_embed.add_field(name="오류 내용", value=analysis.error, inline=False)
+            return error_embed
+
+        embed = discord.Embed(
+            title="🎮 세이브코드 분석 결과",
+            description="아이템 목록은 하단을 확인하세요.",
+            color=0x00ff00 if analysis.valid else 0xff0000
+        )
+        embed.add_field(name="검증 상태", value=analysis.status_text, inline=True)
+        embed.add_field(name="플레이어", value=analysis.player_name, inline=True)
+        embed.add_field(name="영웅", value=analysis.hero_name, inline=True)
+        embed.add_field(name="💰 골드", value=f"{analysis.gold:,}", inline=True)
+        embed.add_field(name="🌲 나무", value=f"{analysis.lumber:,}", inline=True)
+        embed.add_field(name="📈 레벨", value=analysis.level, inline=True)
+
+        # 아이템 목록을 한 메시지에 포함 (3개씩 컬럼 배치)
+        items_list = analysis.items_list
+        items_per_row = 3
+        for i in range(0, len(items_list), items_per_row):
+            batch = items_list[i:i + items_per_row]
+            field_name = f"📦 아이템 슬롯 {i+1}-{min(i+items_per_row, len(items_list))}"
+            field_lines = []
+            for j, item in enumerate(batch):
+                slot_num = i + j + 1
+                emoji = "⚔️" if "무기" in item or "검" in item or "창" in item else \
+                        "🛡️" if "방패" in item or "갑옷" in item or "투구" in item else \
+                        "💍" if "반지" in item or "목걸이" in item else \
+                        "🧪" if "포션" in item or "물약" in item else \
+                        "💎" if "젬" in item or "보석" in item else \
+                        "📜" if "스크롤" in item or "두루마리" in item else \
+                        "🔮" if "오브" in item or "수정" in item else \
+                        "⚡" if "룬" in item else \
+                        "🎯"
+                field_lines.append(f"{emoji} **{slot_num}.** {item}")
+            embed.add_field(
+                name=field_name,
+                value="\n".join(field_lines) if field_lines else "빈 슬롯",
+                inline=True
+            )
+
+        embed.set_footer(text=f"총 {len(items_list)}개의 아이템이 발견되었습니다")
+        return embed
+
+    def _build_load_stats_embed(self, summary: LoadSummary) -> discord.Embed:
+        """/로드 여러 세이브코드 처리 통계 임베드"""
+        def truncate(text: str) -> str:
+            # Discord 필드 제한
+            return text[:1021] + "..." if len(text) > 1024 else text
+
+        stats_embed = discord.Embed(
+            title="📊 세이브코드 처리 통계",
+            description="처리된 모든 세이브코드의 통계입니다",
+            color=0x9b59b6
+        )
+        stats_embed.add_field(name="✅ 유효한 검증", value=f"{summary.valid_count}건", inline=True)
+        stats_embed.add_field(name="❌ 유효하지 않은 검증", value=f"{summary.invalid_count}건", inline=True)
+        stats_embed.add_field(name="👥 캐릭터 수", value=f"{len(summary.characters)}건", inline=True)
+        for status in GRADUATION_STATUSES:
+            emoji, label, _ = LOAD_GRADUATION_LABELS[status]
+            stats_embed.add_field(name=f"{emoji} {label}", value=f"{len(summary.graduates[status])}건", inline=True)
+
+        # 발견된 캐릭터 목록
+        if summary.characters:
+            stats_embed.add_field(
+                name="🎭 발견된 캐릭터",
+                value=truncate(", ".join(sorted(summary.characters))),
+                inline=False
+            )
+
+        # 중복된 캐릭터 목록
+        duplicated_characters = summary.duplicated_characters
+        if duplicated_characters:
+            duplicate_text = ", ".join(f"{char_name} (×{count})"
+                                       for char_name, count in sorted(duplicated_characters.items()))
+            stats_embed.add_field(name="🔄 중복된 캐릭터", value=truncate(duplicate_text), inline=False)
+        else:
+            stats_embed.add_field(name="🔄 중복된 캐릭터", value="중복된 캐릭터가 없습니다", inline=False)
+
+        # 졸업 상태별 캐릭터 목록
+        for status in GRADUATION_STATUSES:
+            emoji, label, empty_text = LOAD_GRADUATION_LABELS[status]
+            graduates = summary.graduates[status]
+            stats_embed.add_field(
+                name=f"{emoji} {label} 캐릭터",
+                value=truncate(", ".join(sorted(graduates))) if graduates else empty_text,
+                inline=False
+            )
+
+        stats_embed.set_footer(text=f"총 {summary.total}개의 세이브코드를 처리했습니다")
+        return stats_embed
+
+    async def _analyze_cached(self, name: str, codes: List[str], deadline: float) -> CachedResult:
+        """
+        /로드, /검증 세이브코드 분석 (같은 이름/코드 목록/데이터 버전의 결과가 캐시에 있으면 재사용)
+
+        여러 코드는 실행기에서 분석하고, 통계 임베드까지 만들어 캐시에 저장
+        """
+        key = self.result_cache.key(name, codes, self.save_analyzer.data_version)
+        result = self.result_cache.get(key)
+        if result is not None:
+            return result
+
+        analyses = await self.compute.map_chunks(self.save_analyzer.analyze_many, codes, name, deadline=deadline)
+        bot_metrics.record_savecode_results(analyses)
+        for analysis in analyses:
+            if analysis.error:
+                logger.error(f"개별 코드 '{analysis.code}' 처리 중 오류: {analysis.error}")
+        header = []
+        if len(codes) > 1:
+            header.append(self._build_load_stats_embed(summarize_analyses(analyses)))
+        result = CachedResult(analyses=analyses, header=header)
+        self.result_cache.put(key, result)
+        return result
+
+    async def _ensure_load_csv(self, result: CachedResult, deadline: float) -> str:
+        """/로드 전체 결과 CSV (처음 요청할 때 만들어 캐시된 결과에 보관)"""
+        if result.csv_text is None:
+            result.csv_text = await self.compute.run(format_analyses_csv, result.analyses,
+                                                     size=len(result.analyses), deadline=deadline)
+        return result.csv_text
+
+    def _build_load_csv_file(self, csv_text: str) -> discord.File:
+        """/로드 전체 결과 CSV 첨부 파일"""
+        return discord.File(
+            io.BytesIO(csv_text.encode('utf-8-sig')),
+            filename=f"load_{int(time.time())}.csv"
+        )
+
     def _validate_savecode_inputs(self, lumber, character_id, level, strength, agility, intelligence, items):
         """세이브코드 입력값 검증"""
         if lumber < 0:
@@ -2213,7 +2727,7 @@ class SaveCodeBot:
             
             # Persistent View 생성 및 등록 (봇이 준비된 후)
             try:
-                self.raid_control_view = RaidControlView(self.raid_system)
+                self.raid_control_view = RaidControlView(self.raid_registry, self.dm_dispatcher, self.scheduler)
                 self.bot.add_view(self.raid_control_view)
                 logger.info("Persistent View 생성 및 등록 완료")
                 print("Persistent View 생성 및 등록 완료")
@@ -2221,18 +2735,58 @@ class SaveCodeBot:
                 logger.error(f"Persistent View 생성/등록 실패: {e}")
                 print(f"Persistent View 생성/등록 실패: {e}")
             
-            print("레이드 버튼 메시지를 보내려면 관리자가 '/레이드메시지' 명령어를 사용하세요.")
-        
-        @self.bot.event
+            # 길드별 디렉토리 도입 전의 레이드 상태 파일 (길드가 하나뿐이면 그 길드로 옮김)
+            if self.raid_registry.has_legacy_state():
+                if len(self.bot.guilds) == 1:
+                    self.raid_registry.migrate_legacy_state(self.bot.guilds[0].id)
+                else:
+                    logger.warning("길드별 디렉토리 도입 전의 레이드 상태 파일이 있습니다. "
+                                   "RAID_STATE_LEGACY_GUILD_ID로 옮겨 받을 길드를 지정하세요.")
+            
+            # 레이드 상태 저널 주기적 동기화 (재연결로 on_ready가 다시 호출되어도 한 번만 시작)
+            if self.config.RAID_STATE_DIR and self._raid_state_task is None:
+                self._raid_state_task = asyncio.create_task(self._raid_state_flush_loop())
+            
+            # 파티 모집 만료 처리 (자동 종료/삭제)
+            if self._party_expiry_task is None:
+                self._party_expiry_task = asyncio.create_task(self._party_expiry_loop())
+            
+            # 지연된 쿠폰 사용 처리 재시도
+            if self.coupon_outbox is not None and self._coupon_outbox_task is None:
+                self._coupon_outbox_task = asyncio.create_task(self.coupon_processor.run_outbox_worker())
+            
+            # 지표 서버/이벤트 루프 지연 측정 (METRICS_PORT를 지정한 경우, 이미 실행 중이면 무시)
+            if self.metrics_server is not None:
+                self.loop_lag_monitor.start()
+                try:
+                    await self.metrics_server.start()
+                except OSError as e:
+                    logger.error(f"지표 서버 시작 실패: {e}")
+            
+            print("레이드 버튼 메시지를 보내려면 관리자가 '/레이드메시지' 명령어를 사용하세요.")
+        
+        @self.bot.event
         async def on_command_error(ctx: commands.Context, error: commands.CommandError):
             """명령어 오류 처리"""
             if isinstance(error, commands.MissingRequiredArgument):
                 await ctx.send("❌ 필수 인자가 누락되었습니다. 명령어 사용법을 확인해주세요.")
             elif isinstance(error, commands.CommandNotFound):
                 await ctx.send("❌ 존재하지 않는 명령어입니다.")
+            elif isinstance(error, CommandQueueRejected):
+                await ctx.send(str(error))
             else:
                 logger.error(f"명령어 오류: {error}")
                 await ctx.send(f"❌ 오류가 발생했습니다: {error}")
+            
+            # 없는 명령어는 지표에 넣지 않음 (라벨 값이 사용자 입력으로 늘어나지 않도록)
+            if ctx.command is not None:
+                outcome = 'rejected' if isinstance(error, CommandQueueRejected) else 'error'
+                self._observe_command(ctx, outcome)
+        
+        @self.bot.event
+        async def on_command_completion(ctx: commands.Context):
+            """명령어 처리 시간 기록"""
+            self._observe_command(ctx, 'ok')
     
     def _setup_commands(self):
         """명령어 설정"""
@@ -2245,18 +2799,13 @@ class SaveCodeBot:
                 return
             
             try:
-                # 기존 함수와 새 함수 둘 다 사용
-                is_valid_legacy = decode_savecode2(code, name, summon_chunk_n=self.config.SUMMON_CHUNK_N)
-                is_valid_new = self.decoder.validate_savecode(code, name)
-                
-                # 결과가 다르면 로그에 기록
-                if is_valid_legacy != is_valid_new:
-                    logger.warning(f"검증 결과 불일치: Legacy={is_valid_legacy}, New={is_valid_new}")
-                
-                # 기존 함수 결과 우선 사용 (호환성 유지)
-                result = "✅ 유효함" if is_valid_legacy else "❌ 유효하지 않음"
-                await ctx.send(f"검증 결과: {result}")
+                result = await self._analyze_cached(name, [code], self._compute_deadline(ctx.message.created_at))
+                await ctx.send(f"검증 결과: {result.analyses[0].status_text}")
                 
+            except ComputeQueueFullError:
+                await ctx.send(COMPUTE_BUSY_MESSAGE)
+            except ComputeExpiredError:
+                await ctx.send(COMPUTE_EXPIRED_MESSAGE)
             except Exception as e:
                 logger.error(f"검증 중 오류: {e}")
                 await ctx.send(f"❌ 검증 중 오류 발생: {e}")
@@ -2269,8 +2818,14 @@ class SaveCodeBot:
                 return
             
             try:
-                items_list = self.decoder.extract_items(code)
+                analysis = self.save_analyzer.analyze(code)
+                if analysis.error:
+                    # 이름 없이 분석하므로 체크섬 실패는 집계하지 않음
+                    bot_metrics.savecode_decode_failures.inc()
+                    await ctx.send(f"❌ 아이템 추출 중 오류 발생: {analysis.error}")
+                    return
                 
+                items_list = analysis.items_list
                 if not items_list:
                     await ctx.send("❌ 아이템 정보를 찾을 수 없습니다.")
                     return
@@ -2282,7 +2837,7 @@ class SaveCodeBot:
                 logger.error(f"아이템 추출 중 오류: {e}")
                 await ctx.send(f"❌ 아이템 추출 중 오류 발생: {e}")
         
-        @self.bot.command(name='로드', help='세이브코드를 검증하고 아이템을 추출합니다')
+        @self.bot.command(name='로드', help='세이브코드를 검증하고 아이템을 추출합니다 (--파일: 전체 결과 CSV 첨부)')
         async def load_command(ctx: commands.Context, name: str, *, code: str):
             """세이브코드 검증 및 아이템 추출 명령어"""
             if not code or not name:
@@ -2291,341 +2846,34 @@ class SaveCodeBot:
             
             try:
                 raw_codes = re.split(r'[;\n,]+|\s{1,}', code.strip()) 
-                codes = [c.strip().upper() for c in raw_codes if c.strip()]
-                
-                # 통계 변수 초기화
-                valid_count = 0
-                invalid_count = 0
-                characters = set()  # 중복 캐릭터 제거를 위한 set
-                character_counts = {}  # 캐릭터별 출현 횟수 추적
-                apocalypse_characters = set()  # 묵시록 레이드 졸업 캐릭터 (죄: 아이템 보유)
-                uriel_characters = set()  # 우리엘 졸업 캐릭터
-                raphael_characters = set()  # 라파엘 졸업 캐릭터
-                gabriel_characters = set()  # 가브리엘 졸업 캐릭터
-                terminator_characters = set()  # 종결자 졸업 캐릭터
-                mikael_characters = set()  # 미카엘 졸업 캐릭터
-                
-                for code in codes:
-                    print(f"[DEBUG] 로드된 코드들: {code}")  # 디버그용 출력
-                    try:
-                        # 검증
-                        is_valid = decode_savecode2(code, name, summon_chunk_n=self.config.SUMMON_CHUNK_N)
-                        result = "✅ 유효함" if is_valid else "❌ 유효하지 않음"
-                        
-                        # 통계 업데이트
-                        if is_valid:
-                            valid_count += 1
-                        else:
-                            invalid_count += 1
-                        
-                        # 세이브 데이터 추출
-                        save_data = extract_save_data(code, name, summon_chunk_n=self.config.SUMMON_CHUNK_N)
-                        
-                        # 디버깅을 위한 타입 확인
-                        print(f"[DEBUG] save_data type: {type(save_data)}")
-                        print(f"[DEBUG] save_data content: {save_data}")
-                        
-                        # 영웅 타입 이름 매핑 (SaveCodeManager 사용)
-                        if isinstance(save_data, dict) and 'hero_type_index' in save_data:
-                            hero_type_index = save_data['hero_type_index']
-                            hero_name = self.savecode_manager.get_character_name(hero_type_index)
-                        else:
-                            print(f"[ERROR] save_data is not a valid dict: {save_data}")
-                            hero_name = "Unknown Character"
-                            # 기본값 설정
-                            save_data = {
-                                'gold': 0,
-                                'lumber': 0,
-                                'hero_type_index': 0,
-                                'level': 1
-                            }
-                        
-                        # 캐릭터 세트에 추가 (중복 제거)
-                        characters.add(hero_name)
-                        
-                        # 캐릭터별 출현 횟수 카운트
-                        character_counts[hero_name] = character_counts.get(hero_name, 0) + 1
-                        
-                        # 아이템 추출
-                        items_list = self.decoder.extract_items(code)
-                        item_ids = save_data.get('items', []) if isinstance(save_data, dict) else []
-                        response = "\n".join(items_list)
-                        
-                        # 졸업 상태 확인 (레이드 아이템 JSON 기반)
-                        graduation_status = self.graduation_checker.get_graduation_status(
-                            items_list=items_list,
-                            item_ids=item_ids
-                        )
-                        
-                        # 졸업 상태에 따라 캐릭터를 해당 카테고리에 추가
-                        if graduation_status == 'mikael':
-                            mikael_characters.add(hero_name)
-                        elif graduation_status == 'terminator':
-                            terminator_characters.add(hero_name)
-                        elif graduation_status == 'raphael':
-                            raphael_characters.add(hero_name)
-                        elif graduation_status == 'gabriel':
-                            gabriel_characters.add(hero_name)
-                        elif graduation_status == 'uriel':
-                            uriel_characters.add(hero_name)
-                        elif graduation_status == 'apocalypse':
-                            apocalypse_characters.add(hero_name)
-                        
-                        # 결과 전송 - Embed 사용 (아이템 포함 단일 메시지)
-                        embed = discord.Embed(
-                            title="🎮 세이브코드 분석 결과",
-                            description="아이템 목록은 하단을 확인하세요.",
-                            color=0x00ff00 if is_valid else 0xff0000
-                        )
-                        embed.add_field(name="검증 상태", value=result, inline=True)
-                        embed.add_field(name="플레이어", value=name, inline=True)
-                        embed.add_field(name="영웅", value=hero_name, inline=True)
-                        embed.add_field(name="💰 골드", value=f"{save_data.get('gold', 0):,}", inline=True)
-                        embed.add_field(name="🌲 나무", value=f"{save_data.get('lumber', 0):,}", inline=True)
-                        embed.add_field(name="📈 레벨", value=save_data.get('level', 1), inline=True)
-
-                        # 아이템 목록을 한 메시지에 포함 (6개씩 컬럼 배치)
-                        if items_list:
-                            items_per_row = 3
-                            for i in range(0, len(items_list), items_per_row):
-                                batch = items_list[i:i + items_per_row]
-                                field_name = f"📦 아이템 슬롯 {i+1}-{min(i+items_per_row, len(items_list))}"
-                                field_lines = []
-                                for j, item in enumerate(batch):
-                                    slot_num = i + j + 1
-                                    emoji = "⚔️" if "무기" in item or "검" in item or "창" in item else \
-                                            "🛡️" if "방패" in item or "갑옷" in item or "투구" in item else \
-                                            "💍" if "반지" in item or "목걸이" in item else \
-                                            "🧪" if "포션" in item or "물약" in item else \
-                                            "💎" if "젬" in item or "보석" in item else \
-                                            "📜" if "스크롤" in item or "두루마리" in item else \
-                                            "🔮" if "오브" in item or "수정" in item else \
-                                            "⚡" if "룬" in item else \
-                                            "🎯"
-                                    field_lines.append(f"{emoji} **{slot_num}.** {item}")
-                                embed.add_field(
-                                    name=field_name,
-                                    value="\n".join(field_lines) if field_lines else "빈 슬롯",
-                                    inline=True
-                                )
-
-                        embed.set_footer(text=f"총 {len(items_list)}개의 아이템이 발견되었습니다")
-                        await ctx.send(embed=embed)
-                        
-                    except Exception as e:
-                        print(f"[ERROR] 개별 코드 처리 중 오류: {e}")
-                        logger.error(f"개별 코드 '{code}' 처리 중 오류: {e}")
-                        
-                        # 오류 발생한 코드에 대한 에러 메시지 전송
-                        error_embed = discord.Embed(
-                            title="❌ 코드 처리 오류",
-                            description=f"코드 '{code[:20]}...' 처리 중 오류가 발생했습니다.",
-                            color=0xff0000
-                        )
-                        error_embed.add_field(name="오류 내용", value=str(e), inline=False)
-                        await ctx.send(embed=error_embed)
-                        continue
-                
-                # 여러 세이브코드가 있는 경우 통계 표시
-                if len(codes) > 1:
-                    stats_embed = discord.Embed(
-                        title="📊 세이브코드 처리 통계",
-                        description="처리된 모든 세이브코드의 통계입니다",
-                        color=0x9b59b6
-                    )
-                    
-                    stats_embed.add_field(
-                        name="✅ 유효한 검증", 
-                        value=f"{valid_count}건", 
-                        inline=True
-                    )
-                    stats_embed.add_field(
-                        name="❌ 유효하지 않은 검증", 
-                        value=f"{invalid_count}건", 
-                        inline=True
-                    )
-                    stats_embed.add_field(
-                        name="👥 캐릭터 수", 
-                        value=f"{len(characters)}건", 
-                        inline=True
-                    )
-                    stats_embed.add_field(
-                        name="🌟 미카엘 졸업", 
-                        value=f"{len(mikael_characters)}건", 
-                        inline=True
-                    )
-                    stats_embed.add_field(
-                        name="💀 종결자 졸업", 
-                        value=f"{len(terminator_characters)}건", 
-                        inline=True
-                    )
-                    stats_embed.add_field(
-                        name="😈 묵시록 레이드 졸업", 
-                        value=f"{len(apocalypse_characters)}건", 
-                        inline=True
-                    )
-                    stats_embed.add_field(
-                        name="👼 우리엘 졸업", 
-                        value=f"{len(uriel_characters)}건", 
-                        inline=True
-                    )
-                    stats_embed.add_field(
-                        name="🕊️ 라파엘 졸업", 
-                        value=f"{len(raphael_characters)}건", 
-                        inline=True
-                    )
-                    stats_embed.add_field(
-                        name="⚔️ 가브리엘 졸업", 
-                        value=f"{len(gabriel_characters)}건", 
-                        inline=True
-                    )
-                    
-                    # 발견된 캐릭터 목록 추가
-                    if characters:
-                        character_list = ", ".join(sorted(characters))
-                        if len(character_list) > 1024:  # Discord 필드 제한
-                            character_list = character_list[:1021] + "..."
-                        stats_embed.add_field(
-                            name="🎭 발견된 캐릭터",
-                            value=character_list,
-                            inline=False
-                        )
-                    
-                    # 중복된 캐릭터 목록 추가
-                    duplicated_characters = {name: count for name, count in character_counts.items() if count > 1}
-                    if duplicated_characters:
-                        duplicate_list = []
-                        for char_name, count in sorted(duplicated_characters.items()):
-                            duplicate_list.append(f"{char_name} (×{count})")
-                        
-                        duplicate_text = ", ".join(duplicate_list)
-                        if len(duplicate_text) > 1024:  # Discord 필드 제한
-                            duplicate_text = duplicate_text[:1021] + "..."
-                        
-                        stats_embed.add_field(
-                            name="🔄 중복된 캐릭터",
-                            value=duplicate_text,
-                            inline=False
-                        )
-                    else:
-                        stats_embed.add_field(
-                            name="🔄 중복된 캐릭터",
-                            value="중복된 캐릭터가 없습니다",
-                            inline=False
-                        )
-                    
-                    # 미카엘 졸업 캐릭터 목록 추가
-                    if mikael_characters:
-                        mikael_list = ", ".join(sorted(mikael_characters))
-                        if len(mikael_list) > 1024:  # Discord 필드 제한
-                            mikael_list = mikael_list[:1021] + "..."
-                        
-                        stats_embed.add_field(
-                            name="🌟 미카엘 졸업 캐릭터",
-                            value=mikael_list,
-                            inline=False
-                        )
-                    else:
-                        stats_embed.add_field(
-                            name="🌟 미카엘 졸업 캐릭터",
-                            value="미카엘 졸업 조건(통치자 성흔+집행하는 자 영혼)을 충족한 캐릭터가 없습니다",
-                            inline=False
-                        )
-                    
-                    # 종결자 졸업 캐릭터 목록 추가
-                    if terminator_characters:
-                        terminator_list = ", ".join(sorted(terminator_characters))
-                        if len(terminator_list) > 1024:  # Discord 필드 제한
-                            terminator_list = terminator_list[:1021] + "..."
-                        
-                        stats_embed.add_field(
-                            name="💀 종결자 졸업 캐릭터",
-                            value=terminator_list,
-                            inline=False
-                        )
-                    else:
-                        stats_embed.add_field(
-                            name="💀 종결자 졸업 캐릭터",
-                            value="종결자 졸업 조건(3가지 특수 아이템)을 충족한 캐릭터가 없습니다",
-                            inline=False
-                        )
-                    
-                    # 묵시록 레이드 졸업 캐릭터 목록 추가
-                    if apocalypse_characters:
-                        apocalypse_list = ", ".join(sorted(apocalypse_characters))
-                        if len(apocalypse_list) > 1024:  # Discord 필드 제한
-                            apocalypse_list = apocalypse_list[:1021] + "..."
-                        
-                        stats_embed.add_field(
-                            name="😈 묵시록 레이드 졸업 캐릭터",
-                            value=apocalypse_list,
-                            inline=False
-                        )
-                    else:
-                        stats_embed.add_field(
-                            name="😈 묵시록 레이드 졸업 캐릭터",
-                            value="묵시록 레이드 아이템(죄:)을 보유한 캐릭터가 없습니다",
-                            inline=False
-                        )
-                    
-                    # 우리엘 졸업 캐릭터 목록 추가
-                    if uriel_characters:
-                        uriel_list = ", ".join(sorted(uriel_characters))
-                        if len(uriel_list) > 1024:  # Discord 필드 제한
-                            uriel_list = uriel_list[:1021] + "..."
-                        
-                        stats_embed.add_field(
-                            name="👼 우리엘 졸업 캐릭터",
-                            value=uriel_list,
-                            inline=False
-                        )
-                    else:
-                        stats_embed.add_field(
-                            name="👼 우리엘 졸업 캐릭터",
-                            value="우리엘 졸업 아이템 쌍을 보유한 캐릭터가 없습니다",
-                            inline=False
-                        )
-                    
-                    # 라파엘 졸업 캐릭터 목록 추가
-                    if raphael_characters:
-                        raphael_list = ", ".join(sorted(raphael_characters))
-                        if len(raphael_list) > 1024:  # Discord 필드 제한
-                            raphael_list = raphael_list[:1021] + "..."
-                        
-                        stats_embed.add_field(
-                            name="🕊️ 라파엘 졸업 캐릭터",
-                            value=raphael_list,
-                            inline=False
-                        )
-                    else:
-                        stats_embed.add_field(
-                            name="🕊️ 라파엘 졸업 캐릭터",
-                            value="라파엘 졸업 아이템 쌍을 보유한 캐릭터가 없습니다",
-                            inline=False
-                        )
-                    
-                    # 가브리엘 졸업 캐릭터 목록 추가
-                    if gabriel_characters:
-                        gabriel_list = ", ".join(sorted(gabriel_characters))
-                        if len(gabriel_list) > 1024:  # Discord 필드 제한
-                            gabriel_list = gabriel_list[:1021] + "..."
-                        
-                        stats_embed.add_field(
-                            name="⚔️ 가브리엘 졸업 캐릭터",
-                            value=gabriel_list,
-                            inline=False
-                        )
-                    else:
-                        stats_embed.add_field(
-                            name="⚔️ 가브리엘 졸업 캐릭터",
-                            value="가브리엘 졸업 아이템 쌍을 보유한 캐릭터가 없습니다",
-                            inline=False
-                        )
-                    
-                    stats_embed.set_footer(text=f"총 {len(codes)}개의 세이브코드를 처리했습니다")
-                    
-                    await ctx.send(embed=stats_embed)
+                tokens = [c.strip() for c in raw_codes if c.strip()]
+                attach_file = any(token.lower() in LOAD_FILE_FLAGS for token in tokens)
+                codes = [token.upper() for token in tokens if token.lower() not in LOAD_FILE_FLAGS]
+                if not codes:
+                    await ctx.send("❌ 세이브코드를 입력해주세요.")
+                    return
+                
+                # 검증/자원/영웅/아이템/졸업 상태를 코드당 한 번의 파싱으로 분석 (여러 개면 실행기에서,
+                # 같은 이름/코드 목록을 다시 입력하면 캐시된 분석 결과와 임베드를 재사용)
+                deadline = self._compute_deadline(ctx.message.created_at)
+                result = await self._analyze_cached(name, codes, deadline)
                 
+                # 결과는 메시지 1개로 전송 (임베드 10개/6000자를 넘으면 버튼으로 페이지 이동)
+                view = LoadResultView(self, ctx.author.id, result)
+                embeds, _, _ = view.pager.page(0)
+                
+                kwargs = {'embeds': embeds}
+                if not view.pager.single_page:
+                    view.update_buttons()
+                    kwargs['view'] = view
+                if attach_file:
+                    kwargs['file'] = self._build_load_csv_file(await self._ensure_load_csv(result, deadline))
+                view.message = await ctx.send(**kwargs)
+                
+            except ComputeQueueFullError:
+                await ctx.send(COMPUTE_BUSY_MESSAGE)
+            except ComputeExpiredError:
+                await ctx.send(COMPUTE_EXPIRED_MESSAGE)
             except Exception as e:
                 logger.error(f"로드 처리 중 오류: {e}")
                 await ctx.send(f"❌ 로드 처리 중 오류 발생: {e}")
@@ -2639,7 +2887,10 @@ class SaveCodeBot:
             
             try:
                 # 매칭되는 아이템들 찾기
-                matching_items = self.item_searcher.find_matching_items(item_name)
+                matching_items = await self.compute.run(
+                    self.item_searcher.find_matching_items, item_name,
+                    deadline=self._compute_deadline(ctx.message.created_at)
+                )
                 
                 if not matching_items:
                     await ctx.send(f"❌ '{item_name}'과(와) 일치하는 아이템을 찾을 수 없습니다.")
@@ -2667,6 +2918,10 @@ class SaveCodeBot:
                     
                     await ctx.send(response)
                 
+            except ComputeQueueFullError:
+                await ctx.send(COMPUTE_BUSY_MESSAGE)
+            except ComputeExpiredError:
+                await ctx.send(COMPUTE_EXPIRED_MESSAGE)
             except Exception as e:
                 logger.error(f"아이템 값 검색 중 오류: {e}")
                 await ctx.send(f"❌ 아이템 값 검색 중 오류 발생: {e}")
@@ -2888,7 +3143,7 @@ class SaveCodeBot:
             try:
                 # View가 아직 생성되지 않았으면 생성
                 if self.raid_control_view is None:
-                    self.raid_control_view = RaidControlView(self.raid_system)
+                    self.raid_control_view = RaidControlView(self.raid_registry, self.dm_dispatcher, self.scheduler)
                     self.bot.add_view(self.raid_control_view)
                 
                 embed = discord.Embed(
@@ -2931,6 +3186,9 @@ class SaveCodeBot:
                 await ctx.send(embed=embed, view=self.raid_control_view)
                 logger.info(f"레이드 메시지를 {ctx.guild.name}의 #{ctx.channel.name}에 수동으로 전송했습니다.")
                 
+                if self.raid_status is not None:
+                    await self.raid_status.attach(ctx.channel, self.raid_registry.get_board(ctx.guild.id))
+                
             except commands.MissingPermissions:
                 embed = discord.Embed(
                     title="❌ 권한 부족",
@@ -3424,7 +3682,7 @@ class SaveCodeBot:
                 )
                 
                 # 쿠폰 UI 버튼 뷰 생성
-                view = CouponUIView()
+                view = CouponUIView(self.coupon_processor, self.command_scheduler)
                 await ctx.send(embed=embed, view=view)
                 
             except Exception as e:
@@ -3471,13 +3729,297 @@ class SaveCodeBot:
                 )
                 
                 # 쿠폰 생성 UI 버튼 뷰 생성
-                view = CouponCreateUIView()
+                view = CouponCreateUIView(self.coupon_processor, self.command_scheduler)
                 await ctx.send(embed=embed, view=view)
                 
             except Exception as e:
                 logger.error(f"쿠폰 생성 UI 명령어 처리 중 오류: {e}")
                 await ctx.send(f"❌ 쿠폰 생성 UI 명령어 처리 중 오류 발생: {e}")
         
+        @self.bot.command(name='쿠폰대량생성', help='같은 내용의 쿠폰을 여러 장 생성해 CSV로 받습니다. (관리자 전용) 사용법: /쿠폰대량생성 개수 나무 [골드]')
+        async def coupon_bulk_command(ctx: commands.Context, count: int, lumber: int, gold: int = 0):
+            """쿠폰 대량 발급 명령어 (관리자 전용)"""
+            try:
+                if not ctx.author.guild_permissions.administrator:
+                    embed = discord.Embed(
+                        title="❌ 권한 없음",
+                        description="쿠폰 대량 생성은 서버 관리자만 사용할 수 있습니다.",
+                        color=0xff0000
+                    )
+                    await ctx.send(embed=embed)
+                    return
+                
+                max_count = self.config.COUPON_BULK_MAX_COUNT
+                if not 1 <= count <= max_count:
+                    await ctx.send(f"❌ 개수는 1 이상 {max_count:,} 이하로 입력해주세요.")
+                    return
+                if not (0 <= lumber <= 99999999 and 0 <= gold <= 99999999):
+                    await ctx.send("❌ 나무와 골드는 0 이상 99,999,999 이하의 값이어야 합니다.")
+                    return
+                
+                # 결과 CSV는 DM으로 보내므로 쿠폰을 만들기 전에 DM이 가능한지 먼저 확인
+                try:
+                    await ctx.author.send(f"🎫 쿠폰 {count:,}장 생성을 시작합니다. 완료되면 쿠폰 목록 CSV를 보내드립니다.")
+                except discord.Forbidden:
+                    await ctx.send("❌ DM을 보낼 수 없습니다. DM 수신을 허용한 뒤 다시 시도해주세요.")
+                    return
+                
+                embed = discord.Embed(
+                    title="🔄 쿠폰 대량 생성 중...",
+                    description=f"나무 {lumber:,} / 골드 {gold:,} 쿠폰 {count:,}장\n0/{count:,} (0%)",
+                    color=0xffff00
+                )
+                progress_message = await ctx.send(embed=embed)
+                
+                # 진행 상황은 한 메시지를 수정해서 표시 (수정 요청이 몰리지 않도록 2초 간격)
+                last_edit = 0.0
+                
+                async def report_progress(result):
+                    nonlocal last_edit
+                    now = time.monotonic()
+                    if now - last_edit < 2.0 or result.done == result.requested:
+                        return
+                    last_edit = now
+                    embed.description = f"나무 {lumber:,} / 골드 {gold:,} 쿠폰 {count:,}장\n{format_bulk_progress(result)}"
+                    await progress_message.edit(embed=embed)
+                
+                csv_buffer = io.StringIO()
+                result = await issue_coupons(
+                    self.coupon_processor, count, lumber, gold,
+                    concurrency=self.config.COUPON_BULK_CONCURRENCY,
+                    rate=self.config.COUPON_BULK_RATE,
+                    max_retries=self.config.COUPON_BULK_MAX_RETRIES,
+                    csv_file=csv_buffer,
+                    on_progress=report_progress
+                )
+                
+                all_created = result.failed == 0 and result.unconfirmed == 0
+                embed.title = "✅ 쿠폰 대량 생성 완료" if all_created else "⚠️ 쿠폰 대량 생성 완료 (일부 실패)"
+                embed.color = 0x00ff00 if all_created else 0xffa500
+                embed.description = f"나무 {lumber:,} / 골드 {gold:,} 쿠폰 {count:,}장\n{format_bulk_progress(result)}"
+                if result.unconfirmed:
+                    embed.add_field(
+                        name="⚠️ 확인 필요",
+                        value=(f"{result.unconfirmed:,}장은 시간 초과/서버 오류로 생성 여부를 알 수 없어 다시 요청하지 않았습니다.\n"
+                               "쿠폰 서버에서 생성 여부를 확인해주세요. (CSV의 '확인 필요' 항목)"),
+                        inline=False
+                    )
+                if result.errors:
+                    embed.add_field(name="❌ 마지막 오류", value=result.errors[-1][:1024], inline=False)
+                await progress_message.edit(embed=embed)
+                
+                # 쿠폰 코드 목록은 채널에 남지 않도록 요청한 관리자에게 DM으로 전송
+                csv_file = discord.File(
+                    io.BytesIO(csv_buffer.getvalue().encode('utf-8-sig')),
+                    filename=f"coupons_{int(time.time())}.csv"
+                )
+                await ctx.author.send(f"🎫 생성된 쿠폰 {result.created:,}장", file=csv_file)
+                await ctx.send("📩 쿠폰 목록 CSV를 DM으로 보냈습니다.")
+                
+            except Exception as e:
+                logger.error(f"쿠폰 대량 생성 명령어 처리 중 오류: {e}")
+                await ctx.send(f"❌ 쿠폰 대량 생성 중 오류 발생: {e}")
+        
+        @self.bot.command(name='쿠폰상태', help='쿠폰 서버 연결/사용 처리 대기열/캐시 상태를 확인합니다. (관리자 전용)')
+        async def coupon_status_command(ctx: commands.Context):
+            """쿠폰 서버 연결/아웃박스/체크 캐시 상태 명령어 (관리자 전용)"""
+            try:
+                if not ctx.author.guild_permissions.administrator:
+                    embed = discord.Embed(
+                        title="❌ 권한 없음",
+                        description="쿠폰 상태 확인은 서버 관리자만 사용할 수 있습니다.",
+                        color=0xff0000
+                    )
+                    await ctx.send(embed=embed)
+                    return
+                
+                embed = discord.Embed(title="🎫 쿠폰 처리 상태", color=0x3498db)
+                
+                if self.coupon_outbox is not None:
+                    outbox = self.coupon_outbox.get_stats()
+                    embed.add_field(
+                        name="📮 사용 처리 대기열",
+                        value=(
+                            f"• 대기: {outbox['depth']:,}건\n"
+                            f"• 가장 오래된 대기: {outbox['oldest_age'] / 60:.1f}분\n"
+                            f"• 최대 재시도 횟수: {outbox['max_attempts']}회\n"
+                            f"• 사용 확인: {outbox['confirmed']:,}건 / 서버 거절: {outbox['rejected']:,}건 / "
+                            f"실패 후 재시도 예약: {outbox['failures']:,}건"
+                        ),
+                        inline=False
+                    )
+                else:
+                    embed.add_field(name="📮 사용 처리 대기열", value="비활성화됨", inline=False)
+                
+                resilience = self.coupon_resilience.get_stats()
+                circuit_names = {'closed': '🟢 정상', 'open': '🔴 차단 중', 'half_open': '🟡 복구 확인 중'}
+                circuit_text = circuit_names.get(resilience['circuit_state'], resilience['circuit_state'])
+                if resilience['circuit_state'] == 'open':
+                    circuit_text += f" ({resilience['circuit_remaining']:.0f}초 후 재확인)"
+                rejected = resilience['rejected']
+                embed.add_field(
+                    name="🛡️ 쿠폰 서버 연결",
+                    value=(
+                        f"• 서킷 브레이커: {circuit_text} (누적 {resilience['circuit_open_count']}회 차단)\n"
+                        f"• 진행 중 요청: {resilience['in_flight']}건 / 재시도 예산: {resilience['retry_budget']:.1f}\n"
+                        f"• 바로 거절: 차단 {rejected.get('circuit_open', 0):,}건 · 혼잡 {rejected.get('shed', 0):,}건"
+                    ),
+                    inline=False
+                )
+                for label, endpoint in resilience['endpoints'].items():
+                    errors = ", ".join(f"{kind} {count}" for kind, count in endpoint['errors'].items()) or "없음"
+                    embed.add_field(
+                        name=f"⏱️ {label}",
+                        value=(
+                            f"• 요청 {endpoint['requests']:,}건 (재시도 {endpoint['retries']:,}건)\n"
+                            f"• 평균 {endpoint['mean_ms']:.0f}ms · p50 ≤{endpoint['p50_ms']:.0f}ms · "
+                            f"p95 ≤{endpoint['p95_ms']:.0f}ms · p99 ≤{endpoint['p99_ms']:.0f}ms\n"
+                            f"• 오류: {errors}"
+                        ),
+                        inline=False
+                    )
+                
+                dedup = self.coupon_processor.get_dedup_stats()
+                embed.add_field(
+                    name="🔀 동시 요청 병합",
+                    value=(
+                        f"• 쿠폰 체크: 서버 요청 {dedup['checks_executed']:,}건 / 병합 {dedup['checks_coalesced']:,}건\n"
+                        f"• 사용 처리 중인 코드: {dedup['redeeming_codes']:,}개 / 앞 사람을 기다린 요청: {dedup['redeem_waited']:,}건"
+                    ),
+                    inline=False
+                )
+                
+                cache = self.coupon_check_cache.get_stats()
+                embed.add_field(
+                    name="🗂️ 쿠폰 체크 캐시",
+                    value=(
+                        f"• 항목: {cache['entries']:,}개\n"
+                        f"• 적중: {cache['hits']:,} / 미적중: {cache['misses']:,} ({cache['hit_rate'] * 100:.1f}%)\n"
+                        f"• 무효화: {cache['invalidations']:,}건"
+                    ),
+                    inline=False
+                )
+                
+                await ctx.send(embed=embed)
+                
+            except Exception as e:
+                logger.error(f"쿠폰 상태 명령어 처리 중 오류: {e}")
+                await ctx.send(f"❌ 쿠폰 상태 확인 중 오류 발생: {e}")
+        
+        @self.bot.command(name='대기열상태', help='무거운 명령어 대기열과 대기 시간을 확인합니다. (관리자 전용)')
+        async def command_queue_status_command(ctx: commands.Context):
+            """명령어 대기열/CPU 작업 실행기 상태 명령어 (관리자 전용)"""
+            try:
+                if not is_admin(ctx.author):
+                    embed = discord.Embed(
+                        title="❌ 권한 없음",
+                        description="대기열 상태 확인은 서버 관리자만 사용할 수 있습니다.",
+                        color=0xff0000
+                    )
+                    await ctx.send(embed=embed)
+                    return
+                
+                stats = self.command_scheduler.get_stats()
+                rejected = stats['rejected']
+                embed = discord.Embed(title="🚦 명령어 대기열 상태", color=0x3498db)
+                embed.add_field(
+                    name="📋 대기열",
+                    value=(
+                        f"• 실행 중: {stats['running']}건 / 대기: {stats['queued']}건 (사용자 {stats['queued_users']}명)\n"
+                        f"• 누적: 등록 {stats['submitted']:,}건 · 시작 {stats['started']:,}건 "
+                        f"(관리자 {stats['admin_started']:,}건) · 취소 {stats['cancelled']:,}건"
+                    ),
+                    inline=False
+                )
+                embed.add_field(
+                    name="⏱️ 대기 시간 (최근 1,000건)",
+                    value=f"p50 {stats['wait_p50']:.1f}초 · p99 {stats['wait_p99']:.1f}초 · 최대 {stats['wait_max']:.1f}초",
+                    inline=False
+                )
+                embed.add_field(
+                    name="🚫 거절",
+                    value=(
+                        f"• 요청 속도: 사용자 {rejected.get('rate_limited', 0):,}건 · 서버 {rejected.get('guild_rate_limited', 0):,}건\n"
+                        f"• 대기열 초과: 사용자 {rejected.get('user_queue', 0):,}건 · 전체 {rejected.get('queue_full', 0):,}건"
+                    ),
+                    inline=False
+                )
+                compute = self.compute.get_stats()
+                embed.add_field(
+                    name="🧮 CPU 작업 실행기",
+                    value=(
+                        f"• {compute['executor']} 작업자 {compute['workers']}개 · 대기 {compute['pending']}/{compute['max_queue']}건\n"
+                        f"• 바로 실행 {compute['inline']:,}건 · 실행기 {compute['offloaded']:,}건 · "
+                        f"거절 {compute['rejected']:,}건 · 시간 초과 {compute['expired']:,}건"
+                    ),
+                    inline=False
+                )
+                await ctx.send(embed=embed)
+                
+            except Exception as e:
+                logger.error(f"대기열 상태 명령어 처리 중 오류: {e}")
+                await ctx.send(f"❌ 대기열 상태 확인 중 오류 발생: {e}")
+
+        @self.bot.command(name='데이터리로드', help='아이템/졸업 조건 데이터를 다시 불러옵니다. (관리자 전용)')
+        async def reload_data_command(ctx: commands.Context):
+            """아이템/졸업 조건 데이터 다시 로드 명령어 (관리자 전용)"""
+            try:
+                if not is_admin(ctx.author):
+                    embed = discord.Embed(
+                        title="❌ 권한 없음",
+                        description="데이터 다시 로드는 서버 관리자만 사용할 수 있습니다.",
+                        color=0xff0000
+                    )
+                    await ctx.send(embed=embed)
+                    return
+
+                old_version = self.save_analyzer.data_version
+                self.item_db.reload()
+                self.graduation_checker.reload()
+                new_version = self.save_analyzer.data_version
+                cache_stats = self.result_cache.get_stats()
+                cleared = cache_stats['entries']
+                self.result_cache.invalidate()
+
+                embed = discord.Embed(title="🔄 데이터 다시 로드 완료", color=0x00ff00)
+                embed.add_field(
+                    name="📦 아이템",
+                    value=f"{self.item_db.get_item_count():,}개 · 버전 `{old_version[0]}` → `{new_version[0]}`",
+                    inline=False
+                )
+                embed.add_field(
+                    name="🎓 졸업 조건",
+                    value=f"버전 `{old_version[1]}` → `{new_version[1]}`",
+                    inline=False
+                )
+                embed.add_field(
+                    name="🗃️ 분석 결과 캐시",
+                    value=(
+                        f"• {cleared}건 비움\n"
+                        f"• 누적 적중 {cache_stats['hits']:,}건 · 미적중 {cache_stats['misses']:,}건 "
+                        f"(적중률 {cache_stats['hit_rate']:.0%})"
+                    ),
+                    inline=False
+                )
+                await ctx.send(embed=embed)
+
+            except Exception as e:
+                logger.error(f"데이터 다시 로드 중 오류: {e}")
+                await ctx.send(f"❌ 데이터 다시 로드 중 오류 발생: {e}")
+
+        # 무거운 명령어는 사용자별 공정 대기열을 거쳐 실행
+        # (discord.py는 __self__가 있는 훅을 Cog 메서드로 보고 인스턴스를 한 번 더 넘기므로 함수로 감쌈)
+        async def acquire_command_slot(ctx: commands.Context):
+            await self._acquire_command_slot(ctx)
+        
+        async def release_command_slot(ctx: commands.Context):
+            await self._release_command_slot(ctx)
+        
+        for command_name in SCHEDULED_COMMANDS:
+            command = self.bot.get_command(command_name)
+            command.before_invoke(acquire_command_slot)
+            command.after_invoke(release_command_slot)
+        
         # 기존 명령어들은 주석 처리 (현재는 버튼 기반 시스템 사용)
         # @self.bot.command(name='대기', help='레이드 대기 목록에 등록합니다')
         # async def raid_wait_command(ctx: commands.Context):
@@ -3590,7 +4132,7 @@ class SaveCodeBot:
         try:
             # View가 아직 생성되지 않았으면 생성
             if self.raid_control_view is None:
-                self.raid_control_view = RaidControlView(self.raid_system)
+                self.raid_control_view = RaidControlView(self.raid_registry, self.dm_dispatcher, self.scheduler)
                 self.bot.add_view(self.raid_control_view)
             
             # 특정 채널 ID가 설정되어 있으면 해당 채널에만 보내기
@@ -3616,6 +4158,8 @@ class SaveCodeBot:
                     
                     await target_channel.send(embed=embed, view=self.raid_control_view)
                     logger.info(f"레이드 컨트롤 메시지를 지정된 채널 (ID: {self.config.RAID_CHANNEL_ID})에 전송했습니다.")
+                    if self.raid_status is not None:
+                        await self.raid_status.attach(target_channel, self.raid_registry.get_board(target_channel.guild.id))
                 else:
                     logger.error(f"지정된 채널 (ID: {self.config.RAID_CHANNEL_ID})를 찾을 수 없거나 권한이 없습니다.")
                 return
@@ -3659,12 +4203,139 @@ class SaveCodeBot:
                     
                     await target_channel.send(embed=embed, view=self.raid_control_view)
                     logger.info(f"레이드 컨트롤 메시지를 {guild.name}의 #{target_channel.name}에 전송했습니다.")
+                    if self.raid_status is not None:
+                        await self.raid_status.attach(target_channel, self.raid_registry.get_board(target_channel.guild.id))
                 else:
                     logger.warning(f"길드 {guild.name}에서 메시지를 보낼 수 있는 채널을 찾을 수 없습니다.")
                     
         except Exception as e:
             logger.error(f"레이드 컨트롤 메시지 전송 중 오류: {e}")
     
+    def _setup_guild_raid_system(self, guild_id: int, raid_system: RaidWaitingSystem):
+        """길드 레이드 시스템이 새로 생성될 때 길드별 부가 기능 연결"""
+        raid_system.add_change_listener(self._on_party_schedule_change)
+        
+        if self.config.RAID_AUTO_MATCH:
+            # 대기 목록 자동 매칭 (설정으로 켠 경우에만 대기 목록 변경을 감시)
+            self.raid_matchmakers[guild_id] = RaidMatchmaker(
+                raid_system,
+                party_size=self.config.RAID_MAX_PARTICIPANTS,
+                party_sizes=self.config.RAID_PARTY_SIZES,
+                max_helpers=self.config.RAID_AUTO_MATCH_MAX_HELPERS,
+                debounce_seconds=self.config.RAID_AUTO_MATCH_DEBOUNCE,
+                max_wait_seconds=self.config.RAID_AUTO_MATCH_MAX_WAIT,
+                on_match=lambda results: self._notify_auto_match(raid_system, results)
+            )
+    
+    async def _raid_state_flush_loop(self):
+        """레이드 상태 저널을 주기적으로 fsync하고 필요 시 스냅샷 작성"""
+        while True:
+            await asyncio.sleep(self.config.RAID_STATE_FSYNC_INTERVAL)
+            self.raid_registry.flush_state()
+    
+    def _on_party_schedule_change(self, op: str):
+        """파티 생성/종료 시 만료 루프를 깨워 새로 생긴 작업의 마감 시각을 반영"""
+        if op in PARTY_SCHEDULE_OPS and self._party_expiry_wakeup is not None:
+            self._party_expiry_wakeup.set()
+    
+    async def _party_expiry_loop(self):
+        """가장 이른 만료/알림 시각까지 대기한 뒤 만료된 파티 모집 정리 및 시작 전 알림 발송"""
+        # 봇 이벤트 루프 안에서 생성 (SaveCodeBot.__init__은 루프 시작 전에 실행됨)
+        self._party_expiry_wakeup = asyncio.Event()
+        while True:
+            # 타이머는 하나만 두고, 대기 중에 파티가 생성/종료되면 깨어나서 마감 시각을 다시 계산
+            self._party_expiry_wakeup.clear()
+            next_expiry = self.raid_registry.get_next_expiry()
+            delay = None if next_expiry is None else max(next_expiry - time.time(), 0)
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self._party_expiry_wakeup.wait(), timeout=delay)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+            
+            try:
+                events = self.raid_registry.expire_parties()
+            except Exception as e:
+                logger.error(f"파티 모집 만료 처리 중 오류: {e}")
+                continue
+            
+            for _, event in events:
+                if event.kind == PartyExpiryEvent.EXPIRED:
+                    await self._notify_party_expired(event.party)
+                elif event.kind == PartyExpiryEvent.REMINDER:
+                    self._notify_party_reminder(event.party)
+                elif event.kind == PartyExpiryEvent.NO_SHOW:
+                    self._notify_party_no_show(event.party)
+    
+    def _notify_party_reminder(self, party):
+        """예정 시작 시각이 다가온 파티의 모든 파티원에게 DM 알림"""
+        embed = discord.Embed(
+            title="⏰ 레이드 시작 예정 알림",
+            description=f"**{party.raid_name}** 레이드가 곧 시작됩니다: {format_scheduled_time(party.scheduled_at)}",
+            color=0xf1c40f
+        )
+        embed.add_field(name="🏷️ 파티 ID", value=party.party_id, inline=True)
+        embed.add_field(name="👥 인원", value=f"{len(party.current_members)}/{party.max_members}", inline=True)
+        if party.room_title:
+            embed.add_field(name="🏠 방제", value=party.room_title, inline=False)
+        embed.set_footer(text="리더는 시간이 되면 내 파티 관리에서 레이드를 시작해주세요.")
+        
+        self.dm_dispatcher.dispatch_background(party.current_members, embed, route='party_reminder')
+    
+    def _notify_party_no_show(self, party):
+        """예정 시각이 지나도록 시작하지 않아 자동 종료된 파티의 모든 파티원에게 DM 알림"""
+        embed = discord.Embed(
+            title="⌛ 파티 모집 자동 종료",
+            description=(f"**{party.raid_name}** 파티가 예정 시각({format_scheduled_time(party.scheduled_at)}) 후 "
+                         f"{self.config.RAID_NO_SHOW_MINUTES}분 동안 시작되지 않아 자동으로 종료되었습니다."),
+            color=0x95a5a6
+        )
+        embed.add_field(name="🏷️ 파티 ID", value=party.party_id, inline=True)
+        if party.room_title:
+            embed.add_field(name="🏠 방제", value=party.room_title, inline=False)
+        embed.set_footer(text="계속 모집하려면 파티 모집을 다시 등록해주세요.")
+        
+        self.dm_dispatcher.dispatch_background(party.current_members, embed, route='party_no_show')
+    
+    async def _notify_party_expired(self, party):
+        """시간 초과로 자동 종료된 파티의 리더에게 DM 알림"""
+        try:
+            embed = discord.Embed(
+                title="⌛ 파티 모집 자동 종료",
+                description=f"**{party.raid_name}** 파티 모집이 {self.config.RAID_TIMEOUT_MINUTES}분이 지나 자동으로 종료되었습니다.",
+                color=0x95a5a6
+            )
+            embed.add_field(name="🏷️ 파티 ID", value=party.party_id, inline=True)
+            embed.add_field(name="👥 인원", value=f"{len(party.current_members)}/{party.max_members}", inline=True)
+            if party.room_title:
+                embed.add_field(name="🏠 방제", value=party.room_title, inline=False)
+            embed.set_footer(text="계속 모집하려면 파티 모집을 다시 등록해주세요.")
+            
+            await self.dm_dispatcher.dispatch([party.leader_id], embed, route='party_expired')
+        except Exception as e:
+            logger.error(f"파티 자동 종료 알림 중 오류 (party_id: {party.party_id}): {e}")
+    
+    async def _notify_auto_match(self, raid_system: RaidWaitingSystem, results):
+        """자동 매칭으로 구성된 파티의 모든 멤버에게 DM 알림"""
+        for result in results:
+            party = result.party
+            embed = discord.Embed(
+                title="🎯 자동 매칭 완료!",
+                description=f"**{party.raid_name}** 대기 인원이 모여 파티가 구성되었습니다.",
+                color=0x00ff00
+            )
+            embed.add_field(name="📋 파티 정보", value=raid_system.format_party_info(party), inline=False)
+            if result.helper_ids:
+                embed.add_field(
+                    name="🤝 헬퍼",
+                    value=", ".join(f"<@{user_id}>" for user_id in result.helper_ids),
+                    inline=False
+                )
+            embed.set_footer(text="매칭된 레이드/헬퍼 대기 목록에서는 자동으로 제거되었습니다.")
+            
+            self.dm_dispatcher.dispatch_background(result.all_user_ids(), embed, route='auto_match')
+    
     def run(self):
         """봇 실행"""
         try:
@@ -3676,7 +4347,11 @@ class SaveCodeBot:
                 raise ValueError("DISCORD_BOT_TOKEN이 설정되지 않았습니다.")
             
             # 봇 실행 - bot.run()은 내부적으로 이벤트 루프를 생성하고 관리합니다
-            self.bot.run(self.config.BOT_TOKEN, log_handler=None)
+            try:
+                self.bot.run(self.config.BOT_TOKEN, log_handler=None)
+            finally:
+                # 종료 시 레이드 상태 스냅샷 저장
+                self.raid_registry.close_state()
             
         except ValueError as e:
             logger.error(f"설정 오류: {e}")
@@ -3738,7 +4413,7 @@ def main():
         raise
 
 
-class SaveCodeUIView(ui.View):
+class SaveCodeUIView(TimedView):
     """세이브코드 생성 UI 버튼 뷰"""
     
     def __init__(self, bot_instance):
@@ -3752,7 +4427,7 @@ class SaveCodeUIView(ui.View):
         await interaction.response.send_modal(modal)
 
 
-class SaveCodeCreationModal(ui.Modal, title='🔮 세이브코드 생성'):
+class SaveCodeCreationModal(TimedModal, title='🔮 세이브코드 생성'):
     """세이브코드 생성을 위한 모달"""
     
     def __init__(self, bot_instance):
@@ -3885,24 +4560,28 @@ class SaveCodeCreationModal(ui.Modal, title='🔮 세이브코드 생성'):
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
-class CouponUIView(ui.View):
+class CouponUIView(TimedView):
     """쿠폰 사용 UI 버튼 뷰"""
     
-    def __init__(self):
+    def __init__(self, coupon_processor: AsyncCouponProcessor, command_scheduler: CommandScheduler):
         super().__init__(timeout=300)
+        self.coupon_processor = coupon_processor
+        self.command_scheduler = command_scheduler
     
     @ui.button(label="🎫 쿠폰 사용하기", style=discord.ButtonStyle.secondary, emoji="🎫")
     async def open_coupon_modal(self, interaction: discord.Interaction, button: ui.Button):
         """쿠폰 처리 모달 열기"""
-        modal = CouponProcessModal(None)  # bot_instance는 Modal에서 사용하지 않으므로 None
+        modal = CouponProcessModal(self.coupon_processor, self.command_scheduler)
         await interaction.response.send_modal(modal)
 
 
-class CouponCreateUIView(ui.View):
+class CouponCreateUIView(TimedView):
     """쿠폰 생성 UI 버튼 뷰"""
     
-    def __init__(self):
+    def __init__(self, coupon_processor: AsyncCouponProcessor, command_scheduler: CommandScheduler):
         super().__init__(timeout=300)
+        self.coupon_processor = coupon_processor
+        self.command_scheduler = command_scheduler
     
     @ui.button(label="🎫 쿠폰 생성하기", style=discord.ButtonStyle.danger, emoji="🎫")
     async def open_coupon_create_modal(self, interaction: discord.Interaction, button: ui.Button):
@@ -3915,7 +4594,7 @@ class CouponCreateUIView(ui.View):
             )
             return
             
-        modal = CouponCreateModal()
+        modal = CouponCreateModal(self.coupon_processor, self.command_scheduler)
         await interaction.response.send_modal(modal)
 
 
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+명령어 공정 스케줄러 모듈
+무거운 명령어(/로드, /값, /세이브생성, 쿠폰 모달)를 사용자별 대기열에 넣고 돌아가며 실행하여
+한 사용자가 요청을 몰아 넣어도 다른 사용자가 계속 처리되도록 함.
+사용자/길드별 동시 실행 수와 토큰 버킷 요청 속도를 제한하고, 관리자 요청은 먼저 실행
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict, deque
+from typing import Deque, Hashable, Optional
+
+from rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# 거절 사유별 안내 문구
+REJECTION_MESSAGES = {
+    'rate_limited': "⏳ 요청이 너무 잦습니다. {retry_after:.0f}초 후 다시 시도해주세요.",
+    'guild_rate_limited': "⏳ 이 서버의 요청이 너무 많습니다. {retry_after:.0f}초 후 다시 시도해주세요.",
+    'user_queue': "⏳ 이미 대기 중인 요청이 있습니다. 앞선 요청이 끝난 뒤 다시 시도해주세요.",
+    'queue_full': "⏳ 지금은 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+}
+
+
+class SchedulerRejectedError(RuntimeError):
+    """요청 속도/대기열 제한으로 명령어를 받지 않음"""
+
+    def __init__(self, reason: str, retry_after: float = 0.0):
+        super().__init__(f"command rejected: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def user_message(self) -> str:
+        """사용자에게 보여줄 안내 문구"""
+        return REJECTION_MESSAGES[self.reason].format(retry_after=max(1.0, self.retry_after))
+
+
+class CommandTicket:
+    """대기열에 등록된 명령어 1건"""
+
+    __slots__ = ('user_id', 'guild_id', 'admin', 'label', 'enqueued_at', 'started_at', 'released', 'future')
+
+    def __init__(self, user_id: Hashable, guild_id: Optional[Hashable], admin: bool, label: str,
+                 future: asyncio.Future):
+        self.user_id = user_id
+        self.guild_id = guild_id
+        self.admin = admin
+        self.label = label
+        self.enqueued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.released = False
+        self.future = future
+
+    @property
+    def started(self) -> bool:
+        return self.started_at is not None
+
+
+class CommandScheduler:
+    """
+    사용자별 라운드 로빈 명령어 스케줄러
+
+    일반 요청은 사용자별 대기열을 돌아가며 하나씩 시작하고 (한 사용자의 요청이 많아도 다른 사용자가 밀리지 않음),
+    관리자 요청은 별도 대기열에서 먼저 시작함. 시작 조건은 전체/사용자별/길드별 동시 실행 수
+    """
+
+    def __init__(self, max_concurrent: int = 4, user_concurrency: int = 1, guild_concurrency: int = 3,
+                 user_rate: float = 10 / 60, user_burst: float = 3, guild_rate: float = 1.0, guild_burst: float = 20,
+                 max_queue: int = 100, max_user_queue: int = 2, max_buckets: int = 10000):
+        """
+        스케줄러 초기화
+
+        Args:
+            max_concurrent: 동시에 실행할 명령어 수
+            user_concurrency: 사용자 1명이 동시에 실행할 수 있는 명령어 수
+            guild_concurrency: 길드 1곳에서 동시에 실행할 수 있는 명령어 수
+            user_rate: 사용자별 초당 요청 수 (토큰 버킷, 관리자는 제한 없음)
+            user_burst: 사용자별 순간 요청 수
+            guild_rate: 길드별 초당 요청 수
+            guild_burst: 길드별 순간 요청 수
+            max_queue: 전체 대기 요청 수 상한 (관리자 요청은 제외)
+            max_user_queue: 사용자 1명의 대기 요청 수 상한
+            max_buckets: 보관할 사용자/길드 토큰 버킷 수 (오래 쓰지 않은 버킷부터 삭제)
+        """
+        self.max_concurrent = max_concurrent
+        self.user_concurrency = user_concurrency
+        self.guild_concurrency = guild_concurrency
+        self.user_rate = user_rate
+        self.user_burst = user_burst
+        self.guild_rate = guild_rate
+        self.guild_burst = guild_burst
+        self.max_queue = max_queue
+        self.max_user_queue = max_user_queue
+        self.max_buckets = max_buckets
+
+        self._admin_queue: Deque[CommandTicket] = deque()
+        self._user_queues: 'OrderedDict[Hashable, Deque[CommandTicket]]' = OrderedDict()  # 순서 = 라운드 로빈 순서
+        self._queued = 0  # 일반 대기 요청 수
+        self._running = 0
+        self._user_running: Counter = Counter()
+        self._guild_running: Counter = Counter()
+        self._user_buckets: 'OrderedDict[Hashable, TokenBucket]' = OrderedDict()
+        self._guild_buckets: 'OrderedDict[Hashable, TokenBucket]' = OrderedDict()
+
+        # 통계
+        self.submitted = 0
+        self.started = 0
+        self.admin_started = 0
+        self.cancelled = 0
+        self.rejected: Counter = Counter()  # {거절 사유: 횟수}
+        self._wait_times: Deque[float] = deque(maxlen=1000)  # 최근 시작한 요청의 대기 시간 (초)
+
+    def _bucket(self, buckets: 'OrderedDict[Hashable, TokenBucket]', key: Hashable,
+                rate: float, burst: float) -> TokenBucket:
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = TokenBucket(rate, burst)
+            if len(buckets) > self.max_buckets:
+                buckets.popitem(last=False)
+        else:
+            buckets.move_to_end(key)
+        return bucket
+
+    def _check_rate(self, user_id: Hashable, guild_id: Optional[Hashable]):
+        user_bucket = self._bucket(self._user_buckets, user_id, self.user_rate, self.user_burst)
+        if not user_bucket.try_acquire():
+            raise SchedulerRejectedError('rate_limited', user_bucket.wait_time())
+        if guild_id is not None:
+            guild_bucket = self._bucket(self._guild_buckets, guild_id, self.guild_rate, self.guild_burst)
+            if not guild_bucket.try_acquire():
+                user_bucket.refund()
+                raise SchedulerRejectedError('guild_rate_limited', guild_bucket.wait_time())
+
+    def submit(self, user_id: Hashable, guild_id: Optional[Hashable] = None, admin: bool = False,
+               label: str = '') -> CommandTicket:
+        """
+        명령어를 대기열에 등록 (자리가 있으면 바로 시작)
+
+        Args:
+            user_id: 요청한 사용자 ID
+            guild_id: 요청한 길드 ID (DM이면 None)
+            admin: 관리자 요청 여부 (우선 실행, 요청 속도 제한 없음)
+            label: 명령어 이름 (로그용)
+
+        Returns:
+            CommandTicket: 등록된 요청 (wait()로 차례를 기다리고 끝나면 release())
+
+        Raises:
+            SchedulerRejectedError: 요청 속도나 대기열 제한에 걸린 경우
+        """
+        try:
+            if not admin:
+                user_queue = self._user_queues.get(user_id)
+                if user_queue is not None and len(user_queue) >= self.max_user_queue:
+                    raise SchedulerRejectedError('user_queue')
+                if self._queued >= self.max_queue:
+                    raise SchedulerRejectedError('queue_full')
+                self._check_rate(user_id, guild_id)
+        except SchedulerRejectedError as e:
+            self.rejected[e.reason] += 1
+            raise
+
+        ticket = CommandTicket(user_id, guild_id, admin, label, asyncio.get_running_loop().create_future())
+        self.submitted += 1
+        if admin:
+            self._admin_queue.append(ticket)
+        else:
+            self._user_queues.setdefault(user_id, deque()).append(ticket)
+            self._queued += 1
+        self._dispatch()
+        return ticket
+
+    def position(self, ticket: CommandTicket) -> int:
+        """
+        대기 순번 (1부터, 이미 시작했으면 0)
+
+        일반 요청은 라운드 로빈 순서대로 앞에 있는 요청 수로 계산 (동시 실행 제한으로 건너뛰는 경우는 반영하지 않음)
+        """
+        if ticket.started:
+            return 0
+        if ticket.admin:
+            return self._admin_queue.index(ticket) + 1
+
+        own_queue = self._user_queues[ticket.user_id]
+        rank = own_queue.index(ticket)
+        ahead = len(self._admin_queue) + rank
+        before_own = True
+        for user_id, queue in self._user_queues.items():
+            if user_id == ticket.user_id:
+                before_own = False
+                continue
+            # 앞 순서 사용자는 같은 바퀴에서 먼저, 뒤 순서 사용자는 이전 바퀴까지만 앞섬
+            ahead += min(len(queue), rank + 1 if before_own else rank)
+        return ahead + 1
+
+    async def wait(self, ticket: CommandTicket):
+        """차례가 될 때까지 대기 (기다리다 취소되면 대기열에서 제거)"""
+        try:
+            await ticket.future
+        except asyncio.CancelledError:
+            self.release(ticket)
+            raise
+
+    def release(self, ticket: CommandTicket):
+        """명령어 처리 종료 (시작 전이면 대기열에서 제거)"""
+        if ticket.released:
+            return
+        ticket.released = True
+        if not ticket.started:
+            self.cancelled += 1
+            if ticket.admin:
+                self._admin_queue.remove(ticket)
+            else:
+                queue = self._user_queues[ticket.user_id]
+                queue.remove(ticket)
+                self._queued -= 1
+                if not queue:
+                    del self._user_queues[ticket.user_id]
+            if not ticket.future.done():
+                ticket.future.cancel()
+            return
+
+        self._running -= 1
+        self._user_running[ticket.user_id] -= 1
+        if self._user_running[ticket.user_id] <= 0:
+            del self._user_running[ticket.user_id]
+        if ticket.guild_id is not None:
+            self._guild_running[ticket.guild_id] -= 1
+            if self._guild_running[ticket.guild_id] <= 0:
+                del self._guild_running[ticket.guild_id]
+        self._dispatch()
+
+    def _can_start(self, ticket: CommandTicket) -> bool:
+        if self._user_running[ticket.user_id] >= self.user_concurrency:
+            return False
+        if ticket.guild_id is not None and self._guild_running[ticket.guild_id] >= self.guild_concurrency:
+            return False
+        return True
+
+    def _next_ticket(self) -> Optional[CommandTicket]:
+        for ticket in self._admin_queue:
+            if self._can_start(ticket):
+                self._admin_queue.remove(ticket)
+                return ticket
+        for user_id, queue in self._user_queues.items():
+            ticket = queue[0]
+            if self._can_start(ticket):
+                queue.popleft()
+                self._queued -= 1
+                # 시작한 사용자는 라운드 로빈 순서의 맨 뒤로
+                del self._user_queues[user_id]
+                if queue:
+                    self._user_queues[user_id] = queue
+                return ticket
+        return None
+
+    def _dispatch(self):
+        while self._running < self.max_concurrent:
+            ticket = self._next_ticket()
+            if ticket is None:
+                return
+            ticket.started_at = time.monotonic()
+            self._running += 1
+            self._user_running[ticket.user_id] += 1
+            if ticket.guild_id is not None:
+                self._guild_running[ticket.guild_id] += 1
+            self.started += 1
+            if ticket.admin:
+                self.admin_started += 1
+            self._wait_times.append(ticket.started_at - ticket.enqueued_at)
+            if not ticket.future.done():
+                ticket.future.set_result(None)
+
+    def get_stats(self) -> dict:
+        """대기열/대기 시간 통계 (대기 시간은 최근 시작한 요청 기준, 초)"""
+        waits = sorted(self._wait_times)
+
+        def percentile(q: float) -> float:
+            return waits[min(len(waits) - 1, int(q * len(waits)))] if waits else 0.0
+
+        return {
+            'running': self._running,
+            'queued': self._queued + len(self._admin_queue),
+            'queued_users': len(self._user_queues),
+            'submitted': self.submitted,
+            'started': self.started,
+            'admin_started': self.admin_started,
+            'cancelled': self.cancelled,
+            'rejected': dict(self.rejected),
+            'wait_p50': percentile(0.5),
+            'wait_p99': percentile(0.99),
+            'wait_max': waits[-1] if waits else 0.0,
+        }
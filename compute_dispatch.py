@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+계산 작업 분배 모듈
+세이브코드 일괄 분석, 아이템 검색처럼 CPU를 쓰는 작업을 크기 제한이 있는 실행기(스레드/프로세스 풀)로 보내
+이벤트 루프(디스코드 하트비트, 다른 명령어 처리)가 멈추지 않도록 함.
+작은 작업은 실행기로 보내는 비용이 더 크므로 이벤트 루프에서 바로 실행
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import sys
+from typing import Any, Callable, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_KINDS = ('thread', 'process')
+
+
+class ComputeQueueFullError(RuntimeError):
+    """실행기에 대기 중인 작업이 너무 많아 새 작업을 받을 수 없음"""
+
+
+class ComputeExpiredError(RuntimeError):
+    """응답 기한이 지나 작업을 취소함"""
+
+
+class ComputeDispatcher:
+    """
+    CPU 작업 실행기
+
+    실행기로 보낸 작업은 실제로 끝날 때까지 대기 수에 포함되므로 (기한이 지나 결과를 버린 작업도 포함)
+    동시에 쌓이는 작업은 max_queue개를 넘지 않음
+    """
+
+    def __init__(self, executor: str = 'thread', max_workers: int = 2, max_queue: int = 32,
+                 inline_max: int = 1, chunk_size: int = 25):
+        """
+        실행기 초기화
+
+        Args:
+            executor: 'thread' (ThreadPoolExecutor) 또는 'process' (ProcessPoolExecutor, 함수와 인자가 pickle 가능해야 함)
+            max_workers: 작업자 수
+            max_queue: 실행 중이거나 대기 중인 작업 수 상한 (넘으면 ComputeQueueFullError)
+            inline_max: 이 크기 이하의 작업은 이벤트 루프에서 바로 실행
+            chunk_size: map_chunks에서 실행기로 한 번에 보낼 항목 수
+        """
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(f"executor must be one of {EXECUTOR_KINDS}")
+        self.executor_kind = executor
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.inline_max = inline_max
+        self.chunk_size = chunk_size
+        self._executor: Optional[concurrent.futures.Executor] = None
+        self._pending = 0
+        self._futures: Set[concurrent.futures.Future] = set()  # 실행기로 보낸 뒤 아직 끝나지 않은 작업
+
+        # 통계
+        self.inline = 0
+        self.offloaded = 0
+        self.rejected = 0
+        self.expired = 0
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        # 첫 작업에서 생성 (계산 작업이 없으면 작업자 스레드/프로세스를 만들지 않음)
+        if self._executor is None:
+            if self.executor_kind == 'process':
+                self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                                                       thread_name_prefix='compute')
+        return self._executor
+
+    def _finish(self, loop: asyncio.AbstractEventLoop, future: concurrent.futures.Future):
+        # 작업자 스레드에서 호출될 수 있으므로 대기 수는 이벤트 루프에서 줄임
+        self._futures.discard(future)
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            pass  # 봇 종료로 이벤트 루프가 이미 닫힌 경우
+
+    def _release(self):
+        self._pending -= 1
+
+    async def _offload(self, func: Callable, args: tuple, deadline: Optional[float]) -> Any:
+        loop = asyncio.get_running_loop()
+        timeout = None
+        if deadline is not None:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                self.expired += 1
+                raise ComputeExpiredError("compute deadline passed before the job started")
+        if self._pending >= self.max_queue:
+            self.rejected += 1
+            raise ComputeQueueFullError(f"too many compute jobs queued ({self.max_queue})")
+
+        future = self._get_executor().submit(functools.partial(func, *args))
+        self._pending += 1
+        self.offloaded += 1
+        self._futures.add(future)
+        future.add_done_callback(functools.partial(self._finish, loop))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            # 아직 시작하지 않은 작업은 취소됨 (이미 실행 중인 작업은 끝난 뒤 결과를 버림)
+            future.cancel()
+            self.expired += 1
+            raise ComputeExpiredError("compute deadline passed") from None
+
+    async def run(self, func: Callable, *args, size: Optional[int] = None, deadline: Optional[float] = None) -> Any:
+        """
+        func(*args) 실행
+
+        Args:
+            func: 실행할 함수
+            size: 작업 크기 (세이브코드 수 등, inline_max 이하면 이벤트 루프에서 바로 실행, None이면 항상 실행기 사용)
+            deadline: 응답 기한 (loop.time() 기준, 지나면 ComputeExpiredError)
+
+        Raises:
+            ComputeQueueFullError: 대기 중인 작업이 max_queue개 이상인 경우
+            ComputeExpiredError: 기한 안에 끝나지 않은 경우
+        """
+        if size is not None and size <= self.inline_max:
+            self.inline += 1
+            return func(*args)
+        return await self._offload(func, args, deadline)
+
+    async def map_chunks(self, func: Callable[..., List[Any]], items: Sequence[Any], *args,
+                         deadline: Optional[float] = None) -> List[Any]:
+        """
+        items를 chunk_size개씩 나눠 func(chunk, *args)를 차례로 실행하고 결과 목록을 이어 붙임
+
+        덩어리 사이마다 기한을 확인하므로 큰 작업도 기한이 지나면 남은 덩어리는 실행하지 않으며,
+        작업자를 한 요청이 오래 붙잡지 않아 다른 요청의 작업이 사이사이 실행됨
+        """
+        if len(items) <= self.inline_max:
+            self.inline += 1
+            return func(list(items), *args)
+        results: List[Any] = []
+        for start in range(0, len(items), self.chunk_size):
+            results.extend(await self._offload(func, (list(items[start:start + self.chunk_size]),) + args, deadline))
+        return results
+
+    def get_stats(self) -> dict:
+        return {
+            'executor': self.executor_kind,
+            'workers': self.max_workers,
+            'pending': self._pending,
+            'max_queue': self.max_queue,
+            'inline': self.inline,
+            'offloaded': self.offloaded,
+            'rejected': self.rejected,
+            'expired': self.expired,
+        }
+
+    async def shutdown(self, wait: bool = False):
+        """
+        실행기 종료 (대기 중인 작업은 취소)
+
+        Args:
+            wait: 실행 중인 작업이 끝나고 워커가 정리될 때까지 기다릴지 여부
+                (프로세스 풀은 인터프리터 종료 처리와 겹치지 않도록 종료 직전에는 True로 호출)
+        """
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            if sys.version_info >= (3, 9):
+                shutdown = functools.partial(executor.shutdown, cancel_futures=True)
+            else:
+                # Python 3.8에는 cancel_futures가 없으므로 아직 시작하지 않은 작업을 직접 취소
+                for future in list(self._futures):
+                    future.cancel()
+                shutdown = executor.shutdown
+            if wait:
+                # 워커 정리는 블로킹 호출이므로 이벤트 루프 밖에서 기다림
+                await asyncio.get_running_loop().run_in_executor(None, functools.partial(shutdown, wait=True))
+            else:
+                shutdown(wait=False)
+            logger.info("계산 작업 실행기 종료")
@@ -24,6 +24,29 @@ class BotSettings:
     command_prefix: str = '/'
     log_level: str = 'INFO'
     log_format: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    dm_concurrency: int = 8  # 동시에 진행할 최대 DM 발송 수
+    dm_global_rate: float = 40.0  # 전체 DM 발송 초당 요청 수 (Discord 전역 한도 50/초보다 낮게)
+    dm_route_rate: float = 10.0  # 알림 종류(경로)별 DM 발송 초당 요청 수
+    scheduler_max_in_flight: int = 16  # 지연 작업(임시 메시지 삭제/수정) 최대 동시 실행 수
+    compute_executor: str = 'thread'  # CPU 작업 실행기 ('thread' 또는 'process')
+    compute_workers: int = 2  # CPU 작업 실행기 작업자 수
+    compute_max_queue: int = 32  # 실행기에 쌓일 수 있는 CPU 작업 수 (넘으면 바로 거절)
+    compute_inline_max: int = 1  # 이 개수 이하의 세이브코드는 실행기로 보내지 않고 바로 처리
+    compute_timeout: float = 60.0  # CPU 작업 응답 기한 (초, 슬래시 상호작용은 토큰 만료 15분도 함께 적용)
+    command_max_concurrent: int = 4  # 무거운 명령어(/로드, /값, /세이브생성, 쿠폰 모달) 동시 실행 수
+    command_user_concurrency: int = 1  # 사용자 1명의 무거운 명령어 동시 실행 수
+    command_guild_concurrency: int = 3  # 길드 1곳의 무거운 명령어 동시 실행 수
+    command_user_rate: float = 10.0  # 사용자별 분당 요청 수 (관리자 제외)
+    command_user_burst: int = 3  # 사용자별 연속 요청 허용 수
+    command_guild_rate: float = 60.0  # 길드별 분당 요청 수
+    command_guild_burst: int = 20  # 길드별 연속 요청 허용 수
+    command_max_queue: int = 100  # 전체 대기 요청 수 (넘으면 바로 거절)
+    command_max_user_queue: int = 2  # 사용자 1명의 대기 요청 수
+    result_cache_ttl: float = 600.0  # /로드, /검증 분석 결과 보관 시간 (초, 0이면 캐시 안 함)
+    result_cache_max_entries: int = 256  # /로드, /검증 분석 결과 최대 보관 개수
+    metrics_port: int = 0  # Prometheus 지표(/metrics) HTTP 포트 (0이면 끔)
+    metrics_host: str = '127.0.0.1'  # 지표 서버 주소 (외부에 열지 않도록 기본은 로컬)
+    metrics_loop_lag_interval: float = 1.0  # 이벤트 루프 지연 측정 간격 (초)
 
 
 @dataclass
@@ -31,7 +54,27 @@ class RaidSettings:
     """레이드 시스템 설정"""
     channel_id: int = 0  # 0이면 자동 검색
     max_participants: int = 30
-    timeout_minutes: int = 30
+    timeout_minutes: int = 30  # 파티 모집 자동 종료 시간 (0이면 자동 종료 안 함)
+    party_purge_minutes: int = 10  # 종료된 파티 모집을 삭제하기까지의 유예 시간 (0이면 삭제 안 함)
+    reminder_minutes: int = 10  # 예정 시간이 있는 파티의 시작 전 알림 시점 (0이면 알림 안 함)
+    no_show_minutes: int = 30  # 예정 시각 후 레이드를 시작하지 않은 파티를 자동 종료하기까지의 시간 (0이면 비활성화)
+    catalog_file: str = ''  # 길드별 레이드 목록 JSON 파일 (비어 있으면 기본 레이드 목록 사용)
+    state_dir: str = 'raid_state'  # 빈 문자열이면 상태 저장 비활성화 (길드별 하위 디렉토리에 저장)
+    state_fsync_interval: float = 0.5  # 저널 fsync 묶음 간격 (초)
+    state_snapshot_every: int = 1000  # 저널 기록 N건마다 스냅샷 작성
+    state_legacy_guild_id: int = 0  # state_dir 바로 아래의 이전 상태 파일을 옮겨 받을 길드 (0이면 봇이 속한 길드가 하나일 때 자동)
+    auto_match_enabled: bool = False  # 대기 목록 자동 매칭 사용 여부
+    auto_match_debounce: float = 2.0  # 마지막 대기 목록 변경 후 자동 매칭까지 대기 시간 (초)
+    auto_match_max_wait: float = 10.0  # 변경이 계속 이어져도 첫 변경 후 이 시간 안에는 매칭 실행 (초)
+    auto_match_max_helpers: int = 1  # 자동 매칭 파티 하나에 채울 수 있는 최대 헬퍼 수
+    status_message_enabled: bool = False  # 레이드 메시지와 함께 실시간 현황 메시지 고정 여부
+    status_debounce: float = 2.0  # 현황 메시지 수정 전 변경을 모으는 시간 (초)
+    status_min_edit_interval: float = 5.0  # 현황 메시지 수정 최소 간격 (초, 채널 수정 한도 대응)
+    party_sizes: dict = None  # 레이드별 파티 인원 {레이드 이름: 인원} (없으면 max_participants)
+    
+    def __post_init__(self):
+        if self.party_sizes is None:
+            self.party_sizes = {}  # 기본값: 모든 레이드가 max_participants 사용
 
 
 @dataclass
@@ -72,6 +115,31 @@ class GameSettings:
             self.summon_chunk_n = 0
 
 
+@dataclass
+class CouponSettings:
+    """쿠폰 API 관련 설정"""
+    api_url: str = 'http://211.202.189.93:5036'
+    timeout: float = 10.0  # 요청 1건의 전체 제한 시간 (초)
+    connect_timeout: float = 3.0  # 연결 수립 제한 시간 (초)
+    pool_size: int = 10  # 쿠폰 서버와 유지할 최대 연결 수
+    negative_cache_ttl: float = 30.0  # 사용할 수 없는 쿠폰 체크 결과 캐시 시간 (초, 0이면 캐시 안 함)
+    cache_max_entries: int = 10000  # 쿠폰 체크 캐시 최대 항목 수
+    outbox_path: str = 'coupon_outbox.db'  # 빈 문자열이면 쿠폰 사용 아웃박스 비활성화
+    outbox_base_delay: float = 5.0  # 쿠폰 사용 재시도 첫 대기 시간 (초, 실패할 때마다 2배)
+    outbox_max_delay: float = 600.0  # 쿠폰 사용 재시도 대기 시간 상한 (초)
+    breaker_threshold: int = 5  # 서킷 브레이커를 여는 연속 실패 횟수 (0이면 사용 안 함)
+    breaker_reset: float = 30.0  # 회로를 연 뒤 시험 요청까지의 시간 (초)
+    max_retries: int = 2  # 요청 1건의 최대 재시도 횟수
+    retry_base_delay: float = 0.2  # 재시도 대기 시간 기준값 (초, 지수 백오프 + 지터)
+    retry_budget_ratio: float = 0.2  # 요청 1건당 적립되는 재시도 예산
+    max_in_flight: int = 20  # 쿠폰 서버로 동시에 보낼 수 있는 요청 수 (초과하면 바로 거절)
+    max_redeeming_codes: int = 1000  # 동시에 사용 처리할 수 있는 쿠폰 코드 수 (코드별 락 맵 크기)
+    bulk_max_count: int = 1000  # 대량 발급 1회 최대 쿠폰 수
+    bulk_concurrency: int = 5  # 대량 발급 동시 생성 요청 수
+    bulk_rate: float = 5.0  # 대량 발급 초당 생성 요청 수 (재시도 포함)
+    bulk_max_retries: int = 3  # 대량 발급 실패 항목 최대 재시도 횟수
+
+
 @dataclass
 class OptimizationSettings:
     """최적화 관련 설정"""
@@ -92,6 +160,7 @@ class ConfigManager:
         self.raid = self._load_raid_settings()
         self.permissions = self._load_permission_settings()
         self.game = self._load_game_settings()
+        self.coupon = self._load_coupon_settings()
         self.optimization = self._load_optimization_settings()
         self._setup_logging()
     
@@ -105,15 +174,62 @@ class ConfigManager:
             token=token,
             command_prefix=os.getenv('COMMAND_PREFIX', '/'),
             log_level=os.getenv('LOG_LEVEL', 'INFO'),
-            log_format=os.getenv('LOG_FORMAT', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            log_format=os.getenv('LOG_FORMAT', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
+            dm_concurrency=int(os.getenv('DM_CONCURRENCY', '8')),
+            dm_global_rate=float(os.getenv('DM_GLOBAL_RATE', '40')),
+            dm_route_rate=float(os.getenv('DM_ROUTE_RATE', '10')),
+            scheduler_max_in_flight=int(os.getenv('SCHEDULER_MAX_IN_FLIGHT', '16')),
+            compute_executor=os.getenv('COMPUTE_EXECUTOR', 'thread').lower(),
+            compute_workers=int(os.getenv('COMPUTE_WORKERS', '2')),
+            compute_max_queue=int(os.getenv('COMPUTE_MAX_QUEUE', '32')),
+            compute_inline_max=int(os.getenv('COMPUTE_INLINE_MAX', '1')),
+            compute_timeout=float(os.getenv('COMPUTE_TIMEOUT', '60')),
+            command_max_concurrent=int(os.getenv('COMMAND_MAX_CONCURRENT', '4')),
+            command_user_concurrency=int(os.getenv('COMMAND_USER_CONCURRENCY', '1')),
+            command_guild_concurrency=int(os.getenv('COMMAND_GUILD_CONCURRENCY', '3')),
+            command_user_rate=float(os.getenv('COMMAND_USER_RATE', '10')),
+            command_user_burst=int(os.getenv('COMMAND_USER_BURST', '3')),
+            command_guild_rate=float(os.getenv('COMMAND_GUILD_RATE', '60')),
+            command_guild_burst=int(os.getenv('COMMAND_GUILD_BURST', '20')),
+            command_max_queue=int(os.getenv('COMMAND_MAX_QUEUE', '100')),
+            command_max_user_queue=int(os.getenv('COMMAND_MAX_USER_QUEUE', '2')),
+            result_cache_ttl=float(os.getenv('RESULT_CACHE_TTL', '600')),
+            result_cache_max_entries=int(os.getenv('RESULT_CACHE_MAX_ENTRIES', '256')),
+            metrics_port=int(os.getenv('METRICS_PORT', '0')),
+            metrics_host=os.getenv('METRICS_HOST', '127.0.0.1'),
+            metrics_loop_lag_interval=float(os.getenv('METRICS_LOOP_LAG_INTERVAL', '1'))
         )
     
     def _load_raid_settings(self) -> RaidSettings:
         """레이드 설정 로드"""
+        # 레이드별 파티 인원을 "델모크:8,아몬:6" 형식으로 받기
+        party_sizes_str = os.getenv('RAID_PARTY_SIZES', '')
+        party_sizes = {}
+        for entry in party_sizes_str.split(','):
+            raid_name, _, size = entry.rpartition(':')
+            if raid_name.strip() and size.strip().isdigit():
+                party_sizes[raid_name.strip()] = int(size.strip())
+        
         return RaidSettings(
             channel_id=int(os.getenv('RAID_CHANNEL_ID', '0')),
             max_participants=int(os.getenv('RAID_MAX_PARTICIPANTS', '30')),
-            timeout_minutes=int(os.getenv('RAID_TIMEOUT_MINUTES', '30'))
+            timeout_minutes=int(os.getenv('RAID_TIMEOUT_MINUTES', '30')),
+            party_purge_minutes=int(os.getenv('RAID_PARTY_PURGE_MINUTES', '10')),
+            reminder_minutes=int(os.getenv('RAID_REMINDER_MINUTES', '10')),
+            no_show_minutes=int(os.getenv('RAID_NO_SHOW_MINUTES', '30')),
+            catalog_file=os.getenv('RAID_CATALOG_FILE', ''),
+            state_dir=os.getenv('RAID_STATE_DIR', 'raid_state'),
+            state_fsync_interval=float(os.getenv('RAID_STATE_FSYNC_INTERVAL', '0.5')),
+            state_snapshot_every=int(os.getenv('RAID_STATE_SNAPSHOT_EVERY', '1000')),
+            state_legacy_guild_id=int(os.getenv('RAID_STATE_LEGACY_GUILD_ID', '0')),
+            auto_match_enabled=os.getenv('RAID_AUTO_MATCH', 'False').lower() == 'true',
+            auto_match_debounce=float(os.getenv('RAID_AUTO_MATCH_DEBOUNCE', '2.0')),
+            auto_match_max_wait=float(os.getenv('RAID_AUTO_MATCH_MAX_WAIT', '10.0')),
+            auto_match_max_helpers=int(os.getenv('RAID_AUTO_MATCH_MAX_HELPERS', '1')),
+            status_message_enabled=os.getenv('RAID_STATUS_MESSAGE', 'False').lower() == 'true',
+            status_debounce=float(os.getenv('RAID_STATUS_DEBOUNCE', '2.0')),
+            status_min_edit_interval=float(os.getenv('RAID_STATUS_MIN_EDIT_INTERVAL', '5.0')),
+            party_sizes=party_sizes
         )
     
     def _load_permission_settings(self) -> PermissionSettings:
@@ -139,6 +255,31 @@ class ConfigManager:
             summon_chunk_n=int(os.getenv('SUMMON_CHUNK_N', '0'))
         )
     
+    def _load_coupon_settings(self) -> CouponSettings:
+        """쿠폰 API 설정 로드"""
+        return CouponSettings(
+            api_url=os.getenv('COUPON_API_URL', 'http://211.202.189.93:5036'),
+            timeout=float(os.getenv('COUPON_TIMEOUT', '10')),
+            connect_timeout=float(os.getenv('COUPON_CONNECT_TIMEOUT', '3')),
+            pool_size=int(os.getenv('COUPON_POOL_SIZE', '10')),
+            negative_cache_ttl=float(os.getenv('COUPON_NEGATIVE_CACHE_TTL', '30')),
+            cache_max_entries=int(os.getenv('COUPON_CACHE_MAX_ENTRIES', '10000')),
+            outbox_path=os.getenv('COUPON_OUTBOX_PATH', 'coupon_outbox.db'),
+            outbox_base_delay=float(os.getenv('COUPON_OUTBOX_BASE_DELAY', '5')),
+            outbox_max_delay=float(os.getenv('COUPON_OUTBOX_MAX_DELAY', '600')),
+            breaker_threshold=int(os.getenv('COUPON_BREAKER_THRESHOLD', '5')),
+            breaker_reset=float(os.getenv('COUPON_BREAKER_RESET', '30')),
+            max_retries=int(os.getenv('COUPON_MAX_RETRIES', '2')),
+            retry_base_delay=float(os.getenv('COUPON_RETRY_BASE_DELAY', '0.2')),
+            retry_budget_ratio=float(os.getenv('COUPON_RETRY_BUDGET_RATIO', '0.2')),
+            max_in_flight=int(os.getenv('COUPON_MAX_IN_FLIGHT', '20')),
+            max_redeeming_codes=int(os.getenv('COUPON_MAX_REDEEMING_CODES', '1000')),
+            bulk_max_count=int(os.getenv('COUPON_BULK_MAX_COUNT', '1000')),
+            bulk_concurrency=int(os.getenv('COUPON_BULK_CONCURRENCY', '5')),
+            bulk_rate=float(os.getenv('COUPON_BULK_RATE', '5')),
+            bulk_max_retries=int(os.getenv('COUPON_BULK_MAX_RETRIES', '3'))
+        )
+    
     def _load_optimization_settings(self) -> OptimizationSettings:
         """최적화 설정 로드"""
         return OptimizationSettings(
@@ -164,8 +305,82 @@ class ConfigManager:
         if self.optimization.max_cores <= 0:
             raise ValueError("Max cores must be > 0")
         
+        if self.bot.dm_concurrency <= 0 or self.bot.dm_global_rate <= 0 or self.bot.dm_route_rate <= 0:
+            raise ValueError("DM concurrency and rates must be > 0")
+        
+        if self.bot.scheduler_max_in_flight <= 0:
+            raise ValueError("Scheduler max in-flight must be > 0")
+        
+        if self.bot.compute_executor not in ('thread', 'process'):
+            raise ValueError("Compute executor must be 'thread' or 'process'")
+        
+        if self.bot.compute_workers <= 0 or self.bot.compute_max_queue <= 0 or self.bot.compute_timeout <= 0:
+            raise ValueError("Compute workers, max queue and timeout must be > 0")
+        
+        if self.bot.compute_inline_max < 0:
+            raise ValueError("Compute inline max must be >= 0")
+        
+        if (self.bot.command_max_concurrent <= 0 or self.bot.command_user_concurrency <= 0
+                or self.bot.command_guild_concurrency <= 0):
+            raise ValueError("Command concurrency limits must be > 0")
+        
+        if (self.bot.command_user_rate <= 0 or self.bot.command_user_burst <= 0
+                or self.bot.command_guild_rate <= 0 or self.bot.command_guild_burst <= 0):
+            raise ValueError("Command rates and bursts must be > 0")
+        
+        if self.bot.command_max_queue <= 0 or self.bot.command_max_user_queue <= 0:
+            raise ValueError("Command queue limits must be > 0")
+        
+        if self.bot.result_cache_ttl < 0 or self.bot.result_cache_max_entries < 0:
+            raise ValueError("Result cache TTL and max entries must be >= 0")
+        
+        if not 0 <= self.bot.metrics_port <= 65535:
+            raise ValueError("Metrics port must be between 0 and 65535")
+        
+        if self.bot.metrics_loop_lag_interval <= 0:
+            raise ValueError("Metrics loop lag interval must be > 0")
+        
         if self.raid.max_participants <= 0:
             raise ValueError("Raid max participants must be > 0")
+        
+        if self.raid.timeout_minutes < 0 or self.raid.party_purge_minutes < 0:
+            raise ValueError("Raid party timeout/purge minutes must be >= 0")
+        
+        if self.raid.reminder_minutes < 0 or self.raid.no_show_minutes < 0:
+            raise ValueError("Raid reminder/no-show minutes must be >= 0")
+        
+        if self.raid.auto_match_max_helpers < 0:
+            raise ValueError("Raid auto match max helpers must be >= 0")
+        
+        if self.raid.auto_match_max_wait < self.raid.auto_match_debounce:
+            raise ValueError("Raid auto match max wait must be >= debounce")
+        
+        if self.raid.state_snapshot_every <= 0:
+            raise ValueError("Raid state snapshot interval must be > 0")
+        
+        if self.coupon.timeout <= 0 or self.coupon.connect_timeout <= 0 or self.coupon.pool_size <= 0:
+            raise ValueError("Coupon API timeouts and pool size must be > 0")
+        
+        if self.coupon.negative_cache_ttl < 0 or self.coupon.cache_max_entries <= 0:
+            raise ValueError("Coupon cache TTL must be >= 0 and max entries > 0")
+        
+        if self.coupon.outbox_base_delay <= 0 or self.coupon.outbox_max_delay < self.coupon.outbox_base_delay:
+            raise ValueError("Coupon outbox base delay must be > 0 and max delay >= base delay")
+        
+        if self.coupon.breaker_threshold < 0 or self.coupon.breaker_reset <= 0:
+            raise ValueError("Coupon breaker threshold must be >= 0 and reset > 0")
+        
+        if self.coupon.max_retries < 0 or self.coupon.retry_base_delay < 0 or self.coupon.retry_budget_ratio < 0:
+            raise ValueError("Coupon retries, retry delay and retry budget ratio must be >= 0")
+        
+        if self.coupon.max_in_flight <= 0 or self.coupon.max_redeeming_codes <= 0:
+            raise ValueError("Coupon max in-flight and max redeeming codes must be > 0")
+        
+        if self.coupon.bulk_max_count <= 0 or self.coupon.bulk_concurrency <= 0 or self.coupon.bulk_rate <= 0:
+            raise ValueError("Coupon bulk max count, concurrency and rate must be > 0")
+        
+        if self.coupon.bulk_max_retries < 0:
+            raise ValueError("Coupon bulk max retries must be >= 0")
     
     def get_env_info(self) -> Dict[str, Any]:
         """환경 정보 반환 (디버깅용)"""
@@ -188,7 +403,48 @@ class Config:
         # 기존 속성들을 매핑
         self.BOT_TOKEN = self._manager.bot.token
         self.COMMAND_PREFIX = self._manager.bot.command_prefix
+        self.DM_CONCURRENCY = self._manager.bot.dm_concurrency
+        self.DM_GLOBAL_RATE = self._manager.bot.dm_global_rate
+        self.DM_ROUTE_RATE = self._manager.bot.dm_route_rate
+        self.SCHEDULER_MAX_IN_FLIGHT = self._manager.bot.scheduler_max_in_flight
+        self.COMPUTE_EXECUTOR = self._manager.bot.compute_executor
+        self.COMPUTE_WORKERS = self._manager.bot.compute_workers
+        self.COMPUTE_MAX_QUEUE = self._manager.bot.compute_max_queue
+        self.COMPUTE_INLINE_MAX = self._manager.bot.compute_inline_max
+        self.COMPUTE_TIMEOUT = self._manager.bot.compute_timeout
+        self.COMMAND_MAX_CONCURRENT = self._manager.bot.command_max_concurrent
+        self.COMMAND_USER_CONCURRENCY = self._manager.bot.command_user_concurrency
+        self.COMMAND_GUILD_CONCURRENCY = self._manager.bot.command_guild_concurrency
+        self.COMMAND_USER_RATE = self._manager.bot.command_user_rate
+        self.COMMAND_USER_BURST = self._manager.bot.command_user_burst
+        self.COMMAND_GUILD_RATE = self._manager.bot.command_guild_rate
+        self.COMMAND_GUILD_BURST = self._manager.bot.command_guild_burst
+        self.COMMAND_MAX_QUEUE = self._manager.bot.command_max_queue
+        self.COMMAND_MAX_USER_QUEUE = self._manager.bot.command_max_user_queue
+        self.RESULT_CACHE_TTL = self._manager.bot.result_cache_ttl
+        self.RESULT_CACHE_MAX_ENTRIES = self._manager.bot.result_cache_max_entries
+        self.METRICS_PORT = self._manager.bot.metrics_port
+        self.METRICS_HOST = self._manager.bot.metrics_host
+        self.METRICS_LOOP_LAG_INTERVAL = self._manager.bot.metrics_loop_lag_interval
         self.RAID_CHANNEL_ID = self._manager.raid.channel_id
+        self.RAID_TIMEOUT_MINUTES = self._manager.raid.timeout_minutes
+        self.RAID_PARTY_PURGE_MINUTES = self._manager.raid.party_purge_minutes
+        self.RAID_REMINDER_MINUTES = self._manager.raid.reminder_minutes
+        self.RAID_NO_SHOW_MINUTES = self._manager.raid.no_show_minutes
+        self.RAID_CATALOG_FILE = self._manager.raid.catalog_file
+        self.RAID_STATE_DIR = self._manager.raid.state_dir
+        self.RAID_STATE_FSYNC_INTERVAL = self._manager.raid.state_fsync_interval
+        self.RAID_STATE_SNAPSHOT_EVERY = self._manager.raid.state_snapshot_every
+        self.RAID_STATE_LEGACY_GUILD_ID = self._manager.raid.state_legacy_guild_id
+        self.RAID_MAX_PARTICIPANTS = self._manager.raid.max_participants
+        self.RAID_PARTY_SIZES = self._manager.raid.party_sizes
+        self.RAID_STATUS_MESSAGE = self._manager.raid.status_message_enabled
+        self.RAID_STATUS_DEBOUNCE = self._manager.raid.status_debounce
+        self.RAID_STATUS_MIN_EDIT_INTERVAL = self._manager.raid.status_min_edit_interval
+        self.RAID_AUTO_MATCH = self._manager.raid.auto_match_enabled
+        self.RAID_AUTO_MATCH_DEBOUNCE = self._manager.raid.auto_match_debounce
+        self.RAID_AUTO_MATCH_MAX_WAIT = self._manager.raid.auto_match_max_wait
+        self.RAID_AUTO_MATCH_MAX_HELPERS = self._manager.raid.auto_match_max_helpers
         self.GAME_VERSION = self._manager.game.version
         self.UDG_SAVE_VALUE_LENGTH = self._manager.game.udg_save_value_length
         self.ITEM_SLOTS = self._manager.game.item_slots
@@ -196,6 +452,26 @@ class Config:
         self.CHAR_MAP_PLAY_FALSE = self._manager.game.char_map_play_false
         self.STRING_SOURCE = self._manager.game.string_source
         self.SUMMON_CHUNK_N = self._manager.game.summon_chunk_n
+        self.COUPON_API_URL = self._manager.coupon.api_url
+        self.COUPON_TIMEOUT = self._manager.coupon.timeout
+        self.COUPON_CONNECT_TIMEOUT = self._manager.coupon.connect_timeout
+        self.COUPON_POOL_SIZE = self._manager.coupon.pool_size
+        self.COUPON_NEGATIVE_CACHE_TTL = self._manager.coupon.negative_cache_ttl
+        self.COUPON_CACHE_MAX_ENTRIES = self._manager.coupon.cache_max_entries
+        self.COUPON_OUTBOX_PATH = self._manager.coupon.outbox_path
+        self.COUPON_OUTBOX_BASE_DELAY = self._manager.coupon.outbox_base_delay
+        self.COUPON_OUTBOX_MAX_DELAY = self._manager.coupon.outbox_max_delay
+        self.COUPON_BREAKER_THRESHOLD = self._manager.coupon.breaker_threshold
+        self.COUPON_BREAKER_RESET = self._manager.coupon.breaker_reset
+        self.COUPON_MAX_RETRIES = self._manager.coupon.max_retries
+        self.COUPON_RETRY_BASE_DELAY = self._manager.coupon.retry_base_delay
+        self.COUPON_RETRY_BUDGET_RATIO = self._manager.coupon.retry_budget_ratio
+        self.COUPON_MAX_IN_FLIGHT = self._manager.coupon.max_in_flight
+        self.COUPON_MAX_REDEEMING_CODES = self._manager.coupon.max_redeeming_codes
+        self.COUPON_BULK_MAX_COUNT = self._manager.coupon.bulk_max_count
+        self.COUPON_BULK_CONCURRENCY = self._manager.coupon.bulk_concurrency
+        self.COUPON_BULK_RATE = self._manager.coupon.bulk_rate
+        self.COUPON_BULK_MAX_RETRIES = self._manager.coupon.bulk_max_retries
         self.LOG_LEVEL = self._manager.bot.log_level
         self.LOG_FORMAT = self._manager.bot.log_format
         
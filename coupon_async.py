@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 쿠폰 처리 모듈
+디스코드 이벤트 루프를 막지 않도록 aiohttp로 쿠폰 API를 호출하는 CouponProcessor의 비동기 버전
+(봇 실행 동안 세션 하나를 유지하여 연결을 재사용)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Optional, Set, Tuple
+
+import aiohttp
+
+from coupon_cache import CouponCheckCache
+from coupon_outbox import CouponOutbox
+from coupon_resilience import CouponAPIError, CouponResilience
+from singleflight import KeyedLockMap, LockMapFullError, SingleFlight
+from coupon_integrated import (DEFAULT_BASE_URL, OUTBOX_RETRY_MESSAGE,
+                               PENDING_REDEMPTION_MESSAGE, USE_CONFIRMED,
+                               USE_PENDING, USE_REJECTED, CouponApplyError,
+                               CouponCheckResponse, CouponCreateResponse,
+                               CouponProcessResult, CouponUseResponse,
+                               apply_coupon_to_savecode, settle_coupon_use)
+from lumber_modifier import LumberModifier
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCouponProcessor:
+    """aiohttp 기반 쿠폰 처리 클래스 (봇 전체에서 하나를 공유)"""
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, timeout: float = 10,
+                 connect_timeout: float = 3, pool_size: int = 10,
+                 modifier: Optional[LumberModifier] = None,
+                 check_cache: Optional[CouponCheckCache] = None,
+                 outbox: Optional[CouponOutbox] = None,
+                 resilience: Optional[CouponResilience] = None,
+                 max_redeeming_codes: int = 1000):
+        """
+        비동기 쿠폰 처리기 초기화
+
+        Args:
+            base_url: API 기본 URL
+            timeout: 요청 1건의 전체 제한 시간 (초)
+            connect_timeout: 연결 수립 제한 시간 (초)
+            pool_size: 쿠폰 서버와 유지할 최대 연결 수
+            modifier: 세이브코드 수정기 (None이면 생성)
+            check_cache: 사용할 수 없는 쿠폰 체크 결과 캐시 (None이면 캐시 안 함)
+            outbox: 쿠폰 사용 호출 아웃박스 (None이면 사용 처리 실패 시 재시도 안 함)
+            resilience: 서킷 브레이커/재시도/동시 요청 제한 정책 (None이면 기본값으로 생성)
+            max_redeeming_codes: 동시에 사용 처리할 수 있는 쿠폰 코드 수 (코드별 락 맵 크기)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.check_endpoint = f"{self.base_url}/api/coupon/check"
+        self.use_endpoint = f"{self.base_url}/api/coupon/use"
+        self.create_endpoint = f"{self.base_url}/api/coupon/create"
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self.pool_size = pool_size
+        self.resilience = resilience or CouponResilience(max_in_flight=pool_size * 2)
+
+        # 세션은 이벤트 루프 안에서 처음 요청할 때 생성
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # 세이브코드 수정기 (디코더/인코더 데이터 로드가 무거우므로 한 번만, 처음 필요할 때 생성)
+        self._modifier = modifier
+        self.check_cache = check_cache
+
+        # 공개된 쿠폰에 요청이 몰릴 때: 같은 코드의 체크는 한 번만 보내고, 사용 처리는 코드별로 한 건씩
+        self._check_flights = SingleFlight()
+        self._redeem_locks = KeyedLockMap(max_redeeming_codes)
+
+        # 사용 처리 실패분은 아웃박스 워커가 재시도 (새로 실패가 기록되면 깨움)
+        self.outbox = outbox
+        self._outbox_wakeup: Optional[asyncio.Event] = None  # 워커가 시작될 때 생성
+
+        # 세이브코드는 이미 돌려줬지만 서버의 사용 처리가 확인되지 않은 쿠폰 코드
+        # (서버는 아직 사용 가능으로 답하므로 다른 요청이 같은 쿠폰을 다시 받지 않도록 막음)
+        self._pending_redemptions: Set[str] = set()
+        if outbox is not None:
+            self._pending_redemptions.update(code.strip() for code in outbox.get_pending_codes())
+
+    @property
+    def modifier(self) -> LumberModifier:
+        """세이브코드 수정기 (쿠폰 생성만 하는 경우에는 만들지 않음)"""
+        if self._modifier is None:
+            self._modifier = LumberModifier()
+        return self._modifier
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """연결 풀을 가진 세션 반환 (없거나 닫혔으면 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={'User-Agent': 'MasinSavecode-CouponProcessor/1.0'}
+            )
+        return self._session
+
+    async def _request_once(self, method: str, url: str, label: str, payload: dict = None,
+                            headers: dict = None) -> dict:
+        """
+        API 1회 호출 후 JSON 응답 반환
+
+        Raises:
+            CouponAPIError: 시간 초과, 연결 실패, HTTP 오류, 파싱 실패 시
+        """
+        try:
+            async with self._get_session().request(method, url, json=payload, headers=headers) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except asyncio.TimeoutError:
+            raise CouponAPIError(f"{label} API 요청 시간 초과", 'timeout')
+        except aiohttp.ClientResponseError as e:
+            kind = 'http_5xx' if e.status >= 500 else 'http_4xx'
+            raise CouponAPIError(f"{label} HTTP 오류: {e.status}", kind)
+        except aiohttp.ClientConnectorError:
+            raise CouponAPIError(f"{label} API 서버에 연결할 수 없습니다", 'connect')
+        except aiohttp.ClientConnectionError:
+            raise CouponAPIError(f"{label} API 서버에 연결할 수 없습니다", 'connection')
+        except json.JSONDecodeError:
+            raise CouponAPIError(f"{label} API 응답을 파싱할 수 없습니다", 'parse')
+        except Exception as e:
+            raise CouponAPIError(f"{label} 예상치 못한 오류: {str(e)}")
+
+    async def _request(self, method: str, url: str, label: str, payload: dict = None,
+                       headers: dict = None, idempotent: bool = None) -> dict:
+        """
+        장애 대응 정책(서킷 브레이커, 동시 요청 제한, 재시도 예산)을 적용한 API 호출
+
+        Args:
+            idempotent: 같은 요청을 다시 보내도 되는지 (None이면 GET만)
+
+        Raises:
+            CouponAPIError: 재시도 후에도 실패했거나 요청을 보내지 않은 경우
+        """
+        if idempotent is None:
+            idempotent = method == 'GET'
+        policy = self.resilience
+        policy.on_new_request()
+
+        attempt = 0
+        while True:
+            policy.acquire(label)
+            start = time.perf_counter()
+            try:
+                data = await self._request_once(method, url, label, payload, headers)
+            except CouponAPIError as e:
+                policy.record(label, (time.perf_counter() - start) * 1000, e)
+                if not policy.should_retry(label, e, attempt, idempotent):
+                    raise
+                error = e
+            else:
+                policy.record(label, (time.perf_counter() - start) * 1000)
+                return data
+            finally:
+                policy.release()
+
+            delay = policy.retry_delay(attempt)
+            attempt += 1
+            logger.warning(f"{error} - {delay:.2f}초 후 재시도 ({attempt}/{policy.max_retries})")
+            await asyncio.sleep(delay)
+
+    async def check_coupon(self, coupon_code: str) -> Tuple[bool, CouponCheckResponse]:
+        """
+        쿠폰 사용 가능 여부 체크
+
+        Returns:
+            Tuple[bool, CouponCheckResponse]: (API 호출 성공 여부, 응답 데이터)
+        """
+        if coupon_code.strip() in self._pending_redemptions:
+            return True, CouponCheckResponse(
+                is_success=True,
+                is_usable=False,
+                coupon_code=coupon_code,
+                error_message=PENDING_REDEMPTION_MESSAGE,
+                lumber=0,
+                gold=0
+            )
+
+        if self.check_cache is not None:
+            cached = self.check_cache.get(coupon_code)
+            if cached is not None:
+                logger.info(f"쿠폰 체크 캐시 사용: {coupon_code}")
+                return True, cached
+
+        logger.info(f"쿠폰 체크 요청: {coupon_code}")
+        try:
+            data = await self._request('GET', f"{self.check_endpoint}/{coupon_code}", "쿠폰 체크")
+        except CouponAPIError as e:
+            logger.error(str(e))
+            return False, CouponCheckResponse(
+                is_success=False,
+                is_usable=False,
+                coupon_code=coupon_code,
+                error_message=str(e),
+                lumber=0,
+                gold=0
+            )
+
+        check_response = CouponCheckResponse.from_dict(data)
+        if self.check_cache is not None:
+            self.check_cache.put(coupon_code, check_response)
+        logger.info(f"쿠폰 체크 응답: {check_response}")
+        return True, check_response
+
+    async def use_coupon(self, coupon_code: str,
+                         idempotency_key: str = None) -> Tuple[bool, CouponUseResponse]:
+        """
+        쿠폰 사용 API 호출 (시간 초과/5xx는 요청 단위로 재시도하지 않음)
+
+        쿠폰 서버가 Idempotency-Key를 지킨다는 보장이 없어, 바로 다시 보내면 앞 요청이 처리된 경우
+        '이미 사용됨'으로 거절돼 세이브코드를 돌려주지 못할 수 있음. 재시도는 아웃박스 워커가 맡음
+
+        Args:
+            coupon_code: 쿠폰 코드
+            idempotency_key: 아웃박스 재시도 시 같은 사용 요청임을 알리는 키 (Idempotency-Key 헤더)
+
+        Returns:
+            Tuple[bool, CouponUseResponse]: (API 호출 성공 여부, 응답 데이터)
+        """
+        logger.info(f"쿠폰 사용 요청: {coupon_code}")
+        try:
+            data = await self._request('POST', self.use_endpoint, "쿠폰 사용",
+                                       {"couponCode": coupon_code.strip()},
+                                       {'Idempotency-Key': idempotency_key} if idempotency_key else None)
+        except CouponAPIError as e:
+            logger.error(str(e))
+            return False, CouponUseResponse(
+                is_success=False,
+                lumber=0,
+                gold=0,
+                coupon_code=coupon_code,
+                error_message=str(e)
+            )
+
+        use_response = CouponUseResponse.from_dict(data)
+        if use_response.is_success and self.check_cache is not None:
+            # 같은 코드로 기다리던 요청이 서버에 다시 묻지 않고 바로 '이미 사용됨'을 받도록 저장
+            self.check_cache.put(coupon_code, CouponCheckResponse(
+                is_success=True,
+                is_usable=False,
+                coupon_code=coupon_code,
+                error_message="이미 사용된 쿠폰입니다",
+                lumber=use_response.lumber,
+                gold=use_response.gold
+            ))
+        logger.info(f"쿠폰 사용 응답: {use_response}")
+        return True, use_response
+
+    async def create_coupon(self, lumber: int, gold: int) -> Tuple[bool, CouponCreateResponse]:
+        """
+        쿠폰 생성 API 호출
+
+        Returns:
+            Tuple[bool, CouponCreateResponse]: (API 호출 성공 여부, 응답 데이터)
+        """
+        logger.info(f"쿠폰 생성 요청: lumber={lumber:,}, gold={gold:,}")
+        try:
+            data = await self._request('POST', self.create_endpoint, "쿠폰 생성",
+                                       {"lumber": lumber, "gold": gold})
+        except CouponAPIError as e:
+            logger.error(str(e))
+            return False, CouponCreateResponse(
+                is_success=False,
+                coupon_code="",
+                lumber=lumber,
+                gold=gold,
+                error_message=str(e),
+                error_kind=e.kind
+            )
+
+        create_response = CouponCreateResponse.from_dict(data)
+        if create_response.is_success and self.check_cache is not None:
+            # 생성 전에 같은 코드로 체크해서 남은 '없는 쿠폰' 결과 제거
+            self.check_cache.invalidate(create_response.coupon_code)
+        logger.info(f"쿠폰 생성 응답: {create_response}")
+        return True, create_response
+
+    async def process_coupon_with_savecode(self, coupon_code: str, savecode: str,
+                                           player_name: str = None) -> CouponProcessResult:
+        """
+        쿠폰 체크 -> 세이브코드 수정 -> 성공시 쿠폰 사용 처리 전체 워크플로우
+        (CouponProcessor.process_coupon_with_savecode와 같은 결과)
+        """
+        logger.info(f"쿠폰 처리 시작: {coupon_code}")
+
+        def failed(error_message: str) -> CouponProcessResult:
+            return CouponProcessResult(
+                success=False,
+                original_savecode=savecode,
+                modified_savecode="",
+                gold_gained=0,
+                lumber_gained=0,
+                coupon_code=coupon_code,
+                error_message=error_message
+            )
+
+        # 1단계: 쿠폰 체크 (같은 코드로 동시에 들어온 체크는 서버 요청 한 번으로 병합)
+        code_key = coupon_code.strip()
+        check_success, check_response = await self._check_flights.do(
+            code_key, lambda: self.check_coupon(coupon_code)
+        )
+        if not check_success:
+            return failed(f"쿠폰 체크 실패: {check_response.error_message}")
+        if not check_response.is_success or not check_response.is_usable:
+            return failed(check_response.error_message or "사용할 수 없는 쿠폰입니다")
+
+        # 2~3단계는 코드별로 한 건씩 (여러 명이 동시에 같은 쿠폰을 '성공'하는 경쟁 방지)
+        try:
+            async with self._redeem_locks.hold(code_key) as waited:
+                # 기다리는 동안 앞 사람의 사용 처리가 지연됐으면 (이미 진행 중이던 체크 결과와 관계없이) 거절
+                if code_key in self._pending_redemptions:
+                    return failed(PENDING_REDEMPTION_MESSAGE)
+                if waited:
+                    # 앞 사람이 사용했다면 캐시된 '이미 사용됨' 결과를 바로 받음
+                    check_success, check_response = await self._check_flights.do(
+                        code_key, lambda: self.check_coupon(coupon_code)
+                    )
+                    if not check_success:
+                        return failed(f"쿠폰 체크 실패: {check_response.error_message}")
+                    if not check_response.is_success or not check_response.is_usable:
+                        return failed(check_response.error_message or "사용할 수 없는 쿠폰입니다")
+                return await self._redeem(coupon_code, savecode, player_name, check_response, failed)
+        except LockMapFullError:
+            logger.warning(f"쿠폰 사용 처리 중인 코드가 너무 많아 거절: {coupon_code}")
+            return failed("쿠폰 사용 요청이 몰려 처리할 수 없습니다. 잠시 후 다시 시도해주세요")
+
+    async def _redeem(self, coupon_code: str, savecode: str, player_name: Optional[str],
+                      check_response: CouponCheckResponse, failed) -> CouponProcessResult:
+        """세이브코드 수정 -> 쿠폰 사용 처리 (코드별 락을 쥔 상태에서 호출)"""
+        # 2단계: 세이브코드 수정
+        try:
+            modified_savecode = apply_coupon_to_savecode(
+                self.modifier, savecode, check_response.gold, check_response.lumber, player_name
+            )
+        except CouponApplyError as e:
+            return failed(str(e))
+        except Exception as e:
+            logger.error(f"세이브코드 수정 중 오류: {str(e)}")
+            return failed(f"세이브코드 수정 중 오류: {str(e)}")
+
+        # 3단계: 세이브코드 수정이 성공했으므로 쿠폰 사용 처리
+        # (아웃박스가 있으면 세이브코드를 돌려주기 전에 사용 호출부터 기록)
+        logger.info(f"세이브코드 수정 성공, 쿠폰 사용 처리 진행: {coupon_code}")
+        entry = self.outbox.add(coupon_code) if self.outbox is not None else None
+        use_success, use_response = await self.use_coupon(
+            coupon_code, entry.idempotency_key if entry is not None else None
+        )
+
+        error_message = ""
+        outcome = settle_coupon_use(self.outbox, entry, use_success, use_response)
+        if outcome == USE_CONFIRMED:
+            logger.info(f"쿠폰 처리 완료: {coupon_code}")
+        elif outcome == USE_REJECTED:
+            # 서버가 사용을 거절(이미 사용됨 등)했으면 수정한 세이브코드를 돌려주지 않음
+            logger.warning(f"쿠폰 사용 거절: {coupon_code} - {use_response.error_message}")
+            return failed(use_response.error_message or "이미 사용된 쿠폰입니다")
+        elif entry is not None:
+            # 아웃박스 워커가 서버가 확인할 때까지 재시도 (그 사이 같은 쿠폰은 다시 사용할 수 없음)
+            self._pending_redemptions.add(coupon_code.strip())
+            if self._outbox_wakeup is not None:
+                self._outbox_wakeup.set()
+            error_message = OUTBOX_RETRY_MESSAGE
+        else:
+            # 세이브코드 수정은 성공했으므로 성공으로 반환하되 경고 메시지 포함
+            # (재시도하지 않으므로 이 프로세스에서는 같은 쿠폰을 계속 사용 처리 대기로 취급)
+            self._pending_redemptions.add(coupon_code.strip())
+            logger.warning(f"쿠폰 사용 처리 실패했지만 세이브코드는 이미 수정됨: {use_response.error_message}")
+            error_message = f"⚠️ 세이브코드는 수정되었지만 쿠폰 사용 처리 실패: {use_response.error_message}"
+
+        return CouponProcessResult(
+            success=True,
+            original_savecode=savecode,
+            modified_savecode=modified_savecode,
+            gold_gained=check_response.gold,
+            lumber_gained=check_response.lumber,
+            coupon_code=coupon_code,
+            error_message=error_message
+        )
+
+    async def retry_outbox(self) -> int:
+        """
+        재시도 시각이 된 아웃박스 호출 처리
+
+        Returns:
+            int: 서버가 사용 처리를 확인한 호출 수
+        """
+        confirmed = 0
+        for entry in self.outbox.get_due():
+            use_success, use_response = await self.use_coupon(entry.coupon_code, entry.idempotency_key)
+            outcome = settle_coupon_use(self.outbox, entry, use_success, use_response)
+            if outcome != USE_PENDING:
+                self._pending_redemptions.discard(entry.coupon_code.strip())
+            if outcome == USE_CONFIRMED:
+                confirmed += 1
+                logger.info(f"지연된 쿠폰 사용 처리 완료: {entry.coupon_code} ({entry.attempts + 1}번째 시도)")
+            elif outcome == USE_REJECTED:
+                # 서버가 응답했지만 거절 (앞선 시도가 이미 처리됐거나 없는 쿠폰) - 더 보낼 필요 없음
+                logger.warning(f"지연된 쿠폰 사용 처리 거절: {entry.coupon_code} - {use_response.error_message}")
+        return confirmed
+
+    async def run_outbox_worker(self):
+        """아웃박스 재시도 루프 (다음 재시도 시각까지 대기, 새 실패가 기록되면 다시 계산)"""
+        if self.outbox is None:
+            return
+
+        logger.info(f"쿠폰 아웃박스 워커 시작 (대기 {self.outbox.get_stats()['depth']}건)")
+        if self._outbox_wakeup is None:
+            self._outbox_wakeup = asyncio.Event()
+        while True:
+            try:
+                await self.retry_outbox()
+            except Exception as e:
+                logger.error(f"쿠폰 아웃박스 재시도 중 오류: {e}")
+
+            self._outbox_wakeup.clear()
+            next_attempt_at = self.outbox.get_next_attempt_at()
+            delay = None if next_attempt_at is None else max(0.0, next_attempt_at - time.time())
+            try:
+                await asyncio.wait_for(self._outbox_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def get_dedup_stats(self) -> dict:
+        """동시 요청 병합/코드별 직렬화 통계"""
+        return {
+            'checks_executed': self._check_flights.executed,
+            'checks_coalesced': self._check_flights.coalesced,
+            'redeeming_codes': len(self._redeem_locks),
+            'redeem_waited': self._redeem_locks.contended,
+            'pending_redemptions': len(self._pending_redemptions),
+        }
+
+    async def close(self):
+        """세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+쿠폰 처리 벤치마크
+호출마다 CouponProcessor를 새로 만드는 기존 방식과 처리기 하나를 계속 쓰는 방식의
+연속 쿠폰 사용 지연 시간을 로컬 대역 서버로 비교
+"""
+
+import os
+import statistics
+import sys
+import time
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from coupon_fake_server import FakeCouponServer
+from coupon_integrated import CouponProcessor
+
+MASIN_SAVECODE = 'MasinSaveV2_홍길동_37_50000_15_200_100_150_264_266_268_270_272_274'
+
+
+def redeem_with_new_processor(base_url: str, coupon_code: str):
+    """기존 방식: 호출마다 처리기(세션 + 세이브코드 수정기) 생성 후 종료"""
+    processor = CouponProcessor(base_url=base_url)
+    try:
+        return processor.process_coupon_with_savecode(coupon_code, MASIN_SAVECODE)
+    finally:
+        processor.close()
+
+
+def measure(server: FakeCouponServer, redeem, count: int, prefix: str):
+    """연속 쿠폰 사용 지연 시간 측정 (ms 목록, 서버가 본 연결 수)"""
+    server.peers.clear()
+    latencies = []
+    for i in range(count):
+        code = f"{prefix}{i}"
+        server.add_coupon(code, lumber=100)
+        start = time.perf_counter()
+        result = redeem(code)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert result.success, result.error_message
+    return latencies, len(server.peers)
+
+
+def report(label: str, latencies, connections: int):
+    """측정 결과 출력"""
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"   {label:<24} 평균 {statistics.mean(latencies):8.2f}ms  "
+          f"중앙값 {statistics.median(latencies):8.2f}ms  p95 {p95:8.2f}ms  연결 {connections}개")
+
+
+def run_benchmark(count: int = 50):
+    """기존 방식과 공유 처리기 방식 비교"""
+    server = FakeCouponServer()
+    server.start_in_thread()
+    base_url = server.base_url
+    print(f"\n📊 연속 쿠폰 사용 {count}회 (체크 + 세이브코드 수정 + 사용)")
+
+    latencies, connections = measure(server, lambda code: redeem_with_new_processor(base_url, code), count, "NEW")
+    report("호출마다 새 처리기", latencies, connections)
+
+    processor = CouponProcessor(base_url=base_url)
+    processor.check_coupon("WARMUP")  # 연결 미리 수립
+    latencies, connections = measure(
+        server, lambda code: processor.process_coupon_with_savecode(code, MASIN_SAVECODE), count, "SHARED")
+    report("공유 처리기 (keep-alive)", latencies, connections)
+
+    processor.close()
+    server.stop_thread()
+
+
+if __name__ == "__main__":
+    # 세이브코드 수정기가 Config를 읽으므로 .env가 없는 환경에서도 실행되도록 설정
+    os.environ.setdefault('DISCORD_BOT_TOKEN', 'benchmark-token')
+    run_benchmark()
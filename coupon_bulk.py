@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+쿠폰 대량 발급 모듈
+이벤트용 쿠폰 수백 장을 동시 요청 수/초당 요청 수 제한 안에서 병렬로 생성하고
+결과를 CSV로 기록 (봇 명령어와 CLI에서 함께 사용)
+"""
+
+import argparse
+import asyncio
+import csv
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional, TextIO
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from coupon_async import AsyncCouponProcessor
+from coupon_integrated import DEFAULT_BASE_URL
+from rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+CSV_HEADER = ['번호', '쿠폰코드', '나무', '골드', '상태', '시도횟수', '오류']
+
+# 요청이 서버에서 처리되지 않은 것이 확실해 다시 보내도 쿠폰이 중복 생성되지 않는 오류 종류
+# (연결 전 실패, 보내기 전 차단, 서버가 요청을 거절한 4xx)
+RETRYABLE_ERROR_KINDS = {'connect', 'shed', 'circuit_open', 'http_4xx'}
+
+
+@dataclass
+class BulkIssueResult:
+    """대량 발급 결과"""
+    requested: int
+    created: int = 0
+    failed: int = 0
+    unconfirmed: int = 0  # 시간 초과/5xx 등으로 서버에서 생성됐는지 알 수 없는 항목 (재시도하지 않음)
+    coupon_codes: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)  # 실패/확인 필요 항목의 마지막 오류
+    elapsed: float = 0.0
+
+    @property
+    def done(self) -> int:
+        return self.created + self.failed + self.unconfirmed
+
+
+ProgressCallback = Callable[[BulkIssueResult], Awaitable[None]]
+
+
+async def issue_coupons(processor: AsyncCouponProcessor, count: int, lumber: int, gold: int,
+                        concurrency: int = 5, rate: float = 5.0, max_retries: int = 3,
+                        retry_delay: float = 1.0, csv_file: Optional[TextIO] = None,
+                        on_progress: Optional[ProgressCallback] = None) -> BulkIssueResult:
+    """
+    쿠폰 대량 발급
+
+    생성 API는 멱등하지 않으므로 서버가 생성하지 않은 것이 확실한 경우
+    (생성 실패 응답, RETRYABLE_ERROR_KINDS)에만 재시도하고,
+    시간 초과/연결 끊김/5xx처럼 서버 처리 여부를 알 수 없는 항목은 다시 보내지 않고
+    '확인 필요'로 기록 (관리자가 쿠폰 서버에서 직접 확인)
+
+    Args:
+        processor: 비동기 쿠폰 처리기
+        count: 발급할 쿠폰 수
+        lumber: 쿠폰 1장당 나무
+        gold: 쿠폰 1장당 골드
+        concurrency: 동시에 진행할 생성 요청 수
+        rate: 초당 생성 요청 수 (재시도 포함)
+        max_retries: 재시도할 수 있는 실패 항목의 최대 재시도 횟수
+        retry_delay: 첫 재시도 대기 시간 (초, 재시도마다 2배)
+        csv_file: 결과를 한 줄씩 기록할 파일 (헤더 포함, None이면 기록 안 함)
+        on_progress: 항목 하나가 끝날 때마다 호출할 비동기 함수
+
+    Returns:
+        BulkIssueResult: 발급 결과
+    """
+    result = BulkIssueResult(requested=count)
+    bucket = TokenBucket(rate, capacity=max(1.0, min(rate, concurrency)))
+    queue: asyncio.Queue = asyncio.Queue()
+    for index in range(1, count + 1):
+        queue.put_nowait(index)
+
+    writer = csv.writer(csv_file) if csv_file is not None else None
+    if writer is not None:
+        writer.writerow(CSV_HEADER)
+
+    start = time.perf_counter()
+
+    async def issue_one(index: int):
+        error = ""
+        for attempt in range(1, max_retries + 2):
+            await bucket.acquire()
+            success, response = await processor.create_coupon(lumber, gold)
+            if success and response.is_success and response.coupon_code:
+                result.created += 1
+                result.coupon_codes.append(response.coupon_code)
+                if writer is not None:
+                    writer.writerow([index, response.coupon_code, response.lumber, response.gold, '성공', attempt, ''])
+                return
+            error = response.error_message or "쿠폰 생성 실패"
+            if not success and response.error_kind not in RETRYABLE_ERROR_KINDS:
+                logger.warning(f"쿠폰 대량 발급 {index}번 생성 여부 확인 필요: {error}")
+                result.unconfirmed += 1
+                result.errors.append(error)
+                if writer is not None:
+                    writer.writerow([index, '', lumber, gold, '확인 필요', attempt, error])
+                return
+            if attempt <= max_retries:
+                logger.warning(f"쿠폰 대량 발급 {index}번 실패, 재시도 ({attempt}/{max_retries}): {error}")
+                await asyncio.sleep(retry_delay * (2 ** (attempt - 1)))
+
+        result.failed += 1
+        result.errors.append(error)
+        if writer is not None:
+            writer.writerow([index, '', lumber, gold, '실패', max_retries + 1, error])
+
+    async def worker():
+        while True:
+            try:
+                index = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                await issue_one(index)
+            except Exception as e:
+                logger.error(f"쿠폰 대량 발급 {index}번 처리 중 오류: {e}")
+                result.failed += 1
+                result.errors.append(str(e))
+            result.elapsed = time.perf_counter() - start
+            if on_progress is not None:
+                try:
+                    await on_progress(result)
+                except Exception as e:
+                    logger.error(f"쿠폰 대량 발급 진행 상황 알림 오류: {e}")
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, count)))))
+    result.elapsed = time.perf_counter() - start
+    logger.info(f"쿠폰 대량 발급 완료: 요청 {count}장, 성공 {result.created}장, "
+                f"실패 {result.failed}장, 확인 필요 {result.unconfirmed}장 ({result.elapsed:.1f}초)")
+    return result
+
+
+def format_bulk_progress(result: BulkIssueResult) -> str:
+    """진행 상황 한 줄 요약"""
+    percent = result.done / result.requested * 100 if result.requested else 100.0
+    unconfirmed = f" · 확인 필요 {result.unconfirmed:,}" if result.unconfirmed else ""
+    return (f"{result.done:,}/{result.requested:,} ({percent:.0f}%) · "
+            f"성공 {result.created:,} · 실패 {result.failed:,}{unconfirmed} · {result.elapsed:.1f}초")
+
+
+async def _run_cli(args: argparse.Namespace):
+    processor = AsyncCouponProcessor(base_url=args.base_url, pool_size=max(args.concurrency, 1))
+
+    async def print_progress(result: BulkIssueResult):
+        print(f"\r🔄 {format_bulk_progress(result)}", end='', flush=True)
+
+    try:
+        with open(args.output, 'w', newline='', encoding='utf-8-sig') as csv_file:
+            result = await issue_coupons(
+                processor, args.count, args.lumber, args.gold,
+                concurrency=args.concurrency, rate=args.rate, max_retries=args.retries,
+                csv_file=csv_file, on_progress=print_progress
+            )
+    finally:
+        await processor.close()
+
+    icon = "✅" if result.failed == 0 and result.unconfirmed == 0 else "⚠️"
+    print(f"\n{icon} 완료: 성공 {result.created:,}장, 실패 {result.failed:,}장, "
+          f"확인 필요 {result.unconfirmed:,}장 -> {args.output}")
+    return result
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='쿠폰 대량 발급 (결과를 CSV로 저장)')
+    parser.add_argument('--count', type=int, required=True, help='발급할 쿠폰 수')
+    parser.add_argument('--lumber', type=int, default=0, help='쿠폰 1장당 나무')
+    parser.add_argument('--gold', type=int, default=0, help='쿠폰 1장당 골드')
+    parser.add_argument('--output', default='coupons.csv', help='결과 CSV 파일 경로')
+    parser.add_argument('--concurrency', type=int, default=5, help='동시 생성 요청 수')
+    parser.add_argument('--rate', type=float, default=5.0, help='초당 생성 요청 수')
+    parser.add_argument('--retries', type=int, default=3, help='재시도할 수 있는 실패 항목의 최대 재시도 횟수')
+    parser.add_argument('--base-url', default=os.getenv('COUPON_API_URL', DEFAULT_BASE_URL), help='쿠폰 API 주소')
+    args = parser.parse_args(argv)
+
+    if args.count <= 0 or args.concurrency <= 0 or args.rate <= 0 or args.retries < 0:
+        parser.error("count/concurrency/rate는 0보다 커야 하고 retries는 0 이상이어야 합니다")
+    if not (0 <= args.lumber <= 99999999 and 0 <= args.gold <= 99999999):
+        parser.error("나무와 골드는 0 이상 99,999,999 이하의 값이어야 합니다")
+
+    result = asyncio.run(_run_cli(args))
+    return 0 if result.failed == 0 and result.unconfirmed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+쿠폰 체크 결과 캐시 모듈
+사용할 수 없는(없는/이미 사용된) 쿠폰의 체크 결과만 짧은 시간 동안 보관하여
+같은 쿠폰을 반복 입력할 때 쿠폰 서버로 요청이 다시 가지 않도록 함
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class CouponCheckCache:
+    """
+    쿠폰 체크 음성 결과 TTL 캐시
+
+    사용 가능 응답은 다른 사람이 먼저 사용하면 바로 바뀌므로 저장하지 않고,
+    API 호출 자체가 실패한 경우(시간 초과 등)도 저장하지 않음
+    """
+
+    def __init__(self, negative_ttl: float = 30, max_entries: int = 10000):
+        """
+        캐시 초기화
+
+        Args:
+            negative_ttl: 사용할 수 없는 쿠폰 결과를 보관할 시간 (초, 0이면 캐시 안 함)
+            max_entries: 최대 보관 개수 (초과 시 가장 오래된 항목부터 제거)
+        """
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()  # {쿠폰 코드: (만료 시각, CouponCheckResponse)}
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(coupon_code: str) -> str:
+        return coupon_code.strip()
+
+    def get(self, coupon_code: str) -> Optional[Any]:
+        """캐시된 체크 결과 반환 (없거나 만료됐으면 None)"""
+        key = self._key(coupon_code)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, coupon_code: str, response):
+        """체크 결과 저장 (사용할 수 없는 쿠폰 결과만 저장)"""
+        if self.negative_ttl <= 0 or (response.is_success and response.is_usable):
+            return
+
+        key = self._key(coupon_code)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.negative_ttl, response)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, coupon_code: str):
+        """쿠폰 상태가 바뀌었을 때(사용/생성) 캐시된 결과 제거"""
+        with self._lock:
+            if self._entries.pop(self._key(coupon_code), None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """캐시 통계 반환"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'invalidations': self.invalidations,
+        }
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """
 쿠폰 생성 기능 테스트
+(실서버 대신 대역 서버를 쓰려면 coupon_fake_server.py를 띄우고 COUPON_API_URL 지정)
 """
 
 import os
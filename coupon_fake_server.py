@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+쿠폰 API 대역 서버
+실제 쿠폰 서버와 같은 경로/응답 형식을 가진 로컬 서버로, 지연 시간/오류 주입/사용 상태를 설정할 수 있어
+실서버 없이 쿠폰 처리 테스트와 부하 테스트를 할 수 있음
+
+    python coupon_fake_server.py --port 5036 --coupon TEST100:1000:0
+    COUPON_API_URL=http://127.0.0.1:5036 python coupon_integrated_test.py
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+
+class FakeCouponServer:
+    """쿠폰 체크/사용/생성 API 대역 서버 (aiohttp, 같은 프로세스 안에서 실행)"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 host: str = '127.0.0.1', port: int = 0, seed: Optional[int] = None):
+        """
+        대역 서버 초기화
+
+        Args:
+            latency: 모든 응답에 더할 지연 시간 (초)
+            jitter: 지연 시간에 더할 무작위 범위 (0~jitter초)
+            error_rate: 요청을 500으로 실패시킬 확률 (0~1)
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            seed: 지연/오류 난수 시드 (재현용)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.host = host
+        self.port = port
+        self._random = random.Random(seed)
+
+        self.coupons: Dict[str, dict] = {}  # {쿠폰 코드: {'lumber': 나무, 'gold': 골드}}
+        self.used = set()
+        self._next_id = 1
+        self._fail_next: Counter = Counter()  # {엔드포인트: 남은 강제 실패 횟수}
+        self._fail_status: Dict[str, int] = {}
+        self._idempotent_responses: Dict[str, dict] = {}  # {Idempotency-Key: 사용 응답}
+
+        # 통계
+        self.requests: Counter = Counter()  # {check/use/create: 요청 수}
+        self.injected_errors: Counter = Counter()
+        self.idempotency_keys = []
+        self.peers = set()  # 요청을 보낸 클라이언트 연결 (연결 재사용 확인용)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self.base_url = ''
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def add_coupon(self, code: str, lumber: int = 0, gold: int = 0, used: bool = False):
+        """쿠폰 등록"""
+        self.coupons[code] = {'lumber': lumber, 'gold': gold}
+        if used:
+            self.used.add(code)
+        else:
+            self.used.discard(code)
+
+    def fail_next(self, endpoint: str, count: int = 1, status: int = 500):
+        """다음 count번의 요청을 status로 실패시킴 (endpoint: check/use/create)"""
+        self._fail_next[endpoint] = count
+        self._fail_status[endpoint] = status
+
+    async def _begin(self, request: web.Request, endpoint: str) -> Optional[web.Response]:
+        """요청 공통 처리 (통계, 지연, 오류 주입). 실패시킬 요청이면 오류 응답 반환"""
+        self.requests[endpoint] += 1
+        self.peers.add(request.transport.get_extra_info('peername') if request.transport else None)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            if delay:
+                await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+
+        if self._fail_next[endpoint] > 0:
+            self._fail_next[endpoint] -= 1
+            self.injected_errors[endpoint] += 1
+            return web.Response(status=self._fail_status.get(endpoint, 500))
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.injected_errors[endpoint] += 1
+            return web.Response(status=500)
+        return None
+
+    async def handle_check(self, request: web.Request) -> web.Response:
+        error = await self._begin(request, 'check')
+        if error is not None:
+            return error
+        code = request.match_info['code']
+        coupon = self.coupons.get(code)
+        if coupon is None:
+            return web.json_response({'isSuccess': True, 'isUsable': False, 'couponCode': code,
+                                      'errorMessage': '존재하지 않는 쿠폰입니다', 'lumber': 0, 'gold': 0})
+        used = code in self.used
+        return web.json_response({'isSuccess': True, 'isUsable': not used, 'couponCode': code,
+                                  'errorMessage': '이미 사용된 쿠폰입니다' if used else '', **coupon})
+
+    async def handle_use(self, request: web.Request) -> web.Response:
+        key = request.headers.get('Idempotency-Key')
+        self.idempotency_keys.append(key)
+        error = await self._begin(request, 'use')
+        if error is not None:
+            return error
+        if key and key in self._idempotent_responses:
+            return web.json_response(self._idempotent_responses[key])
+
+        code = (await request.json()).get('couponCode', '')
+        coupon = self.coupons.get(code)
+        if coupon is None:
+            data = {'isSuccess': False, 'couponCode': code, 'errorMessage': '존재하지 않는 쿠폰입니다',
+                    'lumber': 0, 'gold': 0}
+        elif code in self.used:
+            data = {'isSuccess': False, 'couponCode': code, 'errorMessage': '이미 사용된 쿠폰입니다', **coupon}
+        else:
+            self.used.add(code)
+            data = {'isSuccess': True, 'couponCode': code, 'errorMessage': '', **coupon}
+        if key:
+            self._idempotent_responses[key] = data
+        return web.json_response(data)
+
+    async def handle_create(self, request: web.Request) -> web.Response:
+        error = await self._begin(request, 'create')
+        if error is not None:
+            return error
+        data = await request.json()
+        code = f"NEW{self._next_id}"
+        self._next_id += 1
+        self.add_coupon(code, data.get('lumber', 0), data.get('gold', 0))
+        return web.json_response({'isSuccess': True, 'couponCode': code, 'errorMessage': '생성 완료',
+                                  **self.coupons[code]})
+
+    def _make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/api/coupon/check/{code}', self.handle_check)
+        app.router.add_post('/api/coupon/use', self.handle_use)
+        app.router.add_post('/api/coupon/create', self.handle_create)
+        return app
+
+    async def start(self):
+        """현재 이벤트 루프에서 서버 시작"""
+        self._runner = web.AppRunner(self._make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{self.host}:{self.port}"
+        logger.info(f"쿠폰 대역 서버 시작: {self.base_url}")
+
+    async def stop(self):
+        """서버 종료"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self):
+        """별도 스레드의 이벤트 루프에서 서버 시작 (동기 쿠폰 처리기 테스트용)"""
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop_thread(self):
+        """start_in_thread로 시작한 서버 종료"""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+
+def _parse_coupon(text: str):
+    """'코드:나무:골드' 형식 파싱"""
+    code, lumber, gold = text.split(':')
+    return code, int(lumber), int(gold)
+
+
+async def _serve_forever(server: FakeCouponServer):
+    await server.start()
+    print(f"🎫 쿠폰 대역 서버 실행 중: {server.base_url} (Ctrl+C로 종료)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='쿠폰 API 대역 서버')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=5036, help='포트')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 시간 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연 시간 무작위 추가 범위 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 오류 응답 확률 (0~1)')
+    parser.add_argument('--coupon', action='append', type=_parse_coupon, default=[],
+                        metavar='CODE:LUMBER:GOLD', help='미리 등록할 쿠폰 (여러 번 지정 가능)')
+    args = parser.parse_args()
+
+    server = FakeCouponServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                              host=args.host, port=args.port)
+    for code, lumber, gold in args.coupon:
+        server.add_coupon(code, lumber, gold)
+
+    try:
+        asyncio.run(_serve_forever(server))
+    except KeyboardInterrupt:
+        print("\n👋 쿠폰 대역 서버를 종료합니다.")
+
+
+if __name__ == "__main__":
+    main()
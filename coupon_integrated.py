@@ -7,17 +7,39 @@
 
 import json
 import logging
+import os
+import threading
+import time
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from coupon_cache import CouponCheckCache
+from coupon_outbox import CouponOutbox, OutboxEntry
+from coupon_resilience import CouponAPIError, CouponResilience
 from lumber_modifier import LumberModifier
+from singleflight import LockMapFullError, ThreadKeyedLockMap
 
 # 로거 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 쿠폰 API 기본 주소 (COUPON_API_URL로 대역 서버 등 다른 주소를 지정할 수 있음)
+DEFAULT_BASE_URL = os.getenv('COUPON_API_URL', "http://211.202.189.93:5036")
+
+# 세이브코드에 저장할 수 있는 나무 최대값
+MAX_LUMBER = 990000
+
+PENDING_REDEMPTION_MESSAGE = "⏳ 사용 처리 대기 중인 쿠폰입니다. 잠시 후 다시 확인해주세요"
+OUTBOX_RETRY_MESSAGE = "⏳ 쿠폰 사용 처리가 지연되어 자동으로 다시 시도합니다"
+
+# 쿠폰 사용 호출 결과 (settle_coupon_use 반환값)
+USE_CONFIRMED = 'confirmed'  # 서버가 사용 처리를 확인
+USE_REJECTED = 'rejected'    # 서버가 응답했지만 사용을 거절 (이미 사용됨 등)
+USE_PENDING = 'pending'      # 서버 응답을 받지 못해 사용 처리 여부를 모름
+
 
 @dataclass
 class CouponCheckResponse:
@@ -71,6 +93,7 @@ class CouponCreateResponse:
     lumber: int
     gold: int
     error_message: str
+    error_kind: str = ''  # API 호출 자체가 실패한 경우 CouponAPIError.kind (서버가 응답했으면 빈 문자열)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'CouponCreateResponse':
@@ -84,6 +107,84 @@ class CouponCreateResponse:
         )
 
 
+class CouponApplyError(ValueError):
+    """쿠폰 내용을 세이브코드에 적용할 수 없는 경우 (사용자에게 그대로 보여줄 메시지)"""
+
+
+def apply_coupon_to_savecode(modifier: LumberModifier, savecode: str, gold: int, lumber: int,
+                             player_name: str = None) -> str:
+    """
+    쿠폰 리워드(골드/나무)를 더한 세이브코드 생성
+    
+    Args:
+        modifier: 세이브코드 수정기
+        savecode: 원본 세이브코드
+        gold: 추가할 골드
+        lumber: 추가할 나무
+        player_name: 플레이어 이름 (원본 게임 세이브코드의 경우 필수)
+        
+    Returns:
+        str: 수정된 세이브코드
+        
+    Raises:
+        CouponApplyError: 세이브코드 형식상 쿠폰을 적용할 수 없는 경우
+    """
+    if savecode.startswith('MasinSaveV2_'):
+        # 마신 세이브코드는 골드 수정 미지원
+        if gold > 0:
+            raise CouponApplyError("마신 세이브코드는 골드 추가를 지원하지 않습니다")
+        
+        # 나무만 추가
+        original_data = modifier.parse_masin_savecode(savecode)
+        new_lumber = original_data['lumber'] + lumber
+        if new_lumber > MAX_LUMBER:
+            new_lumber = MAX_LUMBER
+            logger.warning(f"나무 값이 {MAX_LUMBER}을 초과하여 {MAX_LUMBER}으로 제한됨")
+        return modifier.modify_lumber(savecode, new_lumber)
+    
+    # 원본 게임 세이브코드
+    if player_name is None:
+        raise CouponApplyError("원본 게임 세이브코드 수정을 위해서는 플레이어 이름이 필요합니다")
+    
+    # 현재 골드/나무 확인
+    original_data = modifier.parse_original_savecode(savecode)
+    new_gold = original_data['gold'] + gold
+    new_lumber = original_data['lumber'] + lumber
+    if new_lumber > MAX_LUMBER:
+        new_lumber = MAX_LUMBER
+        logger.warning(f"나무 값이 {MAX_LUMBER}을 초과하여 {MAX_LUMBER}으로 제한됨")
+    
+    # 골드와 나무 모두 수정
+    return modifier.modify_resources(
+        savecode,
+        gold_amount=new_gold,
+        lumber_amount=new_lumber,
+        player_name=player_name
+    )
+
+
+def settle_coupon_use(outbox: Optional[CouponOutbox], entry: Optional[OutboxEntry],
+                      use_success: bool, use_response: 'CouponUseResponse') -> str:
+    """
+    쿠폰 사용 호출 결과를 아웃박스에 반영하고 결과 종류 반환 (동기/비동기 처리기 공용)
+
+    Returns:
+        str: USE_CONFIRMED, USE_REJECTED, USE_PENDING 중 하나
+    """
+    if use_success and use_response.is_success:
+        if entry is not None:
+            outbox.mark_done(entry.entry_id)
+        return USE_CONFIRMED
+    if use_success:
+        # 다시 보내도 결과가 같으므로 재시도하지 않음
+        if entry is not None:
+            outbox.mark_rejected(entry.entry_id)
+        return USE_REJECTED
+    if entry is not None:
+        outbox.mark_failed(entry, use_response.error_message)
+    return USE_PENDING
+
+
 @dataclass
 class CouponProcessResult:
     """쿠폰 처리 결과"""
@@ -99,28 +200,109 @@ class CouponProcessResult:
 class CouponProcessor:
     """쿠폰 처리 통합 클래스"""
     
-    def __init__(self, base_url: str = "http://211.202.189.93:5036"):
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, timeout: float = 10, pool_size: int = 10,
+                 modifier: Optional[LumberModifier] = None, check_cache: Optional[CouponCheckCache] = None,
+                 resilience: Optional[CouponResilience] = None, outbox: Optional[CouponOutbox] = None,
+                 max_redeeming_codes: int = 1000):
         """
-        쿠폰 처리기 초기화
+        쿠폰 처리기 초기화 (세션을 유지하며 여러 번 사용하는 것을 전제로 함)
         
         Args:
             base_url: API 기본 URL
+            timeout: 요청 제한 시간 (초)
+            pool_size: 쿠폰 서버와 유지할 최대 연결 수 (keep-alive 재사용)
+            modifier: 세이브코드 수정기 (None이면 생성)
+            check_cache: 사용할 수 없는 쿠폰 체크 결과 캐시 (None이면 캐시 안 함)
+            resilience: 서킷 브레이커/재시도/동시 요청 제한 정책 (None이면 기본값으로 생성)
+            outbox: 쿠폰 사용 호출 아웃박스 (None이면 사용 처리 실패 시 재시도 안 함, retry_outbox()로 재시도)
+            max_redeeming_codes: 동시에 사용 처리할 수 있는 쿠폰 코드 수 (코드별 락 맵 크기)
         """
         self.base_url = base_url.rstrip('/')
         self.check_endpoint = f"{self.base_url}/api/coupon/check"
         self.use_endpoint = f"{self.base_url}/api/coupon/use"
         self.create_endpoint = f"{self.base_url}/api/coupon/create"
-        self.timeout = 10
+        self.timeout = timeout
+        self.resilience = resilience or CouponResilience(max_in_flight=pool_size * 2)
         
-        # 세션 생성
+        # 세션 생성 (연결 풀 크기 지정, 같은 서버로 가는 요청은 연결을 재사용)
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'Content-Type': 'application/json',
             'User-Agent': 'MasinSavecode-CouponProcessor/1.0'
         })
         
         # 세이브코드 수정기 초기화
-        self.modifier = LumberModifier()
+        self.modifier = modifier or LumberModifier()
+        self.check_cache = check_cache
+        
+        # 사용 처리는 코드별로 한 스레드씩, 세이브코드를 돌려줬지만 사용 처리가 확인되지 않은 코드는 재사용 차단
+        self._redeem_locks = ThreadKeyedLockMap(max_redeeming_codes)
+        self.outbox = outbox
+        self._pending_redemptions: Set[str] = set()
+        if outbox is not None:
+            self._pending_redemptions.update(code.strip() for code in outbox.get_pending_codes())
+    
+    def _request_once(self, method: str, url: str, label: str, payload: dict = None,
+                      headers: dict = None) -> dict:
+        """
+        API 1회 호출 후 JSON 응답 반환
+        
+        Raises:
+            CouponAPIError: 시간 초과, 연결 실패, HTTP 오류, 파싱 실패 시
+        """
+        try:
+            response = self.session.request(method, url, json=payload, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.ConnectTimeout:
+            raise CouponAPIError(f"{label} API 서버에 연결할 수 없습니다", 'connect')
+        except requests.exceptions.Timeout:
+            raise CouponAPIError(f"{label} API 요청 시간 초과", 'timeout')
+        except requests.exceptions.ConnectionError:
+            raise CouponAPIError(f"{label} API 서버에 연결할 수 없습니다", 'connection')
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code
+            raise CouponAPIError(f"{label} HTTP 오류: {status}", 'http_5xx' if status >= 500 else 'http_4xx')
+        except json.JSONDecodeError:
+            raise CouponAPIError(f"{label} API 응답을 파싱할 수 없습니다", 'parse')
+        except Exception as e:
+            raise CouponAPIError(f"{label} 예상치 못한 오류: {str(e)}")
+    
+    def _request(self, method: str, url: str, label: str, payload: dict = None, headers: dict = None) -> dict:
+        """
+        장애 대응 정책(서킷 브레이커, 동시 요청 제한, 재시도 예산)을 적용한 API 호출
+        (GET만 시간 초과/5xx에도 재시도하고, POST는 연결 수립 실패만 재시도)
+        
+        Raises:
+            CouponAPIError: 재시도 후에도 실패했거나 요청을 보내지 않은 경우
+        """
+        policy = self.resilience
+        policy.on_new_request()
+        
+        attempt = 0
+        while True:
+            policy.acquire(label)
+            start = time.perf_counter()
+            try:
+                data = self._request_once(method, url, label, payload, headers)
+            except CouponAPIError as e:
+                policy.record(label, (time.perf_counter() - start) * 1000, e)
+                if not policy.should_retry(label, e, attempt, method == 'GET'):
+                    raise
+                error = e
+            else:
+                policy.record(label, (time.perf_counter() - start) * 1000)
+                return data
+            finally:
+                policy.release()
+            
+            delay = policy.retry_delay(attempt)
+            attempt += 1
+            logger.warning(f"{error} - {delay:.2f}초 후 재시도 ({attempt}/{policy.max_retries})")
+            time.sleep(delay)
     
     def check_coupon(self, coupon_code: str) -> Tuple[bool, CouponCheckResponse]:
         """
@@ -132,174 +314,73 @@ class CouponProcessor:
         Returns:
             Tuple[bool, CouponCheckResponse]: (API 호출 성공 여부, 응답 데이터)
         """
-        try:
-            logger.info(f"쿠폰 체크 요청: {coupon_code}")
-            
-            # GET 요청으로 쿠폰 체크
-            url = f"{self.check_endpoint}/{coupon_code}"
-            response = self.session.get(url, timeout=self.timeout)
-            
-            # HTTP 상태 코드 확인
-            response.raise_for_status()
-            
-            # JSON 응답 파싱
-            response_data = response.json()
-            check_response = CouponCheckResponse.from_dict(response_data)
-            
-            logger.info(f"쿠폰 체크 응답: {check_response}")
-            
-            return True, check_response
-            
-        except requests.exceptions.Timeout:
-            error_msg = "쿠폰 체크 API 요청 시간 초과"
-            logger.error(error_msg)
-            return False, CouponCheckResponse(
-                is_success=False,
-                is_usable=False,
-                coupon_code=coupon_code,
-                error_message=error_msg,
-                lumber=0,
-                gold=0
-            )
-            
-        except requests.exceptions.ConnectionError:
-            error_msg = "쿠폰 체크 API 서버에 연결할 수 없습니다"
-            logger.error(error_msg)
-            return False, CouponCheckResponse(
-                is_success=False,
+        if coupon_code.strip() in self._pending_redemptions:
+            return True, CouponCheckResponse(
+                is_success=True,
                 is_usable=False,
                 coupon_code=coupon_code,
-                error_message=error_msg,
+                error_message=PENDING_REDEMPTION_MESSAGE,
                 lumber=0,
                 gold=0
             )
-            
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"쿠폰 체크 HTTP 오류: {e.response.status_code}"
-            logger.error(error_msg)
-            return False, CouponCheckResponse(
-                is_success=False,
-                is_usable=False,
-                coupon_code=coupon_code,
-                error_message=error_msg,
-                lumber=0,
-                gold=0
-            )
-            
-        except json.JSONDecodeError:
-            error_msg = "쿠폰 체크 API 응답을 파싱할 수 없습니다"
-            logger.error(error_msg)
-            return False, CouponCheckResponse(
-                is_success=False,
-                is_usable=False,
-                coupon_code=coupon_code,
-                error_message=error_msg,
-                lumber=0,
-                gold=0
-            )
-            
-        except Exception as e:
-            error_msg = f"쿠폰 체크 예상치 못한 오류: {str(e)}"
-            logger.error(error_msg)
+        
+        if self.check_cache is not None:
+            cached = self.check_cache.get(coupon_code)
+            if cached is not None:
+                logger.info(f"쿠폰 체크 캐시 사용: {coupon_code}")
+                return True, cached
+        
+        logger.info(f"쿠폰 체크 요청: {coupon_code}")
+        try:
+            response_data = self._request('GET', f"{self.check_endpoint}/{coupon_code}", "쿠폰 체크")
+        except CouponAPIError as e:
+            logger.error(str(e))
             return False, CouponCheckResponse(
                 is_success=False,
                 is_usable=False,
                 coupon_code=coupon_code,
-                error_message=error_msg,
+                error_message=str(e),
                 lumber=0,
                 gold=0
             )
+        
+        check_response = CouponCheckResponse.from_dict(response_data)
+        if self.check_cache is not None:
+            self.check_cache.put(coupon_code, check_response)
+        logger.info(f"쿠폰 체크 응답: {check_response}")
+        return True, check_response
     
-    def use_coupon(self, coupon_code: str) -> Tuple[bool, CouponUseResponse]:
+    def use_coupon(self, coupon_code: str, idempotency_key: str = None) -> Tuple[bool, CouponUseResponse]:
         """
-        쿠폰 사용 API 호출
+        쿠폰 사용 API 호출 (POST이므로 요청 단위로는 재시도하지 않음)
         
         Args:
             coupon_code: 사용할 쿠폰 코드
+            idempotency_key: 아웃박스 재시도 시 같은 사용 요청임을 알리는 키 (Idempotency-Key 헤더)
             
         Returns:
             Tuple[bool, CouponUseResponse]: (API 호출 성공 여부, 응답 데이터)
         """
+        logger.info(f"쿠폰 사용 요청: {coupon_code}")
         try:
-            # 요청 데이터 준비
-            payload = {
-                "couponCode": coupon_code.strip()
-            }
-            
-            logger.info(f"쿠폰 사용 요청: {coupon_code}")
-            
-            # API 호출
-            response = self.session.post(
-                self.use_endpoint,
-                json=payload,
-                timeout=self.timeout
-            )
-            
-            # HTTP 상태 코드 확인
-            response.raise_for_status()
-            
-            # JSON 응답 파싱
-            response_data = response.json()
-            use_response = CouponUseResponse.from_dict(response_data)
-            
-            logger.info(f"쿠폰 사용 응답: {use_response}")
-            
-            return True, use_response
-            
-        except requests.exceptions.Timeout:
-            error_msg = "쿠폰 사용 API 요청 시간 초과"
-            logger.error(error_msg)
-            return False, CouponUseResponse(
-                is_success=False,
-                lumber=0,
-                gold=0,
-                coupon_code=coupon_code,
-                error_message=error_msg
-            )
-            
-        except requests.exceptions.ConnectionError:
-            error_msg = "쿠폰 사용 API 서버에 연결할 수 없습니다"
-            logger.error(error_msg)
-            return False, CouponUseResponse(
-                is_success=False,
-                lumber=0,
-                gold=0,
-                coupon_code=coupon_code,
-                error_message=error_msg
-            )
-            
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"쿠폰 사용 HTTP 오류: {e.response.status_code}"
-            logger.error(error_msg)
+            response_data = self._request('POST', self.use_endpoint, "쿠폰 사용",
+                                          {"couponCode": coupon_code.strip()},
+                                          {'Idempotency-Key': idempotency_key} if idempotency_key else None)
+        except CouponAPIError as e:
+            logger.error(str(e))
             return False, CouponUseResponse(
                 is_success=False,
                 lumber=0,
                 gold=0,
                 coupon_code=coupon_code,
-                error_message=error_msg
-            )
-            
-        except json.JSONDecodeError:
-            error_msg = "쿠폰 사용 API 응답을 파싱할 수 없습니다"
-            logger.error(error_msg)
-            return False, CouponUseResponse(
-                is_success=False,
-                lumber=0,
-                gold=0,
-                coupon_code=coupon_code,
-                error_message=error_msg
-            )
-            
-        except Exception as e:
-            error_msg = f"쿠폰 사용 예상치 못한 오류: {str(e)}"
-            logger.error(error_msg)
-            return False, CouponUseResponse(
-                is_success=False,
-                lumber=0,
-                gold=0,
-                coupon_code=coupon_code,
-                error_message=error_msg
+                error_message=str(e)
             )
+        
+        use_response = CouponUseResponse.from_dict(response_data)
+        if use_response.is_success and self.check_cache is not None:
+            self.check_cache.invalidate(coupon_code)
+        logger.info(f"쿠폰 사용 응답: {use_response}")
+        return True, use_response
     
     def create_coupon(self, lumber: int, gold: int) -> Tuple[bool, CouponCreateResponse]:
         """
@@ -312,92 +393,34 @@ class CouponProcessor:
         Returns:
             Tuple[bool, CouponCreateResponse]: (API 호출 성공 여부, 응답 데이터)
         """
+        logger.info(f"쿠폰 생성 요청: lumber={lumber:,}, gold={gold:,}")
         try:
-            # 요청 데이터 준비
-            payload = {
-                "lumber": lumber,
-                "gold": gold
-            }
-            
-            logger.info(f"쿠폰 생성 요청: lumber={lumber:,}, gold={gold:,}")
-            
-            # API 호출
-            response = self.session.post(
-                self.create_endpoint,
-                json=payload,
-                timeout=self.timeout
-            )
-            
-            # HTTP 상태 코드 확인
-            response.raise_for_status()
-            
-            # JSON 응답 파싱
-            response_data = response.json()
-            create_response = CouponCreateResponse.from_dict(response_data)
-            
-            logger.info(f"쿠폰 생성 응답: {create_response}")
-            
-            return True, create_response
-            
-        except requests.exceptions.Timeout:
-            error_msg = "쿠폰 생성 API 요청 시간 초과"
-            logger.error(error_msg)
-            return False, CouponCreateResponse(
-                is_success=False,
-                coupon_code="",
-                lumber=lumber,
-                gold=gold,
-                error_message=error_msg
-            )
-            
-        except requests.exceptions.ConnectionError:
-            error_msg = "쿠폰 생성 API 서버에 연결할 수 없습니다"
-            logger.error(error_msg)
-            return False, CouponCreateResponse(
-                is_success=False,
-                coupon_code="",
-                lumber=lumber,
-                gold=gold,
-                error_message=error_msg
-            )
-            
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"쿠폰 생성 HTTP 오류: {e.response.status_code}"
-            logger.error(error_msg)
-            return False, CouponCreateResponse(
-                is_success=False,
-                coupon_code="",
-                lumber=lumber,
-                gold=gold,
-                error_message=error_msg
-            )
-            
-        except json.JSONDecodeError:
-            error_msg = "쿠폰 생성 API 응답을 파싱할 수 없습니다"
-            logger.error(error_msg)
-            return False, CouponCreateResponse(
-                is_success=False,
-                coupon_code="",
-                lumber=lumber,
-                gold=gold,
-                error_message=error_msg
-            )
-            
-        except Exception as e:
-            error_msg = f"쿠폰 생성 예상치 못한 오류: {str(e)}"
-            logger.error(error_msg)
+            response_data = self._request('POST', self.create_endpoint, "쿠폰 생성",
+                                          {"lumber": lumber, "gold": gold})
+        except CouponAPIError as e:
+            logger.error(str(e))
             return False, CouponCreateResponse(
                 is_success=False,
                 coupon_code="",
                 lumber=lumber,
                 gold=gold,
-                error_message=error_msg
+                error_message=str(e)
             )
+        
+        create_response = CouponCreateResponse.from_dict(response_data)
+        if create_response.is_success and self.check_cache is not None:
+            # 생성 전에 같은 코드로 체크해서 남은 '없는 쿠폰' 결과 제거
+            self.check_cache.invalidate(create_response.coupon_code)
+        logger.info(f"쿠폰 생성 응답: {create_response}")
+        return True, create_response
     
     def process_coupon_with_savecode(self, coupon_code: str, savecode: str, player_name: str = None) -> CouponProcessResult:
         """
         쿠폰 체크 -> 세이브코드 수정 -> 성공시 쿠폰 사용 처리 전체 워크플로우
         
+        서버가 사용을 거절하면 수정한 세이브코드를 돌려주지 않고, 사용 처리 결과를 받지 못한 쿠폰은
+        (아웃박스가 있으면 기록해 두고) 확인될 때까지 같은 처리기에서 다시 사용할 수 없음
+        
         Args:
             coupon_code: 쿠폰 코드
             savecode: 원본 세이브코드
@@ -408,10 +431,7 @@ class CouponProcessor:
         """
         logger.info(f"쿠폰 처리 시작: {coupon_code}")
         
-        # 1단계: 쿠폰 체크
-        check_success, check_response = self.check_coupon(coupon_code)
-        
-        if not check_success:
+        def failed(error_message: str) -> CouponProcessResult:
             return CouponProcessResult(
                 success=False,
                 original_savecode=savecode,
@@ -419,129 +439,107 @@ class CouponProcessor:
                 gold_gained=0,
                 lumber_gained=0,
                 coupon_code=coupon_code,
-                error_message=f"쿠폰 체크 실패: {check_response.error_message}"
+                error_message=error_message
             )
         
+        # 1단계: 쿠폰 체크
+        check_success, check_response = self.check_coupon(coupon_code)
+        if not check_success:
+            return failed(f"쿠폰 체크 실패: {check_response.error_message}")
+        
         # 쿠폰 체크 API가 성공했지만 사용할 수 없는 경우
         if not check_response.is_success or not check_response.is_usable:
-            return CouponProcessResult(
-                success=False,
-                original_savecode=savecode,
-                modified_savecode="",
-                gold_gained=0,
-                lumber_gained=0,
-                coupon_code=coupon_code,
-                error_message=check_response.error_message or "사용할 수 없는 쿠폰입니다"
-            )
+            return failed(check_response.error_message or "사용할 수 없는 쿠폰입니다")
         
+        # 2~3단계는 코드별로 한 스레드씩 (여러 스레드가 같은 쿠폰을 동시에 '성공'하는 경쟁 방지)
+        code_key = coupon_code.strip()
+        try:
+            with self._redeem_locks.hold(code_key) as waited:
+                if code_key in self._pending_redemptions:
+                    return failed(PENDING_REDEMPTION_MESSAGE)
+                if waited:
+                    # 앞 스레드가 사용했을 수 있으므로 다시 확인
+                    check_success, check_response = self.check_coupon(coupon_code)
+                    if not check_success:
+                        return failed(f"쿠폰 체크 실패: {check_response.error_message}")
+                    if not check_response.is_success or not check_response.is_usable:
+                        return failed(check_response.error_message or "사용할 수 없는 쿠폰입니다")
+                return self._redeem(coupon_code, savecode, player_name, check_response, failed)
+        except LockMapFullError:
+            logger.warning(f"쿠폰 사용 처리 중인 코드가 너무 많아 거절: {coupon_code}")
+            return failed("쿠폰 사용 요청이 몰려 처리할 수 없습니다. 잠시 후 다시 시도해주세요")
+    
+    def _redeem(self, coupon_code: str, savecode: str, player_name: Optional[str],
+                check_response: CouponCheckResponse, failed) -> CouponProcessResult:
+        """세이브코드 수정 -> 쿠폰 사용 처리 (코드별 락을 쥔 상태에서 호출)"""
         # 2단계: 세이브코드 수정 (쿠폰 체크에서 받은 정보 사용)
         try:
-            # 원본 세이브코드 파싱하여 현재 골드/나무 확인
-            if savecode.startswith('MasinSaveV2_'):
-                # 마신 세이브코드는 골드 수정 미지원
-                if check_response.gold > 0:
-                    return CouponProcessResult(
-                        success=False,
-                        original_savecode=savecode,
-                        modified_savecode="",
-                        gold_gained=0,
-                        lumber_gained=0,
-                        coupon_code=coupon_code,
-                        error_message="마신 세이브코드는 골드 추가를 지원하지 않습니다"
-                    )
-                
-                # 나무만 추가
-                original_data = self.modifier.parse_masin_savecode(savecode)
-                new_lumber = original_data['lumber'] + check_response.lumber
-                # 나무 최대값 제한 (990000)
-                if new_lumber > 990000:
-                    new_lumber = 990000
-                    logger.warning(f"나무 값이 990000을 초과하여 990000으로 제한됨")
-                modified_savecode = self.modifier.modify_lumber(savecode, new_lumber)
-                
-            else:
-                # 원본 게임 세이브코드
-                if player_name is None:
-                    return CouponProcessResult(
-                        success=False,
-                        original_savecode=savecode,
-                        modified_savecode="",
-                        gold_gained=0,
-                        lumber_gained=0,
-                        coupon_code=coupon_code,
-                        error_message="원본 게임 세이브코드 수정을 위해서는 플레이어 이름이 필요합니다"
-                    )
-                
-                # 현재 골드/나무 확인
-                original_data = self.modifier.parse_original_savecode(savecode)
-                new_gold = original_data['gold'] + check_response.gold
-                new_lumber = original_data['lumber'] + check_response.lumber
-                
-                # 나무 최대값 제한 (990000)
-                if new_lumber > 990000:
-                    new_lumber = 990000
-                    logger.warning(f"나무 값이 990000을 초과하여 990000으로 제한됨")
-                
-                # 골드와 나무 모두 수정
-                modified_savecode = self.modifier.modify_resources(
-                    savecode, 
-                    gold_amount=new_gold,
-                    lumber_amount=new_lumber,
-                    player_name=player_name
-                )
-            
-            # 3단계: 세이브코드 수정이 성공했으므로 쿠폰 사용 처리
-            logger.info(f"세이브코드 수정 성공, 쿠폰 사용 처리 진행: {coupon_code}")
-            use_success, use_response = self.use_coupon(coupon_code)
-            
-            if not use_success:
-                logger.warning(f"쿠폰 사용 API 호출 실패했지만 세이브코드는 이미 수정됨: {use_response.error_message}")
-                # 세이브코드 수정은 성공했으므로 성공으로 반환하되 경고 메시지 포함
-                return CouponProcessResult(
-                    success=True,
-                    original_savecode=savecode,
-                    modified_savecode=modified_savecode,
-                    gold_gained=check_response.gold,
-                    lumber_gained=check_response.lumber,
-                    coupon_code=coupon_code,
-                    error_message=f"⚠️ 세이브코드는 수정되었지만 쿠폰 사용 처리 실패: {use_response.error_message}"
-                )
-            
-            if not use_response.is_success:
-                logger.warning(f"쿠폰 사용 실패했지만 세이브코드는 이미 수정됨: {use_response.error_message}")
-                return CouponProcessResult(
-                    success=True,
-                    original_savecode=savecode,
-                    modified_savecode=modified_savecode,
-                    gold_gained=check_response.gold,
-                    lumber_gained=check_response.lumber,
-                    coupon_code=coupon_code,
-                    error_message=f"⚠️ 세이브코드는 수정되었지만 쿠폰 사용 처리 실패: {use_response.error_message}"
-                )
-            
-            # 모든 단계 성공
-            logger.info(f"쿠폰 처리 완료: {coupon_code}")
-            return CouponProcessResult(
-                success=True,
-                original_savecode=savecode,
-                modified_savecode=modified_savecode,
-                gold_gained=check_response.gold,
-                lumber_gained=check_response.lumber,
-                coupon_code=coupon_code,
-                error_message=""
+            modified_savecode = apply_coupon_to_savecode(
+                self.modifier, savecode, check_response.gold, check_response.lumber, player_name
             )
-            
+        except CouponApplyError as e:
+            return failed(str(e))
         except Exception as e:
             logger.error(f"세이브코드 수정 중 오류: {str(e)}")
-            return CouponProcessResult(
-                success=False,
-                original_savecode=savecode,
-                modified_savecode="",
-                gold_gained=0,
-                lumber_gained=0,
-                coupon_code=coupon_code,
-                error_message=f"세이브코드 수정 중 오류: {str(e)}"
-            )
+            return failed(f"세이브코드 수정 중 오류: {str(e)}")
+        
+        # 3단계: 세이브코드 수정이 성공했으므로 쿠폰 사용 처리
+        # (아웃박스가 있으면 세이브코드를 돌려주기 전에 사용 호출부터 기록)
+        logger.info(f"세이브코드 수정 성공, 쿠폰 사용 처리 진행: {coupon_code}")
+        entry = self.outbox.add(coupon_code) if self.outbox is not None else None
+        use_success, use_response = self.use_coupon(
+            coupon_code, entry.idempotency_key if entry is not None else None
+        )
+        
+        error_message = ""
+        outcome = settle_coupon_use(self.outbox, entry, use_success, use_response)
+        if outcome == USE_REJECTED:
+            # 서버가 사용을 거절(이미 사용됨 등)했으면 수정한 세이브코드를 돌려주지 않음
+            logger.warning(f"쿠폰 사용 거절: {coupon_code} - {use_response.error_message}")
+            return failed(use_response.error_message or "이미 사용된 쿠폰입니다")
+        if outcome == USE_PENDING:
+            # 세이브코드는 돌려주므로 사용 처리가 확인될 때까지 같은 쿠폰은 다시 받을 수 없음
+            self._pending_redemptions.add(coupon_code.strip())
+            if entry is not None:
+                error_message = OUTBOX_RETRY_MESSAGE
+            else:
+                logger.warning(f"쿠폰 사용 처리 실패했지만 세이브코드는 이미 수정됨: {use_response.error_message}")
+                error_message = f"⚠️ 세이브코드는 수정되었지만 쿠폰 사용 처리 실패: {use_response.error_message}"
+        else:
+            logger.info(f"쿠폰 처리 완료: {coupon_code}")
+        
+        return CouponProcessResult(
+            success=True,
+            original_savecode=savecode,
+            modified_savecode=modified_savecode,
+            gold_gained=check_response.gold,
+            lumber_gained=check_response.lumber,
+            coupon_code=coupon_code,
+            error_message=error_message
+        )
+    
+    def retry_outbox(self) -> int:
+        """
+        재시도 시각이 된 아웃박스 호출 처리 (동기 처리기는 워커가 없으므로 호출하는 쪽에서 주기적으로 실행)
+        
+        Returns:
+            int: 서버가 사용 처리를 확인한 호출 수
+        """
+        if self.outbox is None:
+            return 0
+        
+        confirmed = 0
+        for entry in self.outbox.get_due():
+            use_success, use_response = self.use_coupon(entry.coupon_code, entry.idempotency_key)
+            outcome = settle_coupon_use(self.outbox, entry, use_success, use_response)
+            if outcome != USE_PENDING:
+                self._pending_redemptions.discard(entry.coupon_code.strip())
+            if outcome == USE_CONFIRMED:
+                confirmed += 1
+                logger.info(f"지연된 쿠폰 사용 처리 완료: {entry.coupon_code} ({entry.attempts + 1}번째 시도)")
+            elif outcome == USE_REJECTED:
+                logger.warning(f"지연된 쿠폰 사용 처리 거절: {entry.coupon_code} - {use_response.error_message}")
+        return confirmed
     
     def close(self):
         """세션 종료"""
@@ -549,6 +547,21 @@ class CouponProcessor:
             self.session.close()
 
 
+# 편의 함수들이 공유하는 쿠폰 처리기 (처음 사용할 때 생성)
+_default_processor: Optional[CouponProcessor] = None
+_default_processor_lock = threading.Lock()
+
+
+def get_default_processor() -> CouponProcessor:
+    """편의 함수용 공유 쿠폰 처리기 반환 (세션/세이브코드 수정기를 호출마다 새로 만들지 않음)"""
+    global _default_processor
+    if _default_processor is None:
+        with _default_processor_lock:
+            if _default_processor is None:
+                _default_processor = CouponProcessor()
+    return _default_processor
+
+
 # 편의 함수
 def process_coupon_simple(coupon_code: str, savecode: str, player_name: str = None) -> CouponProcessResult:
     """
@@ -562,11 +575,7 @@ def process_coupon_simple(coupon_code: str, savecode: str, player_name: str = No
     Returns:
         CouponProcessResult: 처리 결과
     """
-    processor = CouponProcessor()
-    try:
-        return processor.process_coupon_with_savecode(coupon_code, savecode, player_name)
-    finally:
-        processor.close()
+    return get_default_processor().process_coupon_with_savecode(coupon_code, savecode, player_name)
 
 
 def create_coupon_simple(lumber: int, gold: int) -> Tuple[bool, CouponCreateResponse]:
@@ -580,11 +589,7 @@ def create_coupon_simple(lumber: int, gold: int) -> Tuple[bool, CouponCreateResp
     Returns:
         Tuple[bool, CouponCreateResponse]: (성공 여부, 응답 데이터)
     """
-    processor = CouponProcessor()
-    try:
-        return processor.create_coupon(lumber, gold)
-    finally:
-        processor.close()
+    return get_default_processor().create_coupon(lumber, gold)
 
 
 def format_coupon_create_result(success: bool, response: CouponCreateResponse) -> str:
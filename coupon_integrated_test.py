@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """
 쿠폰 통합 처리 테스트 및 사용 예제
+(실서버 대신 대역 서버를 쓰려면 coupon_fake_server.py를 띄우고 COUPON_API_URL 지정)
 """
 
 import os
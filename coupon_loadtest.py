@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+쿠폰 처리 부하 테스트
+AsyncCouponProcessor.process_coupon_with_savecode를 N건 동시에 실행하여
+p50/p99 지연 시간과 처리량을 측정 (이벤트 전에 봇 설정을 정하기 위한 용도)
+
+    python coupon_loadtest.py --redemptions 500 --concurrency 50 --latency 0.05
+    python coupon_loadtest.py --base-url http://127.0.0.1:5036 --coupon-prefix EVENT
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from coupon_async import AsyncCouponProcessor
+from coupon_fake_server import FakeCouponServer
+from coupon_resilience import CouponResilience
+
+MASIN_SAVECODE = 'MasinSaveV2_홍길동_37_50000_15_200_100_150_264_266_268_270_272_274'
+
+
+@dataclass
+class LoadTestResult:
+    """부하 테스트 결과"""
+    redemptions: int
+    concurrency: int
+    elapsed: float = 0.0
+    latencies_ms: List[float] = field(default_factory=list)
+    succeeded: int = 0
+    failures: Counter = field(default_factory=Counter)  # {오류 메시지: 횟수}
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 건수"""
+        return self.redemptions / self.elapsed if self.elapsed else 0.0
+
+
+async def run_load_test(processor: AsyncCouponProcessor, coupon_codes: List[str],
+                        concurrency: int, savecode: str = MASIN_SAVECODE) -> LoadTestResult:
+    """
+    쿠폰 코드 목록을 concurrency건씩 동시에 사용 처리
+
+    Args:
+        processor: 비동기 쿠폰 처리기
+        coupon_codes: 사용할 쿠폰 코드 (코드 1개당 1건)
+        concurrency: 동시에 진행할 쿠폰 사용 건수
+        savecode: 쿠폰을 적용할 세이브코드
+
+    Returns:
+        LoadTestResult: 측정 결과
+    """
+    result = LoadTestResult(redemptions=len(coupon_codes), concurrency=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def redeem(code: str):
+        async with semaphore:
+            start = time.perf_counter()
+            outcome = await processor.process_coupon_with_savecode(code, savecode)
+            result.latencies_ms.append((time.perf_counter() - start) * 1000)
+            if outcome.success:
+                result.succeeded += 1
+            else:
+                result.failures[outcome.error_message] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(redeem(code) for code in coupon_codes))
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def format_load_test_result(result: LoadTestResult) -> str:
+    """측정 결과 요약"""
+    lines = [
+        f"📊 쿠폰 사용 {result.redemptions:,}건 (동시 {result.concurrency}건)",
+        f"   소요 시간: {result.elapsed:.2f}초 / 처리량: {result.throughput:.1f}건/초",
+        f"   지연 시간: 평균 {statistics.mean(result.latencies_ms) if result.latencies_ms else 0:.1f}ms  "
+        f"p50 {result.percentile(0.5):.1f}ms  p99 {result.percentile(0.99):.1f}ms  "
+        f"최대 {max(result.latencies_ms, default=0):.1f}ms",
+        f"   성공 {result.succeeded:,}건 / 실패 {result.redemptions - result.succeeded:,}건",
+    ]
+    for message, count in result.failures.most_common(5):
+        lines.append(f"     - {count:,}건: {message}")
+    return "\n".join(lines)
+
+
+async def _run_cli(args: argparse.Namespace) -> LoadTestResult:
+    server: Optional[FakeCouponServer] = None
+    base_url = args.base_url
+    if base_url is None:
+        # 주소를 지정하지 않으면 같은 프로세스에 대역 서버를 띄우고 쿠폰을 미리 등록
+        server = FakeCouponServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, seed=1)
+        for i in range(args.redemptions):
+            server.add_coupon(f"{args.coupon_prefix}{i}", lumber=100)
+        await server.start()
+        base_url = server.base_url
+
+    resilience = CouponResilience(max_in_flight=args.max_in_flight, max_retries=args.retries)
+    processor = AsyncCouponProcessor(base_url=base_url, timeout=args.timeout, pool_size=args.pool_size,
+                                     resilience=resilience)
+    processor.modifier  # 세이브코드 수정기 데이터 로드를 측정 전에 끝냄
+    try:
+        codes = [f"{args.coupon_prefix}{i}" for i in range(args.redemptions)]
+        result = await run_load_test(processor, codes, args.concurrency)
+    finally:
+        await processor.close()
+        if server is not None:
+            await server.stop()
+
+    print(format_load_test_result(result))
+    stats = resilience.get_stats()
+    print(f"   쿠폰 API: 바로 거절 {stats['rejected'] or '없음'}, 서킷 브레이커 {stats['circuit_state']}")
+    for label, endpoint in stats['endpoints'].items():
+        print(f"     {label}: 요청 {endpoint['requests']:,}건, 재시도 {endpoint['retries']:,}건, "
+              f"p99 ≤{endpoint['p99_ms']:.0f}ms, 오류 {endpoint['errors'] or '없음'}")
+    if server is not None:
+        print(f"   대역 서버 최대 동시 처리: {server.max_in_flight}건")
+    return result
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='쿠폰 처리 부하 테스트')
+    parser.add_argument('--redemptions', type=int, default=200, help='쿠폰 사용 건수')
+    parser.add_argument('--concurrency', type=int, default=20, help='동시 쿠폰 사용 건수')
+    parser.add_argument('--base-url', default=None, help='쿠폰 API 주소 (생략하면 내장 대역 서버 사용)')
+    parser.add_argument('--coupon-prefix', default='LOAD', help='사용할 쿠폰 코드 접두사 (접두사 + 0부터 번호)')
+    parser.add_argument('--latency', type=float, default=0.02, help='대역 서버 응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.01, help='대역 서버 지연 무작위 추가 범위 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='대역 서버 500 오류 확률 (0~1)')
+    parser.add_argument('--pool-size', type=int, default=10, help='쿠폰 서버 연결 풀 크기 (COUPON_POOL_SIZE)')
+    parser.add_argument('--max-in-flight', type=int, default=20, help='쿠폰 서버 동시 요청 수 (COUPON_MAX_IN_FLIGHT)')
+    parser.add_argument('--retries', type=int, default=2, help='요청 재시도 횟수 (COUPON_MAX_RETRIES)')
+    parser.add_argument('--timeout', type=float, default=10, help='요청 제한 시간 (COUPON_TIMEOUT)')
+    args = parser.parse_args(argv)
+
+    if args.redemptions <= 0 or args.concurrency <= 0:
+        parser.error("redemptions와 concurrency는 0보다 커야 합니다")
+
+    result = asyncio.run(_run_cli(args))
+    return 0 if result.succeeded == result.redemptions else 1
+
+
+if __name__ == "__main__":
+    # 세이브코드 수정기가 Config를 읽으므로 .env가 없는 환경에서도 실행되도록 설정
+    os.environ.setdefault('DISCORD_BOT_TOKEN', 'loadtest-token')
+    sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+쿠폰 사용 처리 아웃박스 모듈
+세이브코드를 수정해서 돌려주기 전에 '쿠폰 사용' 호출을 SQLite에 먼저 기록하고,
+쿠폰 서버가 사용 처리를 확인할 때까지 재시도할 수 있도록 보관
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxEntry:
+    """처리 대기 중인 쿠폰 사용 호출"""
+    entry_id: int
+    coupon_code: str
+    idempotency_key: str  # 재시도해도 서버가 같은 사용 요청으로 인식하도록 보내는 키
+    created_at: float
+    attempts: int
+    next_attempt_at: float
+    last_error: str
+
+
+class CouponOutbox:
+    """SQLite 기반 쿠폰 사용 아웃박스 (동기 쿠폰 처리기의 여러 스레드에서 함께 사용 가능)"""
+
+    def __init__(self, path: str, base_delay: float = 5, max_delay: float = 600):
+        """
+        아웃박스 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            base_delay: 첫 재시도까지의 대기 시간 (초, 실패할 때마다 2배)
+            max_delay: 재시도 대기 시간 상한 (초)
+        """
+        self.path = path
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")  # 커밋이 끝나면 디스크에 남아 있어야 함
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS coupon_use_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                coupon_code TEXT NOT NULL,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                created_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT NOT NULL DEFAULT ''
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_coupon_use_outbox_next ON coupon_use_outbox (next_attempt_at)"
+        )
+        self._conn.commit()
+
+        # 통계 (프로세스 시작 이후)
+        self.confirmed = 0
+        self.rejected = 0
+        self.failures = 0
+
+    def add(self, coupon_code: str) -> OutboxEntry:
+        """
+        쿠폰 사용 호출 기록 (커밋 후 반환되므로 이후 봇이 종료돼도 재시도됨)
+
+        호출한 쪽이 바로 사용 요청을 보내므로 첫 재시도는 base_delay 뒤로 예약
+        (그 사이 워커가 같은 호출을 중복으로 보내지 않도록)
+        """
+        now = time.time()
+        next_attempt_at = now + self.base_delay
+        key = uuid.uuid4().hex
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO coupon_use_outbox (coupon_code, idempotency_key, created_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?)",
+                (coupon_code, key, now, next_attempt_at)
+            )
+        return OutboxEntry(cursor.lastrowid, coupon_code, key, now, 0, next_attempt_at, '')
+
+    def mark_done(self, entry_id: int):
+        """서버가 사용 처리를 확인한 호출 삭제"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM coupon_use_outbox WHERE id = ?", (entry_id,))
+            self.confirmed += 1
+
+    def mark_rejected(self, entry_id: int):
+        """서버가 응답했지만 사용을 거절한 호출 삭제 (다시 보내도 결과가 같으므로)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM coupon_use_outbox WHERE id = ?", (entry_id,))
+            self.rejected += 1
+
+    def mark_failed(self, entry: OutboxEntry, error: str) -> float:
+        """
+        실패 기록 후 다음 재시도 시각 예약 (지수 백오프)
+
+        Returns:
+            float: 다음 재시도 시각
+        """
+        attempts = entry.attempts + 1
+        delay = min(self.base_delay * (2 ** (attempts - 1)), self.max_delay)
+        next_attempt_at = time.time() + delay
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE coupon_use_outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                (attempts, next_attempt_at, error, entry.entry_id)
+            )
+            self.failures += 1
+        entry.attempts = attempts
+        entry.next_attempt_at = next_attempt_at
+        entry.last_error = error
+        logger.warning(f"쿠폰 사용 처리 재시도 예약 ({entry.coupon_code}, {attempts}회 실패, {delay:.0f}초 후): {error}")
+        return next_attempt_at
+
+    def get_due(self, now: float = None, limit: int = 50) -> List[OutboxEntry]:
+        """재시도 시각이 된 호출 목록 (오래된 것부터)"""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, coupon_code, idempotency_key, created_at, attempts, next_attempt_at, last_error "
+                "FROM coupon_use_outbox WHERE next_attempt_at <= ? ORDER BY next_attempt_at LIMIT ?",
+                (now, limit)
+            ).fetchall()
+        return [OutboxEntry(*row) for row in rows]
+
+    def get_pending_codes(self) -> List[str]:
+        """사용 처리 확인을 기다리는 쿠폰 코드 목록"""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT coupon_code FROM coupon_use_outbox").fetchall()
+        return [row[0] for row in rows]
+
+    def get_next_attempt_at(self) -> Optional[float]:
+        """가장 이른 재시도 예정 시각 (대기 중인 호출이 없으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(next_attempt_at) FROM coupon_use_outbox").fetchone()
+        return row[0]
+
+    def get_stats(self) -> dict:
+        """아웃박스 상태 (관리자 확인용)"""
+        with self._lock:
+            depth, oldest, max_attempts = self._conn.execute(
+                "SELECT COUNT(*), MIN(created_at), MAX(attempts) FROM coupon_use_outbox"
+            ).fetchone()
+        return {
+            'depth': depth,
+            'oldest_age': time.time() - oldest if oldest is not None else 0.0,
+            'max_attempts': max_attempts or 0,
+            'confirmed': self.confirmed,
+            'rejected': self.rejected,
+            'failures': self.failures,
+        }
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
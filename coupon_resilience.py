@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+쿠폰 API 장애 대응 모듈
+서킷 브레이커(서버가 죽어 있으면 바로 실패), 재시도 예산(재시도가 전체 요청의 일정 비율을 넘지 않도록),
+동시 요청 수 제한(서버가 느리면 대기시키지 않고 바로 거절), 엔드포인트별 지연 시간 히스토그램/오류 집계
+(동기/비동기 쿠폰 처리기에서 함께 사용하므로 스레드 안전하게 구현)
+"""
+
+import bisect
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 구간 상한 (ms, 마지막 구간은 그 이상 전부)
+LATENCY_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# 서킷 브레이커 실패로 세는 오류 종류 (서버가 응답하지 못한 경우)
+BREAKER_ERROR_KINDS = {'timeout', 'connect', 'connection', 'http_5xx'}
+
+
+class CouponAPIError(Exception):
+    """쿠폰 API 호출 실패 (사용자에게 보여줄 메시지)"""
+
+    def __init__(self, message: str, kind: str = 'unexpected'):
+        super().__init__(message)
+        self.kind = kind  # timeout, connect, connection, http_4xx, http_5xx, parse, circuit_open, shed, unexpected
+
+
+class CircuitBreaker:
+    """연속 실패가 쌓이면 일정 시간 요청을 막고, 이후 한 건만 시험 삼아 보내는 서킷 브레이커"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        """
+        Args:
+            failure_threshold: 회로를 여는 연속 실패 횟수 (0이면 사용 안 함)
+            reset_timeout: 회로를 연 뒤 시험 요청을 보낼 때까지의 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self.open_count = 0
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인 (반열림 상태에서는 시험 요청 한 건만 허용)"""
+        if self.failure_threshold <= 0:
+            return True
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("쿠폰 API 서킷 브레이커 닫힘 (서버 응답 복구)")
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.open_count += 1
+                    logger.warning(f"쿠폰 API 서킷 브레이커 열림 ({self._failures}회 연속 실패, "
+                                   f"{self.reset_timeout:.0f}초 동안 요청 차단)")
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def get_remaining_open(self) -> float:
+        """열린 회로가 시험 요청을 받을 때까지 남은 시간 (초)"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+
+class RetryBudget:
+    """
+    재시도 예산
+    요청 1건마다 ratio만큼 적립하고 재시도 1회에 1만큼 사용하여,
+    서버 장애 시 재시도가 요청량을 몇 배로 키우지 않도록 제한
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class LatencyHistogram:
+    """구간별 개수로 저장하는 지연 시간 히스토그램"""
+
+    def __init__(self, buckets_ms: List[float] = None):
+        self.buckets_ms = buckets_ms or LATENCY_BUCKETS_MS
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+
+    def percentile(self, q: float) -> float:
+        """q(0~1) 백분위 추정값 (해당 구간의 상한, 마지막 구간이면 inf)"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                return self.buckets_ms[index] if index < len(self.buckets_ms) else float('inf')
+        return float('inf')
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class EndpointStats:
+    """엔드포인트 하나의 요청/오류/지연 시간 통계"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.retries = 0
+        self.errors: Counter = Counter()  # {오류 종류: 횟수}
+
+    def to_dict(self) -> dict:
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'errors': dict(self.errors),
+            'mean_ms': self.latency.mean_ms,
+            'p50_ms': self.latency.percentile(0.5),
+            'p95_ms': self.latency.percentile(0.95),
+            'p99_ms': self.latency.percentile(0.99),
+        }
+
+
+class CouponResilience:
+    """쿠폰 API 호출 정책 (서킷 브레이커 + 재시도 예산 + 동시 요청 수 제한 + 통계)"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30,
+                 max_retries: int = 2, retry_base_delay: float = 0.2,
+                 retry_budget_ratio: float = 0.2, max_in_flight: int = 20):
+        """
+        Args:
+            failure_threshold: 서킷 브레이커를 여는 연속 실패 횟수 (0이면 사용 안 함)
+            reset_timeout: 회로를 연 뒤 시험 요청까지의 시간 (초)
+            max_retries: 요청 1건의 최대 재시도 횟수
+            retry_base_delay: 재시도 대기 시간 기준값 (초, 0~기준값*2^n 사이 무작위)
+            retry_budget_ratio: 요청 1건당 적립되는 재시도 예산
+            max_in_flight: 쿠폰 서버로 동시에 보낼 수 있는 요청 수 (초과하면 바로 거절)
+        """
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.budget = RetryBudget(retry_budget_ratio)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.max_in_flight = max_in_flight
+
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.rejected: Counter = Counter()  # {circuit_open/shed: 횟수}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def _endpoint(self, label: str) -> EndpointStats:
+        stats = self.endpoints.get(label)
+        if stats is None:
+            stats = self.endpoints.setdefault(label, EndpointStats())
+        return stats
+
+    def acquire(self, label: str):
+        """
+        요청 시작 (끝나면 반드시 release 호출)
+
+        Raises:
+            CouponAPIError: 회로가 열려 있거나 동시 요청 수가 가득 찬 경우
+        """
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                self.rejected['shed'] += 1
+                raise CouponAPIError(f"{label} 요청이 몰려 처리할 수 없습니다. 잠시 후 다시 시도해주세요", 'shed')
+            self._in_flight += 1
+        if not self.breaker.allow_request():
+            self.release()
+            self.rejected['circuit_open'] += 1
+            raise CouponAPIError(
+                f"쿠폰 서버가 응답하지 않아 {label} 요청을 보내지 않았습니다. 잠시 후 다시 시도해주세요",
+                'circuit_open'
+            )
+
+    def release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def record(self, label: str, elapsed_ms: float, error: CouponAPIError = None):
+        """요청 1회 결과 기록 (서킷 브레이커 상태 반영)"""
+        stats = self._endpoint(label)
+        stats.requests += 1
+        stats.latency.observe(elapsed_ms)
+        if error is None:
+            self.breaker.record_success()
+            return
+        stats.errors[error.kind] += 1
+        if error.kind in BREAKER_ERROR_KINDS:
+            self.breaker.record_failure()
+        else:
+            # 4xx/파싱 오류는 서버가 응답한 것이므로 회로에는 성공으로 반영
+            self.breaker.record_success()
+
+    def should_retry(self, label: str, error: CouponAPIError, attempt: int, idempotent: bool) -> bool:
+        """
+        재시도 여부 결정
+
+        연결 수립 실패는 요청이 전달되지 않았으므로 항상 재시도 대상이고,
+        시간 초과/5xx는 같은 요청을 다시 보내도 되는 경우(idempotent)에만 재시도
+        """
+        if attempt >= self.max_retries or self.breaker.state == CircuitBreaker.OPEN:
+            return False
+        if error.kind != 'connect' and not (idempotent and error.kind in ('timeout', 'connection', 'http_5xx')):
+            return False
+        if not self.budget.try_withdraw():
+            return False
+        self._endpoint(label).retries += 1
+        return True
+
+    def on_new_request(self):
+        """재시도가 아닌 새 요청마다 재시도 예산 적립"""
+        self.budget.deposit()
+
+    def retry_delay(self, attempt: int) -> float:
+        """재시도 대기 시간 (지수 백오프 + 전체 지터)"""
+        return random.uniform(0, self.retry_base_delay * (2 ** attempt))
+
+    def get_stats(self) -> dict:
+        """관리자 확인용 통계"""
+        return {
+            'circuit_state': self.breaker.state,
+            'circuit_open_count': self.breaker.open_count,
+            'circuit_remaining': self.breaker.get_remaining_open(),
+            'retry_budget': self.budget.tokens,
+            'in_flight': self._in_flight,
+            'rejected': dict(self.rejected),
+            'endpoints': {label: stats.to_dict() for label, stats in self.endpoints.items()},
+        }
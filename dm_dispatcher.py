@@ -0,0 +1,171 @@
+"""
+DM 일괄 발송 모듈
+여러 유저에게 같은 DM을 보낼 때 동시 발송 수와 Discord 요청 속도를 제한하면서
+병렬로 보내고, 결과(성공/실패 수)는 발송이 끝난 뒤 비동기로 전달
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+import discord
+
+from rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTE = 'dm'
+
+
+class DMDispatchResult:
+    """DM 일괄 발송 결과"""
+
+    def __init__(self, total: int = 0, sent: int = 0, failed: int = 0):
+        self.total = total
+        self.sent = sent
+        self.failed = failed
+
+    def __repr__(self) -> str:
+        return f"DMDispatchResult(total={self.total}, sent={self.sent}, failed={self.failed})"
+
+
+class DMDispatcher:
+    """동시 발송 수와 전역/경로별 요청 속도를 제한하는 공용 DM 발송기"""
+
+    def __init__(self, client: Optional[discord.Client] = None, concurrency: int = 8,
+                 global_rate: float = 40, route_rates: Optional[Dict[str, Tuple[float, float]]] = None,
+                 default_route_rate: Optional[Tuple[float, float]] = None):
+        """
+        DM 발송기 초기화
+
+        Args:
+            client: 길드 밖 유저 조회에 사용할 Discord 클라이언트
+            concurrency: 동시에 진행할 최대 발송 수
+            global_rate: 모든 발송에 공통으로 적용하는 초당 요청 수 (Discord 전역 한도보다 낮게)
+            route_rates: 경로별 (초당 요청 수, 최대 순간 요청 수) {경로 이름: (rate, capacity)}
+            default_route_rate: route_rates에 없는 경로에 적용할 (rate, capacity) (None이면 전역 제한만 적용)
+        """
+        self.client = client
+        self.concurrency = concurrency
+        self._semaphore = None  # 첫 발송 때 생성 (봇 이벤트 루프가 시작되기 전에 만들어지므로)
+        self._global_bucket = TokenBucket(global_rate)
+        self._route_buckets: Dict[str, TokenBucket] = {
+            route: TokenBucket(rate, capacity) for route, (rate, capacity) in (route_rates or {}).items()
+        }
+        self.default_route_rate = default_route_rate
+        self._background: Set[asyncio.Task] = set()  # 진행 중인 백그라운드 발송 (이벤트 루프는 약한 참조만 보관)
+
+        # 누적 통계
+        self.total_sent = 0
+        self.total_failed = 0
+
+    def _get_route_bucket(self, route: str) -> Optional[TokenBucket]:
+        """경로별 토큰 버킷 반환 (처음 쓰는 경로는 기본 속도로 생성)"""
+        bucket = self._route_buckets.get(route)
+        if bucket is None and self.default_route_rate is not None:
+            bucket = self._route_buckets[route] = TokenBucket(*self.default_route_rate)
+        return bucket
+
+    async def _resolve_user(self, user_id: int, guild: Optional[discord.Guild]):
+        """DM 대상 조회 (길드 멤버 → 봇 캐시 → API 순)"""
+        if guild is not None:
+            member = guild.get_member(user_id)
+            if member is not None:
+                return member
+        if self.client is None:
+            return None
+        user = self.client.get_user(user_id)
+        if user is None:
+            try:
+                user = await self.client.fetch_user(user_id)
+            except discord.HTTPException:
+                return None
+        return user
+
+    async def _send_one(self, user_id: int, embed: discord.Embed, guild: Optional[discord.Guild], route: str) -> bool:
+        """한 명에게 DM 발송 (동시 발송 수/속도 제한 적용)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            try:
+                user = await self._resolve_user(user_id, guild)
+                if user is None:
+                    return False
+
+                await self._global_bucket.acquire()
+                route_bucket = self._get_route_bucket(route)
+                if route_bucket is not None:
+                    await route_bucket.acquire()
+
+                await user.send(embed=embed)
+                return True
+            except discord.Forbidden:
+                # DM을 받을 수 없는 사용자
+                return False
+            except Exception as e:
+                logger.error(f"DM 발송 중 오류 (user_id: {user_id}): {e}")
+                return False
+
+    async def dispatch(self, user_ids: Iterable[int], embed: discord.Embed,
+                       guild: Optional[discord.Guild] = None, route: str = DEFAULT_ROUTE) -> DMDispatchResult:
+        """
+        같은 임베드를 여러 유저에게 병렬 발송하고 끝날 때까지 대기
+
+        Args:
+            user_ids: 받을 유저 ID 목록
+            embed: 모든 유저에게 보낼 임베드 (한 번만 만들어 재사용)
+            guild: 멤버 조회에 먼저 사용할 길드 (없으면 봇 캐시/API로 조회)
+            route: 경로별 속도 제한 이름
+
+        Returns:
+            DMDispatchResult: 발송 결과
+        """
+        user_ids = list(dict.fromkeys(user_ids))  # 중복 제거 (순서 유지)
+        results = await asyncio.gather(*(self._send_one(user_id, embed, guild, route) for user_id in user_ids))
+
+        sent = sum(results)
+        result = DMDispatchResult(total=len(user_ids), sent=sent, failed=len(user_ids) - sent)
+        self.total_sent += result.sent
+        self.total_failed += result.failed
+        logger.info(f"DM 발송 완료 ({route}) - 성공: {result.sent}명, 실패: {result.failed}명")
+        return result
+
+    def dispatch_background(self, user_ids: Iterable[int], embed: discord.Embed,
+                            guild: Optional[discord.Guild] = None, route: str = DEFAULT_ROUTE,
+                            on_complete: Optional[Callable[[DMDispatchResult], Awaitable[None]]] = None) -> asyncio.Task:
+        """
+        백그라운드에서 발송하고 바로 반환 (결과는 on_complete 콜백으로 전달)
+
+        Returns:
+            asyncio.Task: 발송 작업 (결과는 DMDispatchResult)
+        """
+        user_ids = list(user_ids)  # 발송 시작 전에 대상이 바뀌지 않도록 고정
+
+        async def run():
+            result = await self.dispatch(user_ids, embed, guild, route)
+            if on_complete is not None:
+                try:
+                    await on_complete(result)
+                except Exception as e:
+                    logger.error(f"DM 발송 결과 처리 중 오류: {e}")
+            return result
+
+        task = asyncio.create_task(run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def shutdown(self, timeout: float = 10.0):
+        """
+        진행 중인 백그라운드 발송이 끝날 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, 넘기면 남은 발송은 취소)
+        """
+        if not self._background:
+            return
+        pending = list(self._background)
+        logger.info(f"백그라운드 DM 발송 {len(pending)}건 완료 대기")
+        _, not_done = await asyncio.wait(pending, timeout=timeout)
+        for task in not_done:
+            task.cancel()
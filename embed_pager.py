@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+임베드 페이지 나누기 모듈
+항목 목록을 Discord 메시지 한도(임베드 10개, 전체 글자 6000자)에 맞춰 페이지로 나누며,
+페이지는 요청할 때 만들어 처음 페이지만 보는 경우 나머지 임베드를 만들지 않음
+"""
+
+from typing import Any, Callable, List, Sequence, Tuple
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+class EmbedPager:
+    """항목 번호로 임베드를 만드는 함수를 받아 메시지 한도 안에서 페이지 단위로 묶음"""
+
+    def __init__(self, count: int, build: Callable[[int], Any], header: Sequence[Any] = (),
+                 max_embeds: int = MAX_EMBEDS_PER_MESSAGE, max_chars: int = MAX_EMBED_CHARS_PER_MESSAGE,
+                 size: Callable[[Any], int] = len):
+        """
+        페이저 초기화
+
+        Args:
+            count: 항목 수
+            build: 항목 번호(0부터)로 임베드를 만드는 함수
+            header: 첫 페이지 앞에 붙일 임베드 (통계 등)
+            max_embeds: 메시지 1개당 최대 임베드 수
+            max_chars: 메시지 1개당 임베드 전체 글자 수 한도
+            size: 임베드 글자 수 계산 함수 (discord.Embed는 len으로 계산)
+        """
+        self.count = count
+        self.build = build
+        self.header = list(header)
+        self.max_embeds = max_embeds
+        self.max_chars = max_chars
+        self.size = size
+        self._starts = [0]  # 지금까지 만든 페이지의 시작 항목 번호 (다음 페이지 시작은 앞 페이지를 만들 때 정해짐)
+
+    def page(self, index: int) -> Tuple[List[Any], int, int]:
+        """
+        페이지 생성
+
+        한도를 넘는 항목이 있어도 페이지마다 항목을 최소 1개는 담음
+
+        Args:
+            index: 페이지 번호 (0부터, 이미 만든 페이지의 바로 다음 페이지까지 가능)
+
+        Returns:
+            (임베드 목록, 시작 항목 번호, 끝 항목 번호(미포함))
+        """
+        if index >= len(self._starts):
+            raise IndexError(f"page {index} is not reachable yet")
+        start = self._starts[index]
+        embeds = list(self.header) if index == 0 else []
+        chars = sum(self.size(embed) for embed in embeds)
+        end = start
+        while end < self.count and len(embeds) < self.max_embeds:
+            embed = self.build(end)
+            embed_chars = self.size(embed)
+            if end > start and chars + embed_chars > self.max_chars:
+                break
+            embeds.append(embed)
+            chars += embed_chars
+            end += 1
+        if index + 1 == len(self._starts) and end < self.count:
+            self._starts.append(end)
+        return embeds, start, end
+
+    def has_next(self, index: int) -> bool:
+        """다음 페이지가 있는지 (page(index)를 만든 뒤에 확인)"""
+        return index + 1 < len(self._starts)
+
+    @property
+    def single_page(self) -> bool:
+        """첫 페이지에 모든 항목이 들어가는지 (page(0)을 만든 뒤에 확인)"""
+        return not self.has_next(0)
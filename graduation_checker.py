@@ -3,6 +3,7 @@
 JSON 기반으로 졸업 조건을 관리하고 확인하는 기능을 제공
 """
 
+import hashlib
 import json
 import logging
 from typing import Any, Dict, List, Set
@@ -25,8 +26,25 @@ class GraduationChecker:
             config_file: 졸업 조건 JSON 파일 경로
             raid_items_file: 레이드 졸업 아이템 JSON 파일 경로
         """
-        self.conditions = self._load_conditions(config_file)
-        self.raid_items = self._load_raid_items(raid_items_file)
+        self.config_file = config_file
+        self.raid_items_file = raid_items_file
+        self.version = ''  # 졸업 조건 데이터 버전 (파일 내용이 바뀌면 달라짐, 분석 결과 캐시 키에 사용)
+        self.reload()
+
+    def reload(self) -> str:
+        """졸업 조건/레이드 졸업 아이템 파일을 다시 로드하고 새 버전 반환"""
+        self.conditions = self._load_conditions(self.config_file)
+        self.raid_items = self._load_raid_items(self.raid_items_file)
+        digest = hashlib.sha1()
+        for filename in (self.config_file, self.raid_items_file):
+            try:
+                with open(filename, 'rb') as f:
+                    digest.update(f.read())
+            except OSError:
+                pass  # 로드 실패는 위에서 기록됨 (빈 조건으로 동작)
+            digest.update(b'\0')
+        self.version = digest.hexdigest()[:12]
+        return self.version
         
     def _load_conditions(self, filename: str) -> dict:
         """졸업 조건 JSON 파일 로드"""
@@ -3,6 +3,7 @@
 JSON 파일에서 아이템 ID와 이름 매핑을 로드
 """
 
+import hashlib
 import json
 import os
 from typing import Dict
@@ -14,7 +15,20 @@ class ItemDatabase:
     def __init__(self, json_file_path: str = "items_list.json"):
         self.json_file_path = json_file_path
         self._items: Dict[int, str] = {}
+        self.version = ''  # 아이템 데이터 버전 (내용이 바뀌면 달라짐, 분석 결과 캐시 키에 사용)
         self._load_items_from_json()
+        self._refresh_version()
+    
+    def _refresh_version(self):
+        """현재 아이템 데이터의 내용 해시로 버전 갱신"""
+        payload = json.dumps(sorted(self._items.items()), ensure_ascii=False)
+        self.version = hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+    
+    def reload(self) -> str:
+        """JSON 파일에서 아이템 데이터를 다시 로드하고 새 버전 반환"""
+        self._load_items_from_json()
+        self._refresh_version()
+        return self.version
     
     def _load_items_from_json(self):
         """JSON 파일에서 아이템 데이터 로드"""
@@ -76,6 +90,7 @@ class ItemDatabase:
     def add_item(self, item_id: int, item_name: str, save_to_file: bool = True):
         """새 아이템 추가"""
         self._items[item_id] = item_name
+        self._refresh_version()
         if save_to_file:
             self.save_items_to_json()
         print(f"아이템 추가됨: {item_id} - {item_name}")
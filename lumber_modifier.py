@@ -17,9 +17,10 @@ from savecode_decoder import parse_savecode
 class LumberModifier:
     """세이브코드의 나무 수량을 변경하는 클래스"""
     
-    def __init__(self):
-        self.decoder = SaveCodeDecoder()
-        self.encoder = SaveCodeEncoder()
+    def __init__(self, decoder: SaveCodeDecoder = None, encoder: SaveCodeEncoder = None):
+        # 봇처럼 이미 디코더/인코더를 가진 쪽은 넘겨서 아이템 데이터/설정을 다시 로드하지 않음
+        self.decoder = decoder or SaveCodeDecoder()
+        self.encoder = encoder or SaveCodeEncoder()
     
     def parse_masin_savecode(self, savecode: str) -> dict:
         """
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+봇 지표(메트릭) 모듈
+명령어/버튼 응답 시간 히스토그램, 세이브코드 해석 실패 카운터, 이벤트 루프 지연 등을 모아
+로컬 HTTP 포트에서 Prometheus 텍스트 형식(/metrics)으로 제공.
+기록은 메모리의 숫자만 바꾸고, 다른 모듈이 이미 가진 통계(쿠폰 API, 대기열 크기)는
+수집기를 등록해 두었다가 수집 요청이 올 때만 읽음 (아무도 수집하지 않으면 비용이 거의 없음)
+"""
+
+import asyncio
+import bisect
+import logging
+import math
+import re
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 응답 시간 히스토그램 구간 (초, Discord 상호작용 응답 기한 3초 주변을 촘촘하게)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 30.0, 60.0)
+# 이벤트 루프 지연 히스토그램 구간 (초)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+# 상호작용 첫 응답 API 경로 (POST /interactions/{id}/{token}/callback)
+INTERACTION_CALLBACK_PATH = re.compile(r'/interactions/(\d+)/[^/]+/callback$')
+
+# 수집기가 반환하는 지표: (이름, 종류, 설명, [(라벨, 값), ...])
+Sample = Tuple[Dict[str, str], float]
+MetricFamily = Tuple[str, str, str, List[Sample]]
+
+
+def _escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + '}'
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """라벨 값 조합별로 값을 보관하는 지표 (이벤트 루프에서만 기록)"""
+
+    kind = ''
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[tuple, object] = {}
+        if not self.labelnames:
+            self._values[()] = self._initial()
+
+    def _initial(self):
+        # 라벨이 없는 지표는 기록 전에도 0으로 보이도록
+        return 0
+
+    def _key(self, labels: Dict[str, str]) -> tuple:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} labels must be {self.labelnames}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        return [(self.name, self._labels(key), value) for key, value in sorted(self._values.items())]
+
+
+class Counter(_Metric):
+    """증가만 하는 카운터"""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """현재 값을 나타내는 게이지"""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """구간별 관측 횟수와 합계를 보관하는 히스토그램"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help_text, labelnames)
+
+    def _initial(self):
+        # [구간별 횟수 (마지막은 +Inf), 합계]
+        return [[0] * (len(self.buckets) + 1), 0.0]
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = self._initial()
+        state[0][bisect.bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        result = []
+        for key, (counts, total) in sorted(self._values.items()):
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                result.append((f"{self.name}_bucket", {**labels, 'le': _format_value(bound)}, cumulative))
+            result.append((f"{self.name}_sum", labels, total))
+            result.append((f"{self.name}_count", labels, cumulative))
+        return result
+
+
+class MetricsRegistry:
+    """지표 목록과 수집기 (수집 요청 시 Prometheus 텍스트 형식으로 변환)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+        self.scrapes = 0
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"metric {metric.name} already registered with a different type or labels")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[MetricFamily]]):
+        """수집 요청 때마다 호출되어 (이름, 종류, 설명, 샘플 목록)을 반환하는 함수 등록"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """전체 지표를 Prometheus 텍스트 형식으로 변환"""
+        self.scrapes += 1
+        lines: List[str] = []
+
+        def add_family(name: str, kind: str, help_text: str, samples):
+            lines.append(f"# HELP {name} {_escape_help(help_text)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+
+        for metric in self._metrics.values():
+            add_family(metric.name, metric.kind, metric.help, metric.samples())
+        for collector in self._collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                logger.error(f"지표 수집기 오류: {e}")
+                continue
+            for name, kind, help_text, samples in families:
+                add_family(name, kind, help_text, [(name, labels, value) for labels, value in samples])
+        return '\n'.join(lines) + '\n'
+
+
+class BotMetrics:
+    """봇에서 기록하는 지표 모음"""
+
+    def __init__(self, registry: MetricsRegistry = None):
+        self.registry = registry or MetricsRegistry()
+        registry = self.registry
+        self.command_first_response = registry.histogram(
+            'savebot_command_first_response_seconds',
+            '명령어 메시지를 받은 뒤 첫 응답 메시지를 보내기까지 걸린 시간', ('command',))
+        self.command_duration = registry.histogram(
+            'savebot_command_duration_seconds',
+            '명령어 메시지를 받은 뒤 처리가 끝나기까지 걸린 시간', ('command', 'outcome'))
+        self.interaction_first_response = registry.histogram(
+            'savebot_interaction_first_response_seconds',
+            '버튼/선택 메뉴/모달 처리를 시작한 뒤 상호작용에 첫 응답(응답/defer)을 보내기까지 걸린 시간',
+            ('component',))
+        self.interaction_duration = registry.histogram(
+            'savebot_interaction_duration_seconds',
+            '버튼/선택 메뉴/모달 처리를 시작한 뒤 끝나기까지 걸린 시간', ('component', 'outcome'))
+        self.savecode_decode_failures = registry.counter(
+            'savebot_savecode_decode_failures_total', '해석할 수 없었던 세이브코드 수')
+        self.savecode_checksum_failures = registry.counter(
+            'savebot_savecode_checksum_failures_total', '체크섬이 맞지 않았던 세이브코드 수')
+        self.loop_lag = registry.histogram(
+            'savebot_event_loop_lag_seconds', '이벤트 루프 지연 (예약한 시각보다 늦게 깨어난 시간)',
+            buckets=LOOP_LAG_BUCKETS)
+        self.loop_lag_last = registry.gauge(
+            'savebot_event_loop_lag_last_seconds', '가장 최근에 측정한 이벤트 루프 지연')
+        self._interactions: Dict[int, list] = {}  # {상호작용 ID: [구성 요소 이름, 시작 시각, 첫 응답 여부]}
+
+    def observe_command(self, command: str, received_at: float, first_response_at: Optional[float],
+                        outcome: str):
+        """명령어 처리 종료 기록 (시각은 time.perf_counter 기준)"""
+        now = time.perf_counter()
+        if first_response_at is not None:
+            self.command_first_response.observe(first_response_at - received_at, command=command)
+        self.command_duration.observe(now - received_at, command=command, outcome=outcome)
+
+    def wrap_interaction(self, component: str, callback: Callable) -> Callable:
+        """
+        버튼/선택 메뉴/모달 콜백을 처리 시간을 기록하는 콜백으로 감쌈
+
+        첫 응답 시간은 상호작용 응답 API 호출을 trace_config()에서 보고 기록
+        """
+        async def timed_callback(interaction, *args, **kwargs):
+            start = time.perf_counter()
+            entry = [component, start, False]
+            self._interactions[interaction.id] = entry
+            outcome = 'ok'
+            try:
+                return await callback(interaction, *args, **kwargs)
+            except BaseException:
+                outcome = 'error'
+                raise
+            finally:
+                self._interactions.pop(interaction.id, None)
+                self.interaction_duration.observe(time.perf_counter() - start, component=component, outcome=outcome)
+
+        timed_callback.metrics_component = component
+        return timed_callback
+
+    def _on_request_end(self, path: str):
+        match = INTERACTION_CALLBACK_PATH.search(path)
+        if match is None:
+            return
+        entry = self._interactions.get(int(match.group(1)))
+        if entry is not None and not entry[2]:
+            entry[2] = True
+            self.interaction_first_response.observe(time.perf_counter() - entry[1], component=entry[0])
+
+    def trace_config(self):
+        """
+        상호작용 첫 응답 시각을 기록하는 aiohttp TraceConfig (discord.py Client의 http_trace로 전달)
+        """
+        import aiohttp
+
+        async def on_request_end(session, context, params):
+            self._on_request_end(params.url.path)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+
+    def record_savecode_results(self, analyses: Iterable):
+        """세이브코드 분석 결과의 해석/체크섬 실패 집계 (SaveAnalysis 목록)"""
+        for analysis in analyses:
+            if analysis.error:
+                self.savecode_decode_failures.inc()
+            elif not analysis.checksum_valid:
+                self.savecode_checksum_failures.inc()
+
+
+class LoopLagMonitor:
+    """일정 간격으로 잠들었다 깨어난 시각의 차이로 이벤트 루프 지연 측정"""
+
+    def __init__(self, metrics: BotMetrics, interval: float = 1.0):
+        self.metrics = metrics
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self.metrics.loop_lag.observe(lag)
+            self.metrics.loop_lag_last.set(lag)
+
+    async def stop(self):
+        if self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+class MetricsServer:
+    """지표 HTTP 서버 (GET /metrics, aiohttp)"""
+
+    def __init__(self, registry: MetricsRegistry, host: str = '127.0.0.1', port: int = 9108):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._runner = None
+
+    @property
+    def running(self) -> bool:
+        return self._runner is not None
+
+    async def start(self):
+        """서버 시작 (이미 실행 중이면 무시)"""
+        if self._runner is not None:
+            return
+        from aiohttp import web
+
+        async def handle_metrics(request):
+            return web.Response(body=self.registry.render().encode('utf-8'), headers={'Content-Type': CONTENT_TYPE})
+
+        app = web.Application()
+        app.router.add_get('/metrics', handle_metrics)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, self.host, self.port)
+        try:
+            await site.start()
+        except OSError:
+            await runner.cleanup()
+            raise
+        self._runner = runner
+        if self.port == 0:
+            # 테스트 등에서 포트 0으로 띄운 경우 실제 포트 기록
+            self.port = runner.addresses[0][1]
+        logger.info(f"지표 서버 시작: http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._runner is not None:
+            runner, self._runner = self._runner, None
+            await runner.cleanup()
+            logger.info("지표 서버 종료")
+
+
+# 봇 전체에서 공유하는 기본 지표 (버튼/모달 View는 봇 인스턴스 없이 생성되므로 모듈 단위로 둠)
+bot_metrics = BotMetrics()
@@ -0,0 +1,125 @@
+"""
+레이드 대기방 현황판 모듈
+레이드별 대기 목록 버전을 기준으로 바뀐 레이드의 필드만 다시 만들고
+표시 이름을 캐시하여 현황 조회 비용을 줄임
+"""
+
+import logging
+import time
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+from raid_system import RaidWaitingSystem
+
+logger = logging.getLogger(__name__)
+
+BOARD_TITLE = "🏛️ 레이드 대기방 현황"
+BOARD_DESCRIPTION = "각 레이드별 대기자 목록입니다"
+BOARD_COLOR = 0x9b59b6
+HELPER_FIELD_KEY = '__helper__'
+
+
+class RaidBoard:
+    """길드별 대기방 현황 필드를 캐시하는 렌더러"""
+
+    def __init__(self, raid_system: RaidWaitingSystem, preview_size: int = 5, name_ttl: float = 600):
+        """
+        대기방 현황판 초기화
+
+        Args:
+            raid_system: 현황을 표시할 레이드 대기 시스템
+            preview_size: 레이드별로 이름을 보여줄 최대 인원
+            name_ttl: 표시 이름 캐시 유지 시간 (초, 닉네임 변경 반영 주기)
+        """
+        self.raid_system = raid_system
+        self.preview_size = preview_size
+        self.name_ttl = name_ttl
+
+        # {guild_id: {필드 키: (버전, 만료 시각, 필드 이름, 필드 값)}}
+        # 만료 시각은 필드에 들어간 이름 중 가장 오래된 캐시가 만료되는 시각
+        self._fields: Dict[Optional[int], Dict[str, Tuple[int, float, str, str]]] = {}
+        # {guild_id: {user_id: (표시 이름, 캐시 시각)}}
+        self._names: Dict[Optional[int], Dict[int, Tuple[str, float]]] = {}
+
+        self.renders = 0  # 필드를 새로 만든 횟수 (캐시 효율 확인용)
+
+    def _resolve_name(self, guild: Optional[discord.Guild], user_id: int, now: float) -> Tuple[str, float]:
+        """유저 표시 이름 조회 (캐시 우선, (이름, 캐시 시각) 반환)"""
+        names = self._names.setdefault(guild.id if guild else None, {})
+        cached = names.get(user_id)
+        if cached is not None and now - cached[1] < self.name_ttl:
+            return cached
+
+        member = guild.get_member(user_id) if guild else None
+        name = member.display_name if member else f"Unknown User ({user_id})"
+        names[user_id] = (name, now)
+        return name, now
+
+    def _render_field(self, guild: Optional[discord.Guild], title: str, label: str,
+                      count: int, user_ids, now: float) -> Tuple[float, str, str]:
+        """대기자 수와 앞쪽 preview_size명의 이름으로 필드 생성 ((만료 시각, 필드 이름, 필드 값) 반환)"""
+        preview = [self._resolve_name(guild, user_id, now) for user_id in islice(user_ids, self.preview_size)]
+        value = f"**{label} {count}명**\n" + "\n".join(f"• {name}" for name, _ in preview)
+        if count > self.preview_size:
+            value += f"\n... 외 {count - self.preview_size}명"
+        # 대기 목록이 그대로여도 이름 캐시가 만료되면 닉네임 변경을 반영하도록 다시 만듦
+        expires_at = min((cached_at for _, cached_at in preview), default=now) + self.name_ttl
+        self.renders += 1
+        return expires_at, title, value
+
+    def get_fields(self, guild: Optional[discord.Guild] = None) -> List[Tuple[str, str]]:
+        """
+        현재 대기방 현황 필드 목록 반환 (대기자가 없는 레이드는 제외)
+
+        대기 목록 버전이 바뀌었거나 표시 이름 캐시가 만료된 레이드만 다시 만들고
+        나머지는 캐시를 그대로 사용
+
+        Returns:
+            List[Tuple[str, str]]: (필드 이름, 필드 값) 목록
+        """
+        rs = self.raid_system
+        cache = self._fields.setdefault(guild.id if guild else None, {})
+        now = time.time()
+        fields = []
+
+        for raid_name in rs.get_all_raids():
+            count = rs.get_raid_count(raid_name)
+            if not count:
+                continue
+            version = rs.get_raid_version(raid_name)
+            cached = cache.get(raid_name)
+            if cached is None or cached[0] != version or now >= cached[1]:
+                cached = (version,) + self._render_field(guild, f"🎯 {raid_name}", "대기자", count,
+                                                         rs.iter_waiting_queue(raid_name), now)
+                cache[raid_name] = cached
+            fields.append((cached[2], cached[3]))
+
+        helper_count = rs.get_helper_count()
+        if helper_count:
+            version = rs.get_helper_version()
+            cached = cache.get(HELPER_FIELD_KEY)
+            if cached is None or cached[0] != version or now >= cached[1]:
+                cached = (version,) + self._render_field(guild, "🤝 헬퍼 대기", "헬퍼", helper_count,
+                                                         rs.iter_helper_queue(), now)
+                cache[HELPER_FIELD_KEY] = cached
+            fields.append((cached[2], cached[3]))
+
+        return fields
+
+    def build_embed(self, guild: Optional[discord.Guild] = None) -> discord.Embed:
+        """대기방 현황 임베드 생성"""
+        embed = discord.Embed(title=BOARD_TITLE, description=BOARD_DESCRIPTION, color=BOARD_COLOR)
+
+        fields = self.get_fields(guild)
+        for name, value in fields:
+            embed.add_field(name=name, value=value, inline=True)
+
+        if not fields:
+            embed.add_field(
+                name="📭 현재 상황",
+                value="아직 대기 중인 사용자가 없습니다.\n\n레이드 대기 등록을 해보세요!",
+                inline=False
+            )
+        return embed
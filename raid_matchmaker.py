@@ -0,0 +1,216 @@
+"""
+레이드 자동 매칭 모듈
+레이드 대기 목록에서 선착순으로 파티를 구성하고 필요하면 헬퍼로 빈 자리를 채움
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from raid_system import PartyRecruitment, RaidWaitingSystem
+
+logger = logging.getLogger(__name__)
+
+# 매칭 가능성이 새로 생기는 변경 (대기열이 늘어나는 경우만)
+MATCH_TRIGGER_OPS = {'raid_add', 'helper_add'}
+
+AUTO_MATCH_DESCRIPTION = "자동 매칭으로 구성된 파티"
+
+
+class MatchResult:
+    """자동 매칭으로 구성된 파티 정보"""
+
+    def __init__(self, party: PartyRecruitment, member_ids: List[int], helper_ids: List[int]):
+        self.party = party
+        self.member_ids = member_ids  # 레이드 대기자 (첫 번째가 리더)
+        self.helper_ids = helper_ids  # 빈 자리를 채운 헬퍼
+
+    def all_user_ids(self) -> List[int]:
+        """파티에 포함된 전체 유저 ID"""
+        return self.member_ids + self.helper_ids
+
+    def __repr__(self) -> str:
+        return f"MatchResult({self.party.party_id}, members={self.member_ids}, helpers={self.helper_ids})"
+
+
+class RaidMatchmaker:
+    """대기 목록 변경 시 디바운스 후 자동으로 파티를 구성하는 매칭 엔진"""
+
+    def __init__(self, raid_system: RaidWaitingSystem, party_size: int,
+                 party_sizes: Optional[Dict[str, int]] = None, max_helpers: int = 0,
+                 debounce_seconds: float = 2.0, max_wait_seconds: Optional[float] = None,
+                 on_match: Optional[Callable[[List[MatchResult]], Awaitable[None]]] = None):
+        """
+        자동 매칭 엔진 초기화
+
+        Args:
+            raid_system: 매칭 대상 레이드 대기 시스템
+            party_size: 기본 파티 인원
+            party_sizes: 레이드별 파티 인원 {레이드 이름: 인원} (이모지 없는 이름도 허용)
+            max_helpers: 파티 하나에 채울 수 있는 최대 헬퍼 수 (0이면 헬퍼 미사용)
+            debounce_seconds: 마지막 대기열 변경 후 매칭을 실행하기까지의 대기 시간 (초)
+                (그 사이 변경이 또 생기면 다시 기다림)
+            max_wait_seconds: 변경이 계속 이어질 때 첫 변경부터 매칭 실행까지의 최대 대기 시간 (초)
+                (None이면 debounce_seconds의 5배)
+            on_match: 매칭 결과를 전달받을 비동기 콜백 (알림 발송용)
+        """
+        self.raid_system = raid_system
+        self.party_size = party_size
+        self.party_sizes = party_sizes or {}
+        self.max_helpers = max_helpers
+        self.debounce_seconds = debounce_seconds
+        self.max_wait_seconds = max_wait_seconds if max_wait_seconds is not None else debounce_seconds * 5
+        self.on_match = on_match
+
+        self._running = False  # 매칭 중 발생한 변경으로 다시 매칭이 예약되지 않도록 막음
+        self._pending = None   # 예약된 매칭 (asyncio.TimerHandle)
+        self._deadline = None  # 첫 변경 기준 매칭 실행 최대 시각 (loop.time())
+        self._notify_tasks: Set[asyncio.Task] = set()  # 진행 중인 매칭 결과 알림 (이벤트 루프는 약한 참조만 보관)
+
+        raid_system.add_change_listener(self._on_change)
+
+    def get_party_size(self, raid_name: str) -> int:
+        """레이드별 파티 인원 반환 (설정이 없으면 기본 인원)"""
+        if raid_name in self.party_sizes:
+            return self.party_sizes[raid_name]
+        # "🌋 델모크" → "델모크" 형태로도 찾아봄
+        return self.party_sizes.get(raid_name.split(' ', 1)[-1], self.party_size)
+
+    def _on_change(self, op: str):
+        """
+        레이드 상태 변경 리스너: 디바운스 후 매칭 예약
+
+        변경이 생길 때마다 예약을 debounce_seconds 뒤로 미루되,
+        첫 변경 후 max_wait_seconds를 넘기지는 않음
+        """
+        if self._running or op not in MATCH_TRIGGER_OPS:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # 이벤트 루프 밖에서는 run_pass()를 직접 호출해야 함
+
+        now = loop.time()
+        if self._pending is None:
+            self._deadline = now + self.max_wait_seconds
+        else:
+            self._pending.cancel()
+
+        run_at = min(now + self.debounce_seconds, self._deadline)
+        self._pending = loop.call_at(run_at, self._run_scheduled)
+
+    def _run_scheduled(self):
+        """예약된 매칭 실행 후 결과 알림"""
+        self._pending = None
+        self._deadline = None
+        try:
+            results = self.run_pass()
+        except Exception as e:
+            logger.error(f"자동 매칭 중 오류: {e}")
+            return
+
+        if results and self.on_match is not None:
+            task = asyncio.ensure_future(self.on_match(results))
+            self._notify_tasks.add(task)
+            task.add_done_callback(self._notify_tasks.discard)
+
+    def cancel(self):
+        """예약된 매칭 취소"""
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+            self._deadline = None
+
+    def run_pass(self) -> List[MatchResult]:
+        """
+        대기 목록 전체에 대해 매칭 1회 실행
+
+        가장 오래 기다린 대기자가 있는 레이드부터 선착순으로 파티를 구성하며,
+        한 번 매칭된 유저는 같은 회차의 다른 레이드/헬퍼 후보에서 제외되고
+        모든 대기 목록에서 제거됨
+
+        Returns:
+            List[MatchResult]: 이번 회차에 구성된 파티 목록
+        """
+        if self._running:
+            return []
+
+        self._running = True
+        start = time.perf_counter()
+        try:
+            results = self._match_all()
+        finally:
+            self._running = False
+
+        if results:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info(f"자동 매칭 완료: 파티 {len(results)}개 구성 ({elapsed_ms:.1f}ms)")
+        return results
+
+    def _match_all(self) -> List[MatchResult]:
+        """레이드별 그룹 구성 후 파티 생성 및 대기 목록 정리"""
+        rs = self.raid_system
+        matched: Set[int] = set()
+        helper_queue = rs.get_helper_queue() if self.max_helpers > 0 else []
+        helper_pos = 0
+        groups = []
+
+        # 오래 기다린 대기자가 있는 레이드부터 처리
+        raids = [raid_name for raid_name in rs.get_all_raids() if rs.get_oldest_queued_at(raid_name) is not None]
+        raids.sort(key=rs.get_oldest_queued_at)
+
+        for raid_name in raids:
+            size = self.get_party_size(raid_name)
+            if size < 2:
+                continue
+
+            queue = [user_id for user_id in rs.get_waiting_queue(raid_name) if user_id not in matched]
+            pos = 0
+            while pos < len(queue):
+                remaining = len(queue) - pos
+                if remaining >= size:
+                    members, helpers = queue[pos:pos + size], []
+                elif self.max_helpers > 0 and remaining >= max(size - self.max_helpers, 1):
+                    members = queue[pos:]
+                    member_set = set(members)
+                    helpers = []
+                    saved_pos = helper_pos
+                    # 헬퍼는 선착순으로 사용하되 이미 매칭됐거나 같은 파티 대기자인 유저는 건너뜀
+                    while len(members) + len(helpers) < size and helper_pos < len(helper_queue):
+                        helper_id = helper_queue[helper_pos]
+                        helper_pos += 1
+                        if helper_id not in matched and helper_id not in member_set:
+                            helpers.append(helper_id)
+                    if len(members) + len(helpers) < size:
+                        # 헬퍼가 모자라면 사용하지 않고 다음 회차까지 대기
+                        helper_pos = saved_pos
+                        break
+                else:
+                    break
+
+                pos += len(members)
+                matched.update(members)
+                matched.update(helpers)
+                groups.append((raid_name, size, members, helpers))
+
+        # 매칭된 유저는 모든 대기 목록에서 제거 (중복 매칭 방지)
+        for user_id in matched:
+            for raid_name in rs.get_user_raids(user_id):
+                rs.remove_from_raid(raid_name, user_id)
+            rs.remove_from_helper(user_id)
+
+        results = []
+        for raid_name, size, members, helpers in groups:
+            party_id = rs.create_party_recruitment(
+                leader_id=members[0],
+                raid_name=raid_name,
+                max_members=size,
+                description=AUTO_MATCH_DESCRIPTION
+            )
+            for user_id in members[1:] + helpers:
+                rs.join_party(party_id, user_id)
+            results.append(MatchResult(rs.get_party_recruitment(party_id), members, helpers))
+
+        return results
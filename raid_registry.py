@@ -0,0 +1,211 @@
+"""
+길드별 레이드 상태 관리 모듈
+길드마다 독립된 RaidWaitingSystem을 처음 사용할 때 생성하고
+길드별 레이드 목록과 상태 저장 디렉토리를 관리
+"""
+
+import json
+import logging
+import os
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from raid_board import RaidBoard
+from raid_state_store import RaidStateStore, has_saved_state, move_saved_state
+from raid_system import DEFAULT_RAID_NAMES, PartyExpiryEvent, RaidWaitingSystem
+
+logger = logging.getLogger(__name__)
+
+# DM 등 길드가 없는 상호작용에 사용하는 키
+NO_GUILD_ID = 0
+
+
+def load_raid_catalogs(path: str) -> Dict[str, List[str]]:
+    """
+    레이드 목록 설정 파일 로드
+
+    파일 형식: {"default": [레이드 이름, ...], "<guild_id>": [레이드 이름, ...]}
+
+    Returns:
+        Dict[str, List[str]]: {"default" 또는 길드 ID 문자열: 레이드 목록}
+    """
+    if not path or not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"레이드 목록 설정 파일 로드 실패 ({path}): {e}")
+        return {}
+
+    catalogs = {}
+    for key, raid_names in data.items():
+        if isinstance(raid_names, list) and raid_names:
+            catalogs[str(key)] = [str(name) for name in raid_names]
+        else:
+            logger.warning(f"레이드 목록 설정 무시 ({key}): 비어 있지 않은 목록이어야 합니다.")
+    return catalogs
+
+
+class GuildRaidRegistry:
+    """길드 ID별 레이드 대기 시스템 저장소"""
+
+    def __init__(self, state_dir: str = '', fsync_interval: float = 0.5, snapshot_every: int = 1000,
+                 party_timeout_minutes: float = 0, purge_grace_minutes: float = 0,
+                 catalog_path: str = '', reminder_minutes: float = 0, no_show_grace_minutes: float = 0,
+                 legacy_guild_id: int = 0,
+                 on_create: Optional[Callable[[int, RaidWaitingSystem], None]] = None):
+        """
+        길드별 레이드 저장소 초기화
+
+        Args:
+            state_dir: 상태 저장 루트 디렉토리 (길드별 하위 디렉토리 사용, 빈 문자열이면 저장 안 함)
+            fsync_interval: 저널 fsync 최소 간격 (초)
+            snapshot_every: 저널 기록 N건마다 스냅샷 작성
+            party_timeout_minutes: 파티 모집 자동 종료 시간 (분)
+            purge_grace_minutes: 종료된 파티 삭제 유예 시간 (분)
+            catalog_path: 길드별 레이드 목록 설정 파일 경로
+            reminder_minutes: 예정 시작 몇 분 전에 파티원에게 알림을 보낼지
+            no_show_grace_minutes: 예정 시각 후 시작하지 않은 파티를 자동 종료하기까지의 시간 (분)
+            legacy_guild_id: 길드별 디렉토리 도입 전 state_dir 바로 아래에 저장된 상태를 옮겨 받을 길드 ID
+                (0이면 load_saved()에서 옮기지 않음, migrate_legacy_state()로 직접 옮김)
+            on_create: 길드 시스템이 새로 만들어질 때 호출할 콜백 (guild_id, raid_system)
+        """
+        self.state_dir = state_dir
+        self.fsync_interval = fsync_interval
+        self.snapshot_every = snapshot_every
+        self.party_timeout_minutes = party_timeout_minutes
+        self.purge_grace_minutes = purge_grace_minutes
+        self.catalogs = load_raid_catalogs(catalog_path)
+        self.reminder_minutes = reminder_minutes
+        self.no_show_grace_minutes = no_show_grace_minutes
+        self.legacy_guild_id = legacy_guild_id
+        self.on_create = on_create
+
+        self._systems: Dict[int, RaidWaitingSystem] = {}
+        self._boards: Dict[int, RaidBoard] = {}
+
+    def get_catalog(self, guild_id: int) -> List[str]:
+        """길드의 레이드 목록 반환 (길드 설정 → 기본 설정 → 내장 기본값 순)"""
+        return self.catalogs.get(str(guild_id)) or self.catalogs.get('default') or DEFAULT_RAID_NAMES
+
+    def get(self, guild_id: Optional[int]) -> RaidWaitingSystem:
+        """길드의 레이드 대기 시스템 반환 (없으면 생성, 저장된 상태가 있으면 복원)"""
+        if guild_id is None:
+            guild_id = NO_GUILD_ID
+
+        raid_system = self._systems.get(guild_id)
+        if raid_system is not None:
+            return raid_system
+
+        state_store = None
+        if self.state_dir:
+            state_store = RaidStateStore(
+                os.path.join(self.state_dir, str(guild_id)),
+                fsync_interval=self.fsync_interval,
+                snapshot_every=self.snapshot_every
+            )
+
+        raid_system = RaidWaitingSystem(
+            state_store=state_store,
+            party_timeout_minutes=self.party_timeout_minutes,
+            purge_grace_minutes=self.purge_grace_minutes,
+            raid_names=self.get_catalog(guild_id),
+            reminder_minutes=self.reminder_minutes,
+            no_show_grace_minutes=self.no_show_grace_minutes
+        )
+        self._systems[guild_id] = raid_system
+        logger.info(f"길드 레이드 시스템 생성 (guild_id: {guild_id})")
+
+        if self.on_create is not None:
+            self.on_create(guild_id, raid_system)
+        return raid_system
+
+    def get_board(self, guild_id: Optional[int]) -> RaidBoard:
+        """길드의 대기방 현황판 반환 (없으면 생성)"""
+        if guild_id is None:
+            guild_id = NO_GUILD_ID
+
+        board = self._boards.get(guild_id)
+        if board is None:
+            board = self._boards[guild_id] = RaidBoard(self.get(guild_id))
+        return board
+
+    def has_legacy_state(self) -> bool:
+        """state_dir 바로 아래에 길드별 디렉토리 도입 전의 상태 파일이 남아 있는지 확인"""
+        return bool(self.state_dir) and has_saved_state(self.state_dir)
+
+    def migrate_legacy_state(self, guild_id: int) -> bool:
+        """
+        길드별 디렉토리 도입 전의 상태 파일을 길드 디렉토리로 옮기고 복원
+
+        대상 길드에 이미 저장된 상태가 있으면 합치지 않고 그대로 둠
+
+        Returns:
+            bool: 옮겼는지 여부
+        """
+        if not self.has_legacy_state():
+            return False
+
+        guild_dir = os.path.join(self.state_dir, str(guild_id))
+        if has_saved_state(guild_dir):
+            logger.warning(f"길드 {guild_id}에 이미 저장된 레이드 상태가 있어 이전 상태 파일({self.state_dir})을 옮기지 않습니다.")
+            return False
+
+        # 빈 상태로 먼저 만들어진 시스템은 닫고 옮긴 파일로 다시 복원
+        raid_system = self._systems.pop(guild_id, None)
+        if raid_system is not None:
+            raid_system.close_state()
+            self._boards.pop(guild_id, None)
+
+        move_saved_state(self.state_dir, guild_dir)
+        logger.info(f"이전 레이드 상태 파일을 길드 {guild_id} 디렉토리로 옮겼습니다.")
+        self.get(guild_id)
+        return True
+
+    def load_saved(self):
+        """상태 디렉토리에 저장된 길드들을 미리 복원 (만료/자동 매칭이 재시작 직후부터 동작하도록)"""
+        if not self.state_dir or not os.path.isdir(self.state_dir):
+            return
+
+        if self.legacy_guild_id:
+            self.migrate_legacy_state(self.legacy_guild_id)
+
+        for name in os.listdir(self.state_dir):
+            if name.isdigit() and os.path.isdir(os.path.join(self.state_dir, name)):
+                self.get(int(name))
+
+    def items(self) -> Iterator[Tuple[int, RaidWaitingSystem]]:
+        """생성된 (guild_id, 레이드 시스템) 목록 순회"""
+        return iter(list(self._systems.items()))
+
+    def get_next_expiry(self) -> Optional[float]:
+        """모든 길드 중 가장 이른 파티 만료 예정 시각"""
+        deadlines = [d for d in (rs.get_next_expiry() for rs in self._systems.values()) if d is not None]
+        return min(deadlines) if deadlines else None
+
+    def expire_parties(self, now: float = None) -> List[Tuple[int, PartyExpiryEvent]]:
+        """모든 길드의 만료된 파티 정리 (한 길드에서 오류가 나도 나머지 길드는 계속 처리)"""
+        events = []
+        for guild_id, raid_system in self.items():
+            try:
+                events.extend((guild_id, event) for event in raid_system.expire_parties(now))
+            except Exception as e:
+                logger.error(f"파티 만료 처리 중 오류 (guild_id: {guild_id}): {e}")
+        return events
+
+    def flush_state(self):
+        """모든 길드의 상태 저널 동기화"""
+        for guild_id, raid_system in self.items():
+            try:
+                raid_system.flush_state()
+            except Exception as e:
+                logger.error(f"레이드 상태 저장 중 오류 (guild_id: {guild_id}): {e}")
+
+    def close_state(self):
+        """모든 길드의 상태 저장소 닫기"""
+        for guild_id, raid_system in self.items():
+            try:
+                raid_system.close_state()
+            except Exception as e:
+                logger.error(f"레이드 상태 저장소 종료 중 오류 (guild_id: {guild_id}): {e}")
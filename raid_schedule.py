@@ -0,0 +1,93 @@
+"""
+레이드 예정 시간 파싱 모듈
+파티 모집의 예정 시간 입력("21:30", "오후 9시 반", "30분 후" 등)을 한국 시간(KST) 기준 타임스탬프로 변환
+"""
+
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+KST = timezone(timedelta(hours=9), 'KST')
+
+# "1시간 30분 후", "30분 뒤", "2시간후"
+_RELATIVE_PATTERN = re.compile(r'^(?:(\d+)\s*시간)?\s*(?:(\d+)\s*분)?\s*(?:후|뒤)$')
+
+# "21:30", "오늘 저녁 8시", "내일 오전 10시 30분", "9시 반"
+_ABSOLUTE_PATTERN = re.compile(
+    r'^(?:(오늘|내일)\s*)?'
+    r'(?:(오전|오후|아침|새벽|낮|저녁|밤)\s*)?'
+    r'(?:(\d{1,2})\s*:\s*(\d{2})|(\d{1,2})\s*시\s*(?:(\d{1,2})\s*분|(반))?)'
+    r'(?:\s*(?:에|쯤|경))?$'
+)
+
+_PM_WORDS = {'오후', '낮', '저녁', '밤'}
+_AM_WORDS = {'오전', '아침', '새벽'}
+
+
+def parse_scheduled_time(text: str, now: float = None) -> Optional[float]:
+    """
+    예정 시간 문자열을 타임스탬프로 변환
+
+    오전/오후 표시가 없는 1~11시는 지금 이후 가장 가까운 시각으로 해석하고,
+    날짜 표시 없이 이미 지난 시각은 다음 날로 해석
+
+    Args:
+        text: 사용자가 입력한 예정 시간
+        now: 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        Optional[float]: 타임스탬프 (해석할 수 없으면 None)
+    """
+    if now is None:
+        now = time.time()
+    text = text.strip()
+    if not text:
+        return None
+
+    match = _RELATIVE_PATTERN.match(text)
+    if match and (match.group(1) or match.group(2)):
+        hours = int(match.group(1) or 0)
+        minutes = int(match.group(2) or 0)
+        return now + hours * 3600 + minutes * 60
+
+    match = _ABSOLUTE_PATTERN.match(text)
+    if not match:
+        return None
+
+    day_word, meridiem = match.group(1), match.group(2)
+    if match.group(3) is not None:
+        hour, minute = int(match.group(3)), int(match.group(4))
+    else:
+        hour = int(match.group(5))
+        minute = 30 if match.group(7) else int(match.group(6) or 0)
+
+    if hour > 24 or minute >= 60 or (meridiem and hour > 12):
+        return None
+
+    if meridiem in _PM_WORDS and hour < 12:
+        hour += 12
+    elif meridiem == '밤' and hour == 12:
+        hour = 24  # 밤 12시는 자정
+    elif meridiem in _AM_WORDS and hour == 12:
+        hour = 0
+
+    current = datetime.fromtimestamp(now, KST)
+    day = current.replace(hour=0, minute=0, second=0, microsecond=0)
+    if day_word == '내일':
+        day += timedelta(days=1)
+    candidate = day + timedelta(hours=hour, minutes=minute)
+
+    if day_word is None:
+        # "8시"처럼 오전/오후가 없으면 12시간 뒤 시각도 후보로 보고 가장 가까운 미래를 선택
+        if meridiem is None and 1 <= hour < 12 and candidate <= current:
+            candidate += timedelta(hours=12)
+        if candidate <= current:
+            candidate += timedelta(days=1)
+
+    return candidate.timestamp()
+
+
+def format_scheduled_time(timestamp: float) -> str:
+    """예정 시각을 Discord 타임스탬프 표기로 변환 (보는 사람의 시간대로 표시됨)"""
+    return f"<t:{int(timestamp)}:f> (<t:{int(timestamp)}:R>)"
@@ -0,0 +1,157 @@
+"""
+레이드 상태 저장소 모듈
+RaidWaitingSystem의 대기 목록/파티 모집 상태를 로컬 디스크에 저널로 기록하고
+재시작 시 스냅샷 + 저널 재생으로 복원
+"""
+
+import json
+import logging
+import os
+import time
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = 'raid_snapshot.json'
+JOURNAL_FILENAME = 'raid_journal.jsonl'
+
+
+def has_saved_state(state_dir: str) -> bool:
+    """디렉토리에 복원할 스냅샷이나 저널 기록이 있는지 확인"""
+    if os.path.exists(os.path.join(state_dir, SNAPSHOT_FILENAME)):
+        return True
+    journal_path = os.path.join(state_dir, JOURNAL_FILENAME)
+    return os.path.exists(journal_path) and os.path.getsize(journal_path) > 0
+
+
+def move_saved_state(src_dir: str, dst_dir: str):
+    """스냅샷/저널 파일을 다른 디렉토리로 옮김 (대상의 기존 파일은 원본 기준으로 교체/삭제)"""
+    os.makedirs(dst_dir, exist_ok=True)
+    for filename in (SNAPSHOT_FILENAME, JOURNAL_FILENAME):
+        src_path = os.path.join(src_dir, filename)
+        dst_path = os.path.join(dst_dir, filename)
+        if os.path.exists(src_path):
+            os.replace(src_path, dst_path)
+        elif os.path.exists(dst_path):
+            os.remove(dst_path)
+
+
+class RaidStateStore:
+    """append-only 저널과 주기적 스냅샷으로 레이드 상태를 보존하는 저장소"""
+
+    def __init__(self, state_dir: str, fsync_interval: float = 0.5, snapshot_every: int = 1000):
+        """
+        레이드 상태 저장소 초기화
+
+        Args:
+            state_dir: 스냅샷/저널 파일을 저장할 디렉토리
+            fsync_interval: 저널 fsync 최소 간격 (초). 이 간격 안의 기록은 한 번의 fsync로 묶음
+            snapshot_every: 저널 기록이 이 개수를 넘으면 스냅샷을 새로 작성
+        """
+        self.state_dir = state_dir
+        self.snapshot_path = os.path.join(state_dir, SNAPSHOT_FILENAME)
+        self.journal_path = os.path.join(state_dir, JOURNAL_FILENAME)
+        self.fsync_interval = fsync_interval
+        self.snapshot_every = snapshot_every
+
+        self._journal = None
+        self._records_since_snapshot = 0
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+
+        os.makedirs(state_dir, exist_ok=True)
+
+    def load(self) -> Tuple[Optional[dict], List[dict]]:
+        """
+        저장된 스냅샷과 그 이후의 저널 기록을 읽고 저널을 추가 기록 모드로 연다
+
+        Returns:
+            Tuple[Optional[dict], List[dict]]: (스냅샷 상태, 재생할 저널 기록 목록)
+        """
+        snapshot = None
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"레이드 스냅샷 로드 실패: {e}")
+
+        records = []
+        if os.path.exists(self.journal_path):
+            complete_size = 0  # 줄바꿈으로 끝난 부분까지의 크기
+            with open(self.journal_path, 'rb') as f:
+                for line_no, raw_line in enumerate(f, 1):
+                    if raw_line.endswith(b'\n'):
+                        complete_size += len(raw_line)
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line.decode('utf-8')))
+                    except (UnicodeDecodeError, json.JSONDecodeError):
+                        # 기록 도중 종료된 마지막 줄은 버림
+                        logger.warning(f"레이드 저널 {line_no}번째 줄이 손상되어 무시합니다.")
+
+            # 끊긴 마지막 줄을 잘라내야 이어서 기록하는 내용이 그 줄에 붙지 않음
+            if os.path.getsize(self.journal_path) > complete_size:
+                with open(self.journal_path, 'r+b') as f:
+                    f.truncate(complete_size)
+
+        self._records_since_snapshot = len(records)
+        self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        logger.info(f"레이드 상태 로드: 스냅샷 {'있음' if snapshot else '없음'}, 저널 {len(records)}건")
+        return snapshot, records
+
+    def append(self, record: dict):
+        """저널에 상태 변경 기록 추가 (fsync는 fsync_interval 단위로 묶어서 수행)"""
+        if self._journal is None:
+            return
+
+        self._journal.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        # 프로세스가 죽어도 기록이 남도록 OS 버퍼까지는 매번 내려보냄
+        self._journal.flush()
+        self._records_since_snapshot += 1
+        self._unsynced = True
+
+        if time.monotonic() - self._last_fsync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self):
+        """아직 디스크에 확정되지 않은 저널 기록을 fsync"""
+        if self._journal is None or not self._unsynced:
+            return
+
+        os.fsync(self._journal.fileno())
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+
+    def needs_snapshot(self) -> bool:
+        """스냅샷을 새로 작성할 시점인지 확인"""
+        return self._records_since_snapshot >= self.snapshot_every
+
+    def write_snapshot(self, state: dict):
+        """현재 상태를 스냅샷으로 기록하고 저널을 비움"""
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        # 스냅샷에 반영된 저널 기록은 더 이상 필요 없음
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(self.journal_path, 'w', encoding='utf-8')
+        os.fsync(self._journal.fileno())
+        self._records_since_snapshot = 0
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+        logger.info("레이드 상태 스냅샷 작성 완료")
+
+    def close(self):
+        """저널 동기화 후 파일 닫기"""
+        if self._journal is None:
+            return
+        self.sync()
+        self._journal.close()
+        self._journal = None
@@ -0,0 +1,142 @@
+"""
+레이드 실시간 현황 메시지 모듈
+길드별로 고정된 현황 메시지 하나를 대기 목록/파티 변경에 맞춰 수정하며,
+짧은 시간 안의 연속 변경은 한 번의 수정으로 묶어서 채널 수정 한도를 지킴
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Set
+
+import discord
+
+from raid_board import RaidBoard
+
+logger = logging.getLogger(__name__)
+
+
+class RaidStatusMessage:
+    """길드별 실시간 대기방 현황 메시지 관리자"""
+
+    def __init__(self, debounce_seconds: float = 2.0, min_edit_interval: float = 5.0):
+        """
+        실시간 현황 메시지 관리자 초기화
+
+        Args:
+            debounce_seconds: 변경 후 수정까지 기다리는 시간 (이 사이의 변경은 한 번에 반영)
+            min_edit_interval: 메시지 수정 사이의 최소 간격 (초)
+        """
+        self.debounce_seconds = debounce_seconds
+        self.min_edit_interval = min_edit_interval
+
+        self._messages: Dict[int, discord.Message] = {}  # {guild_id: 현황 메시지}
+        self._boards: Dict[int, RaidBoard] = {}  # {guild_id: 길드 현황판}
+        self._dirty_guilds: Set[int] = set()
+        self._last_content: Dict[int, tuple] = {}  # {guild_id: 마지막으로 보낸 내용}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._last_edit = 0.0
+
+        # 수정 통계
+        self.edits_sent = 0
+        self.edits_suppressed = 0  # 다른 수정에 묶였거나 내용이 같아서 생략된 수정
+        self.edits_failed = 0
+
+    async def attach(self, channel: discord.TextChannel, raid_board: RaidBoard):
+        """채널에 길드 현황 메시지를 보내고 고정 (길드에 기존 메시지가 있으면 교체)"""
+        guild_id = channel.guild.id
+        if guild_id not in self._boards:
+            self._boards[guild_id] = raid_board
+            raid_board.raid_system.add_change_listener(lambda op: self._on_change(guild_id))
+
+        old_message = self._messages.pop(guild_id, None)
+        if old_message is not None:
+            try:
+                await old_message.delete()
+            except discord.HTTPException:
+                pass  # 이미 삭제된 경우 무시
+
+        embed, content = self._build(channel.guild)
+        message = await channel.send(embed=embed)
+        try:
+            await message.pin()
+        except discord.HTTPException as e:
+            logger.warning(f"현황 메시지 고정 실패 ({channel.guild.name}): {e}")
+
+        self._messages[guild_id] = message
+        self._last_content[guild_id] = content
+        logger.info(f"실시간 현황 메시지를 {channel.guild.name}의 #{channel.name}에 등록했습니다.")
+
+    def _build(self, guild: discord.Guild):
+        """현황 임베드와 비교용 내용 생성"""
+        raid_board = self._boards[guild.id]
+        embed = raid_board.build_embed(guild)
+        party_count = raid_board.raid_system.count_active_parties()
+        embed.set_footer(text=f"모집 중 파티 {party_count}개 · 마지막 갱신 {time.strftime('%H:%M:%S')}")
+        content = (tuple(raid_board.get_fields(guild)), party_count)
+        return embed, content
+
+    def _on_change(self, guild_id: int):
+        """길드 레이드 상태 변경 리스너: 예약된 수정이 없으면 새로 예약"""
+        if guild_id not in self._messages:
+            return
+
+        if guild_id in self._dirty_guilds:
+            # 이미 예약된 수정에 함께 반영됨
+            self.edits_suppressed += 1
+            return
+        self._dirty_guilds.add(guild_id)
+
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_task = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """디바운스 후 수정, 수정 중 변경이 또 있으면 최소 간격을 지켜 다시 수정"""
+        while self._dirty_guilds:
+            await asyncio.sleep(self.debounce_seconds)
+            wait = self._last_edit + self.min_edit_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            guild_ids, self._dirty_guilds = self._dirty_guilds, set()
+            await self._edit_guilds(guild_ids)
+            self._last_edit = time.monotonic()
+
+    async def _edit_guilds(self, guild_ids: Set[int]):
+        """변경된 길드의 현황 메시지 수정"""
+        for guild_id in guild_ids:
+            message = self._messages.get(guild_id)
+            if message is None:
+                continue
+            try:
+                embed, content = self._build(message.guild)
+                if content == self._last_content.get(guild_id):
+                    self.edits_suppressed += 1
+                    continue
+
+                await message.edit(embed=embed)
+                self._last_content[guild_id] = content
+                self.edits_sent += 1
+            except discord.NotFound:
+                # 누군가 메시지를 삭제한 경우 더 이상 관리하지 않음
+                self._messages.pop(guild_id, None)
+                self._last_content.pop(guild_id, None)
+                logger.warning(f"현황 메시지가 삭제되어 관리를 중단합니다 (guild_id: {guild_id})")
+            except Exception as e:
+                self.edits_failed += 1
+                logger.error(f"현황 메시지 수정 중 오류 (guild_id: {guild_id}): {e}")
+
+    def get_stats(self) -> dict:
+        """현황 메시지 수정 통계 반환"""
+        return {
+            'messages': len(self._messages),
+            'edits_sent': self.edits_sent,
+            'edits_suppressed': self.edits_suppressed,
+            'edits_failed': self.edits_failed,
+        }
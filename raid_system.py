@@ -3,17 +3,40 @@
 Discord 봇의 레이드 대기자 관리 기능을 제공
 """
 
+import bisect
+import heapq
+import itertools
+import logging
 import time
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import discord
 
+from raid_schedule import format_scheduled_time
+from raid_state_store import RaidStateStore
+
+logger = logging.getLogger(__name__)
+
+# 길드별 레이드 목록 설정이 없을 때 사용하는 기본 레이드 목록
+DEFAULT_RAID_NAMES = [
+    "🔮 완전한플뤼톤",
+    "🌋 델모크",
+    "⚡ 아몬",
+    "📖 묵시록(노말)",
+    "🔥 묵시록(인페르날)",
+    "😇 라파엘",
+    "🛡️ 가브리엘",
+    "⚔️ 우리엘",
+    "🌊 노아"
+]
+
 
 class PartyRecruitment:
     """파티 모집 정보를 담는 클래스"""
     
     def __init__(self, party_id: str, leader_id: int, raid_name: str, 
-                 max_members: int, description: str = "", scheduled_time: str = "", room_title: str = ""):
+                 max_members: int, description: str = "", scheduled_time: str = "", room_title: str = "",
+                 scheduled_at: Optional[float] = None):
         self.party_id = party_id
         self.leader_id = leader_id
         self.raid_name = raid_name
@@ -21,8 +44,11 @@ class PartyRecruitment:
         self.current_members = {leader_id}  # 리더는 자동으로 포함
         self.description = description
         self.scheduled_time = scheduled_time
+        self.scheduled_at = scheduled_at  # 예정 시간을 해석한 시작 시각 (해석 못 한 자유 입력이면 None)
+        self.reminder_sent = False
         self.room_title = room_title
         self.created_at = time.time()
+        self.closed_at = None  # 모집 종료 시각 (종료 후 정리 대상 판단용)
         self.is_active = True
     
     def add_member(self, user_id: int) -> bool:
@@ -46,43 +72,387 @@ class PartyRecruitment:
     def get_remaining_slots(self) -> int:
         """남은 자리 수 반환"""
         return self.max_members - len(self.current_members)
+    
+    def to_dict(self) -> dict:
+        """저장용 딕셔너리로 변환"""
+        return {
+            'party_id': self.party_id,
+            'leader_id': self.leader_id,
+            'raid_name': self.raid_name,
+            'max_members': self.max_members,
+            'current_members': list(self.current_members),
+            'description': self.description,
+            'scheduled_time': self.scheduled_time,
+            'scheduled_at': self.scheduled_at,
+            'reminder_sent': self.reminder_sent,
+            'room_title': self.room_title,
+            'created_at': self.created_at,
+            'closed_at': self.closed_at,
+            'is_active': self.is_active
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PartyRecruitment':
+        """딕셔너리에서 PartyRecruitment 객체 생성"""
+        recruitment = cls(
+            party_id=data['party_id'],
+            leader_id=data['leader_id'],
+            raid_name=data['raid_name'],
+            max_members=data['max_members'],
+            description=data.get('description', ''),
+            scheduled_time=data.get('scheduled_time', ''),
+            room_title=data.get('room_title', ''),
+            scheduled_at=data.get('scheduled_at')
+        )
+        recruitment.reminder_sent = data.get('reminder_sent', False)
+        recruitment.current_members = set(data.get('current_members', [data['leader_id']]))
+        recruitment.created_at = data.get('created_at', recruitment.created_at)
+        recruitment.closed_at = data.get('closed_at')
+        recruitment.is_active = data.get('is_active', True)
+        # 종료 시각이 없는 예전 기록은 생성 시각 기준으로 정리
+        if not recruitment.is_active and recruitment.closed_at is None:
+            recruitment.closed_at = recruitment.created_at
+        return recruitment
+
+
+class PartyExpiryEvent:
+    """파티 모집 만료 이벤트 (봇이 모집 메시지 갱신/알림에 사용)"""
+    
+    EXPIRED = 'expired'    # 모집 시간 초과로 자동 종료됨
+    PURGED = 'purged'      # 종료 후 유예 시간이 지나 삭제됨
+    REMINDER = 'reminder'  # 예정 시작 시각이 다가옴 (파티는 그대로 유지)
+    NO_SHOW = 'no_show'    # 예정 시각이 지나도록 레이드를 시작하지 않아 자동 종료됨
+    
+    def __init__(self, kind: str, party: PartyRecruitment):
+        self.kind = kind
+        self.party = party
+    
+    def __repr__(self) -> str:
+        return f"PartyExpiryEvent({self.kind}, {self.party.party_id})"
 
 
 class RaidWaitingSystem:
     """레이드 대기자 관리 시스템"""
     
-    def __init__(self):
+    def __init__(self, state_store: Optional[RaidStateStore] = None,
+                 party_timeout_minutes: float = 0, purge_grace_minutes: float = 0,
+                 raid_names: Optional[List[str]] = None,
+                 reminder_minutes: float = 0, no_show_grace_minutes: float = 0):
+        """
+        레이드 대기 시스템 초기화
+        
+        Args:
+            state_store: 상태 저장소 (None이면 메모리에만 보관)
+            party_timeout_minutes: 파티 모집 자동 종료 시간 (분, 0이면 자동 종료 안 함)
+            purge_grace_minutes: 종료된 파티를 삭제하기까지의 유예 시간 (분, 0이면 삭제 안 함)
+            raid_names: 이 시스템에서 사용할 레이드 목록 (None이면 DEFAULT_RAID_NAMES)
+            reminder_minutes: 예정 시작 몇 분 전에 알림을 보낼지 (0이면 알림 안 함)
+            no_show_grace_minutes: 예정 시각 후 몇 분 안에 시작하지 않으면 자동 종료할지
+                (0이면 예정 시간이 있는 파티도 일반 모집 시간 초과 규칙을 따름)
+        """
         # 레이드별 대기자 목록 {raid_name: set(user_ids)}
-        self.waiting_lists = {
-            "🔮 완전한플뤼톤": set(),
-            "🌋 델모크": set(),
-            "⚡ 아몬": set(),
-            "📖 묵시록(노말)": set(),
-            "🔥 묵시록(인페르날)": set(),
-            "😇 라파엘": set(),
-            "🛡️ 가브리엘": set(),
-            "⚔️ 우리엘": set(),
-            "🌊 노아": set()
-        }
+        self.waiting_lists = {raid_name: set() for raid_name in (raid_names or DEFAULT_RAID_NAMES)}
         
         # 헬퍼 대기자 목록
         self.helper_waiting_list = set()
         
+        # 대기 등록 순서 {raid_name: {user_id: 등록 시각}} (자동 매칭의 선착순 기준)
+        self._queue_order: Dict[str, Dict[int, float]] = {raid_name: {} for raid_name in self.waiting_lists}
+        self._helper_order: Dict[int, float] = {}
+        
+        # 대기 목록 버전 (대기자가 바뀔 때마다 증가, 화면 캐시 무효화 기준)
+        self._raid_versions: Dict[str, int] = {raid_name: 0 for raid_name in self.waiting_lists}
+        self._helper_version = 0
+        self._format_cache: Dict[tuple, Tuple[int, str]] = {}  # {(raid_name, guild_id): (버전, 문자열)}
+        
+        # 상태 변경 리스너 (자동 매칭 등에서 사용, callback(op))
+        self._change_listeners: List[Callable[[str], None]] = []
+        
         # 파티 모집 목록 {party_id: PartyRecruitment}
         self.party_recruitments = {}
         self._party_counter = 0
+        
+        # 유저 기준 역색인 (버튼 클릭마다 전체를 훑지 않도록 변경 시점에 함께 갱신)
+        self._user_raids: Dict[int, Set[str]] = {}  # {user_id: {raid_name}}
+        self._user_led_parties: Dict[int, Set[str]] = {}  # {user_id: {활성 파티 ID}}
+        self._user_joined_parties: Dict[int, Set[str]] = {}  # {user_id: {활성 파티 ID}}
+        
+        # 레이드별 모집 중인(활성 + 빈 자리 있는) 파티 목록, (created_at, party_id) 순 정렬 유지
+        self._open_parties: Dict[str, List[Tuple[float, str]]] = {}
+        self._open_party_ids: Set[str] = set()
+        
+        # 파티 만료 스케줄 (마감 시각 순 최소 힙, 취소된 항목은 꺼낼 때 걸러냄)
+        self.party_timeout = party_timeout_minutes * 60
+        self.purge_grace = purge_grace_minutes * 60
+        self.reminder_lead = reminder_minutes * 60
+        self.no_show_grace = no_show_grace_minutes * 60
+        self._expiry_heap: List[Tuple[float, int, str, str]] = []  # (마감 시각, 순번, 동작, party_id)
+        self._expiry_seq = itertools.count()
+        
+        # 상태 저장소 (복원이 끝난 뒤에 연결해야 재생 중 변경이 다시 기록되지 않음)
+        self._state_store = None
+        if state_store is not None:
+            self._restore_state(state_store)
+            self._state_store = state_store
+    
+    # 상태 저장 관련 메서드들
+    def _record(self, op: str, **fields):
+        """상태 변경을 저널에 기록하고 리스너에 알림"""
+        if self._state_store is not None:
+            fields['op'] = op
+            self._state_store.append(fields)
+        
+        for listener in self._change_listeners:
+            try:
+                listener(op)
+            except Exception as e:
+                logger.error(f"레이드 상태 변경 리스너 오류: {e}")
+    
+    def add_change_listener(self, listener: Callable[[str], None]):
+        """상태 변경 리스너 등록 (변경 종류 op 문자열을 인자로 호출)"""
+        self._change_listeners.append(listener)
+    
+    def _restore_state(self, state_store: RaidStateStore):
+        """스냅샷 로드 후 저널을 재생하여 상태 복원"""
+        snapshot, records = state_store.load()
+        
+        if snapshot:
+            for raid_name, user_ids in snapshot.get('waiting_lists', {}).items():
+                for user_id in user_ids:
+                    self.add_to_raid(raid_name, user_id)
+            for user_id in snapshot.get('helper_waiting_list', []):
+                self.add_to_helper(user_id)
+            for party_data in snapshot.get('parties', []):
+                self._restore_party(party_data)
+            self._party_counter = max(self._party_counter, snapshot.get('party_counter', 0))
+        
+        for record in records:
+            try:
+                self._apply_record(record)
+            except Exception as e:
+                logger.error(f"레이드 저널 재생 중 오류 ({record}): {e}")
+    
+    def _apply_record(self, record: dict):
+        """저널 기록 1건을 현재 상태에 적용"""
+        op = record.get('op')
+        if op == 'raid_add':
+            self.add_to_raid(record['raid'], record['user'])
+        elif op == 'raid_remove':
+            self.remove_from_raid(record['raid'], record['user'])
+        elif op == 'raid_clear':
+            self.clear_raid(record['raid'])
+        elif op == 'raid_clear_all':
+            self.clear_all_raids()
+        elif op == 'helper_add':
+            self.add_to_helper(record['user'])
+        elif op == 'helper_remove':
+            self.remove_from_helper(record['user'])
+        elif op == 'helper_clear':
+            self.clear_helper_list()
+        elif op == 'party_create':
+            self._restore_party(record['party'])
+        elif op == 'party_join':
+            self.join_party(record['party_id'], record['user'])
+        elif op == 'party_leave':
+            self.leave_party(record['party_id'], record['user'])
+        elif op == 'party_remind':
+            self.mark_reminder_sent(record['party_id'])
+        elif op == 'party_close':
+            self._close_party(record['party_id'], record.get('at'))
+        elif op == 'party_delete':
+            self.delete_party_recruitment(record['party_id'])
+        else:
+            logger.warning(f"알 수 없는 레이드 저널 기록: {record}")
+    
+    def _restore_party(self, party_data: dict):
+        """저장된 파티 모집 정보 복원"""
+        recruitment = PartyRecruitment.from_dict(party_data)
+        self.party_recruitments[recruitment.party_id] = recruitment
+        if recruitment.is_active:
+            self._index_active_party(recruitment)
+        self._update_open_party(recruitment)
+        self._schedule_party_expiry(recruitment)
+        
+        # party_N 형식이면 카운터도 맞춰서 ID 중복 방지
+        suffix = recruitment.party_id.rsplit('_', 1)[-1]
+        if suffix.isdigit():
+            self._party_counter = max(self._party_counter, int(suffix))
+    
+    def export_state(self) -> dict:
+        """스냅샷용 전체 상태 반환"""
+        return {
+            'version': 1,
+            # 등록 순서를 보존하도록 순서 목록 기준으로 저장
+            'waiting_lists': {raid_name: list(users) for raid_name, users in self._queue_order.items()},
+            'helper_waiting_list': list(self._helper_order),
+            'party_counter': self._party_counter,
+            'parties': [party.to_dict() for party in self.party_recruitments.values()]
+        }
+    
+    def flush_state(self, force_snapshot: bool = False):
+        """저널 fsync 및 필요 시 스냅샷 작성 (봇의 주기 작업에서 호출)"""
+        if self._state_store is None:
+            return
+        
+        if force_snapshot or self._state_store.needs_snapshot():
+            self._state_store.write_snapshot(self.export_state())
+        else:
+            self._state_store.sync()
+    
+    def close_state(self):
+        """종료 시 스냅샷을 남기고 저장소 닫기"""
+        if self._state_store is None:
+            return
+        
+        self.flush_state(force_snapshot=True)
+        self._state_store.close()
+        self._state_store = None
+    
+    # 파티 만료 관련 메서드들
+    def _schedule_party_expiry(self, party: PartyRecruitment):
+        """파티 상태에 맞는 다음 만료/알림 작업을 힙에 등록 (파티당 최대 2건)"""
+        if not party.is_active:
+            if self.purge_grace > 0:
+                self._push_expiry(party.closed_at + self.purge_grace, PartyExpiryEvent.PURGED, party)
+            return
+        
+        if party.scheduled_at is not None:
+            if self.reminder_lead > 0 and not party.reminder_sent:
+                self._push_expiry(party.scheduled_at - self.reminder_lead, PartyExpiryEvent.REMINDER, party)
+            if self.no_show_grace > 0:
+                self._push_expiry(party.scheduled_at + self.no_show_grace, PartyExpiryEvent.NO_SHOW, party)
+                return
+        
+        if self.party_timeout > 0:
+            deadline = party.created_at + self.party_timeout
+            if party.scheduled_at is not None:
+                deadline = max(deadline, party.scheduled_at)  # 예정 시각 전에는 시간 초과로 닫지 않음
+            self._push_expiry(deadline, PartyExpiryEvent.EXPIRED, party)
+    
+    def _push_expiry(self, deadline: float, action: str, party: PartyRecruitment):
+        """만료 힙에 작업 1건 추가"""
+        heapq.heappush(self._expiry_heap, (deadline, next(self._expiry_seq), action, party.party_id))
+    
+    def get_next_expiry(self) -> Optional[float]:
+        """가장 이른 만료 예정 시각 반환 (없으면 None, 이미 무효화된 항목일 수 있음)"""
+        return self._expiry_heap[0][0] if self._expiry_heap else None
+    
+    def expire_parties(self, now: float = None) -> List[PartyExpiryEvent]:
+        """
+        마감 시각이 지난 파티를 자동 종료/삭제
+        
+        Args:
+            now: 기준 시각 (기본값: 현재 시각)
+            
+        Returns:
+            List[PartyExpiryEvent]: 처리된 만료/알림 이벤트 목록 (처리 순서대로)
+        """
+        if now is None:
+            now = time.time()
+        
+        events = []
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            deadline, _, action, party_id = heapq.heappop(heap)
+            party = self.party_recruitments.get(party_id)
+            if party is None:
+                continue  # 이미 삭제된 파티
+            
+            if action == PartyExpiryEvent.REMINDER:
+                # 이미 시작(종료)했거나, 봇이 꺼져 있는 사이 시작 시각이 지난 파티는 알리지 않음
+                if party.is_active and not party.reminder_sent and now < party.scheduled_at:
+                    self.mark_reminder_sent(party_id)
+                    events.append(PartyExpiryEvent(PartyExpiryEvent.REMINDER, party))
+            elif action in (PartyExpiryEvent.EXPIRED, PartyExpiryEvent.NO_SHOW):
+                # 수동으로 이미 종료된 파티는 종료 시 등록된 정리 작업이 따로 있음
+                if party.is_active:
+                    self._close_party(party_id, deadline)
+                    events.append(PartyExpiryEvent(action, party))
+            elif not party.is_active:
+                self.delete_party_recruitment(party_id)
+                events.append(PartyExpiryEvent(PartyExpiryEvent.PURGED, party))
+        
+        if events:
+            logger.info(f"파티 만료 처리: {len(events)}건")
+        return events
+    
+    # 모집 중 파티 목록 관련 메서드들
+    def _update_open_party(self, party: PartyRecruitment):
+        """파티 상태 변경 후 모집 중 파티 목록에 반영 (참가/탈퇴/종료/삭제 시 호출)"""
+        should_be_open = (party.is_active and not party.is_full()
+                          and self.party_recruitments.get(party.party_id) is party)
+        is_open = party.party_id in self._open_party_ids
+        if should_be_open == is_open:
+            return
+        
+        key = (party.created_at, party.party_id)
+        if should_be_open:
+            bisect.insort(self._open_parties.setdefault(party.raid_name, []), key)
+            self._open_party_ids.add(party.party_id)
+        else:
+            keys = self._open_parties[party.raid_name]
+            del keys[bisect.bisect_left(keys, key)]
+            if not keys:
+                del self._open_parties[party.raid_name]
+            self._open_party_ids.discard(party.party_id)
+    
+    # 역색인 관련 메서드들
+    @staticmethod
+    def _index_add(index: Dict[int, Set[str]], user_id: int, key: str):
+        """역색인에 항목 추가"""
+        index.setdefault(user_id, set()).add(key)
+    
+    @staticmethod
+    def _index_discard(index: Dict[int, Set[str]], user_id: int, key: str):
+        """역색인에서 항목 제거 (빈 항목은 정리)"""
+        keys = index.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[user_id]
+    
+    def _index_active_party(self, party: PartyRecruitment):
+        """활성 파티를 리더/참가자 역색인에 등록"""
+        self._index_add(self._user_led_parties, party.leader_id, party.party_id)
+        for user_id in party.current_members:
+            self._index_add(self._user_joined_parties, user_id, party.party_id)
+    
+    def _unindex_party(self, party: PartyRecruitment):
+        """파티를 리더/참가자 역색인에서 제거"""
+        self._index_discard(self._user_led_parties, party.leader_id, party.party_id)
+        for user_id in party.current_members:
+            self._index_discard(self._user_joined_parties, user_id, party.party_id)
+    
+    def _get_indexed_parties(self, index: Dict[int, Set[str]], user_id: int) -> List[PartyRecruitment]:
+        """역색인에서 파티 목록을 생성 시간 순으로 반환"""
+        party_ids = index.get(user_id)
+        if not party_ids:
+            return []
+        parties = [self.party_recruitments[party_id] for party_id in party_ids]
+        parties.sort(key=lambda x: x.created_at)
+        return parties
     
     def add_to_raid(self, raid_name: str, user_id: int) -> bool:
         """특정 레이드에 유저 추가"""
         if raid_name in self.waiting_lists:
-            self.waiting_lists[raid_name].add(user_id)
+            if user_id not in self.waiting_lists[raid_name]:
+                self.waiting_lists[raid_name].add(user_id)
+                self._queue_order[raid_name][user_id] = time.time()
+                self._raid_versions[raid_name] += 1
+                self._index_add(self._user_raids, user_id, raid_name)
+                self._record('raid_add', raid=raid_name, user=user_id)
             return True
         return False
     
     def remove_from_raid(self, raid_name: str, user_id: int) -> bool:
         """특정 레이드에서 유저 제거"""
         if raid_name in self.waiting_lists:
-            self.waiting_lists[raid_name].discard(user_id)
+            if user_id in self.waiting_lists[raid_name]:
+                self.waiting_lists[raid_name].discard(user_id)
+                self._queue_order[raid_name].pop(user_id, None)
+                self._raid_versions[raid_name] += 1
+                self._index_discard(self._user_raids, user_id, raid_name)
+                self._record('raid_remove', raid=raid_name, user=user_id)
             return True
         return False
     
@@ -92,32 +462,65 @@ class RaidWaitingSystem:
             return False
         
         if user_id in self.waiting_lists[raid_name]:
-            self.waiting_lists[raid_name].discard(user_id)
+            self.remove_from_raid(raid_name, user_id)
             return False  # 제거됨
         else:
-            self.waiting_lists[raid_name].add(user_id)
+            self.add_to_raid(raid_name, user_id)
             return True   # 추가됨
     
     def get_raid_participants(self, raid_name: str) -> Set[int]:
         """특정 레이드의 참여자 목록 반환"""
         return self.waiting_lists.get(raid_name, set()).copy()
     
+    def is_user_waiting(self, raid_name: str, user_id: int) -> bool:
+        """특정 유저가 해당 레이드에 대기 중인지 확인"""
+        return raid_name in self._user_raids.get(user_id, ())
+    
+    def get_waiting_queue(self, raid_name: str) -> List[int]:
+        """특정 레이드의 대기자 목록을 등록 순서대로 반환"""
+        return list(self._queue_order.get(raid_name, ()))
+    
+    def iter_waiting_queue(self, raid_name: str):
+        """특정 레이드의 대기자를 등록 순서대로 순회 (복사 없음, 순회 중 변경 금지)"""
+        return iter(self._queue_order.get(raid_name, ()))
+    
+    def iter_helper_queue(self):
+        """헬퍼 대기자를 등록 순서대로 순회 (복사 없음, 순회 중 변경 금지)"""
+        return iter(self._helper_order)
+    
+    def get_raid_version(self, raid_name: str) -> int:
+        """특정 레이드 대기 목록의 버전 반환 (대기자가 바뀔 때마다 증가)"""
+        return self._raid_versions.get(raid_name, 0)
+    
+    def get_helper_version(self) -> int:
+        """헬퍼 대기 목록의 버전 반환"""
+        return self._helper_version
+    
+    def get_oldest_queued_at(self, raid_name: str) -> Optional[float]:
+        """특정 레이드에서 가장 오래 기다린 대기자의 등록 시각 반환 (대기자 없으면 None)"""
+        queue = self._queue_order.get(raid_name)
+        return next(iter(queue.values())) if queue else None
+    
     def get_all_raids(self) -> list:
         """모든 레이드 이름 목록 반환"""
         return list(self.waiting_lists.keys())
     
     def get_user_raids(self, user_id: int) -> list:
-        """특정 유저가 참여한 레이드 목록 반환"""
-        user_raids = []
-        for raid_name, participants in self.waiting_lists.items():
-            if user_id in participants:
-                user_raids.append(raid_name)
-        return user_raids
+        """특정 유저가 참여한 레이드 목록 반환 (레이드 목록 순서 유지)"""
+        user_raids = self._user_raids.get(user_id)
+        if not user_raids:
+            return []
+        return [raid_name for raid_name in self.waiting_lists if raid_name in user_raids]
     
     def clear_raid(self, raid_name: str) -> bool:
         """특정 레이드의 모든 참여자 초기화"""
         if raid_name in self.waiting_lists:
+            for user_id in self.waiting_lists[raid_name]:
+                self._index_discard(self._user_raids, user_id, raid_name)
             self.waiting_lists[raid_name].clear()
+            self._queue_order[raid_name].clear()
+            self._raid_versions[raid_name] += 1
+            self._record('raid_clear', raid=raid_name)
             return True
         return False
     
@@ -125,30 +528,46 @@ class RaidWaitingSystem:
         """모든 레이드의 참여자 초기화"""
         for raid_name in self.waiting_lists:
             self.waiting_lists[raid_name].clear()
+            self._queue_order[raid_name].clear()
+            self._raid_versions[raid_name] += 1
+        self._user_raids.clear()
+        self._record('raid_clear_all')
     
     def add_to_helper(self, user_id: int) -> bool:
         """헬퍼 대기 목록에 유저 추가"""
-        self.helper_waiting_list.add(user_id)
+        if user_id not in self.helper_waiting_list:
+            self.helper_waiting_list.add(user_id)
+            self._helper_order[user_id] = time.time()
+            self._helper_version += 1
+            self._record('helper_add', user=user_id)
         return True
     
     def remove_from_helper(self, user_id: int) -> bool:
         """헬퍼 대기 목록에서 유저 제거"""
-        self.helper_waiting_list.discard(user_id)
+        if user_id in self.helper_waiting_list:
+            self.helper_waiting_list.discard(user_id)
+            self._helper_order.pop(user_id, None)
+            self._helper_version += 1
+            self._record('helper_remove', user=user_id)
         return True
     
     def toggle_helper_participation(self, user_id: int) -> bool:
         """헬퍼 참여 상태 토글 (추가/제거)"""
         if user_id in self.helper_waiting_list:
-            self.helper_waiting_list.discard(user_id)
+            self.remove_from_helper(user_id)
             return False  # 제거됨
         else:
-            self.helper_waiting_list.add(user_id)
+            self.add_to_helper(user_id)
             return True   # 추가됨
     
     def get_helper_participants(self) -> Set[int]:
         """헬퍼 대기자 목록 반환"""
         return self.helper_waiting_list.copy()
     
+    def get_helper_queue(self) -> List[int]:
+        """헬퍼 대기자 목록을 등록 순서대로 반환"""
+        return list(self._helper_order)
+    
     def get_helper_count(self) -> int:
         """헬퍼 대기자 수 반환"""
         return len(self.helper_waiting_list)
@@ -156,9 +575,27 @@ class RaidWaitingSystem:
     def clear_helper_list(self):
         """헬퍼 대기 목록 초기화"""
         self.helper_waiting_list.clear()
+        self._helper_order.clear()
+        self._helper_version += 1
+        self._record('helper_clear')
+    
+    def _get_cached_format(self, key: str, version: int, guild: discord.Guild, render) -> str:
+        """대기 목록 버전이 그대로면 이전에 만든 문자열을 재사용"""
+        cache_key = (key, guild.id if guild else None)
+        cached = self._format_cache.get(cache_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        text = render()
+        self._format_cache[cache_key] = (version, text)
+        return text
     
     def format_helper_list(self, guild: discord.Guild = None) -> str:
         """헬퍼 대기자 목록을 포맷된 문자열로 반환"""
+        return self._get_cached_format('helper', self._helper_version, guild,
+                                       lambda: self._render_helper_list(guild))
+    
+    def _render_helper_list(self, guild: discord.Guild = None) -> str:
+        """헬퍼 대기자 목록 문자열 생성"""
         if not self.helper_waiting_list:
             return "🤝 헬퍼: 대기자 없음"
         
@@ -181,6 +618,13 @@ class RaidWaitingSystem:
     
     def format_raid_list(self, raid_name: str, guild: discord.Guild = None) -> str:
         """레이드 참여자 목록을 포맷된 문자열로 반환"""
+        if raid_name not in self.waiting_lists:
+            return f"{raid_name}: 대기자 없음"
+        return self._get_cached_format(raid_name, self._raid_versions[raid_name], guild,
+                                       lambda: self._render_raid_list(raid_name, guild))
+    
+    def _render_raid_list(self, raid_name: str, guild: discord.Guild = None) -> str:
+        """레이드 참여자 목록 문자열 생성"""
         participants = self.waiting_lists.get(raid_name, set())
         
         if not participants:
@@ -213,8 +657,9 @@ class RaidWaitingSystem:
     # 파티 모집 관련 메서드들
     def create_party_recruitment(self, leader_id: int, raid_name: str, 
                                max_members: int, description: str = "", 
-                               scheduled_time: str = "", room_title: str = "") -> str:
-        """파티 모집 생성"""
+                               scheduled_time: str = "", room_title: str = "",
+                               scheduled_at: Optional[float] = None) -> str:
+        """파티 모집 생성 (scheduled_at: 예정 시간을 해석한 시작 시각)"""
         self._party_counter += 1
         party_id = f"party_{self._party_counter}"
         
@@ -225,12 +670,26 @@ class RaidWaitingSystem:
             max_members=max_members,
             description=description,
             scheduled_time=scheduled_time,
-            room_title=room_title
+            room_title=room_title,
+            scheduled_at=scheduled_at
         )
         
         self.party_recruitments[party_id] = recruitment
+        self._index_active_party(recruitment)
+        self._update_open_party(recruitment)
+        self._schedule_party_expiry(recruitment)
+        self._record('party_create', party=recruitment.to_dict())
         return party_id
     
+    def mark_reminder_sent(self, party_id: str) -> bool:
+        """시작 전 알림 발송 기록 (재시작 후 같은 알림을 다시 보내지 않도록 저널에 남김)"""
+        party = self.party_recruitments.get(party_id)
+        if party is None or party.reminder_sent:
+            return False
+        party.reminder_sent = True
+        self._record('party_remind', party_id=party_id)
+        return True
+    
     def get_party_recruitment(self, party_id: str) -> Optional[PartyRecruitment]:
         """파티 모집 정보 반환"""
         return self.party_recruitments.get(party_id)
@@ -238,56 +697,88 @@ class RaidWaitingSystem:
     def join_party(self, party_id: str, user_id: int) -> bool:
         """파티 참가"""
         if party_id in self.party_recruitments:
-            return self.party_recruitments[party_id].add_member(user_id)
+            party = self.party_recruitments[party_id]
+            if party.add_member(user_id):
+                if party.is_active:
+                    self._index_add(self._user_joined_parties, user_id, party_id)
+                self._update_open_party(party)
+                self._record('party_join', party_id=party_id, user=user_id)
+                return True
         return False
     
     def leave_party(self, party_id: str, user_id: int) -> bool:
         """파티 탈퇴"""
         if party_id in self.party_recruitments:
-            return self.party_recruitments[party_id].remove_member(user_id)
+            party = self.party_recruitments[party_id]
+            if party.remove_member(user_id):
+                self._index_discard(self._user_joined_parties, user_id, party_id)
+                self._update_open_party(party)
+                self._record('party_leave', party_id=party_id, user=user_id)
+                return True
         return False
     
     def close_party_recruitment(self, party_id: str) -> bool:
         """파티 모집 종료"""
+        return self._close_party(party_id)
+    
+    def _close_party(self, party_id: str, closed_at: float = None) -> bool:
+        """파티 모집 종료 (저널 재생 시에는 기록된 종료 시각을 그대로 사용)"""
         if party_id in self.party_recruitments:
-            self.party_recruitments[party_id].is_active = False
+            party = self.party_recruitments[party_id]
+            if not party.is_active:
+                # 이미 종료된 파티는 종료 시각을 바꾸지 않고 저널에도 다시 기록하지 않음
+                return True
+            party.is_active = False
+            party.closed_at = closed_at if closed_at is not None else time.time()
+            self._unindex_party(party)
+            self._update_open_party(party)
+            self._schedule_party_expiry(party)
+            self._record('party_close', party_id=party_id, at=party.closed_at)
             return True
         return False
     
     def delete_party_recruitment(self, party_id: str) -> bool:
         """파티 모집 삭제"""
         if party_id in self.party_recruitments:
-            del self.party_recruitments[party_id]
+            party = self.party_recruitments.pop(party_id)
+            if party.is_active:
+                self._unindex_party(party)
+            self._update_open_party(party)
+            self._record('party_delete', party_id=party_id)
             return True
         return False
     
-    def get_active_parties(self, raid_name: str = None) -> List[PartyRecruitment]:
-        """활성 파티 모집 목록 반환"""
-        active_parties = []
-        for recruitment in self.party_recruitments.values():
-            if recruitment.is_active and not recruitment.is_full():
-                if raid_name is None or recruitment.raid_name == raid_name:
-                    active_parties.append(recruitment)
+    def get_active_parties(self, raid_name: str = None, offset: int = 0,
+                           limit: Optional[int] = None) -> List[PartyRecruitment]:
+        """
+        모집 중인(활성 + 빈 자리 있는) 파티 목록을 생성 시간 순으로 반환
         
-        # 생성 시간 순으로 정렬
-        active_parties.sort(key=lambda x: x.created_at)
-        return active_parties
+        Args:
+            raid_name: 특정 레이드만 조회 (None이면 전체)
+            offset: 건너뛸 파티 수 (페이지 처리용)
+            limit: 최대 반환 개수 (None이면 전부)
+        """
+        stop = None if limit is None else offset + limit
+        if raid_name is not None:
+            keys = self._open_parties.get(raid_name, [])[offset:stop]
+        else:
+            # 레이드별 목록이 이미 정렬되어 있으므로 병합하면서 필요한 만큼만 꺼냄
+            keys = itertools.islice(heapq.merge(*self._open_parties.values()), offset, stop)
+        return [self.party_recruitments[party_id] for _, party_id in keys]
+    
+    def count_active_parties(self, raid_name: str = None) -> int:
+        """모집 중인 파티 수 반환"""
+        if raid_name is not None:
+            return len(self._open_parties.get(raid_name, []))
+        return len(self._open_party_ids)
     
     def get_user_led_parties(self, user_id: int) -> List[PartyRecruitment]:
         """특정 유저가 리더인 파티 목록 반환"""
-        user_parties = []
-        for recruitment in self.party_recruitments.values():
-            if recruitment.leader_id == user_id and recruitment.is_active:
-                user_parties.append(recruitment)
-        return user_parties
+        return self._get_indexed_parties(self._user_led_parties, user_id)
     
     def get_user_joined_parties(self, user_id: int) -> List[PartyRecruitment]:
         """특정 유저가 참가 중인 파티 목록 반환"""
-        joined_parties = []
-        for recruitment in self.party_recruitments.values():
-            if recruitment.is_active and user_id in recruitment.current_members:
-                joined_parties.append(recruitment)
-        return joined_parties
+        return self._get_indexed_parties(self._user_joined_parties, user_id)
     
     def format_party_info(self, party: PartyRecruitment, guild: discord.Guild = None) -> str:
         """파티 정보를 포맷된 문자열로 반환"""
@@ -318,7 +809,9 @@ class RaidWaitingSystem:
         if party.room_title:
             info += f"🏠 방제: {party.room_title}\n"
         
-        if party.scheduled_time:
+        if party.scheduled_at is not None:
+            info += f"⏰ 시간: {format_scheduled_time(party.scheduled_at)}\n"
+        elif party.scheduled_time:
             info += f"⏰ 시간: {party.scheduled_time}\n"
         
         if party.description:
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+레이드 시스템 조회 벤치마크
+역색인/정렬 목록 조회와 기존 전체 순회 방식의 조회 시간을 비교
+"""
+
+import os
+import random
+import sys
+import time
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from raid_board import RaidBoard
+from raid_system import RaidWaitingSystem
+
+
+def scan_led_parties(raid_system, user_id):
+    """기존 방식: 모든 파티를 순회하여 리더인 파티 검색"""
+    return [p for p in raid_system.party_recruitments.values() if p.leader_id == user_id and p.is_active]
+
+
+def scan_joined_parties(raid_system, user_id):
+    """기존 방식: 모든 파티를 순회하여 참가 중인 파티 검색"""
+    return [p for p in raid_system.party_recruitments.values() if p.is_active and user_id in p.current_members]
+
+
+def scan_user_raids(raid_system, user_id):
+    """기존 방식: 모든 레이드 대기 목록을 순회"""
+    return [raid_name for raid_name, users in raid_system.waiting_lists.items() if user_id in users]
+
+
+def scan_active_parties(raid_system, user_id):
+    """기존 방식: 모든 파티를 순회하여 모집 중 파티를 걸러낸 뒤 정렬"""
+    parties = [p for p in raid_system.party_recruitments.values() if p.is_active and not p.is_full()]
+    parties.sort(key=lambda x: x.created_at)
+    return parties[:20]
+
+
+class FakeMember:
+    """벤치마크용 길드 멤버"""
+
+    def __init__(self, user_id):
+        self.display_name = f"User{user_id}"
+
+
+class FakeGuild:
+    """벤치마크용 길드 (get_member만 지원)"""
+
+    def __init__(self, user_count):
+        self.id = 1
+        self.members = {user_id: FakeMember(user_id) for user_id in range(user_count)}
+
+    def get_member(self, user_id):
+        return self.members.get(user_id)
+
+
+def rebuild_board(raid_system, guild):
+    """기존 방식: 모든 대기자의 이름을 조회하여 현황판 전체를 다시 생성"""
+    fields = []
+    for raid_name in raid_system.get_all_raids():
+        participants = raid_system.get_raid_participants(raid_name)
+        if participants:
+            names = [guild.get_member(user_id).display_name for user_id in participants]
+            fields.append((f"🎯 {raid_name}", "\n".join(names[:5])))
+    return fields
+
+
+def build_system(party_count: int, user_count: int) -> RaidWaitingSystem:
+    """파티 party_count개, 유저 user_count명 규모의 레이드 시스템 생성"""
+    rng = random.Random(42)
+    raid_system = RaidWaitingSystem()
+    raids = raid_system.get_all_raids()
+
+    for user_id in range(user_count):
+        for raid_name in rng.sample(raids, 2):
+            raid_system.add_to_raid(raid_name, user_id)
+
+    for i in range(party_count):
+        party_id = raid_system.create_party_recruitment(
+            leader_id=rng.randrange(user_count),
+            raid_name=rng.choice(raids),
+            max_members=4
+        )
+        for _ in range(2):
+            raid_system.join_party(party_id, rng.randrange(user_count))
+        # 대부분의 파티는 종료된 채로 남아 있음 (실제 운영 상황)
+        if i % 10 != 0:
+            raid_system.close_party_recruitment(party_id)
+
+    return raid_system
+
+
+def measure(func, raid_system, user_ids) -> float:
+    """조회 1회당 평균 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for user_id in user_ids:
+        func(raid_system, user_id)
+    return (time.perf_counter() - start) / len(user_ids) * 1_000_000
+
+
+def run_benchmark(party_count: int = 10000, user_count: int = 2000, lookups: int = 500):
+    """역색인/정렬 목록 조회와 전체 순회 비교"""
+    print(f"🧪 레이드 조회 벤치마크 (파티 {party_count:,}개, 유저 {user_count:,}명)")
+    print("=" * 60)
+
+    raid_system = build_system(party_count, user_count)
+    user_ids = [random.Random(7).randrange(user_count) for _ in range(lookups)]
+
+    # 결과가 동일한지 먼저 확인
+    for user_id in user_ids[:50]:
+        assert {p.party_id for p in raid_system.get_user_led_parties(user_id)} == \
+               {p.party_id for p in scan_led_parties(raid_system, user_id)}
+        assert {p.party_id for p in raid_system.get_user_joined_parties(user_id)} == \
+               {p.party_id for p in scan_joined_parties(raid_system, user_id)}
+        assert raid_system.get_user_raids(user_id) == scan_user_raids(raid_system, user_id)
+    assert raid_system.get_active_parties(limit=20) == scan_active_parties(raid_system, None)
+
+    cases = [
+        ("리더 파티 조회", scan_led_parties, lambda rs, uid: rs.get_user_led_parties(uid)),
+        ("참가 파티 조회", scan_joined_parties, lambda rs, uid: rs.get_user_joined_parties(uid)),
+        ("대기 레이드 조회", scan_user_raids, lambda rs, uid: rs.get_user_raids(uid)),
+        ("모집 파티 20개", scan_active_parties, lambda rs, uid: rs.get_active_parties(limit=20)),
+    ]
+
+    for label, scan_func, index_func in cases:
+        scan_us = measure(scan_func, raid_system, user_ids)
+        index_us = measure(index_func, raid_system, user_ids)
+        print(f"{label}: 전체 순회 {scan_us:8.1f}µs → 역색인 {index_us:6.2f}µs ({scan_us / index_us:,.0f}배)")
+
+
+def run_board_benchmark(user_count: int = 2000, reads: int = 200):
+    """대기방 현황판 캐시와 전체 재생성 비교 (조회 사이에 레이드 1곳만 변경)"""
+    print(f"\n🧪 대기방 현황판 벤치마크 (대기자 {user_count:,}명)")
+    print("=" * 60)
+
+    raid_system = build_system(0, user_count)
+    guild = FakeGuild(user_count)
+    board = RaidBoard(raid_system)
+    raid_name = raid_system.get_all_raids()[0]
+
+    start = time.perf_counter()
+    for i in range(reads):
+        raid_system.toggle_raid_participation(raid_name, i)
+        rebuild_board(raid_system, guild)
+    rebuild_us = (time.perf_counter() - start) / reads * 1_000_000
+
+    start = time.perf_counter()
+    for i in range(reads):
+        raid_system.toggle_raid_participation(raid_name, i)
+        board.get_fields(guild)
+    board_us = (time.perf_counter() - start) / reads * 1_000_000
+
+    print(f"현황판 조회: 전체 재생성 {rebuild_us:8.1f}µs → 캐시 {board_us:6.1f}µs ({rebuild_us / board_us:,.0f}배)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
+    run_board_benchmark()
@@ -0,0 +1,62 @@
+"""
+요청 속도 제한 모듈
+토큰 버킷 방식으로 초당 요청 수를 제한 (Discord API 호출, 외부 API 호출 공용)
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            rate: 초당 충전되는 토큰 수
+            capacity: 최대 토큰 수 (순간적으로 허용되는 요청 수, 기본값: rate)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = None  # acquire()에서 처음 대기할 때 생성 (실행 중인 이벤트 루프에 묶이도록)
+
+    def _refill(self):
+        """경과 시간만큼 토큰 충전"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """토큰이 있으면 바로 사용하고 True, 없으면 False (대기하지 않음)"""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    def refund(self, tokens: float = 1):
+        """사용한 토큰 되돌리기 (함께 확인한 다른 제한에 걸려 요청을 보내지 않은 경우)"""
+        self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """tokens개를 사용할 수 있을 때까지 남은 시간 (초)"""
+        self._refill()
+        return max(0.0, (tokens - self._tokens) / self.rate)
+
+    async def acquire(self, tokens: float = 1):
+        """토큰을 사용할 수 있을 때까지 대기 후 사용 (대기 순서대로 처리)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+세이브코드 분석 결과 캐시 모듈
+같은 플레이어가 같은 세이브코드 목록으로 /로드, /검증을 반복할 때
+분석 결과와 만들어 둔 임베드/CSV를 다시 계산하지 않고 재사용
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from save_analysis import SaveAnalysis
+
+
+def result_cache_key(player_name: str, codes: Sequence[str], data_version: Sequence[str]) -> str:
+    """
+    캐시 키 (플레이어 이름, 정규화한 세이브코드 목록, 데이터 파일 버전의 해시)
+
+    코드 순서는 결과 표시 순서이므로 유지하고 앞뒤 공백만 정규화
+    (대소문자는 명령어마다 처리가 다르므로 호출하는 쪽에서 맞춤)
+    """
+    payload = json.dumps([player_name.strip(), [code.strip() for code in codes], list(data_version)],
+                         ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class CachedResult:
+    """캐시에 보관하는 분석 결과와 만들어 둔 표시용 데이터"""
+    analyses: List[SaveAnalysis]
+    header: List[Any] = field(default_factory=list)  # 통계 임베드 등 앞에 붙는 임베드
+    rendered: Dict[int, Any] = field(default_factory=dict)  # {분석 결과 번호: 임베드} (페이지를 볼 때 채워짐)
+    csv_text: Optional[str] = None  # 처음 CSV를 요청할 때 채워짐
+
+
+class ResultCache:
+    """
+    세이브코드 분석 결과 LRU + TTL 캐시
+
+    키에 데이터 파일 버전이 들어가므로 아이템/졸업 조건을 다시 로드하면 이전 결과는 조회되지 않으며,
+    버전이 바뀐 것을 처음 확인할 때 이전 버전의 항목을 모두 비움 (이벤트 루프에서만 사용)
+    """
+
+    def __init__(self, ttl: float = 600, max_entries: int = 256):
+        """
+        캐시 초기화
+
+        Args:
+            ttl: 결과를 보관할 시간 (초, 0이면 캐시 안 함)
+            max_entries: 최대 보관 개수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[float, CachedResult]]' = OrderedDict()  # {키: (만료 시각, 결과)}
+        self._data_version: Optional[Tuple[str, ...]] = None
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def _check_version(self, data_version: Sequence[str]):
+        data_version = tuple(data_version)
+        if data_version != self._data_version:
+            if self._data_version is not None and self._entries:
+                self.invalidate()
+            self._data_version = data_version
+
+    def key(self, player_name: str, codes: Sequence[str], data_version: Sequence[str]) -> str:
+        """캐시 키 생성 (데이터 버전이 바뀌었으면 이전 항목 제거)"""
+        self._check_version(data_version)
+        return result_cache_key(player_name, codes, data_version)
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """캐시된 결과 반환 (없거나 만료됐으면 None)"""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: CachedResult):
+        """결과 저장"""
+        if not self.enabled:
+            return
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """전체 캐시 비우기 (데이터를 다시 로드했을 때)"""
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def get_stats(self) -> dict:
+        """캐시 통계 반환"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'invalidations': self.invalidations,
+        }
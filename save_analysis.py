@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+세이브코드 분석 모듈
+세이브코드를 한 번만 파싱하여 유효성, 자원, 영웅 이름, 아이템 이름, 졸업 상태를 한꺼번에 계산
+(/로드, /검증, /아이템 명령어가 함께 사용)
+"""
+
+import csv
+import io
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from graduation_checker import GraduationChecker
+from items import ItemDatabase
+from savecode_decoder import parse_savecode
+from savecode_manager import SaveCodeManager
+
+logger = logging.getLogger(__name__)
+
+# /로드 통계에 표시하는 졸업 상태 (표시 순서)
+GRADUATION_STATUSES = ['mikael', 'terminator', 'apocalypse', 'uriel', 'raphael', 'gabriel']
+
+CSV_HEADER = ['번호', '세이브코드', '유효', '영웅', '레벨', '골드', '나무', '졸업', '아이템', '오류']
+
+
+@dataclass
+class SaveAnalysis:
+    """세이브코드 1개의 분석 결과"""
+    code: str
+    player_name: str = ""
+    valid: bool = False  # 체크섬과 영웅 타입이 모두 올바른지
+    checksum_valid: bool = False
+    hero_type_index: int = 0
+    hero_name: str = "Unknown Character"
+    gold: int = 0
+    lumber: int = 0
+    level: int = 1
+    item_ids: List[int] = field(default_factory=list)
+    item_names: List[str] = field(default_factory=list)
+    graduation_status: str = 'none'
+    error: Optional[str] = None  # 코드 자체를 해석할 수 없는 경우의 오류 메시지
+
+    @property
+    def items_list(self) -> List[str]:
+        """'N번째 아이템: 이름' 형식의 아이템 목록 (SaveCodeDecoder.extract_items와 같은 형식)"""
+        return [f"{idx}번째 아이템: {item_name}" for idx, item_name in enumerate(self.item_names, 1)]
+
+    @property
+    def status_text(self) -> str:
+        return "✅ 유효함" if self.valid else "❌ 유효하지 않음"
+
+
+class SaveAnalyzer:
+    """세이브코드 분석기 (코드당 파싱 1회)"""
+
+    def __init__(self, item_db: ItemDatabase = None, savecode_manager: SaveCodeManager = None,
+                 graduation_checker: GraduationChecker = None, save_value_length: List[int] = None,
+                 summon_chunk_n: Optional[int] = None):
+        """
+        분석기 초기화
+
+        Args:
+            item_db: 아이템 이름 조회용 데이터베이스
+            savecode_manager: 영웅 이름 조회용 세이브코드 관리자
+            graduation_checker: 졸업 상태 확인기
+            save_value_length: 세이브 값 길이 목록 (UDG_SAVE_VALUE_LENGTH)
+            summon_chunk_n: 소환 청크 수 (SUMMON_CHUNK_N, 0이면 자동 감지)
+        """
+        self.item_db = item_db or ItemDatabase()
+        self.savecode_manager = savecode_manager or SaveCodeManager(summon_chunk_n=summon_chunk_n)
+        self.graduation_checker = graduation_checker or GraduationChecker()
+        self.save_value_length = save_value_length
+        self.summon_chunk_n = summon_chunk_n or 0
+
+    @property
+    def data_version(self) -> Tuple[str, str]:
+        """분석 결과에 영향을 주는 데이터 파일 버전 (아이템, 졸업 조건)"""
+        return (self.item_db.version, self.graduation_checker.version)
+
+    def analyze(self, code: str, player_name: str = "") -> SaveAnalysis:
+        """
+        세이브코드 분석
+
+        체크섬 검증을 예외 대신 결과 값으로 받아 한 번의 파싱으로 유효성과 데이터를 함께 얻음.
+        코드를 해석할 수 없으면 error에 사유를 담아 반환 (예외를 던지지 않음)
+
+        Args:
+            code: 세이브코드
+            player_name: 플레이어 이름 (유효성 검증용, 비어 있으면 체크섬이 맞지 않음)
+
+        Returns:
+            SaveAnalysis: 분석 결과
+        """
+        analysis = SaveAnalysis(code=code, player_name=player_name)
+        try:
+            parsed = parse_savecode(code, player_name, save_value_length=self.save_value_length,
+                                    summon_chunk_n=self.summon_chunk_n, validate_checksum=False)
+        except Exception as e:
+            logger.warning(f"세이브코드 분석 실패: {e}")
+            analysis.error = str(e)
+            return analysis
+
+        analysis.checksum_valid = bool(parsed['checksum_valid'])
+        analysis.valid = analysis.checksum_valid and bool(parsed['hero_type_valid'])
+        analysis.hero_type_index = parsed['hero_type_index']
+        analysis.hero_name = self.savecode_manager.get_character_name(analysis.hero_type_index)
+        analysis.gold = parsed['gold']
+        analysis.lumber = parsed['lumber']
+        analysis.level = parsed['level']
+        analysis.item_ids = list(parsed['items'])
+        analysis.item_names = [self.item_db.get_item_name(item_id) for item_id in analysis.item_ids]
+        analysis.graduation_status = self.graduation_checker.get_graduation_status(item_ids=analysis.item_ids)
+        return analysis
+
+    def analyze_many(self, codes: List[str], player_name: str = "") -> List[SaveAnalysis]:
+        """여러 세이브코드 분석"""
+        return [self.analyze(code, player_name) for code in codes]
+
+
+@dataclass
+class LoadSummary:
+    """여러 세이브코드 분석 결과의 통계"""
+    total: int = 0
+    valid_count: int = 0
+    invalid_count: int = 0
+    character_counts: Counter = field(default_factory=Counter)  # {영웅 이름: 출현 횟수}
+    graduates: Dict[str, Set[str]] = field(default_factory=dict)  # {졸업 상태: 영웅 이름}
+
+    @property
+    def characters(self) -> Set[str]:
+        return set(self.character_counts)
+
+    @property
+    def duplicated_characters(self) -> Dict[str, int]:
+        return {name: count for name, count in self.character_counts.items() if count > 1}
+
+
+def summarize_analyses(analyses: List[SaveAnalysis]) -> LoadSummary:
+    """분석 결과 통계 (해석할 수 없는 코드는 유효하지 않은 코드로만 집계)"""
+    summary = LoadSummary(total=len(analyses), graduates={status: set() for status in GRADUATION_STATUSES})
+    for analysis in analyses:
+        if analysis.valid:
+            summary.valid_count += 1
+        else:
+            summary.invalid_count += 1
+        if analysis.error:
+            continue
+        summary.character_counts[analysis.hero_name] += 1
+        if analysis.graduation_status in summary.graduates:
+            summary.graduates[analysis.graduation_status].add(analysis.hero_name)
+    return summary
+
+
+def format_analyses_csv(analyses: List[SaveAnalysis]) -> str:
+    """분석 결과 전체를 코드당 한 줄의 CSV로 변환 (아이템은 ' / '로 연결)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    for idx, analysis in enumerate(analyses, 1):
+        writer.writerow([
+            idx, analysis.code, 'O' if analysis.valid else 'X', analysis.hero_name if not analysis.error else '',
+            analysis.level, analysis.gold, analysis.lumber, analysis.graduation_status,
+            ' / '.join(analysis.item_names), analysis.error or ''
+        ])
+    return buffer.getvalue()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+/로드 세이브코드 분석 벤치마크
+코드당 3번 파싱하던 기존 /로드 처리와 SaveAnalyzer 1회 파싱의 처리 시간을 비교
+(디스코드 전송을 제외한 명령어 처리 전체: 검증, 자원, 영웅, 아이템, 졸업 상태, 아이템 필드 구성)
+
+    python save_analysis_benchmark.py --codes 50 --rounds 20
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Config가 토큰을 요구하므로 .env가 없는 환경에서도 실행되도록 설정
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'benchmark-token')
+
+from config import Config
+from decoder import SaveCodeDecoder
+from graduation_checker import GraduationChecker
+from items import ItemDatabase
+from save_analysis import SaveAnalyzer
+from savecode_decoder import decode_savecode2, extract_save_data
+from savecode_manager import SaveCodeManager
+
+PLAYER_NAME = "SinLime#31230"
+SAMPLE_CODES = [
+    "111148YYYYVTYYYYV6YYYYVLEM3G111711UJ1111",
+    "111148YYYYVTYYYYV6YYYYVLEO3G111711UF1111",
+]
+
+
+def format_item_fields(items_list):
+    """/로드 임베드의 아이템 필드 구성 (3개씩 묶음)"""
+    fields = []
+    for i in range(0, len(items_list), 3):
+        batch = items_list[i:i + 3]
+        fields.append("\n".join(f"🎯 **{i + j + 1}.** {item}" for j, item in enumerate(batch)))
+    return fields
+
+
+def legacy_load(codes, name, config, decoder, savecode_manager, graduation_checker):
+    """기존 /로드 처리: 검증, 데이터 추출, 아이템 추출을 각각 파싱 (디버그 출력 포함)"""
+    results = []
+    for code in codes:
+        print(f"[DEBUG] 로드된 코드들: {code}")
+        is_valid = decode_savecode2(code, name, summon_chunk_n=config.SUMMON_CHUNK_N)
+        save_data = extract_save_data(code, name, summon_chunk_n=config.SUMMON_CHUNK_N)
+        print(f"[DEBUG] save_data type: {type(save_data)}")
+        print(f"[DEBUG] save_data content: {save_data}")
+        hero_name = savecode_manager.get_character_name(save_data['hero_type_index'])
+        items_list = decoder.extract_items(code)
+        graduation_status = graduation_checker.get_graduation_status(items_list=items_list,
+                                                                     item_ids=save_data.get('items', []))
+        format_item_fields(items_list)
+        results.append((is_valid, hero_name, save_data['gold'], save_data['lumber'], items_list, graduation_status))
+    return results
+
+
+def analyzed_load(codes, name, analyzer):
+    """SaveAnalyzer로 코드당 1회 파싱"""
+    results = []
+    for analysis in analyzer.analyze_many(codes, name):
+        items_list = analysis.items_list
+        format_item_fields(items_list)
+        results.append((analysis.valid, analysis.hero_name, analysis.gold, analysis.lumber, items_list,
+                        analysis.graduation_status))
+    return results
+
+
+def run_benchmark(code_count: int = 50, rounds: int = 20):
+    """기존 처리와 SaveAnalyzer 처리 비교"""
+    print(f"🧪 /로드 분석 벤치마크 (세이브코드 {code_count}개, {rounds}회 반복)")
+    print("=" * 60)
+
+    config = Config()
+    decoder = SaveCodeDecoder()
+    item_db = ItemDatabase()
+    savecode_manager = SaveCodeManager(summon_chunk_n=config.SUMMON_CHUNK_N)
+    graduation_checker = GraduationChecker()
+    analyzer = SaveAnalyzer(item_db=item_db, savecode_manager=savecode_manager,
+                            graduation_checker=graduation_checker,
+                            save_value_length=config.UDG_SAVE_VALUE_LENGTH,
+                            summon_chunk_n=config.SUMMON_CHUNK_N)
+    codes = [SAMPLE_CODES[i % len(SAMPLE_CODES)] for i in range(code_count)]
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        # 결과가 동일한지 먼저 확인
+        assert legacy_load(codes, PLAYER_NAME, config, decoder, savecode_manager, graduation_checker) == \
+               analyzed_load(codes, PLAYER_NAME, analyzer)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            legacy_load(codes, PLAYER_NAME, config, decoder, savecode_manager, graduation_checker)
+        legacy_ms = (time.perf_counter() - start) / rounds * 1000
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            analyzed_load(codes, PLAYER_NAME, analyzer)
+        analyzed_ms = (time.perf_counter() - start) / rounds * 1000
+
+    print(f"기존 (파싱 3회 + 디버그 출력): {legacy_ms:8.2f}ms / {code_count}개")
+    print(f"SaveAnalyzer (파싱 1회):       {analyzed_ms:8.2f}ms / {code_count}개 "
+          f"({legacy_ms / analyzed_ms:.1f}배)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='/로드 세이브코드 분석 벤치마크')
+    parser.add_argument('--codes', type=int, default=50, help='/로드 한 번에 넣을 세이브코드 수')
+    parser.add_argument('--rounds', type=int, default=20, help='반복 횟수')
+    args = parser.parse_args()
+    run_benchmark(args.codes, args.rounds)
@@ -0,0 +1,210 @@
+"""
+지연 작업 스케줄러 모듈
+임시 메시지 삭제/수정처럼 일정 시간 뒤에 실행할 작업을 최소 힙에 모아
+백그라운드 태스크 하나로 실행 (작업마다 sleep 태스크를 만들지 않음)
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledHandle:
+    """예약된 작업 핸들 (cancel()로 취소)"""
+
+    __slots__ = ('deadline', 'callback', 'name', 'cancelled', 'done', '_scheduler')
+
+    def __init__(self, deadline: float, callback: Callable[[], Awaitable[None]], name: str, scheduler: 'TaskScheduler'):
+        self.deadline = deadline
+        self.callback = callback
+        self.name = name
+        self.cancelled = False
+        self.done = False
+        self._scheduler = scheduler
+
+    def cancel(self) -> bool:
+        """작업 취소 (이미 실행됐거나 취소된 작업이면 False)"""
+        if self.cancelled or self.done:
+            return False
+        self.cancelled = True
+        self._scheduler._on_cancel()
+        return True
+
+
+class TaskScheduler:
+    """단일 백그라운드 태스크로 지연 작업을 실행하는 스케줄러"""
+
+    def __init__(self, max_in_flight: int = 16):
+        """
+        스케줄러 초기화
+
+        Args:
+            max_in_flight: 동시에 실행할 수 있는 최대 작업 수 (초과 시 앞 작업이 끝날 때까지 대기)
+        """
+        self.max_in_flight = max_in_flight
+        self._heap: List[Tuple[float, int, ScheduledHandle]] = []
+        self._seq = itertools.count()
+        # 실행 루프를 처음 시작할 때 생성 (Python 3.9 이하는 생성 시점의 이벤트 루프에 묶임)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._running: set = set()
+        self._closed = False
+
+        # 통계
+        self.pending = 0  # 실행 대기 중인 작업 수 (취소된 작업 제외)
+        self.executed = 0
+        self.failed = 0
+        self.skipped = 0  # 대상 메시지가 이미 없어서 건너뛴 작업
+        self.cancelled = 0
+        self.max_lag = 0.0  # 예정 시각 대비 최대 실행 지연 (초)
+
+    def call_later(self, delay: float, callback: Callable[[], Awaitable[None]], name: str = '') -> ScheduledHandle:
+        """
+        delay초 뒤에 callback() 실행 예약
+
+        Args:
+            delay: 대기 시간 (초)
+            callback: 실행할 비동기 함수 (인자 없음)
+            name: 로그/통계용 작업 이름
+
+        Returns:
+            ScheduledHandle: 취소에 사용할 핸들
+        """
+        return self.call_at(time.monotonic() + delay, callback, name)
+
+    def call_at(self, deadline: float, callback: Callable[[], Awaitable[None]], name: str = '') -> ScheduledHandle:
+        """time.monotonic() 기준 deadline 시각에 callback() 실행 예약"""
+        handle = ScheduledHandle(deadline, callback, name, self)
+        if self._closed:
+            handle.cancelled = True
+            return handle
+
+        # 가장 이른 작업이 바뀌는 경우에만 실행 루프를 깨움
+        if self._wakeup is not None and (not self._heap or deadline < self._heap[0][0]):
+            self._wakeup.set()
+        heapq.heappush(self._heap, (deadline, next(self._seq), handle))
+        self.pending += 1
+        self._ensure_runner()
+        return handle
+
+    def _on_cancel(self):
+        """취소된 작업은 힙에 남겨두고 꺼낼 때 건너뜀"""
+        self.pending -= 1
+        self.cancelled += 1
+
+    def _ensure_runner(self):
+        """실행 루프가 없으면 시작"""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        """가장 이른 작업 시각까지 대기했다가 실행하는 루프"""
+        while not self._closed:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, handle = heapq.heappop(self._heap)
+            if handle.cancelled:
+                continue
+
+            # 동시 실행 한도에 도달하면 빈 자리가 날 때까지 다음 작업을 꺼내지 않음
+            await self._slots.acquire()
+            if handle.cancelled:
+                self._slots.release()  # 기다리는 사이에 취소된 작업
+                continue
+            self._start(handle)
+
+    def _start(self, handle: ScheduledHandle):
+        """작업 실행 태스크 시작 (호출 전에 실행 슬롯을 확보해야 함)"""
+        handle.done = True
+        self.pending -= 1
+        self.max_lag = max(self.max_lag, time.monotonic() - handle.deadline)
+        task = asyncio.get_running_loop().create_task(self._execute(handle))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _execute(self, handle: ScheduledHandle):
+        """작업 1건 실행"""
+        try:
+            await handle.callback()
+            self.executed += 1
+        except discord.NotFound:
+            # 이미 삭제됐거나 만료된 상호작용 응답
+            self.skipped += 1
+        except Exception as e:
+            self.failed += 1
+            logger.warning(f"예약 작업 실행 실패 ({handle.name or handle.callback}): {e}")
+        finally:
+            self._slots.release()
+
+    def delete_response_later(self, interaction: discord.Interaction, delay: float) -> ScheduledHandle:
+        """delay초 뒤에 상호작용 응답 메시지 삭제 예약"""
+        return self.call_later(delay, interaction.delete_original_response, name='delete_response')
+
+    def edit_response_later(self, interaction: discord.Interaction, delay: float, **kwargs) -> ScheduledHandle:
+        """delay초 뒤에 상호작용 응답 메시지 수정 예약"""
+        async def edit():
+            await interaction.edit_original_response(**kwargs)
+        return self.call_later(delay, edit, name='edit_response')
+
+    def get_stats(self) -> dict:
+        """스케줄러 통계 반환"""
+        return {
+            'pending': self.pending,
+            'heap_size': len(self._heap),
+            'in_flight': len(self._running),
+            'executed': self.executed,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'cancelled': self.cancelled,
+            'max_lag': self.max_lag,
+        }
+
+    async def shutdown(self, flush: bool = True, timeout: float = 10.0):
+        """
+        스케줄러 종료
+
+        Args:
+            flush: True면 남은 작업을 예정 시각과 관계없이 즉시 실행 (임시 메시지 정리)
+            timeout: 실행 중인 작업을 기다리는 최대 시간 (초)
+        """
+        self._closed = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if self._runner is not None:
+            self._runner.cancel()
+
+        if flush:
+            while self._heap:
+                _, _, handle = heapq.heappop(self._heap)
+                if not handle.cancelled:
+                    await self._slots.acquire()
+                    self._start(handle)
+        else:
+            self._heap.clear()
+            self.pending = 0
+
+        if self._running:
+            await asyncio.wait(list(self._running), timeout=timeout)
+        logger.info(f"지연 작업 스케줄러 종료: {self.get_stats()}")
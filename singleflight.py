@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+동시 요청 병합 모듈
+같은 키로 동시에 들어온 비동기 작업을 한 번만 실행해 결과를 나눠 갖는 SingleFlight와
+키별로 작업을 하나씩 실행하도록 줄 세우는 크기 제한 락 맵 (비동기/스레드용)
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, List
+
+
+class SingleFlight:
+    """같은 키의 작업이 진행 중이면 새로 실행하지 않고 진행 중인 작업의 결과를 함께 기다림"""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+        # 통계
+        self.executed = 0
+        self.coalesced = 0
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            task.exception()  # 기다리던 쪽이 모두 취소된 경우에도 예외 미확인 경고가 남지 않도록
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키별로 한 번만 func 실행
+
+        먼저 호출한 쪽이 취소되어도 작업은 끝까지 실행되어 함께 기다리던 쪽에 결과가 전달됨
+        """
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._flights[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+
+class LockMapFullError(RuntimeError):
+    """락 맵이 가득 차서 새 키의 락을 만들 수 없음"""
+
+
+class KeyedLockMap:
+    """
+    키별 asyncio.Lock 모음
+    락을 쥐거나 기다리는 작업이 없어지면 바로 제거하므로 크기는 동시에 처리 중인 키 수로 제한됨
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._locks: Dict[Hashable, List] = {}  # {키: [Lock, 쥐고 있거나 기다리는 작업 수]}
+
+        # 통계
+        self.acquired = 0
+        self.contended = 0
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable):
+        """
+        키의 락을 쥐고 실행 (다른 작업이 쥐고 있으면 풀릴 때까지 대기)
+
+        Yields:
+            bool: 다른 작업이 끝나기를 기다렸는지 여부
+
+        Raises:
+            LockMapFullError: 처리 중인 키가 max_entries개를 넘은 경우
+        """
+        entry = self._locks.get(key)
+        if entry is None:
+            if len(self._locks) >= self.max_entries:
+                raise LockMapFullError(f"too many keys in flight ({self.max_entries})")
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        waited = entry[0].locked()
+        if waited:
+            self.contended += 1
+        try:
+            async with entry[0]:
+                self.acquired += 1
+                yield waited
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and self._locks.get(key) is entry:
+                del self._locks[key]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class ThreadKeyedLockMap:
+    """
+    키별 threading.Lock 모음 (동기 쿠폰 처리기용, KeyedLockMap과 같은 방식)
+    락을 쥐거나 기다리는 스레드가 없어지면 바로 제거
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._locks: Dict[Hashable, List] = {}  # {키: [Lock, 쥐고 있거나 기다리는 스레드 수]}
+        self._guard = threading.Lock()
+
+        # 통계
+        self.acquired = 0
+        self.contended = 0
+
+    @contextmanager
+    def hold(self, key: Hashable):
+        """
+        키의 락을 쥐고 실행 (다른 스레드가 쥐고 있으면 풀릴 때까지 대기)
+
+        Yields:
+            bool: 다른 스레드가 끝나기를 기다렸는지 여부
+
+        Raises:
+            LockMapFullError: 처리 중인 키가 max_entries개를 넘은 경우
+        """
+        with self._guard:
+            entry = self._locks.get(key)
+            if entry is None:
+                if len(self._locks) >= self.max_entries:
+                    raise LockMapFullError(f"too many keys in flight ({self.max_entries})")
+                entry = self._locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+
+        waited = not entry[0].acquire(blocking=False)
+        if waited:
+            entry[0].acquire()
+        try:
+            with self._guard:
+                self.acquired += 1
+                if waited:
+                    self.contended += 1
+            yield waited
+        finally:
+            entry[0].release()
+            with self._guard:
+                entry[1] -= 1
+                if entry[1] == 0 and self._locks.get(key) is entry:
+                    del self._locks[key]
+
+    def __len__(self) -> int:
+        return len(self._locks)
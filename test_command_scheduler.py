@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+명령어 공정 스케줄러(CommandScheduler) 테스트
+"""
+
+import asyncio
+import os
+import sys
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from command_scheduler import CommandScheduler, SchedulerRejectedError
+
+
+def make_scheduler(**kwargs) -> CommandScheduler:
+    """요청 속도 제한은 넉넉하게 둔 스케줄러"""
+    options = dict(max_concurrent=1, user_concurrency=1, guild_concurrency=10,
+                   user_rate=100, user_burst=100, guild_rate=100, guild_burst=100,
+                   max_queue=100, max_user_queue=10)
+    options.update(kwargs)
+    return CommandScheduler(**options)
+
+
+async def test_round_robin():
+    """한 사용자가 요청을 몰아 넣어도 다른 사용자와 번갈아 실행"""
+    print("🧪 사용자별 라운드 로빈")
+    scheduler = make_scheduler()
+    order = []
+
+    async def command(user_id, label):
+        ticket = scheduler.submit(user_id, guild_id=1, label=label)
+        await scheduler.wait(ticket)
+        order.append(label)
+        await asyncio.sleep(0.01)
+        scheduler.release(ticket)
+
+    tasks = [asyncio.create_task(command('heavy', f"heavy{i}")) for i in range(4)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(command('light1', "light1")), asyncio.create_task(command('light2', "light2"))]
+    await asyncio.gather(*tasks)
+
+    print(f"   실행 순서: {order}")
+    assert order == ['heavy0', 'heavy1', 'light1', 'light2', 'heavy2', 'heavy3']
+    stats = scheduler.get_stats()
+    assert (stats['started'], stats['running'], stats['queued']) == (6, 0, 0)
+    assert stats['wait_max'] > 0
+    print("✅ 통과\n")
+
+
+async def test_position():
+    """대기 순번은 라운드 로빈 순서 기준"""
+    print("🧪 대기 순번")
+    scheduler = make_scheduler()
+    running = scheduler.submit('a')
+    a1, a2 = scheduler.submit('a'), scheduler.submit('a')
+    b1 = scheduler.submit('b')
+    assert running.started and scheduler.position(running) == 0
+    assert [scheduler.position(t) for t in (a1, b1, a2)] == [1, 2, 3]
+
+    # 관리자 요청은 일반 요청보다 앞
+    admin = scheduler.submit('admin', admin=True)
+    assert scheduler.position(admin) == 1 and scheduler.position(a1) == 2
+
+    scheduler.release(running)
+    assert admin.started and not a1.started
+    print("✅ 통과\n")
+
+
+async def test_concurrency_caps():
+    """사용자/길드별 동시 실행 수 제한"""
+    print("🧪 동시 실행 제한")
+    scheduler = make_scheduler(max_concurrent=10, user_concurrency=1, guild_concurrency=2)
+    a1 = scheduler.submit('a', guild_id=1)
+    b1 = scheduler.submit('b', guild_id=1)
+    c1 = scheduler.submit('c', guild_id=1)
+    a2 = scheduler.submit('a', guild_id=2)
+    d1 = scheduler.submit('d', guild_id=2)
+    assert a1.started and not a2.started  # 사용자 제한 (다른 길드 요청이어도)
+    assert b1.started and not c1.started  # 길드 제한 (길드 1은 2건까지)
+    assert d1.started  # 다른 길드는 영향 없음
+
+    scheduler.release(a1)
+    # 먼저 기다린 c가 시작하고, a의 두 번째 요청도 자기 길드에 자리가 있어 함께 시작
+    assert c1.started and a2.started
+    scheduler.release(b1)
+    assert scheduler.get_stats()['running'] == 3
+    print("✅ 통과\n")
+
+
+async def test_rate_limit_and_queue_limits():
+    """토큰 버킷 요청 속도 제한과 대기열 크기 제한"""
+    print("🧪 요청 속도/대기열 제한")
+    scheduler = make_scheduler(user_rate=0.5, user_burst=2, max_user_queue=1, max_queue=2)
+    t1 = scheduler.submit('a')
+    t2 = scheduler.submit('a')
+    try:
+        scheduler.submit('a')
+        raise AssertionError("대기 요청 수 제한을 넘었는데 받음")
+    except SchedulerRejectedError as e:
+        assert e.reason == 'user_queue'
+
+    scheduler.release(t2)  # 대기 중 취소
+    try:
+        scheduler.submit('a')
+        raise AssertionError("요청 속도 제한을 넘었는데 받음")
+    except SchedulerRejectedError as e:
+        assert e.reason == 'rate_limited' and 0 < e.retry_after <= 2
+        print(f"   {e.user_message}")
+
+    # 관리자는 요청 속도 제한 없음
+    for _ in range(5):
+        scheduler.release(scheduler.submit('admin', admin=True))
+
+    scheduler.submit('b')
+    scheduler.submit('c')
+    try:
+        scheduler.submit('d')
+        raise AssertionError("전체 대기열이 가득 찼는데 받음")
+    except SchedulerRejectedError as e:
+        assert e.reason == 'queue_full'
+
+    stats = scheduler.get_stats()
+    assert stats['rejected'] == {'user_queue': 1, 'rate_limited': 1, 'queue_full': 1}
+    assert stats['cancelled'] == 6  # t2 + 관리자 요청 5건 (a가 실행 중이라 시작 전에 취소됨)
+    scheduler.release(t1)
+    print("✅ 통과\n")
+
+
+async def test_guild_rate_refund():
+    """길드 요청 속도 제한에 걸리면 사용자 토큰은 되돌림"""
+    print("🧪 길드 요청 속도 제한")
+    scheduler = make_scheduler(max_concurrent=10, user_rate=0.1, user_burst=1, guild_rate=0.1, guild_burst=1)
+    scheduler.release(scheduler.submit('a', guild_id=1))
+    try:
+        scheduler.submit('b', guild_id=1)
+        raise AssertionError("길드 요청 속도 제한을 넘었는데 받음")
+    except SchedulerRejectedError as e:
+        assert e.reason == 'guild_rate_limited'
+    scheduler.release(scheduler.submit('b', guild_id=2))  # b의 토큰은 남아 있음
+    print("✅ 통과\n")
+
+
+async def test_cancel_while_waiting():
+    """기다리던 작업이 취소되면 대기열에서 빠지고 다음 요청이 시작"""
+    print("🧪 대기 중 취소")
+    scheduler = make_scheduler()
+    running = scheduler.submit('a')
+    waiting = scheduler.submit('b')
+    task = asyncio.create_task(scheduler.wait(waiting))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    next_ticket = scheduler.submit('c')
+    assert scheduler.position(next_ticket) == 1
+    scheduler.release(running)
+    assert next_ticket.started and scheduler.get_stats()['cancelled'] == 1
+    print("✅ 통과\n")
+
+
+async def main():
+    await test_round_robin()
+    await test_position()
+    await test_concurrency_caps()
+    await test_rate_limit_and_queue_limits()
+    await test_guild_rate_refund()
+    await test_cancel_while_waiting()
+    print("🎉 모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
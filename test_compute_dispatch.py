@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CPU 작업 실행기(ComputeDispatcher) 테스트
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import types
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import compute_dispatch
+from compute_dispatch import ComputeDispatcher, ComputeExpiredError, ComputeQueueFullError
+from save_analysis import SaveAnalyzer
+
+NAME = "SinLime#31230"
+CODE = "111148YYYYVTYYYYV6YYYYVLEM3G111711UJ1111"
+
+
+def busy(seconds: float, value=None):
+    """CPU를 쓰는 작업 흉내"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return value
+
+
+async def measure_loop_lag(work) -> float:
+    """work를 실행하는 동안 이벤트 루프 지연 최대값 (초)"""
+    lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lag = max(lag, time.perf_counter() - start - 0.005)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    try:
+        await work()
+    finally:
+        done = True
+        await task
+    return lag
+
+
+async def test_inline_and_offload():
+    """작은 작업은 이벤트 루프에서, 큰 작업은 실행기에서 실행"""
+    print("🧪 바로 실행/실행기 분배")
+    dispatcher = ComputeDispatcher(max_workers=2, inline_max=1, chunk_size=10)
+    loop_thread = threading.get_ident()
+
+    assert await dispatcher.run(threading.get_ident, size=1) == loop_thread
+    assert await dispatcher.run(threading.get_ident, size=2) != loop_thread
+    assert await dispatcher.run(threading.get_ident) != loop_thread
+
+    # 덩어리로 나눠 실행해도 순서대로 이어 붙임
+    result = await dispatcher.map_chunks(lambda chunk, offset: [x + offset for x in chunk], list(range(35)), 100)
+    assert result == [x + 100 for x in range(35)]
+
+    stats = dispatcher.get_stats()
+    assert (stats['inline'], stats['offloaded'], stats['pending']) == (1, 6, 0)
+    await dispatcher.shutdown(wait=True)
+    print("✅ 통과\n")
+
+
+async def test_loop_not_blocked():
+    """세이브코드 일괄 분석 중에도 이벤트 루프가 멈추지 않음"""
+    print("🧪 이벤트 루프 지연")
+    analyzer = SaveAnalyzer()
+    codes = [CODE] * 2000
+    dispatcher = ComputeDispatcher(max_workers=1, inline_max=1, chunk_size=25)
+
+    inline_lag = await measure_loop_lag(lambda: asyncio.sleep(0, analyzer.analyze_many(codes, NAME)))
+    results = []
+
+    async def offloaded():
+        results.extend(await dispatcher.map_chunks(analyzer.analyze_many, codes, NAME))
+
+    offload_lag = await measure_loop_lag(offloaded)
+    print(f"   바로 실행 최대 지연 {inline_lag * 1000:.1f}ms → 실행기 {offload_lag * 1000:.1f}ms")
+    assert len(results) == len(codes) and all(result.valid for result in results)
+    assert offload_lag < inline_lag
+    await dispatcher.shutdown(wait=True)
+    print("✅ 통과\n")
+
+
+async def test_queue_limit():
+    """대기 작업이 max_queue개면 새 작업은 바로 거절"""
+    print("🧪 대기열 제한")
+    dispatcher = ComputeDispatcher(max_workers=1, max_queue=2)
+    jobs = [asyncio.ensure_future(dispatcher.run(busy, 0.1, i)) for i in range(2)]
+    await asyncio.sleep(0)
+    try:
+        await dispatcher.run(busy, 0.1)
+        raise AssertionError("대기열이 가득 찼는데 작업을 받음")
+    except ComputeQueueFullError:
+        pass
+    assert await asyncio.gather(*jobs) == [0, 1]
+    await asyncio.sleep(0)
+    assert dispatcher.get_stats()['rejected'] == 1 and dispatcher.get_stats()['pending'] == 0
+    await dispatcher.shutdown(wait=True)
+    print("✅ 통과\n")
+
+
+async def test_deadline_cancels_remaining_chunks():
+    """기한이 지나면 남은 덩어리는 실행하지 않음"""
+    print("🧪 응답 기한 취소")
+    dispatcher = ComputeDispatcher(max_workers=1, inline_max=0, chunk_size=1)
+    executed = []
+
+    def slow_chunk(chunk):
+        executed.extend(chunk)
+        return [busy(0.05, x) for x in chunk]
+
+    loop = asyncio.get_running_loop()
+    try:
+        await dispatcher.map_chunks(slow_chunk, list(range(20)), deadline=loop.time() + 0.12)
+        raise AssertionError("기한이 지났는데 완료됨")
+    except ComputeExpiredError:
+        pass
+    await asyncio.sleep(0.1)
+    print(f"   20개 중 {len(executed)}개만 실행")
+    assert len(executed) <= 4
+    assert dispatcher.get_stats()['expired'] == 1 and dispatcher.get_stats()['pending'] == 0
+
+    # 이미 지난 기한이면 실행기로 보내지 않음
+    try:
+        await dispatcher.run(busy, 0.01, deadline=loop.time() - 1)
+        raise AssertionError("기한이 지난 작업을 실행함")
+    except ComputeExpiredError:
+        pass
+    await dispatcher.shutdown(wait=True)
+    print("✅ 통과\n")
+
+
+async def test_process_executor():
+    """프로세스 실행기에서도 분석기 메서드를 그대로 실행"""
+    print("🧪 프로세스 실행기")
+    analyzer = SaveAnalyzer()
+    dispatcher = ComputeDispatcher(executor='process', max_workers=1, inline_max=0)
+    results = await dispatcher.map_chunks(analyzer.analyze_many, [CODE] * 30, NAME)
+    assert [r.hero_name for r in results] == [analyzer.analyze(CODE, NAME).hero_name] * 30
+    await dispatcher.shutdown(wait=True)
+    print("✅ 통과\n")
+
+
+async def test_shutdown_cancels_queued_jobs():
+    """종료 시 아직 시작하지 않은 작업은 취소 (cancel_futures가 없는 Python 3.8 경로 포함)"""
+    print("🧪 종료 시 대기 작업 취소")
+    for version_info in (sys.version_info, (3, 8, 0)):
+        compute_dispatch.sys = types.SimpleNamespace(version_info=version_info)
+        try:
+            dispatcher = ComputeDispatcher(max_workers=1)
+            jobs = [asyncio.ensure_future(dispatcher.run(busy, 0.2, i)) for i in range(3)]
+            await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            await dispatcher.shutdown(wait=True)
+            elapsed = time.perf_counter() - start
+            results = await asyncio.gather(*jobs, return_exceptions=True)
+        finally:
+            compute_dispatch.sys = sys
+        print(f"   Python {version_info[0]}.{version_info[1]} 경로: 종료 {elapsed:.2f}초, "
+              f"결과 {[r if isinstance(r, int) else type(r).__name__ for r in results]}")
+        assert results[0] == 0
+        assert all(isinstance(r, asyncio.CancelledError) for r in results[1:])
+        assert elapsed < 0.35
+    print("✅ 통과\n")
+
+
+async def main():
+    await test_inline_and_offload()
+    await test_loop_not_blocked()
+    await test_queue_limit()
+    await test_deadline_cancels_remaining_chunks()
+    await test_process_executor()
+    await test_shutdown_cancels_queued_jobs()
+    print("🎉 모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    os.environ.setdefault('DISCORD_BOT_TOKEN', 'test-token')
+    asyncio.run(main())
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 쿠폰 처리기 테스트 (로컬 대역 쿠폰 서버 사용)
+"""
+
+import asyncio
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 세이브코드 수정기가 Config를 읽으므로 .env가 없는 환경에서도 실행되도록 설정
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test-token')
+
+from coupon_async import AsyncCouponProcessor
+from coupon_bulk import issue_coupons
+from coupon_cache import CouponCheckCache
+from coupon_fake_server import FakeCouponServer
+from coupon_integrated import CouponProcessor
+from coupon_outbox import CouponOutbox
+from coupon_resilience import CouponResilience
+
+MASIN_SAVECODE = 'MasinSaveV2_홍길동_37_50000_15_200_100_150_264_266_268_270_272_274'
+
+
+async def start_server(**kwargs) -> FakeCouponServer:
+    """테스트용 쿠폰(LUMBER1, GOLD1)이 등록된 대역 서버 시작"""
+    server = FakeCouponServer(**kwargs)
+    server.add_coupon('LUMBER1', lumber=1000)
+    server.add_coupon('GOLD1', gold=500)
+    await server.start()
+    return server
+
+
+async def test_workflow():
+    """체크 -> 세이브코드 수정 -> 사용 처리, 생성, 재사용 거부 테스트"""
+    print("\n🧪 쿠폰 처리 워크플로우 테스트")
+    print("-" * 40)
+
+    server = await start_server()
+    processor = AsyncCouponProcessor(base_url=server.base_url)
+    try:
+        result = await processor.process_coupon_with_savecode('LUMBER1', MASIN_SAVECODE)
+        print(f"   결과: success={result.success}, 나무 +{result.lumber_gained}")
+        assert result.success and result.error_message == ""
+        assert processor.modifier.parse_masin_savecode(result.modified_savecode)['lumber'] == 51000
+
+        result = await processor.process_coupon_with_savecode('LUMBER1', MASIN_SAVECODE)
+        assert not result.success  # 이미 사용된 쿠폰
+
+        result = await processor.process_coupon_with_savecode('GOLD1', MASIN_SAVECODE)
+        assert not result.success and "골드" in result.error_message
+
+        success, response = await processor.create_coupon(100, 200)
+        assert success and response.is_success and response.coupon_code in server.coupons
+
+        # 요청마다 새 연결을 만들지 않고 같은 연결을 재사용
+        print(f"   서버가 본 클라이언트 연결 수: {len(server.peers)}")
+        assert len(server.peers) == 1
+    finally:
+        await processor.close()
+        await server.stop()
+    print("   ✅ 통과")
+
+
+async def test_errors():
+    """HTTP 오류, 시간 초과, 연결 실패 시 실패 응답으로 변환되는지 테스트"""
+    print("\n🧪 오류 처리 테스트")
+    print("-" * 40)
+
+    server = await start_server(latency=0.5)
+    processor = AsyncCouponProcessor(base_url=server.base_url, timeout=0.2)
+    try:
+        success, response = await processor.check_coupon('LUMBER1')
+        print(f"   시간 초과: {response.error_message}")
+        assert not success and "시간 초과" in response.error_message
+
+        server.latency = 0
+        server.fail_next('check', 10, 500)
+        success, response = await processor.check_coupon('LUMBER1')
+        print(f"   HTTP 오류: {response.error_message}")
+        assert not success and "500" in response.error_message
+    finally:
+        await processor.close()
+        await server.stop()
+
+    processor = AsyncCouponProcessor(base_url=server.base_url)
+    try:
+        success, response = await processor.create_coupon(1, 1)
+        print(f"   연결 실패: {response.error_message}")
+        assert not success and "연결" in response.error_message
+    finally:
+        await processor.close()
+    print("   ✅ 통과")
+
+
+async def test_negative_cache():
+    """사용할 수 없는 쿠폰 결과만 캐시하고, 사용 시 '이미 사용됨'으로 바뀌고 생성 시 무효화되는지 테스트"""
+    print("\n🧪 쿠폰 체크 음성 캐시 테스트")
+    print("-" * 40)
+
+    server = await start_server()
+    cache = CouponCheckCache(negative_ttl=30)
+    processor = AsyncCouponProcessor(base_url=server.base_url, check_cache=cache)
+    try:
+        # 없는 쿠폰을 여러 번 입력해도 서버 체크는 한 번
+        for _ in range(5):
+            success, response = await processor.check_coupon('NOPE')
+            assert success and not response.is_usable
+        assert server.requests['check'] == 1
+
+        # 사용 가능한 쿠폰은 캐시하지 않음
+        await processor.check_coupon('LUMBER1')
+        await processor.check_coupon('LUMBER1')
+        assert server.requests['check'] == 3
+
+        # 사용 성공 후에는 서버에 다시 묻지 않고 캐시된 '이미 사용됨' 결과를 받음
+        result = await processor.process_coupon_with_savecode('LUMBER1', MASIN_SAVECODE)
+        assert result.success
+        success, response = await processor.check_coupon('LUMBER1')
+        assert not response.is_usable and server.requests['check'] == 4
+
+        # 생성된 쿠폰 코드에 남아 있던 '없는 쿠폰' 결과는 제거됨
+        await processor.check_coupon('NEW1')
+        success, response = await processor.create_coupon(10, 0)
+        assert response.coupon_code == 'NEW1'
+        success, response = await processor.check_coupon('NEW1')
+        assert response.is_usable
+
+        stats = cache.get_stats()
+        print(f"   캐시 통계: {stats}")
+        assert stats['hits'] == 5 and stats['invalidations'] == 1
+    finally:
+        await processor.close()
+        await server.stop()
+    print("   ✅ 통과")
+
+
+async def test_concurrent_redemption():
+    """공개된 쿠폰 하나에 동시에 몰린 요청 중 한 명만 성공하고 서버 체크는 병합되는지 테스트"""
+    print("\n🧪 같은 쿠폰 동시 사용 테스트")
+    print("-" * 40)
+
+    server = await start_server(latency=0.05)
+    processor = AsyncCouponProcessor(base_url=server.base_url, check_cache=CouponCheckCache(negative_ttl=30))
+    try:
+        results = await asyncio.gather(*(
+            processor.process_coupon_with_savecode('LUMBER1', MASIN_SAVECODE) for _ in range(30)
+        ))
+        winners = [result for result in results if result.success]
+        stats = processor.get_dedup_stats()
+        print(f"   30명 중 성공 {len(winners)}명, 서버 요청 {dict(server.requests)}, 병합 통계 {stats}")
+        assert len(winners) == 1
+        assert all("이미 사용된" in result.error_message for result in results if not result.success)
+        assert server.requests['check'] == 1 and server.requests['use'] == 1
+        assert stats['checks_coalesced'] == 29 and stats['redeeming_codes'] == 0
+
+        # 서버가 사용을 거절하면 수정한 세이브코드를 돌려주지 않음 (다른 봇/경로에서 먼저 사용된 경우)
+        server.add_coupon('LUMBER2', lumber=10)
+        original_check = processor.check_coupon
+
+        async def check_then_used_elsewhere(coupon_code):
+            result = await original_check(coupon_code)
+            server.used.add(coupon_code)
+            return result
+
+        processor.check_coupon = check_then_used_elsewhere
+        result = await processor.process_coupon_with_savecode('LUMBER2', MASIN_SAVECODE)
+        assert not result.success and result.modified_savecode == ""
+    finally:
+        await processor.close()
+        await server.stop()
+    print("   ✅ 통과")
+
+
+async def test_redemption_pending_after_use_failure():
+    """사용 처리가 실패해 세이브코드만 돌려준 쿠폰을 동시에 들어온 다른 요청이 다시 받지 못하는지 테스트"""
+    print("\n🧪 사용 처리 지연 쿠폰 중복 사용 방지 테스트")
+    print("-" * 40)
+
+    server = await start_server(latency=0.05)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        outbox = CouponOutbox(os.path.join(temp_dir, 'outbox.db'), base_delay=0.05)
+        for use_outbox in (True, False):
+            code = 'LUMBER1' if use_outbox else 'LUMBER3'
+            server.add_coupon(code, lumber=1000)
+            processor = AsyncCouponProcessor(base_url=server.base_url,
+                                             outbox=outbox if use_outbox else None,
+                                             resilience=CouponResilience(max_retries=0))
+            try:
+                # 첫 사용 요청은 500, 같은 코드의 두 번째 요청은 그 사이 락을 기다림
+                server.fail_next('use', 1, 500)
+                before = server.requests['use']
+                results = await asyncio.gather(*(
+                    processor.process_coupon_with_savecode(code, MASIN_SAVECODE) for _ in range(2)
+                ))
+                winners = [result for result in results if result.success]
+                print(f"   아웃박스 {'사용' if use_outbox else '미사용'}: 성공 {len(winners)}명, "
+                      f"거절 메시지 {[result.error_message for result in results if not result.success]}")
+                assert len(winners) == 1 and winners[0].error_message
+                assert all("대기 중" in result.error_message for result in results if not result.success)
+                assert server.requests['use'] == before + 1
+
+                # 이후 요청도 서버에 다시 묻지 않고 거절
+                checks = server.requests['check']
+                result = await processor.process_coupon_with_savecode(code, MASIN_SAVECODE)
+                assert not result.success and server.requests['check'] == checks
+                assert processor.get_dedup_stats()['pending_redemptions'] == 1
+
+                if use_outbox:
+                    # 아웃박스 재시도로 사용 처리가 확인되면 '이미 사용됨'으로 바뀜
+                    await asyncio.sleep(0.1)
+                    assert await processor.retry_outbox() == 1
+                    result = await processor.process_coupon_with_savecode(code, MASIN_SAVECODE)
+                    assert not result.success and "대기 중" not in result.error_message
+                    assert processor.get_dedup_stats()['pending_redemptions'] == 0
+            finally:
+                await processor.close()
+        outbox.close()
+    await server.stop()
+    print("   ✅ 통과")
+
+
+async def test_outbox_retry():
+    """쿠폰 사용 처리 실패 시 아웃박스에 남았다가 같은 키로 재시도되는지 테스트"""
+    print("\n🧪 쿠폰 사용 아웃박스 재시도 테스트")
+    print("-" * 40)
+
+    server = await start_server()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'outbox.db')
+        outbox = CouponOutbox(path, base_delay=0.05, max_delay=0.2)
+        # 요청 단위 재시도가 켜져 있어도 사용 요청은 아웃박스만 재시도
+        processor = AsyncCouponProcessor(base_url=server.base_url, outbox=outbox)
+        worker = asyncio.create_task(processor.run_outbox_worker())
+        try:
+            # 바로 성공하면 아웃박스에 남지 않음
+            server.add_coupon('LUMBER2', lumber=10)
+            result = await processor.process_coupon_with_savecode('LUMBER2', MASIN_SAVECODE)
+            assert result.success and result.error_message == ""
+            assert outbox.get_stats()['depth'] == 0
+
+            # 사용 처리가 실패해도 세이브코드는 돌려주고, 서버가 확인할 때까지 재시도
+            server.fail_next('use', 3)
+            before = server.requests['use']
+            result = await processor.process_coupon_with_savecode('LUMBER1', MASIN_SAVECODE)
+            assert result.success and "다시 시도" in result.error_message
+            assert outbox.get_stats()['depth'] == 1 and server.requests['use'] == before + 1
+
+            for _ in range(40):
+                if 'LUMBER1' in server.used:
+                    break
+                await asyncio.sleep(0.05)
+            stats = outbox.get_stats()
+            print(f"   아웃박스 통계: {stats}")
+            assert 'LUMBER1' in server.used and stats['depth'] == 0 and stats['failures'] == 3
+
+            # 재시도 요청은 모두 처음과 같은 키를 사용
+            retry_keys = server.idempotency_keys[1:]
+            assert len(retry_keys) == 4 and len(set(retry_keys)) == 1 and retry_keys[0]
+        finally:
+            worker.cancel()
+            await processor.close()
+            outbox.close()
+
+        # 봇이 재시작돼도 남은 호출은 DB에서 이어서 재시도
+        outbox = CouponOutbox(path, base_delay=0.05)
+        outbox.add('GOLD1')
+        outbox.close()
+        outbox = CouponOutbox(path, base_delay=0.05)
+        processor = AsyncCouponProcessor(base_url=server.base_url, outbox=outbox)
+        try:
+            await asyncio.sleep(0.1)
+            assert await processor.retry_outbox() == 1
+            assert outbox.get_stats()['depth'] == 0
+        finally:
+            await processor.close()
+            outbox.close()
+    await server.stop()
+    print("   ✅ 통과")
+
+
+def test_sync_processor_outbox():
+    """동기 쿠폰 처리기도 사용 처리를 아웃박스에 기록하고, 거절된 쿠폰의 세이브코드는 돌려주지 않는지 테스트"""
+    print("\n🧪 동기 쿠폰 처리기 아웃박스 테스트")
+    print("-" * 40)
+
+    server = FakeCouponServer(latency=0.05)
+    server.add_coupon('LUMBER1', lumber=1000)
+    server.add_coupon('LUMBER3', lumber=1000)
+    server.start_in_thread()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        outbox = CouponOutbox(os.path.join(temp_dir, 'outbox.db'), base_delay=0.05)
+        processor = CouponProcessor(base_url=server.base_url, outbox=outbox,
+                                    resilience=CouponResilience(max_retries=0))
+        try:
+            # 첫 사용 요청은 500: 세이브코드는 한 명만 받고, 호출은 아웃박스에 남음
+            server.fail_next('use', 1, 500)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = list(pool.map(
+                    lambda _: processor.process_coupon_with_savecode('LUMBER1', MASIN_SAVECODE), range(2)
+                ))
+            winners = [result for result in results if result.success]
+            assert len(winners) == 1 and "다시 시도" in winners[0].error_message
+            assert all("대기 중" in result.error_message for result in results if not result.success)
+            assert server.requests['use'] == 1 and outbox.get_stats()['depth'] == 1
+
+            time.sleep(0.1)
+            assert processor.retry_outbox() == 1
+            assert 'LUMBER1' in server.used and outbox.get_stats()['depth'] == 0
+            result = processor.process_coupon_with_savecode('LUMBER1', MASIN_SAVECODE)
+            assert not result.success and "대기 중" not in result.error_message
+
+            # 체크와 사용 사이에 다른 곳에서 사용된 쿠폰: 서버가 거절하면 세이브코드를 돌려주지 않음
+            check_coupon = processor.check_coupon
+
+            def check_then_used_elsewhere(coupon_code):
+                response = check_coupon(coupon_code)
+                server.used.add(coupon_code)
+                return response
+
+            processor.check_coupon = check_then_used_elsewhere
+            result = processor.process_coupon_with_savecode('LUMBER3', MASIN_SAVECODE)
+            print(f"   거절된 쿠폰 결과: 성공 {result.success}, 메시지 '{result.error_message}'")
+            assert not result.success and result.modified_savecode == ""
+            stats = outbox.get_stats()
+            assert stats['depth'] == 0 and stats['rejected'] == 1
+        finally:
+            processor.close()
+            outbox.close()
+    server.stop_thread()
+    print("   ✅ 통과")
+
+
+async def test_bulk_issue():
+    """동시 요청 수 제한, 실패 재시도/확인 필요 기록, CSV 기록, 진행 상황 알림 테스트"""
+    print("\n🧪 쿠폰 대량 발급 테스트")
+    print("-" * 40)
+
+    server = await start_server(latency=0.02)
+    processor = AsyncCouponProcessor(base_url=server.base_url)
+    try:
+        # 서버가 거절한 요청(4xx)은 생성되지 않았으므로 재시도
+        server.fail_next('create', 3, 429)
+        progress = []
+
+        async def on_progress(result):
+            progress.append(result.done)
+
+        csv_buffer = io.StringIO()
+        result = await issue_coupons(processor, 20, 100, 50, concurrency=4, rate=200,
+                                     max_retries=2, retry_delay=0.01,
+                                     csv_file=csv_buffer, on_progress=on_progress)
+        print(f"   성공 {result.created}장, 실패 {result.failed}장, 최대 동시 요청 {server.max_in_flight}건")
+        assert result.created == 20 and result.failed == 0
+        assert len(set(result.coupon_codes)) == 20
+        assert server.max_in_flight <= 4
+        assert progress == list(range(1, 21))
+
+        rows = list(csv.reader(io.StringIO(csv_buffer.getvalue())))
+        assert len(rows) == 21 and all(row[4] == '성공' for row in rows[1:])
+        assert sorted(int(row[0]) for row in rows[1:]) == list(range(1, 21))
+
+        # 재시도 횟수를 넘긴 항목은 실패로 기록
+        server.fail_next('create', 10, 429)
+        csv_buffer = io.StringIO()
+        result = await issue_coupons(processor, 2, 100, 50, concurrency=1, rate=200,
+                                     max_retries=1, retry_delay=0.01, csv_file=csv_buffer)
+        assert result.created == 0 and result.failed == 2 and "429" in result.errors[0]
+        rows = list(csv.reader(io.StringIO(csv_buffer.getvalue())))
+        assert [row[4] for row in rows[1:]] == ['실패', '실패']
+
+        # 5xx는 서버가 생성했는지 알 수 없으므로 다시 보내지 않고 확인 필요로 기록
+        server.fail_next('create', 2, 500)
+        before = len(server.coupons)
+        csv_buffer = io.StringIO()
+        result = await issue_coupons(processor, 3, 100, 50, concurrency=1, rate=200,
+                                     max_retries=3, retry_delay=0.01, csv_file=csv_buffer)
+        print(f"   5xx: 성공 {result.created}장, 확인 필요 {result.unconfirmed}장")
+        assert result.created == 1 and result.unconfirmed == 2 and result.failed == 0
+        assert result.done == 3 and len(server.coupons) == before + 1
+        rows = list(csv.reader(io.StringIO(csv_buffer.getvalue())))
+        assert sorted(row[4] for row in rows[1:]) == ['성공', '확인 필요', '확인 필요']
+        assert all(row[5] == '1' for row in rows[1:])  # 확인 필요 항목도 한 번만 요청
+    finally:
+        await processor.close()
+        await server.stop()
+    print("   ✅ 통과")
+
+
+async def test_resilience():
+    """재시도, 서킷 브레이커, 동시 요청 제한(부하 차단), 지연 시간 통계 테스트"""
+    print("\n🧪 쿠폰 API 장애 대응 테스트")
+    print("-" * 40)
+
+    server = await start_server()
+    resilience = CouponResilience(failure_threshold=3, reset_timeout=0.3, max_retries=1,
+                                  retry_base_delay=0.01, max_in_flight=2)
+    processor = AsyncCouponProcessor(base_url=server.base_url, resilience=resilience)
+    try:
+        # 일시적인 5xx는 체크(GET)만 재시도해서 성공
+        server.fail_next('check', 1, 503)
+        success, response = await processor.check_coupon('LUMBER1')
+        assert success and response.is_usable
+        assert resilience.endpoints['쿠폰 체크'].retries == 1
+
+        # 쿠폰 생성(POST)은 같은 요청을 다시 보내지 않음
+        server.fail_next('create', 1)
+        success, response = await processor.create_coupon(1, 1)
+        assert not success and resilience.endpoints['쿠폰 생성'].retries == 0
+        resilience.breaker.record_success()
+
+        # 서버가 계속 실패하면 회로가 열리고 이후 요청은 서버로 보내지 않고 바로 실패
+        server.fail_next('check', 100, 503)
+        for _ in range(2):
+            await processor.check_coupon('LUMBER1')
+        assert resilience.breaker.state == 'open'
+        before = server.requests['check']
+        success, response = await processor.check_coupon('LUMBER1')
+        print(f"   회로 열림: {response.error_message}")
+        assert not success and server.requests['check'] == before
+        assert resilience.rejected['circuit_open'] == 1
+
+        # 시간이 지나면 시험 요청 한 건으로 복구 확인
+        server.fail_next('check', 0)
+        await asyncio.sleep(0.35)
+        success, response = await processor.check_coupon('LUMBER1')
+        assert success and resilience.breaker.state == 'closed'
+
+        # 서버가 느리면 동시 요청 수를 넘는 요청은 기다리지 않고 바로 거절
+        server.latency = 0.3
+        start = time.perf_counter()
+        results = await asyncio.gather(*(processor.check_coupon('LUMBER1') for _ in range(5)))
+        elapsed = time.perf_counter() - start
+        shed = [response for success, response in results if not success]
+        print(f"   동시 5건 중 {len(shed)}건 바로 거절 ({elapsed:.2f}초)")
+        assert len(shed) == 3 and all("몰려" in response.error_message for response in shed)
+        assert resilience.rejected['shed'] == 3
+
+        stats = resilience.get_stats()['endpoints']['쿠폰 체크']
+        print(f"   쿠폰 체크 통계: {stats}")
+        assert stats['errors']['http_5xx'] >= 3 and stats['p99_ms'] >= 250
+    finally:
+        await processor.close()
+        await server.stop()
+    print("   ✅ 통과")
+
+
+async def test_event_loop_not_blocked():
+    """느린 쿠폰 서버를 기다리는 동안 다른 작업이 계속 실행되는지 테스트"""
+    print("\n🧪 이벤트 루프 비차단 테스트")
+    print("-" * 40)
+
+    server = await start_server(latency=0.5)
+    processor = AsyncCouponProcessor(base_url=server.base_url)
+    try:
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        start = time.perf_counter()
+        results = await asyncio.gather(*(processor.check_coupon('LUMBER1') for _ in range(5)))
+        elapsed = time.perf_counter() - start
+        heartbeat_task.cancel()
+
+        print(f"   느린 요청 5건 동시 처리: {elapsed:.2f}초, 그동안 다른 작업 {ticks}회 실행")
+        assert all(success for success, _ in results)
+        assert elapsed < 1.5 and ticks >= 5
+    finally:
+        await processor.close()
+        await server.stop()
+    print("   ✅ 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 비동기 쿠폰 처리기 테스트 시작")
+    print("=" * 50)
+
+    asyncio.run(test_workflow())
+    asyncio.run(test_errors())
+    asyncio.run(test_negative_cache())
+    asyncio.run(test_concurrent_redemption())
+    asyncio.run(test_redemption_pending_after_use_failure())
+    asyncio.run(test_outbox_retry())
+    test_sync_processor_outbox()
+    asyncio.run(test_bulk_issue())
+    asyncio.run(test_resilience())
+    asyncio.run(test_event_loop_not_blocked())
+
+    print("\n" + "=" * 50)
+    print("🎉 모든 테스트 완료!")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+봇 지표(metrics) 테스트
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import aiohttp
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import BotMetrics, LoopLagMonitor, MetricsRegistry, MetricsServer
+from save_analysis import SaveAnalyzer
+
+NAME = "SinLime#31230"
+CODE = "111148YYYYVTYYYYV6YYYYVLEM3G111711UJ1111"
+
+
+class FakeInteraction:
+    def __init__(self, interaction_id: int):
+        self.id = interaction_id
+
+
+def test_text_format():
+    """Prometheus 텍스트 형식 (누적 구간, 라벨 이스케이프, 수집기)"""
+    print("🧪 텍스트 형식")
+    registry = MetricsRegistry()
+    counter = registry.counter('test_total', '테스트 카운터', ('kind',))
+    histogram = registry.histogram('test_seconds', '테스트 히스토그램', ('command',), buckets=(0.1, 1.0))
+    registry.gauge('test_idle', '라벨 없는 게이지')
+
+    counter.inc(kind='a"b\\c')
+    counter.inc(2, kind='a"b\\c')
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, command='로드')
+    assert registry.counter('test_total', '다시 등록', ('kind',)) is counter
+
+    def broken_collector():
+        raise RuntimeError("수집 실패")
+
+    registry.add_collector(broken_collector)
+    registry.add_collector(lambda: [('test_queue', 'gauge', '대기열', [({'state': 'queued'}, 3)])])
+
+    text = registry.render()
+    print(text)
+    lines = text.splitlines()
+    assert 'test_total{kind="a\\"b\\\\c"} 3' in lines
+    assert 'test_seconds_bucket{command="로드",le="0.1"} 2' in lines
+    assert 'test_seconds_bucket{command="로드",le="1"} 3' in lines
+    assert 'test_seconds_bucket{command="로드",le="+Inf"} 4' in lines
+    assert 'test_seconds_count{command="로드"} 4' in lines
+    assert 'test_seconds_sum{command="로드"} 3.65' in lines
+    assert 'test_idle 0' in lines and '# TYPE test_seconds histogram' in lines
+    assert 'test_queue{state="queued"} 3' in lines
+    try:
+        counter.inc(other='x')
+        raise AssertionError("라벨이 다른데 기록됨")
+    except (KeyError, ValueError):
+        pass
+    print("✅ 통과\n")
+
+
+async def test_interaction_timing():
+    """상호작용 콜백 처리 시간과 응답 API 호출 시점의 첫 응답 시간"""
+    print("🧪 상호작용 응답 시간")
+    metrics = BotMetrics(MetricsRegistry())
+
+    async def callback(interaction):
+        await asyncio.sleep(0.02)
+        # 첫 응답 (defer 등) API 호출이 끝난 시점, 이후 호출은 무시
+        metrics._on_request_end(f"/api/v10/interactions/{interaction.id}/token-abc/callback")
+        metrics._on_request_end(f"/api/v10/interactions/{interaction.id}/token-abc/callback")
+        metrics._on_request_end("/api/v10/webhooks/1/token-abc")
+        await asyncio.sleep(0.03)
+
+    async def failing(interaction):
+        raise RuntimeError("처리 실패")
+
+    timed = metrics.wrap_interaction('RaidControlView.join', callback)
+    await timed(FakeInteraction(1))
+    try:
+        await metrics.wrap_interaction('RaidControlView.leave', failing)(FakeInteraction(2))
+    except RuntimeError:
+        pass
+
+    first = metrics.interaction_first_response._values[('RaidControlView.join',)]
+    total = metrics.interaction_duration._values[('RaidControlView.join', 'ok')]
+    assert sum(first[0]) == 1 and 0.015 < first[1] < total[1]
+    assert total[1] >= 0.05
+    assert sum(metrics.interaction_duration._values[('RaidControlView.leave', 'error')][0]) == 1
+    assert not metrics._interactions  # 처리가 끝난 상호작용은 남지 않음
+
+    # 명령어: 받은 시각 기준 첫 응답/전체 시간
+    received = time.perf_counter() - 0.2
+    metrics.observe_command('로드', received, received + 0.05, 'ok')
+    first_cmd = metrics.command_first_response._values[('로드',)]
+    assert abs(first_cmd[1] - 0.05) < 1e-9
+    assert metrics.command_duration._values[('로드', 'ok')][1] >= 0.2
+    print("✅ 통과\n")
+
+
+def test_savecode_counters():
+    """세이브코드 해석/체크섬 실패 집계"""
+    print("🧪 세이브코드 실패 카운터")
+    metrics = BotMetrics(MetricsRegistry())
+    analyzer = SaveAnalyzer()
+    metrics.record_savecode_results([
+        analyzer.analyze(CODE, NAME),
+        analyzer.analyze(CODE, "Other#1234"),
+        analyzer.analyze("!!", NAME),
+    ])
+    assert metrics.savecode_checksum_failures._values[()] == 1
+    assert metrics.savecode_decode_failures._values[()] == 1
+    print("✅ 통과\n")
+
+
+async def test_server_and_loop_lag():
+    """/metrics 응답과 이벤트 루프 지연 측정"""
+    print("🧪 지표 서버/이벤트 루프 지연")
+    metrics = BotMetrics(MetricsRegistry())
+    server = MetricsServer(metrics.registry, port=0)
+    monitor = LoopLagMonitor(metrics, interval=0.01)
+    await server.start()
+    monitor.start()
+    try:
+        await asyncio.sleep(0.03)
+        time.sleep(0.1)  # 이벤트 루프를 막는 작업
+        await asyncio.sleep(0.03)
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://127.0.0.1:{server.port}/metrics") as response:
+                assert response.status == 200
+                assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+                body = await response.text()
+            async with session.get(f"http://127.0.0.1:{server.port}/other") as response:
+                assert response.status == 404
+    finally:
+        await monitor.stop()
+        await server.stop()
+
+    lag = metrics.loop_lag._values[()]
+    print(f"   지연 합계 {lag[1]:.3f}초 (측정 {sum(lag[0])}회)")
+    assert lag[1] >= 0.08
+    assert 'savebot_event_loop_lag_seconds_bucket{le="+Inf"}' in body
+    assert metrics.registry.scrapes == 1
+    print("✅ 통과\n")
+
+
+def test_overhead():
+    """수집 요청이 없을 때의 기록 비용"""
+    print("🧪 기록 비용")
+    metrics = BotMetrics(MetricsRegistry())
+    n = 100000
+    start = time.perf_counter()
+    for _ in range(n):
+        metrics.command_duration.observe(0.123, command='로드', outcome='ok')
+    per_call = (time.perf_counter() - start) / n
+    print(f"   히스토그램 기록 1회 {per_call * 1e6:.2f}µs")
+    assert per_call < 20e-6
+    print("✅ 통과\n")
+
+
+async def main():
+    test_text_format()
+    await test_interaction_timing()
+    test_savecode_counters()
+    await test_server_and_loop_lag()
+    test_overhead()
+    print("🎉 모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    os.environ.setdefault('DISCORD_BOT_TOKEN', 'test-token')
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+레이드 자동 매칭 테스트
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from raid_matchmaker import RaidMatchmaker
+from raid_system import RaidWaitingSystem
+
+
+def test_fifo_grouping():
+    """선착순으로 파티 인원만큼 묶이는지 테스트"""
+    print("\n🧪 선착순 파티 구성 테스트")
+    print("-" * 40)
+
+    raid_system = RaidWaitingSystem()
+    matchmaker = RaidMatchmaker(raid_system, party_size=3)
+
+    for user_id in range(1, 8):
+        raid_system.add_to_raid("🌋 델모크", user_id)
+
+    results = matchmaker.run_pass()
+    print(f"   구성된 파티: {results}")
+    assert [r.member_ids for r in results] == [[1, 2, 3], [4, 5, 6]]
+    assert results[0].party.leader_id == 1 and results[0].party.is_full()
+    assert raid_system.get_waiting_queue("🌋 델모크") == [7]
+    print("   ✅ 통과")
+
+
+def test_no_double_booking():
+    """여러 레이드에 대기 중인 유저가 한 파티에만 들어가는지 테스트"""
+    print("\n🧪 중복 매칭 방지 테스트")
+    print("-" * 40)
+
+    raid_system = RaidWaitingSystem()
+    matchmaker = RaidMatchmaker(raid_system, party_size=2)
+
+    raid_system.add_to_raid("⚡ 아몬", 1)
+    raid_system.add_to_raid("🌋 델모크", 1)
+    raid_system.add_to_raid("⚡ 아몬", 2)
+    raid_system.add_to_raid("🌋 델모크", 3)
+
+    results = matchmaker.run_pass()
+    print(f"   구성된 파티: {results}")
+    assert len(results) == 1 and results[0].member_ids == [1, 2]
+    assert raid_system.get_user_raids(1) == []
+    assert raid_system.get_waiting_queue("🌋 델모크") == [3]
+    print("   ✅ 통과")
+
+
+def test_helper_fill():
+    """부족한 자리를 헬퍼로 채우는지 테스트"""
+    print("\n🧪 헬퍼 채우기 테스트")
+    print("-" * 40)
+
+    raid_system = RaidWaitingSystem()
+    matchmaker = RaidMatchmaker(raid_system, party_size=4, party_sizes={"아몬": 3}, max_helpers=1)
+
+    raid_system.add_to_raid("⚡ 아몬", 1)
+    raid_system.add_to_raid("⚡ 아몬", 2)
+    raid_system.add_to_raid("🌋 델모크", 3)
+    raid_system.add_to_raid("🌋 델모크", 4)
+    raid_system.add_to_helper(9)
+
+    results = matchmaker.run_pass()
+    print(f"   구성된 파티: {results}")
+    assert len(results) == 1
+    assert results[0].member_ids == [1, 2] and results[0].helper_ids == [9]
+    assert raid_system.get_helper_count() == 0
+    # 델모크는 4인 파티에 헬퍼 1명으로도 부족하므로 대기 유지
+    assert raid_system.get_waiting_queue("🌋 델모크") == [3, 4]
+    print("   ✅ 통과")
+
+
+def test_debounce():
+    """대기 목록 변경이 여러 번 있어도 매칭이 한 번만 실행되는지 테스트"""
+    print("\n🧪 디바운스 테스트")
+    print("-" * 40)
+
+    async def scenario():
+        raid_system = RaidWaitingSystem()
+        notified = []
+
+        async def on_match(results):
+            notified.append(results)
+
+        RaidMatchmaker(raid_system, party_size=2, debounce_seconds=0.05, on_match=on_match)
+        for user_id in range(1, 5):
+            raid_system.add_to_raid("😇 라파엘", user_id)
+
+        await asyncio.sleep(0.1)
+        return notified
+
+    notified = asyncio.run(scenario())
+    print(f"   알림 횟수: {len(notified)}, 파티 수: {len(notified[0]) if notified else 0}")
+    assert len(notified) == 1 and len(notified[0]) == 2
+    print("   ✅ 통과")
+
+
+def test_debounce_reschedule_and_max_wait():
+    """변경이 이어지면 매칭을 미루되 최대 대기 시간은 넘기지 않는지 테스트"""
+    print("\n🧪 디바운스 연장/최대 대기 테스트")
+    print("-" * 40)
+
+    async def scenario(max_wait_seconds):
+        raid_system = RaidWaitingSystem()
+        matched_at = []
+
+        async def on_match(results):
+            matched_at.append(loop.time() - start)
+
+        loop = asyncio.get_running_loop()
+        RaidMatchmaker(raid_system, party_size=2, debounce_seconds=0.05,
+                       max_wait_seconds=max_wait_seconds, on_match=on_match)
+        start = loop.time()
+        # 0.03초 간격으로 계속 등록 (디바운스 간격보다 짧음)
+        for user_id in range(1, 7):
+            raid_system.add_to_raid("😇 라파엘", user_id)
+            await asyncio.sleep(0.03)
+
+        await asyncio.sleep(0.1)
+        return matched_at
+
+    # 마지막 등록 후에야 한 번 실행 (첫 등록 0.05초 후가 아님)
+    matched_at = asyncio.run(scenario(1.0))
+    print(f"   최대 대기 1초: 매칭 시각 {[round(t, 3) for t in matched_at]}")
+    assert len(matched_at) == 1 and matched_at[0] >= 0.15 + 0.05
+
+    # 최대 대기 시간이 짧으면 변경이 이어지는 중에도 실행
+    matched_at = asyncio.run(scenario(0.07))
+    print(f"   최대 대기 0.07초: 매칭 시각 {[round(t, 3) for t in matched_at]}")
+    assert matched_at and matched_at[0] < 0.12
+    print("   ✅ 통과")
+
+
+def test_performance(user_count: int = 1000):
+    """대기자 1000명 규모의 매칭 시간 측정"""
+    print(f"\n🧪 매칭 성능 테스트 (대기자 {user_count:,}명)")
+    print("-" * 40)
+
+    rng = random.Random(42)
+    raid_system = RaidWaitingSystem()
+    matchmaker = RaidMatchmaker(raid_system, party_size=8, max_helpers=2)
+    raids = raid_system.get_all_raids()
+
+    for user_id in range(user_count):
+        for raid_name in rng.sample(raids, rng.randint(1, 3)):
+            raid_system.add_to_raid(raid_name, user_id)
+        if user_id % 10 == 0:
+            raid_system.add_to_helper(user_id)
+
+    start = time.perf_counter()
+    results = matchmaker.run_pass()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    matched_users = [user_id for result in results for user_id in result.all_user_ids()]
+    print(f"   파티 {len(results)}개 구성, 매칭 {len(matched_users)}명, {elapsed_ms:.1f}ms")
+    assert len(matched_users) == len(set(matched_users))
+    print("   ✅ 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 레이드 자동 매칭 테스트 시작")
+    print("=" * 50)
+
+    test_fifo_grouping()
+    test_no_double_booking()
+    test_helper_fill()
+    test_debounce()
+    test_debounce_reschedule_and_max_wait()
+    test_performance()
+
+    print("\n" + "=" * 50)
+    print("🎉 모든 테스트 완료!")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+길드별 레이드 저장소(GuildRaidRegistry) 테스트
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from raid_registry import GuildRaidRegistry
+from raid_state_store import RaidStateStore
+from raid_system import RaidWaitingSystem
+
+
+def test_legacy_state_migration():
+    """길드별 디렉토리 도입 전 상태 파일이 지정한 길드로 옮겨져 복원되는지 테스트"""
+    print("\n🧪 이전 상태 파일 이전 테스트")
+    print("-" * 40)
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        # 길드별 디렉토리 도입 전: state_dir 바로 아래에 저장
+        legacy = RaidWaitingSystem(state_store=RaidStateStore(state_dir))
+        legacy.add_to_raid("🌋 델모크", 1)
+        party_id = legacy.create_party_recruitment(2, "⚡ 아몬", 4)
+        legacy.close_state()
+
+        registry = GuildRaidRegistry(state_dir=state_dir, legacy_guild_id=1234)
+        registry.load_saved()
+        assert not registry.has_legacy_state()
+        restored = registry.get(1234)
+        assert restored.get_waiting_queue("🌋 델모크") == [1]
+        assert restored.get_party_recruitment(party_id) is not None
+        registry.close_state()
+
+        # 길드 ID를 지정하지 않으면 나중에 직접 옮길 때까지 그대로 둠
+        legacy = RaidWaitingSystem(state_store=RaidStateStore(state_dir))
+        legacy.add_to_helper(5)
+        legacy.close_state()
+        registry = GuildRaidRegistry(state_dir=state_dir)
+        registry.load_saved()
+        assert registry.has_legacy_state()
+        assert not registry.migrate_legacy_state(1234)  # 이미 상태가 있는 길드와는 합치지 않음
+        registry.get(5678)  # 먼저 빈 상태로 만들어진 길드도 옮겨 받을 수 있음
+        assert registry.migrate_legacy_state(5678)
+        assert registry.get(5678).get_helper_queue() == [5]
+        registry.close_state()
+    print("   ✅ 통과")
+
+
+def test_expire_parties_isolates_guild_errors():
+    """한 길드의 만료 처리 오류가 다른 길드의 만료 이벤트를 잃게 하지 않는지 테스트"""
+    print("\n🧪 길드별 만료 처리 오류 격리 테스트")
+    print("-" * 40)
+
+    registry = GuildRaidRegistry(party_timeout_minutes=1)
+    broken = registry.get(1)
+    healthy = registry.get(2)
+    broken.create_party_recruitment(10, "🌋 델모크", 4)
+    party_id = healthy.create_party_recruitment(20, "⚡ 아몬", 4)
+
+    def raise_error(now=None):
+        raise RuntimeError("만료 처리 실패")
+
+    broken.expire_parties = raise_error
+    events = registry.expire_parties(now=time.time() + 120)
+    assert [(guild_id, event.party.party_id) for guild_id, event in events] == [(2, party_id)]
+    print("   ✅ 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 길드별 레이드 저장소 테스트 시작")
+    print("=" * 50)
+
+    test_legacy_state_migration()
+    test_expire_parties_isolates_guild_errors()
+
+    print("\n" + "=" * 50)
+    print("🎉 모든 테스트 완료!")
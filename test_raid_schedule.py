@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+레이드 예정 시간 파싱 및 시작 전 알림/미시작 자동 종료 테스트
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from raid_schedule import KST, parse_scheduled_time
+from raid_state_store import RaidStateStore
+from raid_system import PartyExpiryEvent, RaidWaitingSystem
+
+# 기준 시각: 2024-05-01 19:00 KST
+NOW = datetime(2024, 5, 1, 19, 0, tzinfo=KST).timestamp()
+
+
+def kst(day: int, hour: int, minute: int = 0) -> float:
+    return datetime(2024, 5, day, hour, minute, tzinfo=KST).timestamp()
+
+
+def test_parse_scheduled_time():
+    """예정 시간 입력 형식별 해석 테스트"""
+    print("\n🧪 예정 시간 파싱 테스트")
+    print("-" * 40)
+
+    cases = {
+        "21:30": kst(1, 21, 30),
+        "18:00": kst(2, 18),            # 이미 지난 시각은 다음 날
+        "30분 후": NOW + 30 * 60,
+        "1시간 30분 뒤": NOW + 90 * 60,
+        "8시": kst(1, 20),              # 오전/오후가 없으면 가장 가까운 미래
+        "9시 반": kst(1, 21, 30),
+        "오늘 저녁 8시": kst(1, 20),
+        "내일 오전 10시 30분": kst(2, 10, 30),
+        "밤 12시": kst(2, 0),
+        "오늘 저녁 8시쯤": kst(1, 20),
+    }
+    for text, expected in cases.items():
+        result = parse_scheduled_time(text, now=NOW)
+        print(f"   {text!r} -> {datetime.fromtimestamp(result, KST) if result else None}")
+        assert result == expected, text
+
+    for text in ["", "아무때나", "25:00", "오후 13시", "분 후"]:
+        assert parse_scheduled_time(text, now=NOW) is None, text
+    print("   ✅ 통과")
+
+
+def test_reminder_and_no_show():
+    """시작 전 알림 1회 발송 후 미시작 파티 자동 종료 테스트"""
+    print("\n🧪 시작 전 알림/미시작 자동 종료 테스트")
+    print("-" * 40)
+
+    raid_system = RaidWaitingSystem(party_timeout_minutes=30, reminder_minutes=10, no_show_grace_minutes=15)
+    start = time.time() + 3600  # 파티 생성 시각(현재 시각) 기준
+    scheduled = raid_system.create_party_recruitment(1, "🌋 델모크", 4, scheduled_time="20:00", scheduled_at=start)
+    started = raid_system.create_party_recruitment(2, "⚡ 아몬", 4, scheduled_time="20:00", scheduled_at=start)
+    unscheduled = raid_system.create_party_recruitment(3, "⚡ 아몬", 4, scheduled_time="아무때나")
+
+    # 일반 파티는 모집 시간 초과로 종료, 예정 시간이 있는 파티는 시작 전까지 유지
+    events = raid_system.expire_parties(now=raid_system.get_party_recruitment(unscheduled).created_at + 31 * 60)
+    assert [(e.kind, e.party.party_id) for e in events] == [(PartyExpiryEvent.EXPIRED, unscheduled)]
+
+    raid_system.close_party_recruitment(started)  # 레이드 시작
+    events = raid_system.expire_parties(now=start - 5 * 60)
+    print(f"   시작 5분 전: {events}")
+    assert [(e.kind, e.party.party_id) for e in events] == [(PartyExpiryEvent.REMINDER, scheduled)]
+    assert raid_system.expire_parties(now=start) == []
+
+    events = raid_system.expire_parties(now=start + 16 * 60)
+    print(f"   시작 16분 후: {events}")
+    assert [(e.kind, e.party.party_id) for e in events] == [(PartyExpiryEvent.NO_SHOW, scheduled)]
+    assert not raid_system.get_party_recruitment(scheduled).is_active
+    print("   ✅ 통과")
+
+
+def test_reminder_survives_restart():
+    """재시작 후 이미 보낸 알림을 다시 보내지 않는지 테스트"""
+    print("\n🧪 재시작 후 알림 중복 방지 테스트")
+    print("-" * 40)
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        start = time.time() + 3600  # 파티 생성 시각(현재 시각) 기준
+        raid_system = RaidWaitingSystem(state_store=RaidStateStore(state_dir), reminder_minutes=10)
+        party_id = raid_system.create_party_recruitment(1, "🌋 델모크", 4, scheduled_at=start)
+        assert len(raid_system.expire_parties(now=start - 5 * 60)) == 1
+        raid_system.flush_state()
+
+        restored = RaidWaitingSystem(state_store=RaidStateStore(state_dir), reminder_minutes=10)
+        party = restored.get_party_recruitment(party_id)
+        assert party.scheduled_at == start and party.reminder_sent
+        assert restored.expire_parties(now=start - 5 * 60) == []
+        raid_system.close_state()
+        restored.close_state()
+    print("   ✅ 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 레이드 예정 시간 테스트 시작")
+    print("=" * 50)
+
+    test_parse_scheduled_time()
+    test_reminder_and_no_show()
+    test_reminder_survives_restart()
+
+    print("\n" + "=" * 50)
+    print("🎉 모든 테스트 완료!")
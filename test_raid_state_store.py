@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+레이드 상태 저장소(RaidStateStore) 저널/스냅샷 및 상태 변경 기록 테스트
+"""
+
+import os
+import sys
+import tempfile
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from raid_state_store import RaidStateStore
+from raid_system import RaidWaitingSystem
+
+
+def test_append_and_reload():
+    """저널에 기록한 내용이 다시 열었을 때 그대로 로드되는지 테스트"""
+    print("\n🧪 저널 기록 후 재로드 테스트")
+    print("-" * 40)
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        store = RaidStateStore(state_dir)
+        snapshot, records = store.load()
+        assert snapshot is None and records == []
+
+        store.append({'op': 'raid_add', 'raid': '🌋 델모크', 'user': 1})
+        store.append({'op': 'helper_add', 'user': 2})
+        store.close()
+
+        reopened = RaidStateStore(state_dir)
+        snapshot, records = reopened.load()
+        assert snapshot is None
+        assert records == [{'op': 'raid_add', 'raid': '🌋 델모크', 'user': 1},
+                           {'op': 'helper_add', 'user': 2}]
+
+        # 다시 연 저널에는 이어서 기록됨
+        reopened.append({'op': 'raid_remove', 'raid': '🌋 델모크', 'user': 1})
+        reopened.close()
+        _, records = RaidStateStore(state_dir).load()
+        assert len(records) == 3 and records[-1]['op'] == 'raid_remove'
+    print("   ✅ 통과")
+
+
+def test_snapshot_truncates_journal():
+    """스냅샷 작성 시 저널이 비워지고 이후 기록만 재생되는지 테스트"""
+    print("\n🧪 스냅샷 작성 및 저널 정리 테스트")
+    print("-" * 40)
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        store = RaidStateStore(state_dir, snapshot_every=2)
+        store.load()
+        store.append({'op': 'helper_add', 'user': 1})
+        assert not store.needs_snapshot()
+        store.append({'op': 'helper_add', 'user': 2})
+        assert store.needs_snapshot()
+
+        state = {'version': 1, 'helper_waiting_list': [1, 2]}
+        store.write_snapshot(state)
+        assert not store.needs_snapshot()
+        assert os.path.getsize(store.journal_path) == 0
+        assert not os.path.exists(store.snapshot_path + '.tmp')
+
+        store.append({'op': 'helper_remove', 'user': 1})
+        store.close()
+
+        snapshot, records = RaidStateStore(state_dir).load()
+        assert snapshot == state
+        assert records == [{'op': 'helper_remove', 'user': 1}]
+    print("   ✅ 통과")
+
+
+def test_torn_last_line_skipped():
+    """기록 도중 끊긴 마지막 줄은 버리고 나머지를 로드하는지 테스트"""
+    print("\n🧪 손상된 마지막 줄 무시 테스트")
+    print("-" * 40)
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        store = RaidStateStore(state_dir)
+        store.load()
+        store.append({'op': 'helper_add', 'user': 1})
+        store.append({'op': 'helper_add', 'user': 2})
+        store.close()
+
+        with open(store.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"op":"helper_add","us')
+
+        reopened = RaidStateStore(state_dir)
+        _, records = reopened.load()
+        assert [record['user'] for record in records] == [1, 2]
+
+        # 끊긴 줄은 잘려 나가고 이후 기록은 온전히 남음
+        reopened.append({'op': 'helper_add', 'user': 3})
+        reopened.close()
+        _, records = RaidStateStore(state_dir).load()
+        assert [record['user'] for record in records] == [1, 2, 3]
+    print("   ✅ 통과")
+
+
+def test_close_twice_not_journaled():
+    """이미 종료된 파티를 다시 종료해도 저널에 기록되지 않는지 테스트"""
+    print("\n🧪 중복 종료 저널 기록 테스트")
+    print("-" * 40)
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        store = RaidStateStore(state_dir)
+        raid_system = RaidWaitingSystem(state_store=store)
+        party_id = raid_system.create_party_recruitment(1, "🌋 델모크", 4)
+        assert raid_system.close_party_recruitment(party_id)
+        closed_at = raid_system.get_party_recruitment(party_id).closed_at
+        records = store._records_since_snapshot
+
+        assert raid_system.close_party_recruitment(party_id)
+        assert store._records_since_snapshot == records
+        assert raid_system.get_party_recruitment(party_id).closed_at == closed_at
+        raid_system.close_state()
+    print("   ✅ 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 레이드 상태 저장소 테스트 시작")
+    print("=" * 50)
+
+    test_append_and_reload()
+    test_snapshot_truncates_journal()
+    test_torn_last_line_skipped()
+    test_close_twice_not_journaled()
+
+    print("\n" + "=" * 50)
+    print("🎉 모든 테스트 완료!")
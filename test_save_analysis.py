@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+세이브코드 분석(SaveAnalyzer) 테스트
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from decoder import SaveCodeDecoder
+from embed_pager import EmbedPager
+from items import ItemDatabase
+from result_cache import CachedResult, ResultCache
+from save_analysis import SaveAnalyzer, format_analyses_csv, summarize_analyses
+from savecode_decoder import decode_savecode2, extract_save_data
+
+NAME = "SinLime#31230"
+CODES = [
+    "111148YYYYVTYYYYV6YYYYVLEM3G111711UJ1111",
+    "111148YYYYVTYYYYV6YYYYVLEO3G111711UF1111",
+]
+
+
+def test_matches_legacy():
+    """기존 검증/추출 함수와 같은 결과인지 확인"""
+    print("🧪 기존 함수와 결과 비교")
+    analyzer = SaveAnalyzer()
+    decoder = SaveCodeDecoder()
+
+    for code in CODES:
+        analysis = analyzer.analyze(code, NAME)
+        save_data = extract_save_data(code, NAME)
+        assert analysis.error is None
+        assert analysis.valid == decode_savecode2(code, NAME) is True
+        assert (analysis.gold, analysis.lumber, analysis.level) == \
+               (save_data['gold'], save_data['lumber'], save_data['level'])
+        assert analysis.hero_name == analyzer.savecode_manager.get_character_name(save_data['hero_type_index'])
+        assert analysis.items_list == decoder.extract_items(code)
+        assert analysis.graduation_status == analyzer.graduation_checker.get_graduation_status(
+            item_ids=save_data['items'])
+        print(f"   {analysis.hero_name}: {analysis.status_text}, 졸업 {analysis.graduation_status}")
+    print("✅ 통과\n")
+
+
+def test_invalid_codes():
+    """이름이 다른 코드는 유효하지 않고, 해석할 수 없는 코드는 예외 대신 오류로 반환"""
+    print("🧪 유효하지 않은 코드")
+    analyzer = SaveAnalyzer()
+
+    wrong_name = analyzer.analyze(CODES[0], "Other#1234")
+    assert not wrong_name.valid and wrong_name.error is None
+    assert wrong_name.valid == decode_savecode2(CODES[0], "Other#1234")
+    assert wrong_name.items_list  # 아이템은 이름과 관계없이 추출됨
+
+    broken = analyzer.analyze("ABC", NAME)
+    assert not broken.valid and broken.error
+    assert broken.items_list == []
+    print(f"   해석 불가 코드 오류: {broken.error}")
+    print("✅ 통과\n")
+
+
+def test_summary_and_csv():
+    """여러 코드 통계와 CSV 첨부 내용"""
+    print("🧪 통계/CSV")
+    analyzer = SaveAnalyzer()
+    analyses = analyzer.analyze_many(CODES + [CODES[0], "ABC"], NAME)
+    summary = summarize_analyses(analyses)
+
+    assert (summary.total, summary.valid_count, summary.invalid_count) == (4, 3, 1)
+    assert len(summary.characters) == 2
+    assert summary.duplicated_characters == {analyses[0].hero_name: 2}
+    assert summary.graduates['terminator'] == summary.characters
+
+    lines = format_analyses_csv(analyses).splitlines()
+    assert len(lines) == 5  # 헤더 + 코드 4개
+    assert lines[1].startswith(f"1,{CODES[0]},O,{analyses[0].hero_name}")
+    assert lines[4].endswith(analyses[3].error)
+    print("✅ 통과\n")
+
+
+def test_embed_pager():
+    """임베드 10개/6000자 한도에 맞춰 페이지를 나누고 필요한 페이지만 생성"""
+    print("🧪 임베드 페이지 나누기")
+    built = []
+
+    def build(idx):
+        built.append(idx)
+        return "x" * (1000 if idx == 12 else 100)
+
+    pager = EmbedPager(25, build, header=["h" * 500])
+    embeds, start, end = pager.page(0)
+    assert (len(embeds), start, end) == (10, 0, 9)  # 통계 임베드 + 코드 9개
+    assert built == list(range(9))  # 다음 페이지 항목은 아직 만들지 않음
+    assert pager.has_next(0) and not pager.single_page
+
+    embeds, start, end = pager.page(1)
+    assert (start, end) == (9, 19) and "h" * 500 not in embeds
+    embeds, start, end = pager.page(2)
+    assert (start, end) == (19, 25) and not pager.has_next(2)
+    assert pager.page(0)[1:] == (0, 9)  # 이전 페이지로 돌아가도 같은 범위
+
+    # 글자 수 한도: 1200자 임베드는 한 페이지에 5개까지
+    pager = EmbedPager(6, lambda idx: "x" * 1200)
+    assert pager.page(0)[1:] == (0, 5) and pager.page(1)[1:] == (5, 6)
+
+    single = EmbedPager(3, lambda idx: "x")
+    single.page(0)
+    assert single.single_page
+    print("✅ 통과\n")
+
+
+def test_result_cache():
+    """같은 이름/코드 목록은 재사용, 데이터를 다시 로드하면 이전 결과는 버림"""
+    print("🧪 분석 결과 캐시")
+    with tempfile.TemporaryDirectory() as tmp:
+        items_path = os.path.join(tmp, "items.json")
+        with open(items_path, 'w', encoding='utf-8') as f:
+            json.dump({"1": "예언의 손길"}, f)
+        analyzer = SaveAnalyzer(item_db=ItemDatabase(items_path))
+        cache = ResultCache(ttl=60, max_entries=2)
+
+        key = cache.key(NAME, CODES, analyzer.data_version)
+        assert cache.get(key) is None
+        cache.put(key, CachedResult(analyses=analyzer.analyze_many(CODES, NAME)))
+        assert cache.get(cache.key(f" {NAME} ", [f"{code} " for code in CODES], analyzer.data_version)) is not None
+        assert cache.get(cache.key(NAME, list(reversed(CODES)), analyzer.data_version)) is None
+
+        # 내용이 같은 파일을 다시 로드하면 버전이 같아 그대로 재사용
+        version = analyzer.data_version
+        analyzer.item_db.reload()
+        assert analyzer.data_version == version and cache.get(cache.key(NAME, CODES, version)) is not None
+
+        # 아이템 데이터가 바뀌면 새 키가 되고 이전 항목은 비워짐
+        with open(items_path, 'w', encoding='utf-8') as f:
+            json.dump({"1": "예언의 손길", "2": "사무엘의 영혼"}, f)
+        analyzer.item_db.reload()
+        assert analyzer.data_version != version
+        assert cache.get(cache.key(NAME, CODES, analyzer.data_version)) is None
+        assert cache.get_stats()['entries'] == 0 and cache.invalidations == 1
+
+    # 최근에 쓰지 않은 항목부터 제거, 만료된 항목은 조회되지 않음
+    version = analyzer.data_version
+    keys = [cache.key(NAME, [code], version) for code in CODES + ["ABC"]]
+    cache.put(keys[0], CachedResult(analyses=[]))
+    cache.put(keys[1], CachedResult(analyses=[]))
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], CachedResult(analyses=[]))
+    assert cache.get(keys[1]) is None and cache.get(keys[0]) is not None
+
+    short = ResultCache(ttl=0.01)
+    short.put(keys[0], CachedResult(analyses=[]))
+    time.sleep(0.02)
+    assert short.get(keys[0]) is None
+    assert ResultCache(ttl=0).get(keys[0]) is None
+    print("✅ 통과\n")
+
+
+if __name__ == "__main__":
+    os.environ.setdefault('DISCORD_BOT_TOKEN', 'test-token')
+    test_matches_legacy()
+    test_invalid_codes()
+    test_summary_and_csv()
+    test_embed_pager()
+    test_result_cache()
+    print("🎉 모든 테스트 통과")